@@ -49,6 +49,7 @@ class FrlgIdRngMacro(MacroBase):
 
     description = "FRLG TID乱数調整マクロ (Switch 720p)"
     tags = ["pokemon", "frlg", "rng", "tid"]
+    ocr_languages = ["en"]
     settings_path = "resource:settings.toml"
 
     # --------------------------------------------------------
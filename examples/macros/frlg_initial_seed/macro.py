@@ -74,6 +74,7 @@ class FrlgInitialSeedMacro(MacroBase):
 
     description = "FRLG 初期Seed特定マクロ (Switch 720p)"
     tags = ["pokemon", "frlg", "rng", "seed"]
+    ocr_languages = ["en"]
     settings_path = "resource:settings.toml"
 
     _MAX_RETRIES: int = 3
@@ -6,22 +6,22 @@ OCR エンジンのウォームアップなど、マクロの initialize フェ
 
 from __future__ import annotations
 
-import numpy as np
-
 from nyxpy.framework.core.imgproc import OCRProcessor
 from nyxpy.framework.core.macro.command import Command
 
 
 def warmup_ocr(cmd: Command, language: str = "en") -> None:
-    """OCR エンジンを事前に起動し、初回認識のレイテンシを解消する。
+    """OCR エンジンの warm-up 完了を待ち、初回認識のレイテンシを解消する。
+
+    マクロクラスで ``ocr_languages`` を宣言している場合、warm-up は選択時・実行開始時に
+    framework が開始済みのため、ここでは完了を待つだけになる。
 
     :param cmd: コマンドインターフェース（log のみ使用）
     :param language: ウォームアップ対象の言語コード
     """
     cmd.log(f"OCR ウォームアップ開始 (lang={language})", level="INFO")
-    ocr = OCRProcessor.get_instance(language)
-    try:
-        ocr.get_best_text(np.zeros((64, 200, 3), dtype=np.uint8))
-    except Exception:
-        pass
+    report = OCRProcessor.warm_up(language).wait()
+    if report is not None and not report.succeeded:
+        cmd.log(f"OCR ウォームアップ失敗: {report.error}", level="WARNING")
+        return
     cmd.log("OCR ウォームアップ完了", level="INFO")
@@ -4,6 +4,8 @@ import argparse
 import sys
 from pathlib import Path
 
+from nyxpy.cli.logs_cli import add_logs_arguments
+from nyxpy.cli.logs_cli import cli_main as logs_cli_main
 from nyxpy.cli.run_cli import add_run_arguments, cli_main, format_cli_error
 from nyxpy.cli.swbt_cli import add_swbt_arguments
 from nyxpy.cli.swbt_cli import cli_main as swbt_cli_main
@@ -68,6 +70,7 @@ def parse_arguments(argv: list[str] | None = None) -> argparse.Namespace:
     run_parser = subparsers.add_parser("run", help="Run macro via command line interface")
     add_run_arguments(run_parser)
     add_swbt_arguments(subparsers)
+    add_logs_arguments(subparsers)
 
     init_parser = subparsers.add_parser(
         "init",
@@ -157,6 +160,8 @@ def main(argv: list[str] | None = None) -> int:
             return cli_main(args)
         elif args.command == "swbt":
             return swbt_cli_main(args)
+        elif args.command == "logs":
+            return logs_cli_main(args)
         elif args.command == "init":
             return init_app(blank=args.blank, force=args.force)
         elif args.command == "create":
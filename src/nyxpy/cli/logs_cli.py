@@ -0,0 +1,51 @@
+"""`nyxpy logs` CLI。"""
+
+import argparse
+import sys
+from pathlib import Path
+from typing import TextIO
+
+from nyxpy.framework.core.logger.run_trace import export_run_trace_jsonl
+
+from .run_cli import format_cli_error
+
+
+def add_logs_arguments(subparsers: argparse._SubParsersAction) -> None:
+    """top-level parser に `logs` subcommand を追加する。"""
+    logs_parser = subparsers.add_parser("logs", help="Inspect run logs")
+    logs_subparsers = logs_parser.add_subparsers(
+        dest="logs_command",
+        required=True,
+        help="logs command to execute",
+    )
+    export_parser = logs_subparsers.add_parser(
+        "export",
+        help="Export a binary run trace (.nyxlog) as JSONL",
+    )
+    export_parser.add_argument("trace", type=Path, help="Path to a .nyxlog run trace")
+    export_parser.add_argument(
+        "-o",
+        "--output",
+        type=Path,
+        default=None,
+        help="Output JSONL path. Defaults to standard output",
+    )
+
+
+def cli_main(args: argparse.Namespace, *, stdout: TextIO | None = None) -> int:
+    """解析済み `nyxpy logs` 引数を実行する。"""
+    output = stdout or sys.stdout
+    if args.logs_command == "export":
+        try:
+            if args.output is None:
+                export_run_trace_jsonl(args.trace, output)
+                return 0
+            with args.output.open("w", encoding="utf-8") as file:
+                count = export_run_trace_jsonl(args.trace, file)
+        except (OSError, ValueError) as exc:
+            print(format_cli_error(f"run trace を書き出せません: {exc}"), file=output)
+            return 1
+        print(f"Exported {count} events: {args.output}", file=output)
+        return 0
+    print(f"Unknown logs command: {args.logs_command}", file=output)
+    return 1
@@ -15,6 +15,7 @@ from nyxpy.framework.core.hardware.capture_source import (
     WindowCaptureSourceConfig,
     capture_source_from_settings,
 )
+from nyxpy.framework.core.hardware.frame_buffer import FrameRingBuffer
 from nyxpy.framework.core.hardware.ponkan_capture import PonkanCaptureDevice
 from nyxpy.framework.core.hardware.ponkan_discovery import (
     PonkanCaptureDeviceDescriptor,
@@ -31,6 +32,7 @@ __all__ = [
     "CaptureSourceConfig",
     "CaptureSourceKey",
     "DummyCaptureDevice",
+    "FrameRingBuffer",
     "PonkanCaptureDevice",
     "PonkanCaptureDeviceDescriptor",
     "PonkanCaptureDiscoverySnapshot",
@@ -8,8 +8,15 @@ from typing import override
 import cv2
 import numpy as np
 
+from nyxpy.framework.core.hardware.frame_buffer import (
+    CapturedFrame,
+    FrameRingBuffer,
+    readonly_view,
+)
 from nyxpy.framework.core.logger import LoggerPort, NullLoggerPort
 
+DUMMY_FRAME_INTERVAL = 1.0 / 60.0
+
 
 class CaptureDeviceNotReady(RuntimeError):
     """Capture device がまだ frame を返せない状態。"""
@@ -37,11 +44,21 @@ class CaptureDeviceInterface(ABC):
         """デバイスの解放を行う"""
         pass
 
+    def get_captured_frame(self) -> CapturedFrame:
+        """最新のフレームを sequence 番号と取得時刻付きで取得する"""
+        return CapturedFrame(image=self.get_frame(), seq=0, timestamp=time.perf_counter())
+
+    def wait_for_next_frame(self, after_seq: int, timeout: float) -> CapturedFrame | None:
+        """`after_seq` より新しいフレームを待機する。timeout 時は `None` を返す"""
+        raise NotImplementedError("Current capture device does not support frame sequence.")
+
 
 class CameraCaptureDevice(CaptureDeviceInterface):
     """キャプチャデバイスの非同期スレッド実装。
 
     内部で専用のスレッドを起動し、連続的にフレームを取得して最新フレームをキャッシュします。
+    取得した frame は ring buffer の slot へ直接読み込み、読み出し側へは copy せずに
+    読み取り専用 view として渡します。
     """
 
     def __init__(
@@ -56,13 +73,23 @@ class CameraCaptureDevice(CaptureDeviceInterface):
         self.device_index = device_index
         self.api_pref = api_pref  # API preference
         self.cap: cv2.VideoCapture | None = None
-        self.latest_frame: cv2.typing.MatLike | None = None
+        self._frames = FrameRingBuffer()
         self._running = False
         self.fps = fps  # キャプチャのフレームレート
         self._interval = 1.0 / fps if fps > 0 else 1.0 / 60.0  # キャプチャ間隔（秒）
-        self._lock = threading.Lock()
         self._thread = None
 
+    @property
+    def latest_frame(self) -> cv2.typing.MatLike | None:
+        return self._frames.latest()
+
+    @latest_frame.setter
+    def latest_frame(self, frame: cv2.typing.MatLike | None) -> None:
+        if frame is None:
+            self._frames.clear()
+        else:
+            self._frames.write(frame)
+
     def initialize(self) -> None:
         self.cap = cv2.VideoCapture(self.device_index, self.api_pref)
         if not self.cap.isOpened():
@@ -122,21 +149,28 @@ class CameraCaptureDevice(CaptureDeviceInterface):
             if cap is None:
                 break
             begin = time.perf_counter()
-            ret, frame = cap.read()
-            if ret:
-                with self._lock:
-                    self.latest_frame = frame
+            buffer = self._frames.writable_buffer()
+            ret, frame = cap.read() if buffer is None else cap.read(buffer)
+            if ret and frame is not None:
+                self._frames.write(frame, copy=False)
             elapsed = time.perf_counter() - begin
             if elapsed < self._interval:
                 time.sleep(self._interval - elapsed)  # Wait for the next frame
 
     def get_frame(self) -> cv2.typing.MatLike:
-        """キャッシュされた最新のフレームを取得します。"""
-        with self._lock:
-            if self.latest_frame is None:
-                raise CaptureDeviceNotReady("CameraCaptureDevice: No frame available yet.")
-            # Return a copy of the latest or the latest frame
-            return self.latest_frame.copy()
+        """キャッシュされた最新のフレームを読み取り専用 view で取得します。"""
+        return self.get_captured_frame().image
+
+    def get_captured_frame(self) -> CapturedFrame:
+        """キャッシュされた最新のフレームを sequence 番号と取得時刻付きで取得します。"""
+        captured = self._frames.latest_captured()
+        if captured is None:
+            raise CaptureDeviceNotReady("CameraCaptureDevice: No frame available yet.")
+        return captured
+
+    def wait_for_next_frame(self, after_seq: int, timeout: float) -> CapturedFrame | None:
+        """`after_seq` より新しいフレームが届くまで待機します。"""
+        return self._frames.wait_for_next(after_seq, timeout)
 
     def release(self) -> None:
         self._running = False
@@ -154,11 +188,15 @@ class DummyCaptureDevice(CaptureDeviceInterface):
     何もせず、常に黒画面を返す。
     """
 
-    def __init__(self):
-        """1280x720 の黒画面を返すダミーフレームを生成します。"""
+    def __init__(self, frame: cv2.typing.MatLike | None = None):
+        """指定フレーム、または 1280x720 の黒画面を返すダミーフレームを生成します。"""
         # DummyCaptureDevice の初期化を行う
         # 返却用の黒画面(1280x720)を生成
-        self._frame = np.zeros((720, 1280, 3), dtype=np.uint8)
+        if frame is None:
+            frame = np.zeros((720, 1280, 3), dtype=np.uint8)
+        self._frame = readonly_view(frame)
+        self._seq = 1
+        self._timestamp = time.perf_counter()
 
     @override
     def initialize(self) -> None:
@@ -170,6 +208,23 @@ class DummyCaptureDevice(CaptureDeviceInterface):
         """ダミーキャプチャデバイスからフレームを取得する。"""
         return self._frame
 
+    @override
+    def get_captured_frame(self) -> CapturedFrame:
+        """ダミーフレームを現在の sequence 番号付きで取得する。"""
+        return CapturedFrame(image=self._frame, seq=self._seq, timestamp=self._timestamp)
+
+    @override
+    def wait_for_next_frame(self, after_seq: int, timeout: float) -> CapturedFrame | None:
+        """60fps 相当の間隔で同じ黒画面を新しいフレームとして返す。"""
+        if self._seq <= after_seq:
+            if timeout < DUMMY_FRAME_INTERVAL:
+                time.sleep(timeout)
+                return None
+            time.sleep(DUMMY_FRAME_INTERVAL)
+            self._seq = after_seq + 1
+            self._timestamp = time.perf_counter()
+        return self.get_captured_frame()
+
     @override
     def release(self) -> None:
         """ダミーキャプチャデバイスのリソースを解放する。"""
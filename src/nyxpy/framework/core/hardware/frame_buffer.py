@@ -0,0 +1,173 @@
+"""Capture thread と frame 読み出し側で共有する ring buffer。"""
+
+from __future__ import annotations
+
+import sys
+import threading
+import time
+from dataclasses import dataclass
+
+import cv2
+import numpy as np
+
+# `self._buffers` の要素、`_is_reusable()` の local 変数、`sys.getrefcount()` の引数の 3 参照。
+_UNSHARED_REFCOUNT = 3
+
+
+@dataclass(frozen=True)
+class CapturedFrame:
+    """Sequence 番号と取得時刻を付けた capture frame。
+
+    `seq` は frame source ごとに単調増加し、0 は sequence を持たない frame を表します。
+    `timestamp` は `time.perf_counter()` 基準の取得時刻です。
+    """
+
+    image: cv2.typing.MatLike
+    seq: int
+    timestamp: float
+
+
+class FrameRingBuffer:
+    """固定数の frame slot を再利用し、最新 frame を読み取り専用 view で公開します。
+
+    書き込みは 1 つの capture thread から行う前提です。読み出し側へは copy せずに
+    読み取り専用 view を渡します。writer は読み出し側が view を保持していない slot
+    だけを再利用し、view が残っている slot は新しい buffer に差し替えるため、
+    公開済み view の内容は後続 frame で上書きされません。画像を加工する呼び出し側は
+    `frame.copy()` で書き込み可能な配列を作ります。
+    """
+
+    def __init__(self, slots: int = 3) -> None:
+        """Slot 数を検証し、frame 未到着の状態で初期化します。"""
+        if slots < 2:
+            raise ValueError("slots must be greater than or equal to 2")
+        self._buffers: list[np.ndarray | None] = [None] * slots
+        self._latest_index = -1
+        self._latest_timestamp = 0.0
+        self._seq = 0
+        self._lock = threading.Lock()
+        self._published = threading.Condition(self._lock)
+
+    @property
+    def slots(self) -> int:
+        return len(self._buffers)
+
+    @property
+    def seq(self) -> int:
+        """最後に公開した frame の sequence 番号。未到着の場合は 0 です。"""
+        with self._lock:
+            return self._seq
+
+    def writable_buffer(self) -> np.ndarray | None:
+        """次に書き込む slot の buffer を返します。
+
+        読み出し側が view を保持している slot や未確保の slot では `None` を返します。
+        返した buffer へ直接書き込んだ場合は、そのまま `write(buffer, copy=False)` で公開します。
+        """
+        index = self._next_index()
+        if not self._is_reusable(index):
+            return None
+        return self._buffers[index]
+
+    def write(
+        self,
+        frame: cv2.typing.MatLike,
+        *,
+        copy: bool = True,
+        timestamp: float | None = None,
+    ) -> int:
+        """Frame を次の slot へ書き込み、最新 frame として公開します。
+
+        公開時に `wait_for_next()` で待機している読み出し側を起こします。
+
+        Args:
+            frame: 公開する frame。
+            copy: `True` の場合は slot の buffer へ複製します。`False` の場合は
+                `frame` の所有権を受け取り、複製せずに slot へ格納します。
+            timestamp: `time.perf_counter()` 基準の取得時刻。省略時は公開時刻を使います。
+
+        Returns:
+            公開した frame の sequence 番号。
+
+        """
+        index = self._next_index()
+        source = np.asarray(frame)
+        if copy:
+            buffer = self._buffers[index] if self._is_reusable(index) else None
+            if buffer is None or buffer.shape != source.shape or buffer.dtype != source.dtype:
+                buffer = np.empty(source.shape, dtype=source.dtype)
+            np.copyto(buffer, source)
+        else:
+            buffer = source
+        published_at = time.perf_counter() if timestamp is None else timestamp
+        with self._lock:
+            self._buffers[index] = buffer
+            self._seq += 1
+            self._latest_index = index
+            self._latest_timestamp = published_at
+            self._published.notify_all()
+            return self._seq
+
+    def latest(self) -> np.ndarray | None:
+        """最新 frame の読み取り専用 view を返します。未到着の場合は `None` です。"""
+        captured = self.latest_captured()
+        return None if captured is None else captured.image
+
+    def latest_captured(self) -> CapturedFrame | None:
+        """最新 frame を sequence 番号と取得時刻付きで返します。未到着の場合は `None` です。"""
+        with self._lock:
+            return self._captured_locked()
+
+    def wait_for_next(self, after_seq: int, timeout: float) -> CapturedFrame | None:
+        """`after_seq` より新しい frame が公開されるまで待機します。
+
+        Args:
+            after_seq: 呼び出し側が最後に処理した frame の sequence 番号。
+            timeout: 最大待機秒数。
+
+        Returns:
+            新しい frame。`timeout` 内に公開されなかった場合は `None`。
+
+        """
+        with self._published:
+            if not self._published.wait_for(
+                lambda: self._seq > after_seq and self._latest_index >= 0,
+                timeout=timeout,
+            ):
+                return None
+            return self._captured_locked()
+
+    def clear(self) -> None:
+        """公開中の frame を取り下げます。確保済み buffer は再利用のため保持します。"""
+        with self._lock:
+            self._latest_index = -1
+
+    def _captured_locked(self) -> CapturedFrame | None:
+        if self._latest_index < 0:
+            return None
+        buffer = self._buffers[self._latest_index]
+        if buffer is None:
+            return None
+        view = buffer.view()
+        view.flags.writeable = False
+        return CapturedFrame(image=view, seq=self._seq, timestamp=self._latest_timestamp)
+
+    def _next_index(self) -> int:
+        return (self._latest_index + 1) % len(self._buffers)
+
+    def _is_reusable(self, index: int) -> bool:
+        buffer = self._buffers[index]
+        if buffer is None or buffer.base is not None:
+            return False
+        # 読み出し側の view は base として buffer を参照するため、参照数で共有中か判定できる。
+        return sys.getrefcount(buffer) <= _UNSHARED_REFCOUNT
+
+
+def readonly_view(frame: cv2.typing.MatLike) -> cv2.typing.MatLike:
+    """Frame を copy せずに読み取り専用 view として返します。"""
+    array = np.asarray(frame)
+    if not array.flags.writeable:
+        return array
+    view = array.view()
+    view.flags.writeable = False
+    return view
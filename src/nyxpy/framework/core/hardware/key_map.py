@@ -0,0 +1,133 @@
+"""KeyType からシリアル frame の byte 更新操作への対応表。"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable, Mapping
+from typing import Any
+
+type FrameOp = tuple[int, int, int, int]
+"""frame 上の 1 byte の更新操作 `(offset, mask, pressed, released)`。
+
+押下時は `mask` のビットを `pressed`、解放時は `released` に置き換えます。
+ボタンのようなフラグは `mask == pressed` かつ `released == 0`、スティック軸のような
+byte 全体の値は `mask == 0xFF` になります。
+"""
+
+type KeyOpsResolver = Callable[[Any], tuple[FrameOp, ...]]
+"""キーを受け取り、そのキーの更新操作を返す関数。"""
+
+
+class CompiledKeyMap:
+    """キーの型ごとの更新操作表を使い、frame の `bytearray` をその場で更新します。
+
+    Button / Hat のような列挙値は protocol 生成時に作った表から、スティックや touch の
+    ように値を持つキーは memoize した resolver から更新操作を取得します。キーの型は
+    `type(key)` による 1 回の dict 参照で判定し、`isinstance` の連鎖を通りません。
+    対応表にない型のキーは無視します。
+    """
+
+    def __init__(
+        self,
+        initial_frame: bytes,
+        tables: Mapping[type, Mapping[Any, tuple[FrameOp, ...]] | KeyOpsResolver | None],
+        unsupported: Callable[[Any], Exception],
+    ) -> None:
+        """初期 frame とキーの型ごとの更新操作表を設定します。
+
+        Args:
+            initial_frame: すべてのキーを離した状態の frame。
+            tables: キーの型から、列挙値ごとの更新操作表またはキーを受け取る resolver への
+                対応。`None` を指定した型は protocol が表現できないキーとして扱います。
+            unsupported: protocol が表現できないキーの場合に送出する例外を作る関数。
+
+        """
+        self.initial_frame = bytes(initial_frame)
+        self._unsupported = unsupported
+        self._resolvers: dict[type, KeyOpsResolver] = {
+            key_type: _as_resolver(table) for key_type, table in tables.items()
+        }
+
+    def new_frame(self) -> bytearray:
+        """初期状態の frame を新しく作ります。"""
+        return bytearray(self.initial_frame)
+
+    def reset(self, frame: bytearray) -> None:
+        """Frame を初期状態へ戻します。"""
+        frame[:] = self.initial_frame
+
+    def ops(self, key: object) -> tuple[FrameOp, ...]:
+        """キーの更新操作を返します。
+
+        Raises:
+            UnsupportedKeyError: protocol が表現できないキーの場合。
+
+        """
+        resolver = self._resolvers.get(type(key)) or self._resolver_for_subclass(type(key))
+        try:
+            return resolver(key)
+        except KeyError:
+            raise self._unsupported(key) from None
+
+    def press(self, frame: bytearray, keys: Iterable[object]) -> None:
+        """キーを押した状態を frame へ書き込みます。"""
+        for key in keys:
+            for offset, mask, pressed, _released in self.ops(key):
+                frame[offset] = (frame[offset] & ~mask) | pressed
+
+    def release(self, frame: bytearray, keys: Iterable[object]) -> None:
+        """キーを離した状態を frame へ書き込みます。"""
+        for key in keys:
+            for offset, mask, _pressed, released in self.ops(key):
+                frame[offset] = (frame[offset] & ~mask) | released
+
+    def _resolver_for_subclass(self, key_type: type) -> KeyOpsResolver:
+        resolver = next(
+            (
+                candidate
+                for registered, candidate in self._resolvers.items()
+                if issubclass(key_type, registered)
+            ),
+            _no_ops,
+        )
+        # 次回から dict 参照だけで済むよう、サブクラスの判定結果も登録しておく。
+        self._resolvers[key_type] = resolver
+        return resolver
+
+
+def flag_ops(mask: int, offset: int, width: int = 2) -> tuple[FrameOp, ...]:
+    """リトルエンディアンで `width` byte に並ぶフラグの更新操作を作ります。
+
+    Args:
+        mask: 立てるビットのマスク。
+        offset: フラグ領域の先頭 byte の位置。
+        width: フラグ領域の byte 数。
+
+    Returns:
+        マスクのビットを含む byte だけの更新操作。
+
+    """
+    ops = []
+    for index in range(width):
+        byte_mask = (mask >> (8 * index)) & 0xFF
+        if byte_mask:
+            ops.append((offset + index, byte_mask, byte_mask, 0x00))
+    return tuple(ops)
+
+
+def _as_resolver(
+    table: Mapping[Any, tuple[FrameOp, ...]] | KeyOpsResolver | None,
+) -> KeyOpsResolver:
+    if table is None:
+        return _unsupported_ops
+    if isinstance(table, Mapping):
+        # dict の __getitem__ をそのまま使い、表にない値は KeyError として扱う。
+        return dict(table).__getitem__
+    return table
+
+
+def _no_ops(_key: object) -> tuple[FrameOp, ...]:
+    return ()
+
+
+def _unsupported_ops(key: object) -> tuple[FrameOp, ...]:
+    raise KeyError(key)
@@ -16,6 +16,7 @@ from nyxpy.framework.core.hardware.camera_capture import (
     CaptureDeviceReadFailed,
 )
 from nyxpy.framework.core.hardware.capture_source import PonkanCaptureSourceConfig
+from nyxpy.framework.core.hardware.frame_buffer import CapturedFrame, FrameRingBuffer
 from nyxpy.framework.core.logger import LoggerPort, NullLoggerPort
 from nyxpy.framework.core.macro.exceptions import ConfigurationError
 
@@ -56,7 +57,7 @@ class PonkanCaptureDevice(CaptureDeviceInterface):
         self._reader: PonkanReader | None = None
         self._thread: threading.Thread | None = None
         self._lock = threading.Lock()
-        self._latest_frame: cv2.typing.MatLike | None = None
+        self._frames = FrameRingBuffer()
         self._fatal_error: BaseException | None = None
         self._running = False
         self._released = False
@@ -79,13 +80,25 @@ class PonkanCaptureDevice(CaptureDeviceInterface):
 
     @override
     def get_frame(self) -> cv2.typing.MatLike:
-        """Cache 済み最新 frame の copy を返します。"""
-        with self._lock:
-            if self._fatal_error is not None:
-                raise CaptureDeviceReadFailed("ponkan capture reader failed") from self._fatal_error
-            if self._latest_frame is None:
-                raise CaptureDeviceNotReady("ponkan capture has no frame available yet")
-            return self._latest_frame.copy()
+        """Cache 済み最新 frame を読み取り専用 view で返します。"""
+        return self.get_captured_frame().image
+
+    @override
+    def get_captured_frame(self) -> CapturedFrame:
+        """Cache 済み最新 frame を sequence 番号と取得時刻付きで返します。"""
+        self._raise_if_failed()
+        captured = self._frames.latest_captured()
+        if captured is None:
+            raise CaptureDeviceNotReady("ponkan capture has no frame available yet")
+        return captured
+
+    @override
+    def wait_for_next_frame(self, after_seq: int, timeout: float) -> CapturedFrame | None:
+        """`after_seq` より新しい frame が届くまで待機します。"""
+        self._raise_if_failed()
+        captured = self._frames.wait_for_next(after_seq, timeout)
+        self._raise_if_failed()
+        return captured
 
     @override
     def release(self) -> None:
@@ -111,6 +124,11 @@ class PonkanCaptureDevice(CaptureDeviceInterface):
             self._thread.join(timeout=2.0)
             self._thread = None
 
+    def _raise_if_failed(self) -> None:
+        with self._lock:
+            if self._fatal_error is not None:
+                raise CaptureDeviceReadFailed("ponkan capture reader failed") from self._fatal_error
+
     def _read_loop(self) -> None:
         reader = self._reader
         if reader is None:
@@ -123,7 +141,7 @@ class PonkanCaptureDevice(CaptureDeviceInterface):
                     return
                 with self._lock:
                     self._fatal_error = exc
-                    self._latest_frame = None
+                self._frames.clear()
                 self._logger.technical(
                     "ERROR",
                     "Ponkan capture reader failed.",
@@ -136,8 +154,8 @@ class PonkanCaptureDevice(CaptureDeviceInterface):
             if frame is None:
                 time.sleep(self.config.poll_interval)
                 continue
-            with self._lock:
-                self._latest_frame = frame.copy()
+            # reader が内部 buffer を再利用しても影響しないよう、ring buffer の slot へ複製する。
+            self._frames.write(frame)
 
 
 def _open_ponkan_capture(config: PonkanCaptureSourceConfig) -> PonkanReader:
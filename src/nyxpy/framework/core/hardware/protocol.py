@@ -1,6 +1,8 @@
 """コントローラー出力用シリアル protocol interface。"""
 
 from abc import ABC, abstractmethod
+from functools import lru_cache
+from typing import ClassVar
 
 from nyxpy.framework.core.constants import (
     Button,
@@ -14,12 +16,21 @@ from nyxpy.framework.core.constants import (
     ThreeDSButton,
     TouchState,
 )
+from nyxpy.framework.core.hardware.key_map import (
+    CompiledKeyMap,
+    FrameOp,
+    KeyOpsResolver,
+    flag_ops,
+)
 
 
 class SerialProtocolInterface(ABC):
     """Controller 入力をシリアル送信用 bytes へ変換する protocol。"""
 
     supports_touch: bool = False
+    # press / hold / release / touch の command がコントローラー全体の状態を表すかどうか。
+    # True の場合、未送信の古い状態 frame は新しい frame で置き換えて省略できる。
+    full_state_frames: bool = False
 
     @abstractmethod
     def build_press_command(self, keys: tuple[KeyType, ...]) -> bytes:
@@ -110,6 +121,45 @@ class UnsupportedKeyError(ValueError):
     """指定されたキーが対象プロトコルで表現できない場合の例外。"""
 
 
+def _axis_stick_ops(x_offset: int) -> KeyOpsResolver:
+    # x, y を連続した 2 byte に書き、解放時は中央 0x80 へ戻す。
+    @lru_cache(maxsize=1024)
+    def ops(x: int, y: int) -> tuple[FrameOp, ...]:
+        return ((x_offset, 0xFF, x, 0x80), (x_offset + 1, 0xFF, y, 0x80))
+
+    return lambda key: ops(key.x, key.y)
+
+
+def _build_ch552_key_map() -> CompiledKeyMap:
+    return CompiledKeyMap(
+        bytes(
+            [
+                0xAB,  # header
+                0x00,  # btn1
+                0x00,  # btn2
+                Hat.CENTER,  # hat
+                0x80,  # lx (左スティックX中央)
+                0x80,  # ly (左スティックY中央)
+                0x80,  # rx (右スティックX中央)
+                0x80,  # ry (右スティックY中央)
+                0x00,  # kbdheader
+                0x00,  # key
+                0x00,  # centinel (未使用)
+            ]
+        ),
+        {
+            # ボタンは2バイト（btn1, btn2）にわたってマスクする
+            Button: {key: flag_ops(key, 1) for key in Button},
+            Hat: {key: ((3, 0xFF, key, Hat.CENTER),) for key in Hat},
+            LStick: _axis_stick_ops(4),
+            RStick: _axis_stick_ops(6),
+            ThreeDSButton: None,
+            TouchState: None,
+        },
+        lambda key: UnsupportedKeyError(f"CH552 protocol does not support {key!r}."),
+    )
+
+
 class CH552SerialProtocol(SerialProtocolInterface):
     """CH552SerialProtocol は、CH552 デバイス向けの通信プロトコルを実装します。
 
@@ -121,94 +171,39 @@ class CH552SerialProtocol(SerialProtocolInterface):
     - lx, ly: 左スティックの X, Y 座標（中央は 0x80）
     - rx, ry: 右スティックの X, Y 座標（中央は 0x80）
     - kbdheader, key, centinel: キーボード入力用フィールド（kbdheader は操作の種類、key はキーの文字、centinel は常に 0x00）
+
+    キーごとの byte 更新操作は class 共通の `CompiledKeyMap` に保持し、key_state を
+    その場で更新します。
     """
 
+    full_state_frames = True
+    KEY_MAP: ClassVar[CompiledKeyMap] = _build_ch552_key_map()
+
     def __init__(self):
         """CH552 の 11 byte 入力 frame を未押下状態で初期化します。"""
-        self._initialize_key_state()
+        self.key_state = self.KEY_MAP.new_frame()
 
     def _initialize_key_state(self) -> None:
         # 初期状態：キーはすべて未押下、スティックは中央位置、Hat は CENTER
-        self.key_state = bytearray(
-            [
-                0xAB,  # header
-                0x00,  # btn1
-                0x00,  # btn2
-                Hat.CENTER,  # hat
-                0x80,  # lx (左スティックX中央)
-                0x80,  # ly (左スティックY中央)
-                0x80,  # rx (右スティックX中央)
-                0x80,  # ry (右スティックY中央)
-                0x00,  # kbdheader
-                0x00,  # key
-                0x00,  # centinel (未使用)
-            ]
-        )
+        self.KEY_MAP.reset(self.key_state)
 
     def build_press_command(self, keys: tuple[KeyType, ...]) -> bytes:
-        # 各キーに対して、内部状態を更新する
-        for key in keys:
-            if isinstance(key, Button):
-                # ボタンは2バイト（btn1, btn2）にわたってマスクする
-                self.key_state[1] |= key & 0xFF
-                self.key_state[2] |= (key >> 8) & 0xFF
-            elif isinstance(key, Hat):
-                self.key_state[3] = key
-            elif isinstance(key, LStick):
-                self.key_state[4] = key.x
-                self.key_state[5] = key.y
-            elif isinstance(key, RStick):
-                self.key_state[6] = key.x
-                self.key_state[7] = key.y
-            elif isinstance(key, ThreeDSButton | TouchState):
-                raise UnsupportedKeyError(f"CH552 protocol does not support {key!r}.")
-
+        self.KEY_MAP.press(self.key_state, keys)
         # 生成された状態をそのままコマンドデータとして返す
         return bytes(self.key_state)
 
     def build_hold_command(self, keys: tuple[KeyType, ...]) -> bytes:
-        # キー入力状態をリセット
-        self._initialize_key_state()
-        # 各キーに対して、内部状態を更新する
-        for key in keys:
-            if isinstance(key, Button):
-                # ボタンは2バイト（btn1, btn2）にわたってマスクする
-                self.key_state[1] |= key & 0xFF
-                self.key_state[2] |= (key >> 8) & 0xFF
-            elif isinstance(key, Hat):
-                self.key_state[3] = key
-            elif isinstance(key, LStick):
-                self.key_state[4] = key.x
-                self.key_state[5] = key.y
-            elif isinstance(key, RStick):
-                self.key_state[6] = key.x
-                self.key_state[7] = key.y
-            elif isinstance(key, ThreeDSButton | TouchState):
-                raise UnsupportedKeyError(f"CH552 protocol does not support {key!r}.")
-
-        # 生成された状態をそのままコマンドデータとして返す
+        # キー入力状態をリセットしてから押下状態を書き込む
+        self.KEY_MAP.reset(self.key_state)
+        self.KEY_MAP.press(self.key_state, keys)
         return bytes(self.key_state)
 
     def build_release_command(self, keys: tuple[KeyType, ...]) -> bytes:
         # キーが指定されなければ、全体を初期状態にリセット
         if not keys:
-            self._initialize_key_state()
+            self.KEY_MAP.reset(self.key_state)
         else:
-            for key in keys:
-                if isinstance(key, Button):
-                    self.key_state[1] &= (~(key & 0xFF)) & 0xFF
-                    self.key_state[2] &= (~((key >> 8) & 0xFF)) & 0xFF
-                elif isinstance(key, Hat):
-                    self.key_state[3] = Hat.CENTER
-                elif isinstance(key, LStick):
-                    self.key_state[4] = 0x80
-                    self.key_state[5] = 0x80
-                elif isinstance(key, RStick):
-                    self.key_state[6] = 0x80
-                    self.key_state[7] = 0x80
-                elif isinstance(key, ThreeDSButton | TouchState):
-                    raise UnsupportedKeyError(f"CH552 protocol does not support {key!r}.")
-
+            self.KEY_MAP.release(self.key_state, keys)
         return bytes(self.key_state)
 
     def build_keyboard_command(self, text: str) -> bytes:
@@ -231,102 +226,87 @@ class CH552SerialProtocol(SerialProtocolInterface):
         return bytes(self.key_state)
 
 
+def _build_pokecon_key_map() -> CompiledKeyMap:
+    return CompiledKeyMap(
+        bytes(
+            [
+                0x03,  # hex_btns 下位8ビット
+                0x00,  # hex_btns 上位8ビット
+                Hat.CENTER,  # hex_hat
+                0x80,  # hex_pc_lx (左スティックX中央)
+                0x80,  # hex_pc_ly (左スティックY中央)
+                0x80,  # hex_pc_rx (右スティックX中央)
+                0x80,  # hex_pc_ry (右スティックY中央)
+            ]
+        ),
+        {
+            # ボタンは 2 ビット左シフトした 16 ビット（hex_btns）にわたってマスクする
+            Button: {key: flag_ops((key << 2) & 0xFFFF, 0) for key in Button},
+            Hat: {key: ((2, 0xFF, key, Hat.CENTER),) for key in Hat},
+            LStick: _axis_stick_ops(3),
+            RStick: _axis_stick_ops(5),
+            ThreeDSButton: None,
+            TouchState: None,
+        },
+        lambda key: UnsupportedKeyError(f"PokeCon protocol does not support {key!r}."),
+    )
+
+
+@lru_cache(maxsize=4096)
+def _encode_pokecon_state(state: bytes) -> bytes:
+    btns = state[0] | (state[1] << 8)
+    # 16進数の改行コード付き文字列をバイト列(UTF-8)に変換
+    return (
+        f"{btns:#X} {state[2]:X} {state[3]:X} {state[4]:X} {state[5]:X} {state[6]:X}\r\n"
+    ).encode()
+
+
 class PokeConSerialProtocol(SerialProtocolInterface):
     """PokeConSerialProtocol は、PokeCon用プログラムが実装された Arduino デバイス向けの通信プロトコルを実装します。
 
     内部状態（key_state）は以下の構成になっています：
-    [hex_btns, hex_hat, hex_pc_lx, hex_pc_ly, hex_pc_rx, hex_pc_ry]
-    - hex_btns: ボタンの状態（下位／上位8ビット）
+    [btns_low, btns_high, hex_hat, hex_pc_lx, hex_pc_ly, hex_pc_rx, hex_pc_ry]
+    - btns_low, btns_high: ボタンの状態 hex_btns の下位／上位8ビット
     - hex_hat: 方向パッドの状態（押下時は対応する値、解放時は Hat.CENTER）
     - hex_pc_lx, hex_pc_ly: 左スティックの X, Y 座標（中央は 0x80）
     - hex_pc_rx, hex_pc_ry: 右スティックの X, Y 座標（中央は 0x80）
+
+    送信する 16 進数の文字列は状態ごとに memoize するため、同じ状態の繰り返し送信では
+    文字列の整形を省略します。
     """
 
+    full_state_frames = True
+    KEY_MAP: ClassVar[CompiledKeyMap] = _build_pokecon_key_map()
+
     def __init__(self):
-        """PokeCon 用の 6 要素入力状態を未押下状態で初期化します。"""
-        self._initialize_key_state()
+        """PokeCon 用の 7 byte 入力状態を未押下状態で初期化します。"""
+        self.key_state = self.KEY_MAP.new_frame()
 
     def _initialize_key_state(self) -> None:
         # 初期状態：キーはすべて未押下、スティックは中央位置、Hat は CENTER
-        self.key_state: list[int] = list(
-            [
-                0x0003,  # hex_btns (16ビット)
-                Hat.CENTER,  # hex_hat
-                0x80,  # hex_pc_lx (左スティックX中央)
-                0x80,  # hex_pc_ly (左スティックY中央)
-                0x80,  # hex_pc_rx (右スティックX中央)
-                0x80,  # hex_pc_ry (右スティックY中央)
-            ]
-        )
-
-    def build_press_command(self, keys: tuple[KeyType, ...]) -> bytes:
-        # 各キーに対して、内部状態を更新する
-        for key in keys:
-            if isinstance(key, Button):
-                # ボタンは16ビット（hex_btns）にわたってマスクする
-                self.key_state[0] |= (key << 2) & 0xFFFF  # Update to use hex_btns
-            elif isinstance(key, Hat):
-                self.key_state[1] = key
-            elif isinstance(key, LStick):
-                self.key_state[2] = key.x
-                self.key_state[3] = key.y
-            elif isinstance(key, RStick):
-                self.key_state[4] = key.x
-                self.key_state[5] = key.y
-            elif isinstance(key, ThreeDSButton | TouchState):
-                raise UnsupportedKeyError(f"PokeCon protocol does not support {key!r}.")
+        self.KEY_MAP.reset(self.key_state)
 
+    def _encode(self) -> bytes:
         # 生成された状態を16進数の文字列に変換後、バイト列として返す
-        hex_string = f"{self.key_state[0]:#X} {self.key_state[1]:X} {self.key_state[2]:X} {self.key_state[3]:X} {self.key_state[4]:X} {self.key_state[5]:X}\r\n"
-        # 16進数の改行コード付き文字列をバイト列(UTF-8)に変換
-        return hex_string.encode("utf-8")
+        return _encode_pokecon_state(bytes(self.key_state))
 
-    def build_hold_command(self, keys: tuple[KeyType, ...]) -> bytes:
-        # キー入力状態をリセット
-        self._initialize_key_state()
-        # 各キーに対して、内部状態を更新する
-        for key in keys:
-            if isinstance(key, Button):
-                # ボタンは16ビット（hex_btns）にわたってマスクする
-                self.key_state[0] |= (key << 2) & 0xFFFF  # Update to use hex_btns
-            elif isinstance(key, Hat):
-                self.key_state[1] = key
-            elif isinstance(key, LStick):
-                self.key_state[2] = key.x
-                self.key_state[3] = key.y
-            elif isinstance(key, RStick):
-                self.key_state[4] = key.x
-                self.key_state[5] = key.y
-            elif isinstance(key, ThreeDSButton | TouchState):
-                raise UnsupportedKeyError(f"PokeCon protocol does not support {key!r}.")
+    def build_press_command(self, keys: tuple[KeyType, ...]) -> bytes:
+        self.KEY_MAP.press(self.key_state, keys)
+        return self._encode()
 
-        # 生成された状態を16進数の文字列に変換後、バイト列として返す
-        hex_string = f"{self.key_state[0]:#X} {self.key_state[1]:X} {self.key_state[2]:X} {self.key_state[3]:X} {self.key_state[4]:X} {self.key_state[5]:X}\r\n"
-        # 16進数の改行コード付き文字列をバイト列(UTF-8)に変換
-        return hex_string.encode("utf-8")
+    def build_hold_command(self, keys: tuple[KeyType, ...]) -> bytes:
+        # キー入力状態をリセットしてから押下状態を書き込む
+        self.KEY_MAP.reset(self.key_state)
+        self.KEY_MAP.press(self.key_state, keys)
+        return self._encode()
 
     def build_release_command(self, keys: tuple[KeyType, ...]) -> bytes:
         # キーが指定されなければ、全体を初期状態にリセット
         if not keys:
-            self._initialize_key_state()
+            self.KEY_MAP.reset(self.key_state)
         else:
-            for key in keys:
-                if isinstance(key, Button):
-                    self.key_state[0] &= (~((key << 2) & 0xFFFF)) & 0xFFFF
-                elif isinstance(key, Hat):
-                    self.key_state[1] = Hat.CENTER
-                elif isinstance(key, LStick):
-                    self.key_state[2] = 0x80
-                    self.key_state[3] = 0x80
-                elif isinstance(key, RStick):
-                    self.key_state[4] = 0x80
-                    self.key_state[5] = 0x80
-                elif isinstance(key, ThreeDSButton | TouchState):
-                    raise UnsupportedKeyError(f"PokeCon protocol does not support {key!r}.")
-        # 生成された状態を16進数の文字列に変換後、バイト列として返す
-        hex_string = f"{self.key_state[0]:#X} {self.key_state[1]:X} {self.key_state[2]:X} {self.key_state[3]:X} {self.key_state[4]:X} {self.key_state[5]:X}\r\n"
-        # 16進数の改行コード付き文字列をバイト列(UTF-8)に変換
-        return hex_string.encode("utf-8")
+            self.KEY_MAP.release(self.key_state, keys)
+        return self._encode()
 
     def build_keyboard_command(self, text: str) -> bytes:
         # テキスト入力操作のコマンドを生成する
@@ -371,151 +351,110 @@ class PokeConSerialProtocol(SerialProtocolInterface):
                 raise ValueError("Unsupported keyboard operation type")
 
 
+_3DS_BUTTON_MASKS: dict[Button, int] = {
+    Button.Y: 0x0080,
+    Button.B: 0x0020,
+    Button.A: 0x0010,
+    Button.X: 0x0040,
+    Button.L: 0x0100,
+    Button.R: 0x0200,
+    Button.ZL: 0x4000,
+    Button.ZR: 0x8000,
+    Button.MINUS: 0x1000,
+    Button.PLUS: 0x0800,
+    Button.HOME: 0x0400,
+}
+
+_3DS_HAT_MASKS: dict[Hat, int] = {
+    Hat.LEFT: 0x01,
+    Hat.DOWN: 0x02,
+    Hat.RIGHT: 0x04,
+    Hat.UP: 0x08,
+    Hat.UPRIGHT: 0x0C,
+    Hat.DOWNRIGHT: 0x06,
+    Hat.DOWNLEFT: 0x03,
+    Hat.UPLEFT: 0x09,
+    Hat.CENTER: 0x00,
+}
+
+
+def _convert_slide_pad_axis(value: int) -> int:
+    if value <= 128:
+        return round(0xFF - (value / 128) * (0xFF - 0x80))
+    return round(0x80 - ((value - 128) / 127) * 0x80)
+
+
+def _convert_c_stick_axis(value: int) -> int:
+    if value in (127, 128):
+        return 0x00
+    return max(-128, min(127, value - 128)) & 0xFF
+
+
+# スティック軸 0..255 から 3DS の DAC 値への変換表。
+_3DS_SLIDE_PAD_AXIS = tuple(_convert_slide_pad_axis(value) for value in range(256))
+_3DS_C_STICK_AXIS = tuple(_convert_c_stick_axis(value) for value in range(256))
+
+
+def _3ds_stick_ops(x_offset: int, table: tuple[int, ...], released: int) -> KeyOpsResolver:
+    @lru_cache(maxsize=1024)
+    def ops(x: int, y: int) -> tuple[FrameOp, ...]:
+        if not (0 <= x <= 255 and 0 <= y <= 255):
+            raise ValueError("Stick axis must be in range 0..255")
+        return ((x_offset, 0xFF, table[x], released), (x_offset + 1, 0xFF, table[y], released))
+
+    return lambda key: ops(key.x, key.y)
+
+
+@lru_cache(maxsize=1024)
+def _3ds_touch_ops(touch: TouchState) -> tuple[FrameOp, ...]:
+    if not touch.pressed:
+        return tuple((offset, 0xFF, 0x00, 0x00) for offset in range(10, 14))
+    if not 0 <= touch.x <= 319:
+        raise ValueError("Touch X must be in range 0..319")
+    if not 0 <= touch.y <= 239:
+        raise ValueError("Touch Y must be in range 0..239")
+    return (
+        (10, 0xFF, 0x01, 0x00),
+        (11, 0xFF, (touch.x >> 8) & 0xFF, 0x00),
+        (12, 0xFF, touch.x & 0xFF, 0x00),
+        (13, 0xFF, touch.y & 0xFF, 0x00),
+    )
+
+
+def _build_3ds_key_map() -> CompiledKeyMap:
+    return CompiledKeyMap(
+        bytes([0xA1, 0x00, 0x00, 0xA2, 0x80, 0x80, 0xA4, 0x00, 0x00, 0xB2, 0x00, 0x00, 0x00, 0x00]),
+        {
+            Button: {key: flag_ops(mask, 1) for key, mask in _3DS_BUTTON_MASKS.items()},
+            ThreeDSButton: {ThreeDSButton.POWER: flag_ops(0x2000, 1)},
+            # 方向キーは button mask の下位ビットに重ねる
+            Hat: {key: flag_ops(mask, 1) for key, mask in _3DS_HAT_MASKS.items()},
+            LStick: _3ds_stick_ops(4, _3DS_SLIDE_PAD_AXIS, 0x80),
+            RStick: _3ds_stick_ops(7, _3DS_C_STICK_AXIS, 0x00),
+            TouchState: _3ds_touch_ops,
+        },
+        lambda key: UnsupportedKeyError(f"3DS protocol does not support {key!r}."),
+    )
+
+
 class ThreeDSSerialProtocol(SerialProtocolInterface):
-    """Nintendo 3DS 向け S2/T3 シリアルプロトコル実装。"""
+    """Nintendo 3DS 向け S2/T3 シリアルプロトコル実装。
+
+    内部状態（key_state）は送信する 14 byte の frame そのものです：
+    [0xA1, btn_low, btn_high, 0xA2, slide_x, slide_y, 0xA4, c_x, c_y, 0xB2, touch, x_high, x_low, y_low]
+    """
 
     supports_touch = True
 
-    _BUTTON_MASKS: dict[Button, int] = {
-        Button.Y: 0x0080,
-        Button.B: 0x0020,
-        Button.A: 0x0010,
-        Button.X: 0x0040,
-        Button.L: 0x0100,
-        Button.R: 0x0200,
-        Button.ZL: 0x4000,
-        Button.ZR: 0x8000,
-        Button.MINUS: 0x1000,
-        Button.PLUS: 0x0800,
-        Button.HOME: 0x0400,
-    }
-
-    _HAT_MASKS: dict[Hat, int] = {
-        Hat.LEFT: 0x01,
-        Hat.DOWN: 0x02,
-        Hat.RIGHT: 0x04,
-        Hat.UP: 0x08,
-        Hat.UPRIGHT: 0x0C,
-        Hat.DOWNRIGHT: 0x06,
-        Hat.DOWNLEFT: 0x03,
-        Hat.UPLEFT: 0x09,
-        Hat.CENTER: 0x00,
-    }
+    full_state_frames = True
+    KEY_MAP: ClassVar[CompiledKeyMap] = _build_3ds_key_map()
 
     def __init__(self):
         """3DS controller frame の button、stick、touch 状態を初期化します。"""
-        self._initialize_key_state()
+        self.key_state = self.KEY_MAP.new_frame()
 
     def _initialize_key_state(self) -> None:
-        self.button_mask = 0x0000
-        self.slide_x = 0x80
-        self.slide_y = 0x80
-        self.c_stick_x = 0x00
-        self.c_stick_y = 0x00
-        self.touch_pressed = False
-        self.touch_x = 0
-        self.touch_y = 0
-
-    def _build_frame(self) -> bytes:
-        touch_flag = 0x01 if self.touch_pressed else 0x00
-        x_high = (self.touch_x >> 8) & 0xFF if self.touch_pressed else 0x00
-        x_low = self.touch_x & 0xFF if self.touch_pressed else 0x00
-        y_low = self.touch_y & 0xFF if self.touch_pressed else 0x00
-        return bytes(
-            [
-                0xA1,
-                self.button_mask & 0xFF,
-                (self.button_mask >> 8) & 0xFF,
-                0xA2,
-                self.slide_x,
-                self.slide_y,
-                0xA4,
-                self.c_stick_x,
-                self.c_stick_y,
-                0xB2,
-                touch_flag,
-                x_high,
-                x_low,
-                y_low,
-            ]
-        )
-
-    def _apply_press_key(self, key: KeyType) -> None:
-        if isinstance(key, Button | ThreeDSButton):
-            self.button_mask |= self._button_mask(key)
-        elif isinstance(key, Hat):
-            self.button_mask |= self._hat_mask(key)
-        elif isinstance(key, LStick):
-            self.slide_x = self._convert_slide_pad_axis(key.x)
-            self.slide_y = self._convert_slide_pad_axis(key.y)
-        elif isinstance(key, RStick):
-            self.c_stick_x = self._convert_c_stick_axis(key.x)
-            self.c_stick_y = self._convert_c_stick_axis(key.y)
-        elif isinstance(key, TouchState):
-            self._set_touch_state(key)
-
-    def _apply_release_key(self, key: KeyType) -> None:
-        if isinstance(key, Button | ThreeDSButton):
-            self.button_mask &= ~self._button_mask(key) & 0xFFFF
-        elif isinstance(key, Hat):
-            self.button_mask &= ~self._hat_mask(key) & 0xFFFF
-        elif isinstance(key, LStick):
-            self.slide_x = 0x80
-            self.slide_y = 0x80
-        elif isinstance(key, RStick):
-            self.c_stick_x = 0x00
-            self.c_stick_y = 0x00
-        elif isinstance(key, TouchState):
-            self._set_touch_up()
-
-    def _button_mask(self, key: Button | ThreeDSButton) -> int:
-        if isinstance(key, ThreeDSButton):
-            if key == ThreeDSButton.POWER:
-                return 0x2000
-            raise UnsupportedKeyError(f"3DS protocol does not support {key!r}.")
-        if key not in self._BUTTON_MASKS:
-            raise UnsupportedKeyError(f"3DS protocol does not support {key!r}.")
-        return self._BUTTON_MASKS[key]
-
-    def _hat_mask(self, key: Hat) -> int:
-        return self._HAT_MASKS[key]
-
-    def _set_touch_state(self, touch: TouchState) -> None:
-        if touch.pressed:
-            self._validate_touch(touch.x, touch.y)
-            self.touch_pressed = True
-            self.touch_x = touch.x
-            self.touch_y = touch.y
-        else:
-            self._set_touch_up()
-
-    def _set_touch_up(self) -> None:
-        self.touch_pressed = False
-        self.touch_x = 0
-        self.touch_y = 0
-
-    @staticmethod
-    def _validate_touch(x: int, y: int) -> None:
-        if not 0 <= x <= 319:
-            raise ValueError("Touch X must be in range 0..319")
-        if not 0 <= y <= 239:
-            raise ValueError("Touch Y must be in range 0..239")
-
-    @staticmethod
-    def _convert_slide_pad_axis(value: int) -> int:
-        if not 0 <= value <= 255:
-            raise ValueError("Stick axis must be in range 0..255")
-        if value <= 128:
-            return round(0xFF - (value / 128) * (0xFF - 0x80))
-        return round(0x80 - ((value - 128) / 127) * 0x80)
-
-    @staticmethod
-    def _convert_c_stick_axis(value: int) -> int:
-        if not 0 <= value <= 255:
-            raise ValueError("Stick axis must be in range 0..255")
-        if value in (127, 128):
-            return 0x00
-        return max(-128, min(127, value - 128)) & 0xFF
+        self.KEY_MAP.reset(self.key_state)
 
     @staticmethod
     def _validate_calibration_values(values: tuple[int, ...]) -> None:
@@ -524,31 +463,28 @@ class ThreeDSSerialProtocol(SerialProtocolInterface):
                 raise ValueError("Touch calibration value must be in range 0..255")
 
     def build_press_command(self, keys: tuple[KeyType, ...]) -> bytes:
-        for key in keys:
-            self._apply_press_key(key)
-        return self._build_frame()
+        self.KEY_MAP.press(self.key_state, keys)
+        return bytes(self.key_state)
 
     def build_hold_command(self, keys: tuple[KeyType, ...]) -> bytes:
-        self._initialize_key_state()
-        for key in keys:
-            self._apply_press_key(key)
-        return self._build_frame()
+        self.KEY_MAP.reset(self.key_state)
+        self.KEY_MAP.press(self.key_state, keys)
+        return bytes(self.key_state)
 
     def build_release_command(self, keys: tuple[KeyType, ...]) -> bytes:
         if not keys:
-            self._initialize_key_state()
+            self.KEY_MAP.reset(self.key_state)
         else:
-            for key in keys:
-                self._apply_release_key(key)
-        return self._build_frame()
+            self.KEY_MAP.release(self.key_state, keys)
+        return bytes(self.key_state)
 
     def build_touch_down_command(self, x: int, y: int) -> bytes:
-        self._set_touch_state(TouchState.down(x, y))
-        return self._build_frame()
+        self.KEY_MAP.press(self.key_state, (TouchState.down(x, y),))
+        return bytes(self.key_state)
 
     def build_touch_up_command(self) -> bytes:
-        self._set_touch_up()
-        return self._build_frame()
+        self.KEY_MAP.press(self.key_state, (TouchState.up(),))
+        return bytes(self.key_state)
 
     def build_disable_sleep_command(self, enabled: bool) -> bytes:
         return bytes([0xFC, 0x01 if enabled else 0x00])
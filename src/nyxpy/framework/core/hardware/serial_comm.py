@@ -1,9 +1,21 @@
 """シリアルデバイスへの controller command 送信。"""
 
+import threading
+import time
 from abc import ABC, abstractmethod
+from bisect import bisect_left
+from collections import deque
+from dataclasses import dataclass
 
 import serial
 
+from nyxpy.framework.core.logger import LoggerPort, NullLoggerPort
+
+# 書き込み遅延 histogram の bucket 上限（ミリ秒）。最後の bucket はこれを超えた件数。
+WRITE_LATENCY_BUCKETS_MS: tuple[float, ...] = (0.1, 0.5, 1.0, 2.0, 5.0, 10.0, 20.0, 50.0, 100.0)
+# 送信 queue の待ちを warning として記録する最小間隔（秒）。
+_BACKPRESSURE_LOG_INTERVAL_SEC = 1.0
+
 
 class SerialCommInterface(ABC):
     """シリアル通信の抽象インターフェース。
@@ -23,6 +35,23 @@ class SerialCommInterface(ABC):
     def close(self) -> None:
         pass
 
+    def send_state(self, data: bytes) -> None:
+        """コントローラー全体の状態を表す frame を送信します。
+
+        後続の状態 frame が送信前に届いた場合は、古い frame を省略してよいことを示します。
+        既定では `send()` と同じく必ず送信します。
+        """
+        self.send(data)
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """送信済みの command がすべてデバイスへ書き込まれるまで待機します。
+
+        Returns:
+            `timeout` 秒以内に書き込みが完了した場合は `True`。
+
+        """
+        return True
+
 
 class SerialComm(SerialCommInterface):
     """pyserial を利用したシリアル通信の実装例。"""
@@ -66,3 +95,271 @@ class DummySerialComm(SerialCommInterface):
 
     def close(self) -> None:
         pass
+
+
+@dataclass(frozen=True, slots=True)
+class SerialWriterStats:
+    """`ThreadedSerialComm` の送信統計。
+
+    `latency_histogram` は `send()` してからデバイスへ書き込み終えるまでの時間を
+    `WRITE_LATENCY_BUCKETS_MS` の bucket ごとに数えた件数で、最後の要素は最大 bucket を
+    超えた件数です。
+    """
+
+    enqueued: int
+    written: int
+    coalesced: int
+    backpressure_waits: int
+    max_queue_depth: int
+    latency_histogram: tuple[int, ...]
+
+    def latency_percentile_ms(self, percentile: float) -> float | None:
+        """Histogram から書き込み遅延の percentile を bucket 上限で近似します。
+
+        Args:
+            percentile: 0 より大きく 100 以下の percentile。
+
+        Returns:
+            該当する bucket の上限（ミリ秒）。最大 bucket を超える場合は `inf`、
+            書き込みがない場合は `None`。
+
+        """
+        total = sum(self.latency_histogram)
+        if total == 0:
+            return None
+        rank = total * percentile / 100
+        cumulative = 0
+        for index, count in enumerate(self.latency_histogram):
+            cumulative += count
+            if cumulative >= rank:
+                break
+        return (
+            WRITE_LATENCY_BUCKETS_MS[index]
+            if index < len(WRITE_LATENCY_BUCKETS_MS)
+            else float("inf")
+        )
+
+
+class ThreadedSerialComm(SerialCommInterface):
+    """送信を専用 thread で行う `SerialCommInterface` の wrapper。
+
+    `send()` は frame を上限付き queue へ積むだけで戻るため、USB の一時的な詰まりが
+    マクロ thread の入力タイミングを止めません。`send_state()` で積んだ状態 frame は、
+    queue 末尾の未送信の状態 frame を置き換えます。CH552 や 3DS のように frame が
+    コントローラー全体の状態を持つ protocol では、最新の状態だけを送れば十分なためです。
+
+    queue が満杯の場合、`send()` は空きができるまで待機し、その待ちを
+    `serial.backpressure` として logger へ記録します。送信タイミングをそろえたい箇所では
+    `flush()` で queue が空になるまで待機できます。
+    """
+
+    def __init__(
+        self,
+        device: SerialCommInterface,
+        *,
+        queue_size: int = 64,
+        coalesce: bool = True,
+        logger: LoggerPort | None = None,
+    ) -> None:
+        """送信先 device と queue の設定を保持します。thread は `open()` で起動します。
+
+        Args:
+            device: 実際に書き込みを行う serial device。
+            queue_size: 未送信 frame の最大数。
+            coalesce: 未送信の状態 frame を後続の状態 frame で置き換えるかどうか。
+            logger: backpressure と送信統計を記録する logger。
+
+        Raises:
+            ValueError: `queue_size` が 1 未満の場合。
+
+        """
+        if queue_size < 1:
+            raise ValueError("queue_size must be greater than 0")
+        self.device = device
+        self.queue_size = queue_size
+        self.coalesce = coalesce
+        self.logger = logger or NullLoggerPort()
+        # 要素は (data, 状態 frame かどうか, send した時刻)。
+        self._queue: deque[tuple[bytes, bool, float]] = deque()
+        self._condition = threading.Condition()
+        self._thread: threading.Thread | None = None
+        self._writing = False
+        self._stopping = False
+        self._error: BaseException | None = None
+        self._last_backpressure_log = float("-inf")
+        self._enqueued = 0
+        self._written = 0
+        self._coalesced = 0
+        self._backpressure_waits = 0
+        self._max_queue_depth = 0
+        self._histogram = [0] * (len(WRITE_LATENCY_BUCKETS_MS) + 1)
+
+    @property
+    def port(self) -> str | None:
+        """送信先 device の port 名。"""
+        return getattr(self.device, "port", None)
+
+    def open(self, baudrate: int = 9600) -> None:
+        self.device.open(baudrate)
+        self._start()
+
+    def start(self) -> None:
+        """Open 済みの device に対して writer thread を起動します。"""
+        self._start()
+
+    def send(self, data: bytes) -> None:
+        self._enqueue(data, state=False)
+
+    def send_state(self, data: bytes) -> None:
+        self._enqueue(data, state=True)
+
+    def flush(self, timeout: float | None = None) -> bool:
+        deadline = None if timeout is None else time.perf_counter() + timeout
+        with self._condition:
+            while self._queue or self._writing:
+                self._raise_if_failed()
+                remaining = None if deadline is None else deadline - time.perf_counter()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._condition.wait(remaining)
+            self._raise_if_failed()
+        return True
+
+    def close(self) -> None:
+        try:
+            if self._error is None:
+                self.flush(1.0)
+        finally:
+            with self._condition:
+                self._stopping = True
+                self._queue.clear()
+                self._condition.notify_all()
+            thread = self._thread
+            if thread is not None:
+                thread.join(1.0)
+            self._thread = None
+            self._log_stats()
+            self.device.close()
+
+    def stats(self) -> SerialWriterStats:
+        """現在までの送信統計を返します。"""
+        with self._condition:
+            return SerialWriterStats(
+                enqueued=self._enqueued,
+                written=self._written,
+                coalesced=self._coalesced,
+                backpressure_waits=self._backpressure_waits,
+                max_queue_depth=self._max_queue_depth,
+                latency_histogram=tuple(self._histogram),
+            )
+
+    def _start(self) -> None:
+        with self._condition:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._stopping = False
+            self._error = None
+            self._thread = threading.Thread(target=self._run, name="nyx-serial-writer", daemon=True)
+            self._thread.start()
+
+    def _enqueue(self, data: bytes, *, state: bool) -> None:
+        now = time.perf_counter()
+        with self._condition:
+            self._raise_if_failed()
+            if self._thread is None:
+                raise RuntimeError("ThreadedSerialComm: writer thread is not running.")
+            queue = self._queue
+            if state and self.coalesce and queue and queue[-1][1]:
+                # 未送信の状態 frame は後続の状態で置き換えてよい。遅延は古い frame から測る。
+                queue[-1] = (data, True, queue[-1][2])
+                self._coalesced += 1
+                return
+            if len(queue) >= self.queue_size:
+                self._wait_for_space(now)
+            queue.append((data, state, now))
+            self._enqueued += 1
+            self._max_queue_depth = max(self._max_queue_depth, len(queue))
+            self._condition.notify_all()
+
+    def _wait_for_space(self, started: float) -> None:
+        self._backpressure_waits += 1
+        while len(self._queue) >= self.queue_size:
+            self._raise_if_failed()
+            self._condition.wait()
+        self._raise_if_failed()
+        waited = time.perf_counter() - started
+        if started - self._last_backpressure_log >= _BACKPRESSURE_LOG_INTERVAL_SEC:
+            self._last_backpressure_log = started
+            self.logger.technical(
+                "WARNING",
+                "Serial send queue is full; waiting for the writer thread.",
+                component="ThreadedSerialComm",
+                event="serial.backpressure",
+                extra={
+                    "port": self.port,
+                    "queue_size": self.queue_size,
+                    "waited_ms": round(waited * 1000, 3),
+                    "backpressure_waits": self._backpressure_waits,
+                },
+            )
+
+    def _run(self) -> None:
+        condition = self._condition
+        while True:
+            with condition:
+                while not self._queue and not self._stopping:
+                    condition.wait()
+                if self._stopping:
+                    return
+                data, _state, enqueued_at = self._queue.popleft()
+                self._writing = True
+                condition.notify_all()
+            try:
+                self.device.send(data)
+            except BaseException as exc:
+                with condition:
+                    self._error = exc
+                    self._writing = False
+                    self._queue.clear()
+                    condition.notify_all()
+                self.logger.technical(
+                    "ERROR",
+                    "Serial writer thread stopped after a write failure.",
+                    component="ThreadedSerialComm",
+                    event="serial.writer_failed",
+                    extra={"port": self.port},
+                    exc=exc,
+                )
+                return
+            latency_ms = (time.perf_counter() - enqueued_at) * 1000
+            with condition:
+                self._histogram[bisect_left(WRITE_LATENCY_BUCKETS_MS, latency_ms)] += 1
+                self._written += 1
+                self._writing = False
+                condition.notify_all()
+
+    def _raise_if_failed(self) -> None:
+        if self._error is not None:
+            raise RuntimeError("ThreadedSerialComm: serial write failed.") from self._error
+
+    def _log_stats(self) -> None:
+        stats = self.stats()
+        if stats.enqueued == 0:
+            return
+        self.logger.technical(
+            "DEBUG",
+            "Serial writer statistics.",
+            component="ThreadedSerialComm",
+            event="serial.writer_stats",
+            extra={
+                "port": self.port,
+                "enqueued": stats.enqueued,
+                "written": stats.written,
+                "coalesced": stats.coalesced,
+                "backpressure_waits": stats.backpressure_waits,
+                "max_queue_depth": stats.max_queue_depth,
+                "latency_p50_ms": stats.latency_percentile_ms(50),
+                "latency_p95_ms": stats.latency_percentile_ms(95),
+                "latency_histogram": list(stats.latency_histogram),
+            },
+        )
@@ -54,6 +54,7 @@ class SwbtControllerConfig:
     profile_path: Path
     connect_timeout_sec: float = 30.0
     report_period_us: int | None = 8000
+    async_apply: bool = False
 
 
 _PRO_BUTTONS = frozenset(Button)
@@ -3,13 +3,14 @@
 from __future__ import annotations
 
 from collections.abc import Callable
+from functools import partial
 from threading import RLock
 
 from nyxpy.framework.core.constants import IMUFrame, KeyCode, KeyType, SpecialKeyCode
 from nyxpy.framework.core.hardware.swbt.config import SwbtControllerModel
 from nyxpy.framework.core.hardware.swbt.errors import swbt_port_closed
 from nyxpy.framework.core.hardware.swbt.mapper import NyxSwbtInputMapper, NyxSwbtState
-from nyxpy.framework.core.io.ports import ControllerOutputPort
+from nyxpy.framework.core.io.ports import ControllerOutputPort, StickPosition, TapAction
 
 type CloseCallback = Callable[["SwbtControllerOutputPort"], None]
 
@@ -68,6 +69,51 @@ class SwbtControllerOutputPort(ControllerOutputPort):
             self._ensure_open()
             self._apply_locked(self._mapper.set_imu(self._state, frames))
 
+    def _tap_actions(self, keys: tuple[KeyType, ...]) -> tuple[TapAction, TapAction]:
+        """押下と解放の InputState を事前に変換し、繰り返しでは session へ渡すだけにする。"""
+        with self._lock:
+            self._ensure_open()
+            pressed = self._mapper.press(self._state, keys)
+            released = self._mapper.release(pressed, keys) if keys else self._state
+            pressed_input = self._mapper.to_input_state(pressed)
+            released_input = self._mapper.to_input_state(released)
+
+        def press() -> None:
+            with self._lock:
+                self._ensure_open()
+                self._session.apply(pressed_input)
+                self._state = pressed
+
+        def release() -> None:
+            with self._lock:
+                self._ensure_open()
+                self._session.apply(released_input)
+                self._state = released
+
+        return press, release
+
+    def _stick_path_actions(self, positions: tuple[StickPosition, ...]) -> list[TapAction]:
+        """各位置の InputState を事前に変換し、再生中は session へ渡すだけにする。"""
+        with self._lock:
+            self._ensure_open()
+            states: list[NyxSwbtState] = []
+            state = self._state
+            for position in positions:
+                state = self._mapper.press(state, (position,))
+                states.append(state)
+            inputs = [self._mapper.to_input_state(state) for state in states]
+
+        def apply(state: NyxSwbtState, input_state: object) -> None:
+            with self._lock:
+                self._ensure_open()
+                self._session.apply(input_state)
+                self._state = state
+
+        return [
+            partial(apply, state, input_state)
+            for state, input_state in zip(states, inputs, strict=True)
+        ]
+
     def keyboard(self, text: str) -> None:
         """Swbt backend は keyboard 入力を持たない。"""
         raise NotImplementedError("swbt backend does not support keyboard input.")
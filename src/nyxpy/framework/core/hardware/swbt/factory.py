@@ -29,6 +29,7 @@ class SwbtSessionKey:
     adapter: str | None
     profile_path: Path
     report_period_us: int | None
+    async_apply: bool = False
 
 
 class SwbtControllerOutputPortFactory:
@@ -361,6 +362,7 @@ def session_key(config: SwbtControllerConfig) -> SwbtSessionKey:
         adapter=config.adapter,
         profile_path=config.profile_path,
         report_period_us=config.report_period_us,
+        async_apply=config.async_apply,
     )
 
 
@@ -0,0 +1,125 @@
+"""swbt へ送る入力状態を 1 件だけ保持する mailbox。"""
+
+from __future__ import annotations
+
+import time
+from collections import deque
+from dataclasses import dataclass
+from threading import Condition
+
+_LATENCY_SAMPLES = 4096
+
+
+@dataclass(frozen=True, slots=True)
+class SwbtApplyStats:
+    """Mailbox 経由で送った入力状態の件数と遅延。
+
+    `coalesced` は送信前に新しい状態で置き換えられた件数です。遅延は `post()` から
+    swbt controller への反映が終わるまでの時間で、直近 4096 件から計算します。
+    """
+
+    posted: int
+    sent: int
+    coalesced: int
+    latency_p50_ms: float
+    latency_p95_ms: float
+    latency_max_ms: float
+
+
+class SwbtInputMailbox:
+    """最新の入力状態だけを保持する single-slot mailbox。
+
+    マクロの thread は `post()` で状態を置いてすぐに戻り、swbt の event loop は
+    `take()` で取り出して controller へ反映します。取り出される前に次の状態が置かれた
+    場合、古い状態は送らずに置き換えます。入力 report は完全な状態を毎周期送るため、
+    途中の状態を省略しても最終的な入力は変わりません。
+    """
+
+    def __init__(self) -> None:
+        """空の mailbox を作ります。"""
+        self._condition = Condition()
+        self._pending: tuple[object, float] | None = None
+        self._in_flight = False
+        self._posted = 0
+        self._sent = 0
+        self._coalesced = 0
+        self._latencies: deque[float] = deque(maxlen=_LATENCY_SAMPLES)
+
+    def post(self, state: object) -> bool:
+        """状態を置きます。未送信の状態があれば置き換えます。
+
+        Returns:
+            Mailbox が空だった場合は `True`。consumer を起こす必要があるかの判定に使います。
+
+        """
+        posted_at = time.perf_counter()
+        with self._condition:
+            was_empty = self._pending is None
+            if not was_empty:
+                self._coalesced += 1
+            self._pending = (state, posted_at)
+            self._posted += 1
+            return was_empty
+
+    def take(self) -> tuple[object, float] | None:
+        """未送信の状態と `post()` した時刻を取り出します。空の場合は `None`。"""
+        with self._condition:
+            item = self._pending
+            if item is not None:
+                self._pending = None
+                self._in_flight = True
+            return item
+
+    def done(self, posted_at: float) -> None:
+        """`take()` した状態の反映が終わったことを記録します。"""
+        latency = time.perf_counter() - posted_at
+        with self._condition:
+            self._in_flight = False
+            self._sent += 1
+            self._latencies.append(latency)
+            self._condition.notify_all()
+
+    def discard(self) -> bool:
+        """未送信の状態を捨てます。
+
+        Returns:
+            捨てた状態があった場合は `True`。
+
+        """
+        with self._condition:
+            discarded = self._pending is not None
+            self._pending = None
+            self._condition.notify_all()
+            return discarded
+
+    def wait_idle(self, timeout: float | None = None) -> bool:
+        """未送信の状態と反映中の状態がなくなるまで待機します。
+
+        Returns:
+            `timeout` 秒以内に空になった場合は `True`。
+
+        """
+        with self._condition:
+            return self._condition.wait_for(
+                lambda: self._pending is None and not self._in_flight, timeout
+            )
+
+    def stats(self) -> SwbtApplyStats:
+        """現在までの件数と遅延を返します。"""
+        with self._condition:
+            latencies = sorted(self._latencies)
+            return SwbtApplyStats(
+                posted=self._posted,
+                sent=self._sent,
+                coalesced=self._coalesced,
+                latency_p50_ms=_percentile_ms(latencies, 0.50),
+                latency_p95_ms=_percentile_ms(latencies, 0.95),
+                latency_max_ms=latencies[-1] * 1000 if latencies else 0.0,
+            )
+
+
+def _percentile_ms(sorted_values: list[float], ratio: float) -> float:
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, round(ratio * (len(sorted_values) - 1)))
+    return sorted_values[index] * 1000
@@ -2,7 +2,11 @@
 
 from __future__ import annotations
 
+from collections import OrderedDict
 from dataclasses import dataclass, field
+from functools import cache, lru_cache
+from threading import Lock
+from typing import TYPE_CHECKING
 
 from nyxpy.framework.core.constants import (
     Button,
@@ -20,20 +24,30 @@ from nyxpy.framework.core.hardware.swbt.errors import (
     swbt_input_unsupported,
 )
 
+if TYPE_CHECKING:
+    from swbt import Button as SwbtButton
+
 
 def _neutral_imu_frames() -> tuple[IMUFrame, IMUFrame, IMUFrame]:
     frame = IMUFrame.neutral()
     return (frame, frame, frame)
 
 
+type StickAxes = tuple[int, int]
+
+
 @dataclass(frozen=True, slots=True)
 class NyxSwbtState:
-    """SwbtControllerOutputPort が保持する NyX 側入力状態。"""
+    """SwbtControllerOutputPort が保持する NyX 側入力状態。
+
+    Stick は NyX の 0..255 座標の組で保持します。値だけで比較と hash ができるため、
+    同じ入力状態は別々に作っても `NyxSwbtInputMapper` の変換 cache を共有します。
+    """
 
     buttons: frozenset[Button] = field(default_factory=frozenset)
-    dpad_buttons: frozenset[object] = field(default_factory=frozenset)
-    left_stick: LStick | None = None
-    right_stick: RStick | None = None
+    hat: Hat = Hat.CENTER
+    left_stick: StickAxes | None = None
+    right_stick: StickAxes | None = None
     imu_frames: tuple[IMUFrame, IMUFrame, IMUFrame] = field(default_factory=_neutral_imu_frames)
 
     @classmethod
@@ -43,11 +57,26 @@ class NyxSwbtState:
 
 
 class NyxSwbtInputMapper:
-    """NyX の入力 model を swbt の入力 model へ変換する。"""
+    """NyX の入力 model を swbt の入力 model へ変換する。
 
-    def __init__(self, model: SwbtControllerModel) -> None:
-        """Controller model と capabilities を保持する。"""
+    `to_input_state()` の結果は `NyxSwbtState` ごとに LRU cache へ保持します。stick を
+    回す macro のように同じ状態を繰り返し送る場合、2 回目以降は変換を省略します。
+    """
+
+    def __init__(self, model: SwbtControllerModel, *, cache_size: int = 256) -> None:
+        """Controller model と capabilities を保持する。
+
+        Args:
+            model: 変換対象の controller model。
+            cache_size: 保持する変換結果の最大件数。`0` の場合は cache しません。
+
+        """
+        if cache_size < 0:
+            raise ValueError("cache_size must be greater than or equal to 0")
         self.model = model
+        self.cache_size = cache_size
+        self._input_states: OrderedDict[NyxSwbtState, object] = OrderedDict()
+        self._cache_lock = Lock()
 
     def press(self, state: NyxSwbtState, keys: tuple[KeyType, ...]) -> NyxSwbtState:
         """既存状態へ keys を追加または反映する。"""
@@ -73,7 +102,7 @@ class NyxSwbtInputMapper:
         """IMU frame だけを置き換える。"""
         return NyxSwbtState(
             buttons=state.buttons,
-            dpad_buttons=state.dpad_buttons,
+            hat=state.hat,
             left_stick=state.left_stick,
             right_stick=state.right_stick,
             imu_frames=normalize_imu_frames(frames),
@@ -81,11 +110,30 @@ class NyxSwbtInputMapper:
 
     def to_input_state(self, state: NyxSwbtState):
         """NyX 側状態を swbt.InputState に変換する。"""
+        if self.cache_size == 0:
+            return self._build_input_state(state)
+        with self._cache_lock:
+            cached = self._input_states.get(state)
+            if cached is not None:
+                self._input_states.move_to_end(state)
+                return cached
+        input_state = self._build_input_state(state)
+        with self._cache_lock:
+            self._input_states[state] = input_state
+            if len(self._input_states) > self.cache_size:
+                self._input_states.popitem(last=False)
+        return input_state
+
+    def _build_input_state(self, state: NyxSwbtState):
         from swbt import InputState, InvalidInputError
 
+        button_table = _swbt_button_table()
+        try:
+            buttons = [button_table[button] for button in state.buttons]
+        except KeyError as exc:
+            raise swbt_input_invalid(f"unsupported NyX button: {exc.args[0]}") from exc
+        buttons.extend(_swbt_dpad_table()[state.hat])
         try:
-            buttons = {_swbt_button(button) for button in state.buttons}
-            buttons.update(state.dpad_buttons)
             input_state = InputState.neutral().with_buttons(buttons)
             input_state = input_state.with_sticks(
                 left_stick=_swbt_stick(state.left_stick),
@@ -100,7 +148,7 @@ class NyxSwbtInputMapper:
             self._require_button(key)
             return NyxSwbtState(
                 buttons=state.buttons | {key},
-                dpad_buttons=state.dpad_buttons,
+                hat=state.hat,
                 left_stick=state.left_stick,
                 right_stick=state.right_stick,
                 imu_frames=state.imu_frames,
@@ -108,7 +156,7 @@ class NyxSwbtInputMapper:
         if isinstance(key, Hat):
             return NyxSwbtState(
                 buttons=state.buttons,
-                dpad_buttons=_swbt_dpad_buttons(key),
+                hat=key,
                 left_stick=state.left_stick,
                 right_stick=state.right_stick,
                 imu_frames=state.imu_frames,
@@ -117,8 +165,8 @@ class NyxSwbtInputMapper:
             self._require_left_stick()
             return NyxSwbtState(
                 buttons=state.buttons,
-                dpad_buttons=state.dpad_buttons,
-                left_stick=key,
+                hat=state.hat,
+                left_stick=(key.x, key.y),
                 right_stick=state.right_stick,
                 imu_frames=state.imu_frames,
             )
@@ -126,9 +174,9 @@ class NyxSwbtInputMapper:
             self._require_right_stick()
             return NyxSwbtState(
                 buttons=state.buttons,
-                dpad_buttons=state.dpad_buttons,
+                hat=state.hat,
                 left_stick=state.left_stick,
-                right_stick=key,
+                right_stick=(key.x, key.y),
                 imu_frames=state.imu_frames,
             )
         raise swbt_input_unsupported(f"swbt backend does not support input: {type(key).__name__}")
@@ -137,7 +185,7 @@ class NyxSwbtInputMapper:
         if isinstance(key, Button):
             return NyxSwbtState(
                 buttons=state.buttons - {key},
-                dpad_buttons=state.dpad_buttons,
+                hat=state.hat,
                 left_stick=state.left_stick,
                 right_stick=state.right_stick,
                 imu_frames=state.imu_frames,
@@ -145,7 +193,7 @@ class NyxSwbtInputMapper:
         if isinstance(key, Hat):
             return NyxSwbtState(
                 buttons=state.buttons,
-                dpad_buttons=frozenset(),
+                hat=Hat.CENTER,
                 left_stick=state.left_stick,
                 right_stick=state.right_stick,
                 imu_frames=state.imu_frames,
@@ -153,7 +201,7 @@ class NyxSwbtInputMapper:
         if isinstance(key, LStick):
             return NyxSwbtState(
                 buttons=state.buttons,
-                dpad_buttons=state.dpad_buttons,
+                hat=state.hat,
                 left_stick=None,
                 right_stick=state.right_stick,
                 imu_frames=state.imu_frames,
@@ -161,7 +209,7 @@ class NyxSwbtInputMapper:
         if isinstance(key, RStick):
             return NyxSwbtState(
                 buttons=state.buttons,
-                dpad_buttons=state.dpad_buttons,
+                hat=state.hat,
                 left_stick=state.left_stick,
                 right_stick=None,
                 imu_frames=state.imu_frames,
@@ -192,10 +240,11 @@ def normalize_imu_frames(frames: tuple[IMUFrame, ...]) -> tuple[IMUFrame, IMUFra
     raise imu_frame_count_invalid(len(frames))
 
 
-def _swbt_button(button: Button):
+@cache
+def _swbt_button_table() -> dict[Button, SwbtButton]:
     from swbt import Button as SwbtButton
 
-    mapping = {
+    return {
         Button.A: SwbtButton.A,
         Button.B: SwbtButton.B,
         Button.X: SwbtButton.X,
@@ -211,16 +260,13 @@ def _swbt_button(button: Button):
         Button.LS: SwbtButton.LEFT_STICK,
         Button.RS: SwbtButton.RIGHT_STICK,
     }
-    try:
-        return mapping[button]
-    except KeyError as exc:
-        raise swbt_input_invalid(f"unsupported NyX button: {button}") from exc
 
 
-def _swbt_dpad_buttons(hat: Hat) -> frozenset[object]:
+@cache
+def _swbt_dpad_table() -> dict[Hat, tuple[SwbtButton, ...]]:
     from swbt import Button as SwbtButton
 
-    mapping = {
+    return {
         Hat.UP: (SwbtButton.DPAD_UP,),
         Hat.UPRIGHT: (SwbtButton.DPAD_UP, SwbtButton.DPAD_RIGHT),
         Hat.RIGHT: (SwbtButton.DPAD_RIGHT,),
@@ -231,17 +277,18 @@ def _swbt_dpad_buttons(hat: Hat) -> frozenset[object]:
         Hat.UPLEFT: (SwbtButton.DPAD_UP, SwbtButton.DPAD_LEFT),
         Hat.CENTER: (),
     }
-    return frozenset(mapping[hat])
 
 
-def _swbt_stick(stick: LStick | RStick | None):
+@lru_cache(maxsize=1024)
+def _swbt_stick(axes: StickAxes | None):
     from swbt import Stick
 
-    if stick is None:
+    if axes is None:
         return Stick.center()
+    x, y = axes
     return Stick.normalized(
-        x=_nyx_stick_axis_to_normalized(stick.x),
-        y=-_nyx_stick_axis_to_normalized(stick.y),
+        x=_nyx_stick_axis_to_normalized(x),
+        y=-_nyx_stick_axis_to_normalized(y),
     )
 
 
@@ -6,6 +6,7 @@ import asyncio
 import inspect
 import time
 from collections.abc import Awaitable, Callable
+from concurrent.futures import CancelledError, Future
 from concurrent.futures import TimeoutError as FutureTimeoutError
 from dataclasses import dataclass, field
 from threading import Event, RLock, Thread, current_thread
@@ -18,6 +19,7 @@ from nyxpy.framework.core.hardware.swbt.errors import (
     swbt_configuration_error,
     swbt_not_connected,
 )
+from nyxpy.framework.core.hardware.swbt.mailbox import SwbtApplyStats, SwbtInputMailbox
 from nyxpy.framework.core.macro.exceptions import ConfigurationError, DeviceError
 
 type SwbtControllerFactory = Callable[[SwbtControllerConfig, DiagnosticsWriter | None], object]
@@ -28,6 +30,7 @@ type SwbtProfileCreator = Callable[
 
 _INPUT_REPORT_ID = 0x30
 _DEFAULT_REPORT_PERIOD_US = 8000
+_NEUTRAL = object()
 
 
 class SwbtControllerSessionProtocol(Protocol):
@@ -95,6 +98,10 @@ class SwbtControllerSession:
         self._opened = False
         self._connected = False
         self._closed = False
+        self._mailbox = SwbtInputMailbox()
+        self._pump_future: Future[None] | None = None
+        self._pump_wake: asyncio.Event | None = None
+        self._pump_error: Exception | None = None
 
     @property
     def connected(self) -> bool:
@@ -139,6 +146,7 @@ class SwbtControllerSession:
     def pair(self, *, timeout_sec: float, cancellation_event: Event | None = None) -> None:
         """明示 pairing を実行する。"""
         with self._lock:
+            self._stop_pump_locked()
             try:
                 if self._profile_exists():
                     self.open()
@@ -179,6 +187,7 @@ class SwbtControllerSession:
     def reconnect(self, *, timeout_sec: float, cancellation_event: Event | None = None) -> None:
         """保存済み pairing profile に基づく reconnect を実行する。"""
         with self._lock:
+            self._stop_pump_locked()
             self.open()
             controller = self._require_controller()
             try:
@@ -207,7 +216,15 @@ class SwbtControllerSession:
             )
 
     def apply(self, state: object) -> None:
-        """完全な swbt InputState を controller へ適用する。"""
+        """完全な swbt InputState を controller へ適用する。
+
+        `config.async_apply` が有効な場合は mailbox へ置いてすぐに戻り、event loop が
+        report 周期ごとに最新の状態だけを反映します。反映時の error は次の `apply()` で
+        送出します。
+        """
+        if self.config.async_apply:
+            self._post_input(state)
+            return
         with self._lock:
             controller = self._require_connected_controller()
             try:
@@ -219,6 +236,10 @@ class SwbtControllerSession:
 
     def neutral(self) -> None:
         """全入力を neutral に戻す。"""
+        if self.config.async_apply:
+            self._post_input(_NEUTRAL)
+            self._wait_inputs_applied()
+            return
         with self._lock:
             controller = self._require_connected_controller()
             try:
@@ -241,13 +262,19 @@ class SwbtControllerSession:
             self._connected = is_swbt_status_connected(status)
             return status
 
+    def apply_stats(self) -> SwbtApplyStats:
+        """`async_apply` で送った入力状態の件数と遅延を返す。"""
+        return self._mailbox.stats()
+
     def close(self) -> None:
         """neutral=True で controller を閉じる。idempotent。"""
         with self._lock:
+            self._stop_pump_locked()
             if self._loop_stopping:
                 self._stop_loop_locked()
             if self._closed:
                 return
+            self._write_apply_stats()
             controller = self._controller
             self._connected = False
             if controller is None:
@@ -281,6 +308,97 @@ class SwbtControllerSession:
             if errors:
                 raise ExceptionGroup("swbt session close failed", errors)
 
+    def _post_input(self, state: object) -> None:
+        with self._lock:
+            self._raise_pump_error_locked()
+            if not self._connected or not self._opened or self._controller is None:
+                raise swbt_not_connected(type(self).__name__)
+            self._ensure_pump_locked(self._controller)
+            loop = self._loop
+            wake = self._pump_wake
+            if self._mailbox.post(state) and loop is not None and wake is not None:
+                loop.call_soon_threadsafe(wake.set)
+
+    def _wait_inputs_applied(self) -> None:
+        if not self._mailbox.wait_idle(timeout=self._operation_timeout_sec):
+            raise swbt_configuration_error(
+                "swbt input state was not applied in time",
+                code="NYX_SWBT_APPLY_TIMEOUT",
+                component=type(self).__name__,
+            )
+        with self._lock:
+            self._raise_pump_error_locked()
+
+    def _raise_pump_error_locked(self) -> None:
+        error = self._pump_error
+        if error is not None:
+            self._pump_error = None
+            raise error
+
+    def _ensure_pump_locked(self, controller: object) -> None:
+        if self._pump_future is not None and not self._pump_future.done():
+            return
+        self._ensure_loop_locked()
+        loop = cast(asyncio.AbstractEventLoop, self._loop)
+        # asyncio.Event は loop thread 上で作り、以後の set も loop thread で行う。
+        wake = asyncio.run_coroutine_threadsafe(_new_event(), loop).result(
+            timeout=self._operation_timeout_sec
+        )
+        self._pump_wake = wake
+        self._pump_future = asyncio.run_coroutine_threadsafe(
+            self._pump_inputs(controller, wake), loop
+        )
+
+    def _stop_pump_locked(self) -> None:
+        self._mailbox.discard()
+        future = self._pump_future
+        self._pump_future = None
+        self._pump_wake = None
+        self._pump_error = None
+        if future is None or future.done():
+            return
+        future.cancel()
+        try:
+            future.result(timeout=self._cancellation_timeout_sec)
+        except (CancelledError, FutureTimeoutError):
+            pass
+
+    def _write_apply_stats(self) -> None:
+        stats = self._mailbox.stats()
+        if self._diagnostics_writer is None or stats.posted == 0:
+            return
+        self._diagnostics_writer.write(
+            f"nyx async apply: posted={stats.posted} sent={stats.sent} "
+            f"coalesced={stats.coalesced} latency_p50_ms={stats.latency_p50_ms:.3f} "
+            f"latency_p95_ms={stats.latency_p95_ms:.3f} "
+            f"latency_max_ms={stats.latency_max_ms:.3f}\n"
+        )
+
+    async def _pump_inputs(self, controller: object, wake: asyncio.Event) -> None:
+        """Mailbox の最新状態を report 周期ごとに controller へ反映する。"""
+        period_sec = (self.config.report_period_us or _DEFAULT_REPORT_PERIOD_US) / 1_000_000
+        mailbox = self._mailbox
+        while True:
+            item = mailbox.take()
+            if item is None:
+                await wake.wait()
+                wake.clear()
+                continue
+            state, posted_at = item
+            args = () if state is _NEUTRAL else (state,)
+            method_name = "neutral" if state is _NEUTRAL else "apply"
+            try:
+                result = getattr(controller, method_name)(*args)
+                if inspect.isawaitable(result):
+                    await result
+            except (ConfigurationError, DeviceError) as exc:
+                self._pump_error = exc
+            except Exception as exc:
+                self._pump_error = map_swbt_exception(exc, component=type(self).__name__)
+            finally:
+                mailbox.done(posted_at)
+            await asyncio.sleep(period_sec)
+
     def _require_controller(self) -> object:
         if self._controller is None:
             raise swbt_not_connected(type(self).__name__)
@@ -531,6 +649,10 @@ class SwbtControllerSession:
         self._loop_stopping = False
 
 
+async def _new_event() -> asyncio.Event:
+    return asyncio.Event()
+
+
 async def _await_result(awaitable: Awaitable[object], completed: Event) -> object:
     try:
         return await awaitable
@@ -18,6 +18,7 @@ from nyxpy.framework.core.hardware.camera_capture import (
     CaptureDeviceReadFailed,
 )
 from nyxpy.framework.core.hardware.capture_source import WindowCaptureSourceConfig
+from nyxpy.framework.core.hardware.frame_buffer import CapturedFrame, FrameRingBuffer
 from nyxpy.framework.core.hardware.frame_transform import FrameTransformer
 from nyxpy.framework.core.hardware.platform_capture import ensure_capture_coordinate_space
 from nyxpy.framework.core.hardware.window_discovery import (
@@ -40,6 +41,7 @@ class WindowCaptureSession(ABC):
 
     @abstractmethod
     def latest_frame(self) -> cv2.typing.MatLike:
+        """最新 frame を呼び出し側が所有できる新しい配列として返します。"""
         pass
 
     @abstractmethod
@@ -269,6 +271,12 @@ class WindowCaptureDevice(CaptureDeviceInterface):
     def get_frame(self) -> cv2.typing.MatLike:
         return self._device.get_frame()
 
+    def get_captured_frame(self) -> CapturedFrame:
+        return self._device.get_captured_frame()
+
+    def wait_for_next_frame(self, after_seq: int, timeout: float) -> CapturedFrame | None:
+        return self._device.wait_for_next_frame(after_seq, timeout)
+
     def release(self) -> None:
         self._device.release()
 
@@ -289,8 +297,7 @@ class _ThreadedSessionCaptureDevice(CaptureDeviceInterface):
         self._transformer = FrameTransformer()
         self._running = False
         self._thread: threading.Thread | None = None
-        self._lock = threading.Lock()
-        self._latest_frame: cv2.typing.MatLike | None = None
+        self._frames = FrameRingBuffer()
         self._last_error: Exception | None = None
         self._start_error: Exception | None = None
         self._ready = threading.Event()
@@ -314,16 +321,22 @@ class _ThreadedSessionCaptureDevice(CaptureDeviceInterface):
             raise RuntimeError(f"{self.config.source_type} capture failed to start") from error
 
     def get_frame(self) -> cv2.typing.MatLike:
-        with self._lock:
-            if self._last_error is not None and not self._running:
-                raise CaptureDeviceReadFailed(
-                    f"{self.config.source_type} capture reader failed"
-                ) from self._last_error
-            if self._latest_frame is None:
-                raise CaptureDeviceNotReady(
-                    f"{self.config.source_type} capture has no frame available yet"
-                )
-            return self._latest_frame.copy()
+        return self.get_captured_frame().image
+
+    def get_captured_frame(self) -> CapturedFrame:
+        self._raise_if_failed()
+        captured = self._frames.latest_captured()
+        if captured is None:
+            raise CaptureDeviceNotReady(
+                f"{self.config.source_type} capture has no frame available yet"
+            )
+        return captured
+
+    def wait_for_next_frame(self, after_seq: int, timeout: float) -> CapturedFrame | None:
+        self._raise_if_failed()
+        captured = self._frames.wait_for_next(after_seq, timeout)
+        self._raise_if_failed()
+        return captured
 
     def release(self) -> None:
         self._running = False
@@ -332,6 +345,12 @@ class _ThreadedSessionCaptureDevice(CaptureDeviceInterface):
             self._thread = None
         self.backend.release()
 
+    def _raise_if_failed(self) -> None:
+        if self._last_error is not None and not self._running:
+            raise CaptureDeviceReadFailed(
+                f"{self.config.source_type} capture reader failed"
+            ) from self._last_error
+
     def _capture_loop(self) -> None:
         session = self.backend.create_session(self.config, self.locator)
         interval = 1.0 / self.config.fps if self.config.fps > 0 else 1.0 / 30.0
@@ -350,16 +369,15 @@ class _ThreadedSessionCaptureDevice(CaptureDeviceInterface):
                 try:
                     frame = session.latest_frame()
                     transformed = self._transformer.transform(frame, self.config.transform)
-                    with self._lock:
-                        self._latest_frame = transformed.copy()
+                    # session は毎回新しい配列を返すため、複製せずに slot へ格納する。
+                    self._frames.write(transformed, copy=False)
                     consecutive_failures = 0
                     resolve_deadline = None
                 except Exception as exc:
                     consecutive_failures += 1
                     self._last_error = exc
                     if consecutive_failures >= 3:
-                        with self._lock:
-                            self._latest_frame = None
+                        self._frames.clear()
                         resolve_deadline = resolve_deadline or time.monotonic() + 10.0
                         if time.monotonic() >= resolve_deadline:
                             self.logger.technical(
@@ -16,8 +16,21 @@ from .exceptions import (
     TemplateMatchingError,
     ThresholdNotMetError,
 )
-from .ocr_engine import OCRProcessor, OCRResult
+from .glyph_recognizer import GlyphDigitRecognizer
+from .ocr_engine import (
+    FallbackOCRBackend,
+    OCRBackend,
+    OCRCacheStats,
+    OCRProcessor,
+    OCRResult,
+    OCRResultCache,
+    OCRWarmup,
+    OCRWarmupReport,
+)
+from .ocr_service import OCRService
+from .ocr_worker import OCRWorkerProcess, OCRWorkerProcessor
 from .processor import ImageProcessor
+from .template_bank import TemplateBank
 from .template_matcher import MatchResult, contains_template, find_template
 from .utils import ImagePreprocessor
 
@@ -28,9 +41,20 @@ __all__ = [
     "find_template",
     "contains_template",
     "MatchResult",
+    "TemplateBank",
     # OCR関連
+    "OCRBackend",
     "OCRProcessor",
+    "GlyphDigitRecognizer",
+    "FallbackOCRBackend",
     "OCRResult",
+    "OCRResultCache",
+    "OCRCacheStats",
+    "OCRService",
+    "OCRWarmup",
+    "OCRWarmupReport",
+    "OCRWorkerProcess",
+    "OCRWorkerProcessor",
     # ユーティリティ
     "ImagePreprocessor",
     # 例外クラス
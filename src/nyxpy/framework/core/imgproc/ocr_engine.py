@@ -1,13 +1,23 @@
 """PaddleOCR を使った OCR processor。"""
 
+import hashlib
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from collections.abc import Callable, Sequence
 from dataclasses import dataclass
 from threading import Lock
 from typing import ClassVar
 
 import cv2
+import numpy as np
 
 from .exceptions import InvalidImageError, OCREngineNotFoundError, OCRProcessingError
 
+# warm-up の試行推論に使う画像。
+_WARMUP_IMAGE = np.zeros((64, 200, 3), dtype=np.uint8)
+
 
 @dataclass
 class OCRResult:
@@ -17,18 +27,231 @@ class OCRResult:
     confidence: float
 
 
-class OCRProcessor:
+@dataclass(frozen=True)
+class OCRCacheStats:
+    """OCR 結果 cache の利用状況。"""
+
+    hits: int
+    misses: int
+    size: int
+    max_entries: int
+
+
+class OCRResultCache:
+    """画像内容の hash をキーに OCR 結果を保持する LRU cache。
+
+    キーは画像の shape・dtype・画素 bytes から作る hash で、同じ内容の画像であれば
+    別の配列でも同じキーになります。画素が 1 つでも異なる画像は別の結果として扱います。
+    """
+
+    def __init__(self, max_entries: int = 256) -> None:
+        """保持件数の上限を設定します。
+
+        Args:
+            max_entries: 保持する結果の最大件数。超えた場合は最も古く使った結果を破棄します。
+
+        """
+        if max_entries < 1:
+            raise ValueError("max_entries must be greater than or equal to 1")
+        self.max_entries = max_entries
+        self._entries: OrderedDict[bytes, tuple[OCRResult, ...]] = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self._lock = Lock()
+
+    @staticmethod
+    def key_for(image: cv2.typing.MatLike) -> bytes:
+        """画像内容から cache キーを作ります。"""
+        array = np.ascontiguousarray(image)
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(f"{array.shape}:{array.dtype.str}".encode())
+        digest.update(array.data)
+        return digest.digest()
+
+    def get(self, key: bytes) -> list[OCRResult] | None:
+        """キーに対応する結果を返します。未登録の場合は `None` です。"""
+        with self._lock:
+            results = self._entries.get(key)
+            if results is None:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return list(results)
+
+    def put(self, key: bytes, results: list[OCRResult]) -> None:
+        """結果を登録します。上限を超えた場合は最も古く使った結果を破棄します。"""
+        with self._lock:
+            self._entries[key] = tuple(results)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """保持中の結果と hit/miss 数を破棄します。"""
+        with self._lock:
+            self._entries.clear()
+            self._hits = 0
+            self._misses = 0
+
+    def stats(self) -> OCRCacheStats:
+        """現在の hit/miss 数と保持件数を返します。"""
+        with self._lock:
+            return OCRCacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                size=len(self._entries),
+                max_entries=self.max_entries,
+            )
+
+
+@dataclass(frozen=True)
+class OCRWarmupReport:
+    """OCR エンジンの warm-up 結果。"""
+
+    language: str
+    elapsed_sec: float
+    error: BaseException | None = None
+
+    @property
+    def succeeded(self) -> bool:
+        """エンジンのロードと試行推論に成功したか。"""
+        return self.error is None
+
+
+class OCRWarmup:
+    """バックグラウンド thread で実行中の OCR warm-up の handle。
+
+    `OCRProcessor.warm_up()` が返します。thread はモデルのロードと 1 回の試行推論を行い、
+    終了すると `report` に所要時間を記録します。warm-up の完了を待たずに
+    `OCRProcessor.get_instance()` を呼んだ場合は、同じロードの完了を待ってから
+    同じインスタンスを受け取ります。
+    """
+
+    def __init__(self, language: str, load: Callable[[], "OCRProcessor"]) -> None:
+        """Warm-up thread を起動します。
+
+        Args:
+            language: warm-up する認識言語。
+            load: OCR processor を取得する関数。
+
+        """
+        self.language = language
+        self._load = load
+        self._report: OCRWarmupReport | None = None
+        self._callbacks: list[Callable[[OCRWarmupReport], None]] = []
+        self._lock = Lock()
+        self._done = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run,
+            name=f"nyx-ocr-warmup-{language}",
+            daemon=True,
+        )
+        self._thread.start()
+
+    @property
+    def report(self) -> OCRWarmupReport | None:
+        """Warm-up の結果。実行中は `None`。"""
+        return self._report
+
+    def done(self) -> bool:
+        """Warm-up が終了しているかを返します。"""
+        return self._done.is_set()
+
+    def wait(self, timeout: float | None = None) -> OCRWarmupReport | None:
+        """Warm-up の終了を待機します。
+
+        Args:
+            timeout: 最大待機秒数。`None` の場合は終了まで待機します。
+
+        Returns:
+            warm-up の結果。時間内に終了しなかった場合は `None`。
+
+        """
+        self._done.wait(timeout)
+        return self._report
+
+    def add_done_callback(self, callback: Callable[[OCRWarmupReport], None]) -> None:
+        """Warm-up 終了時に結果を受け取る callback を登録します。
+
+        終了済みの場合は呼び出し元 thread ですぐに呼び出します。未終了の場合は
+        warm-up thread から呼び出します。
+        """
+        with self._lock:
+            if self._report is None:
+                self._callbacks.append(callback)
+                return
+            report = self._report
+        callback(report)
+
+    def _run(self) -> None:
+        started = time.perf_counter()
+        error: BaseException | None = None
+        try:
+            processor = self._load()
+            # 初回推論で遅延初期化される predictor も含めて温めるため、空画像を 1 回認識する。
+            processor.recognize_text(_WARMUP_IMAGE, use_cache=False)
+        except Exception as exc:
+            error = exc
+        report = OCRWarmupReport(self.language, time.perf_counter() - started, error)
+        with self._lock:
+            self._report = report
+            callbacks, self._callbacks = self._callbacks, []
+        try:
+            for callback in callbacks:
+                callback(report)
+        finally:
+            # wait() から戻った時点で callback (timing の記録など) が済んでいるようにする。
+            self._done.set()
+
+
+class OCRBackend(ABC):
+    """テキスト認識 backend の共通 interface。
+
+    `recognize_text()` だけを実装すれば、最良テキストの取得や数字抽出は共通実装を使えます。
+    """
+
+    @abstractmethod
+    def recognize_text(self, image: cv2.typing.MatLike) -> list[OCRResult]:
+        """テキスト認識を実行し、認識結果のリストを返します。"""
+
+    def recognize_batch(self, images: Sequence[cv2.typing.MatLike]) -> list[list[OCRResult]]:
+        """複数画像のテキスト認識を実行します。既定では 1 枚ずつ認識します。"""
+        return [self.recognize_text(image) for image in images]
+
+    def get_best_text(self, image: cv2.typing.MatLike) -> str:
+        """最も信頼度の高いテキストを返します。見つからない場合は空文字列です。"""
+        return _best_text(self.recognize_text(image))
+
+    def extract_digits(self, image: cv2.typing.MatLike) -> str:
+        """最も信頼度の高いテキストから数字だけを抽出して返します。"""
+        return _digits_only(self.get_best_text(image))
+
+
+class OCRProcessor(OCRBackend):
     """PaddleOCR を使う OCR 処理クラス。
 
     通常のインスタンス生成 (``OCRProcessor(language)``) に加え、
     ``get_instance(language)`` で言語ごとにキャッシュされた
     シングルトンインスタンスを取得できる。
     PaddleOCR のモデルロード・初回推論コストを複数箇所で共有したい場合は
-    ``get_instance`` の利用を推奨する。
+    ``get_instance`` の利用を推奨する。``warm_up(language)`` を使うと、
+    ``get_instance`` と同じインスタンスのロードをバックグラウンド thread で先に開始できる。
+    PaddleOCR 自体は最初のインスタンス生成時に import する。
+    ``use_worker_process(True)`` を呼ぶと、``get_instance`` は推論を別 process で実行する
+    ``OCRWorkerProcessor`` を返すようになる。
+
+    認識結果は画像内容の hash をキーに ``cache_size`` 件まで保持し、
+    同じ内容の画像では PaddleOCR の推論を省略する。``cache_size=0`` で無効化できる。
     """
 
     _instances: ClassVar[dict[str, "OCRProcessor"]] = {}
+    _warmups: ClassVar[dict[str, OCRWarmup]] = {}
+    _worker_process: ClassVar[bool] = False
     _lock: ClassVar[Lock] = Lock()
+    # モデル構築は数秒かかるため、``_lock`` ではなく言語ごとの lock で直列化する。
+    # ``warm_up`` や別言語の ``get_instance`` がロード完了を待たないようにするため。
+    _init_locks: ClassVar[dict[str, Lock]] = {}
 
     @classmethod
     def get_instance(cls, language: str = "ja") -> "OCRProcessor":
@@ -44,30 +267,100 @@ class OCRProcessor:
             キャッシュ済みの `OCRProcessor`。
 
         """
-        if language not in cls._instances:
-            with cls._lock:
-                # ダブルチェックロッキング
-                if language not in cls._instances:
-                    cls._instances[language] = cls(language)
-        return cls._instances[language]
+        instance = cls._instances.get(language)
+        if instance is not None:
+            return instance
+        with cls._lock:
+            init_lock = cls._init_locks.setdefault(language, Lock())
+        with init_lock:
+            # ダブルチェックロッキング
+            instance = cls._instances.get(language)
+            if instance is None:
+                instance = cls._create_shared_instance(language)
+                with cls._lock:
+                    cls._instances[language] = instance
+        return instance
+
+    @classmethod
+    def use_worker_process(cls, enabled: bool = True) -> None:
+        """``get_instance`` が返すインスタンスの推論を別 process で実行するかを切り替える。
+
+        切り替えた場合はキャッシュ済みのインスタンスを ``close()`` して破棄し、次の
+        ``get_instance`` で新しい方式のインスタンスを作る。同じ設定の再指定では何もしないため、
+        worker process は実行をまたいで再利用される。
+
+        Args:
+            enabled: 別 process の worker で推論するか。
+
+        """
+        with cls._lock:
+            if OCRProcessor._worker_process == enabled:
+                return
+            OCRProcessor._worker_process = enabled
+            instances = list(cls._instances.values())
+            cls._instances.clear()
+            cls._warmups.clear()
+        for instance in instances:
+            instance.close()
+
+    @classmethod
+    def _create_shared_instance(cls, language: str) -> "OCRProcessor":
+        if OCRProcessor._worker_process:
+            from .ocr_worker import OCRWorkerProcessor
+
+            return OCRWorkerProcessor(language)
+        return cls(language)
+
+    @classmethod
+    def warm_up(cls, language: str = "ja") -> OCRWarmup:
+        """``get_instance(language)`` のロードと試行推論をバックグラウンドで開始する。
+
+        同じ ``language`` に対する warm-up は 1 回だけ実行し、実行中または成功済みの
+        handle を返す。前回の warm-up が失敗していた場合だけ再実行する。
+
+        Args:
+            language: 認識言語。`"ja"` または `"en"`。
+
+        Returns:
+            warm-up の完了待ちと所要時間の取得に使う handle。
+
+        """
+        with cls._lock:
+            warmup = cls._warmups.get(language)
+            if warmup is not None and (warmup.report is None or warmup.report.succeeded):
+                return warmup
+            warmup = OCRWarmup(language, lambda: cls.get_instance(language))
+            cls._warmups[language] = warmup
+            return warmup
 
     @classmethod
     def clear_cache(cls) -> None:
         """キャッシュを全クリアする (テスト用)。"""
         with cls._lock:
+            instances = list(cls._instances.values())
             cls._instances.clear()
+            cls._warmups.clear()
+        for instance in instances:
+            instance.close()
 
-    def __init__(self, language: str = "ja"):
+    def __init__(self, language: str = "ja", cache_size: int = 256):
         """OCR 処理クラスを初期化します。
 
         Args:
             language: 認識言語。`"ja"` または `"en"`。
+            cache_size: 認識結果 cache の最大件数。0 の場合は cache を使いません。
 
         """
         self.language = language
+        self.cache = OCRResultCache(cache_size) if cache_size > 0 else None
         self._ocr_engine = None
+        # PaddleOCR の predictor は thread safe ではないため、推論呼び出しを直列化する。
+        self._engine_lock = Lock()
         self._init_engine()
 
+    def close(self) -> None:
+        """保持しているリソースを解放します。同じ process で推論する場合は何もしません。"""
+
     def _init_engine(self):
         """OCRエンジンの初期化"""
         try:
@@ -92,72 +385,203 @@ class OCRProcessor:
         except Exception as e:
             raise OCREngineNotFoundError(f"PaddleOCRの初期化に失敗しました: {e}")
 
-    def recognize_text(self, image: cv2.typing.MatLike) -> list[OCRResult]:
+    def recognize_text(
+        self,
+        image: cv2.typing.MatLike,
+        *,
+        use_cache: bool = True,
+    ) -> list[OCRResult]:
         """テキスト認識を実行します。
 
         Args:
             image: 認識対象画像。
+            use_cache: 認識結果 cache を参照・更新するか。
 
         Returns:
             認識結果のリスト。
 
         """
-        if image is None or image.size == 0:
-            raise InvalidImageError("OCR image is None or empty")
+        return self.recognize_batch([image], use_cache=use_cache)[0]
+
+    def recognize_batch(
+        self,
+        images: Sequence[cv2.typing.MatLike],
+        *,
+        use_cache: bool = True,
+    ) -> list[list[OCRResult]]:
+        """複数画像のテキスト認識を 1 回の推論呼び出しで実行します。
+
+        cache に結果がある画像は推論から除き、残りの画像だけをまとめて推論します。
+
+        Args:
+            images: 認識対象画像のリスト。
+            use_cache: 認識結果 cache を参照・更新するか。
+
+        Returns:
+            `images` と同じ順序で並べた、画像ごとの認識結果のリスト。
+
+        """
+        if not images:
+            return []
+        for image in images:
+            if image is None or image.size == 0:
+                raise InvalidImageError("OCR image is None or empty")
+
+        cache = self.cache if use_cache else None
+        if cache is None:
+            return self._predict(images)
+        keys = [cache.key_for(image) for image in images]
+        results = [cache.get(key) for key in keys]
+        missing = [index for index, result in enumerate(results) if result is None]
+        if missing:
+            predicted = self._predict([images[index] for index in missing])
+            for index, result in zip(missing, predicted, strict=True):
+                cache.put(keys[index], result)
+                results[index] = result
+        return [result for result in results if result is not None]
+
+    def _predict(self, images: Sequence[cv2.typing.MatLike]) -> list[list[OCRResult]]:
         if self._ocr_engine is None:
             raise OCREngineNotFoundError("PaddleOCR is not initialized")
 
         try:
-            # 呼び出し時にも向き分類を明示的に無効化する
-            # (OCR.yaml デフォルトが True のため、コンストラクタ設定だけでは
-            # predict() のキーワード引数で上書きされる可能性があるため)
-            results = self._ocr_engine.predict(
-                image,
-                use_doc_orientation_classify=False,
-                use_doc_unwarping=False,
-                use_textline_orientation=False,
+            with self._engine_lock:
+                # 呼び出し時にも向き分類を明示的に無効化する
+                # (OCR.yaml デフォルトが True のため、コンストラクタ設定だけでは
+                # predict() のキーワード引数で上書きされる可能性があるため)
+                results = self._ocr_engine.predict(
+                    list(images) if len(images) > 1 else images[0],
+                    use_doc_orientation_classify=False,
+                    use_doc_unwarping=False,
+                    use_textline_orientation=False,
+                )
+            results = list(results or [])
+        except Exception as e:
+            raise OCRProcessingError(f"OCR処理中にエラーが発生しました: {e}")
+
+        if len(images) == 1:
+            # 1 枚の推論では結果 item を全て同じ画像の認識結果として扱う。
+            return [[result for item in results for result in _parse_prediction(item)]]
+        if len(results) != len(images):
+            raise OCRProcessingError(
+                f"OCR batch returned {len(results)} results for {len(images)} images"
             )
+        return [_parse_prediction(item) for item in results]
 
-            ocr_results = []
-            if results:
-                for item in results:
-                    rec_texts = item.get("rec_texts", [])
-                    rec_scores = item.get("rec_scores", [])
-                    for text, score in zip(rec_texts, rec_scores):
-                        ocr_results.append(OCRResult(text=text, confidence=score))
+    def recognize_regions(
+        self,
+        image: cv2.typing.MatLike,
+        regions: Sequence[tuple[int, int, int, int]],
+        *,
+        use_cache: bool = True,
+    ) -> list[list[OCRResult]]:
+        """1 枚の画像の複数領域を切り出し、まとめてテキスト認識します。
 
-            return ocr_results
+        Args:
+            image: 認識対象画像。
+            regions: 認識領域 `(x, y, width, height)` のリスト。
+            use_cache: 認識結果 cache を参照・更新するか。
 
-        except Exception as e:
-            raise OCRProcessingError(f"OCR処理中にエラーが発生しました: {e}")
+        Returns:
+            `regions` と同じ順序で並べた、領域ごとの認識結果のリスト。
 
-    def get_best_text(self, image: cv2.typing.MatLike) -> str:
+        """
+        if image is None or image.size == 0:
+            raise InvalidImageError("OCR image is None or empty")
+        return self.recognize_batch(
+            [image[y : y + h, x : x + w] for x, y, w, h in regions],
+            use_cache=use_cache,
+        )
+
+    def get_best_text(self, image: cv2.typing.MatLike, *, use_cache: bool = True) -> str:
         """最も信頼度の高いテキストを取得します。
 
         Args:
             image: 認識対象画像。
+            use_cache: 認識結果 cache を参照・更新するか。
 
         Returns:
             最も信頼度の高いテキスト。見つからない場合は空文字列。
 
         """
-        results = self.recognize_text(image)
-        if results:
-            best_result = max(results, key=lambda r: r.confidence)
-            return best_result.text
-        return ""
+        return _best_text(self.recognize_text(image, use_cache=use_cache))
 
-    def extract_digits(self, image: cv2.typing.MatLike) -> str:
+    def extract_digits(self, image: cv2.typing.MatLike, *, use_cache: bool = True) -> str:
         """画像から数字のみを認識して返します。
 
         Args:
             image: 認識対象画像。
+            use_cache: 認識結果 cache を参照・更新するか。
 
         Returns:
             認識された数字文字列。
 
         """
-        text = self.get_best_text(image)
-        # 数字のみを抽出
-        digits = "".join(filter(str.isdigit, text))
-        return digits
+        return _digits_only(self.get_best_text(image, use_cache=use_cache))
+
+
+class FallbackOCRBackend(OCRBackend):
+    """軽量 backend の結果が低信頼度の場合だけ別 backend で認識し直します。
+
+    `GlyphDigitRecognizer` のような高速な backend を先に使い、最良結果の信頼度が
+    `min_confidence` 未満、または結果が空の場合に PaddleOCR などの fallback を使います。
+    fallback を省略した場合は、最初に必要になった時点で
+    `OCRProcessor.get_instance(fallback_language)` を取得します。
+    """
+
+    def __init__(
+        self,
+        primary: OCRBackend,
+        fallback: OCRBackend | None = None,
+        *,
+        min_confidence: float = 0.8,
+        fallback_language: str = "en",
+    ) -> None:
+        """Backend と切り替えの閾値を設定します。
+
+        Args:
+            primary: 先に使う backend。
+            fallback: 低信頼度の場合に使う backend。`None` の場合は PaddleOCR を遅延取得します。
+            min_confidence: `primary` の結果を採用する最小信頼度。
+            fallback_language: `fallback` を省略した場合の PaddleOCR の認識言語。
+
+        """
+        self.primary = primary
+        self.min_confidence = min_confidence
+        self.fallback_language = fallback_language
+        self.fallback_count = 0
+        self._fallback = fallback
+
+    def recognize_text(self, image: cv2.typing.MatLike) -> list[OCRResult]:
+        """`primary` で認識し、低信頼度の場合は fallback の結果を返します。"""
+        results = self.primary.recognize_text(image)
+        if results and max(result.confidence for result in results) >= self.min_confidence:
+            return results
+        self.fallback_count += 1
+        return self._get_fallback().recognize_text(image)
+
+    def _get_fallback(self) -> OCRBackend:
+        if self._fallback is None:
+            self._fallback = OCRProcessor.get_instance(self.fallback_language)
+        return self._fallback
+
+
+def _best_text(results: list[OCRResult]) -> str:
+    if results:
+        best_result = max(results, key=lambda r: r.confidence)
+        return best_result.text
+    return ""
+
+
+def _digits_only(text: str) -> str:
+    # 数字のみを抽出
+    return "".join(filter(str.isdigit, text))
+
+
+def _parse_prediction(item) -> list[OCRResult]:
+    rec_texts = item.get("rec_texts", [])
+    rec_scores = item.get("rec_scores", [])
+    return [
+        OCRResult(text=text, confidence=score)
+        for text, score in zip(rec_texts, rec_scores, strict=False)
+    ]
@@ -0,0 +1,135 @@
+"""OCR を worker thread で実行する service。"""
+
+from __future__ import annotations
+
+import threading
+from collections.abc import Sequence
+from concurrent.futures import Future, ThreadPoolExecutor
+
+import cv2
+
+from .ocr_engine import OCRProcessor, OCRResult
+
+
+class OCRService:
+    """`OCRProcessor` の推論を専用 worker thread で実行します。
+
+    `submit()` / `submit_regions()` / `submit_batch()` は `Future` を返すため、
+    マクロ thread は OCR の完了を待たずにコントローラー操作を続けられます。
+    worker は 1 本だけなので、内部の OCR エンジンへの呼び出しは投入順に直列化されます。
+    複数の ROI は 1 回の推論呼び出しにまとめて渡します。
+
+    使い終わったら `close()` または `with` 文で worker を停止します。
+    """
+
+    def __init__(self, processor: OCRProcessor | None = None, *, language: str = "ja") -> None:
+        """OCR processor を受け取り、worker は初回投入時に起動します。
+
+        Args:
+            processor: 推論に使う OCR processor。`None` の場合は
+                `OCRProcessor.get_instance(language)` を初回投入時に取得します。
+            language: `processor` を省略した場合の認識言語。
+
+        """
+        self._processor = processor
+        self.language = processor.language if processor is not None else language
+        self._executor: ThreadPoolExecutor | None = None
+        self._lock = threading.Lock()
+        self._closed = False
+
+    def __enter__(self) -> OCRService:
+        """`with` 文の開始時に service 自身を返します。"""
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        """`with` 文の終了時に worker を停止します。"""
+        self.close()
+
+    def submit(self, image: cv2.typing.MatLike) -> Future[list[OCRResult]]:
+        """1 枚の画像の認識を worker へ投入します。
+
+        Args:
+            image: 認識対象画像。
+
+        Returns:
+            認識結果のリストを返す `Future`。
+
+        """
+        image = image.copy()
+        return self._submit(lambda processor: processor.recognize_text(image))
+
+    def submit_regions(
+        self,
+        image: cv2.typing.MatLike,
+        regions: Sequence[tuple[int, int, int, int]],
+    ) -> Future[list[list[OCRResult]]]:
+        """1 枚の画像の複数領域の認識を worker へ投入します。
+
+        Args:
+            image: 認識対象画像。
+            regions: 認識領域 `(x, y, width, height)` のリスト。
+
+        Returns:
+            `regions` と同じ順序の認識結果のリストを返す `Future`。
+
+        """
+        # 呼び出し側が投入後に画像を書き換えても結果が変わらないよう、必要な領域だけ複製する。
+        crops = [image[y : y + h, x : x + w].copy() for x, y, w, h in regions]
+        return self._submit(lambda processor: processor.recognize_batch(crops))
+
+    def submit_batch(
+        self,
+        images: Sequence[cv2.typing.MatLike],
+    ) -> Future[list[list[OCRResult]]]:
+        """複数画像の認識を 1 回の推論呼び出しとして worker へ投入します。
+
+        Args:
+            images: 認識対象画像のリスト。
+
+        Returns:
+            `images` と同じ順序の認識結果のリストを返す `Future`。
+
+        """
+        copies = [image.copy() for image in images]
+        return self._submit(lambda processor: processor.recognize_batch(copies))
+
+    def recognize_regions(
+        self,
+        image: cv2.typing.MatLike,
+        regions: Sequence[tuple[int, int, int, int]],
+        timeout: float | None = None,
+    ) -> list[list[OCRResult]]:
+        """複数領域を worker でまとめて認識し、完了まで待機します。
+
+        Args:
+            image: 認識対象画像。
+            regions: 認識領域 `(x, y, width, height)` のリスト。
+            timeout: 最大待機秒数。`None` の場合は完了まで待機します。
+
+        Returns:
+            `regions` と同じ順序の認識結果のリスト。
+
+        """
+        return self.submit_regions(image, regions).result(timeout)
+
+    def close(self) -> None:
+        """Worker を停止します。投入済みの認識は完了まで待機します。"""
+        with self._lock:
+            self._closed = True
+            executor = self._executor
+            self._executor = None
+        if executor is not None:
+            executor.shutdown(wait=True)
+
+    def _submit(self, task) -> Future:
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("OCRService is closed")
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="OCRService")
+            return self._executor.submit(lambda: task(self._get_processor()))
+
+    def _get_processor(self) -> OCRProcessor:
+        if self._processor is None:
+            self._processor = OCRProcessor.get_instance(self.language)
+        return self._processor
@@ -0,0 +1,302 @@
+"""OCR エンジンを別 process で実行する worker。"""
+
+from __future__ import annotations
+
+import multiprocessing
+import threading
+from collections.abc import Callable, Sequence
+from multiprocessing.connection import Connection
+from multiprocessing.shared_memory import SharedMemory
+
+import cv2
+import numpy as np
+
+from .exceptions import InvalidImageError, OCREngineNotFoundError, OCRProcessingError
+from .ocr_engine import OCRBackend, OCRProcessor, OCRResult
+
+type OCREngineFactory = Callable[[str], OCRBackend]
+
+# shared memory 上の画像の先頭位置をそろえる境界。
+_ALIGNMENT = 64
+_INITIAL_SHARED_MEMORY_SIZE = 4 * 1024 * 1024
+_REMOTE_ERRORS: dict[str, type[Exception]] = {
+    "InvalidImageError": InvalidImageError,
+    "OCREngineNotFoundError": OCREngineNotFoundError,
+}
+
+
+class OCRWorkerProcess:
+    """OCR エンジンを持つ子 process と、画像を渡す shared memory を管理します。
+
+    子 process は `spawn` で起動し、起動時に `engine_factory(language)` で OCR エンジンを
+    作ります。認識要求では画像を shared memory へ書き込み、pipe では画像の位置と形状だけを
+    送ります。子 process が終了していた場合は次の要求で自動的に起動し直します。
+
+    `restart()` で子 process を作り直すと、PaddlePaddle が確保したメモリを解放できます。
+    """
+
+    def __init__(
+        self,
+        language: str = "ja",
+        *,
+        engine_factory: OCREngineFactory | None = None,
+        start_timeout_sec: float = 120.0,
+        request_timeout_sec: float = 60.0,
+    ) -> None:
+        """Worker の設定を保持します。子 process は `start()` または初回要求で起動します。
+
+        Args:
+            language: 認識言語。`"ja"` または `"en"`。
+            engine_factory: 子 process で OCR エンジンを作る関数。`spawn` で渡すため
+                module の top-level で定義した関数を指定します。`None` の場合は
+                cache なしの `OCRProcessor` を使います。
+            start_timeout_sec: 子 process の起動とエンジン初期化を待つ最大秒数。
+            request_timeout_sec: 1 回の認識要求を待つ最大秒数。
+
+        """
+        self.language = language
+        self._engine_factory = engine_factory or _create_paddle_engine
+        self._start_timeout_sec = start_timeout_sec
+        self._request_timeout_sec = request_timeout_sec
+        self._process: multiprocessing.process.BaseProcess | None = None
+        self._connection: Connection | None = None
+        self._shared_memory: SharedMemory | None = None
+        self._lock = threading.Lock()
+
+    @property
+    def pid(self) -> int | None:
+        """子 process の PID。起動していない場合は `None`。"""
+        process = self._process
+        return process.pid if process is not None and process.is_alive() else None
+
+    def is_alive(self) -> bool:
+        """子 process が動作しているかを返します。"""
+        return self.pid is not None
+
+    def start(self) -> None:
+        """子 process を起動し、OCR エンジンの初期化完了まで待機します。
+
+        Raises:
+            OCREngineNotFoundError: 子 process でエンジンを初期化できなかった場合。
+            OCRProcessingError: 時間内に起動しなかった場合。
+
+        """
+        with self._lock:
+            self._ensure_started()
+
+    def predict(self, images: Sequence[cv2.typing.MatLike]) -> list[list[OCRResult]]:
+        """複数画像を子 process でまとめて認識します。
+
+        Args:
+            images: 認識対象画像のリスト。
+
+        Returns:
+            `images` と同じ順序で並べた、画像ごとの認識結果のリスト。
+
+        Raises:
+            OCRProcessingError: 認識に失敗した場合、または子 process が応答しない場合。
+
+        """
+        if not images:
+            return []
+        with self._lock:
+            self._ensure_started()
+            specs = self._write_images(images)
+            assert self._connection is not None and self._shared_memory is not None
+            try:
+                self._connection.send(("predict", self._shared_memory.name, specs))
+                reply = self._receive(self._request_timeout_sec)
+            except OCRProcessingError:
+                self._stop(terminate=True)
+                raise
+        if reply[0] == "error":
+            raise _remote_error(reply[1], reply[2])
+        return reply[1]
+
+    def restart(self) -> None:
+        """子 process を停止してから起動し直します。"""
+        with self._lock:
+            self._stop(terminate=False)
+            self._ensure_started()
+
+    def close(self) -> None:
+        """子 process を停止し、shared memory を解放します。"""
+        with self._lock:
+            self._stop(terminate=False)
+            if self._shared_memory is not None:
+                self._shared_memory.close()
+                self._shared_memory.unlink()
+                self._shared_memory = None
+
+    def _ensure_started(self) -> None:
+        if self._process is not None and self._process.is_alive():
+            return
+        self._stop(terminate=True)
+        context = multiprocessing.get_context("spawn")
+        parent_connection, child_connection = context.Pipe()
+        process = context.Process(
+            target=_worker_main,
+            args=(child_connection, self.language, self._engine_factory),
+            name=f"nyx-ocr-worker-{self.language}",
+            daemon=True,
+        )
+        process.start()
+        child_connection.close()
+        self._process = process
+        self._connection = parent_connection
+        try:
+            reply = self._receive(self._start_timeout_sec)
+        except OCRProcessingError:
+            self._stop(terminate=True)
+            raise
+        if reply[0] == "error":
+            self._stop(terminate=True)
+            raise OCREngineNotFoundError(f"OCR worker failed to start: {reply[2]}")
+
+    def _receive(self, timeout: float) -> tuple:
+        assert self._connection is not None
+        try:
+            if not self._connection.poll(timeout):
+                raise OCRProcessingError(f"OCR worker did not respond within {timeout} seconds")
+            return self._connection.recv()
+        except (EOFError, OSError) as exc:
+            raise OCRProcessingError(f"OCR worker process exited: {exc}")
+
+    def _stop(self, *, terminate: bool) -> None:
+        process, connection = self._process, self._connection
+        self._process = None
+        self._connection = None
+        if connection is not None:
+            if not terminate:
+                try:
+                    connection.send(("stop",))
+                except (BrokenPipeError, OSError):
+                    pass
+            connection.close()
+        if process is not None:
+            process.join(0 if terminate else 5.0)
+            if process.is_alive():
+                process.terminate()
+                process.join(5.0)
+
+    def _write_images(
+        self, images: Sequence[cv2.typing.MatLike]
+    ) -> list[tuple[int, tuple[int, ...], str]]:
+        specs: list[tuple[int, tuple[int, ...], str]] = []
+        offset = 0
+        for image in images:
+            if image is None or image.size == 0:
+                raise InvalidImageError("OCR image is None or empty")
+            specs.append((offset, image.shape, image.dtype.str))
+            offset += -(-image.nbytes // _ALIGNMENT) * _ALIGNMENT
+        buffer = self._reserve(offset)
+        for image, (start, shape, dtype) in zip(images, specs, strict=True):
+            # ROI の view も含め、中間の連続配列を作らずに shared memory へ直接書き込む。
+            np.ndarray(shape, dtype=dtype, buffer=buffer, offset=start)[...] = image
+        return specs
+
+    def _reserve(self, size: int) -> memoryview:
+        segment = self._shared_memory
+        if segment is None or segment.size < size:
+            if segment is not None:
+                segment.close()
+                segment.unlink()
+            capacity = _INITIAL_SHARED_MEMORY_SIZE
+            while capacity < size:
+                capacity *= 2
+            segment = SharedMemory(create=True, size=capacity)
+            self._shared_memory = segment
+        buffer = segment.buf
+        if buffer is None:
+            raise OCRProcessingError("OCR shared memory is already closed")
+        return buffer
+
+
+class OCRWorkerProcessor(OCRProcessor):
+    """推論を `OCRWorkerProcess` の子 process で実行する `OCRProcessor`。
+
+    認識結果 cache と API は `OCRProcessor` と同じで、PaddleOCR の推論とメモリだけを
+    子 process へ分離します。GUI や capture thread と同じ interpreter で推論しないため、
+    OCR の負荷が画面更新や入力のタイミングへ影響しにくくなります。
+    """
+
+    def __init__(
+        self,
+        language: str = "ja",
+        cache_size: int = 256,
+        *,
+        worker: OCRWorkerProcess | None = None,
+    ) -> None:
+        """子 process を起動し、OCR エンジンの初期化完了まで待機します。
+
+        Args:
+            language: 認識言語。`"ja"` または `"en"`。
+            cache_size: 認識結果 cache の最大件数。0 の場合は cache を使いません。
+            worker: 推論に使う worker。`None` の場合は `language` の worker を作ります。
+
+        """
+        self.worker = worker or OCRWorkerProcess(language)
+        super().__init__(language, cache_size)
+
+    def _init_engine(self) -> None:
+        self.worker.start()
+
+    def _predict(self, images: Sequence[cv2.typing.MatLike]) -> list[list[OCRResult]]:
+        return self.worker.predict(images)
+
+    def restart_worker(self) -> None:
+        """子 process を起動し直し、推論エンジンが確保したメモリを解放します。"""
+        self.worker.restart()
+
+    def close(self) -> None:
+        """子 process を停止します。"""
+        self.worker.close()
+
+
+def _create_paddle_engine(language: str) -> OCRBackend:
+    return OCRProcessor(language, cache_size=0)
+
+
+def _remote_error(error_type: str, message: str) -> Exception:
+    return _REMOTE_ERRORS.get(error_type, OCRProcessingError)(message)
+
+
+def _worker_main(connection: Connection, language: str, engine_factory: OCREngineFactory) -> None:
+    """子 process の要求処理 loop。"""
+    try:
+        engine = engine_factory(language)
+    except Exception as exc:
+        connection.send(("error", type(exc).__name__, str(exc)))
+        connection.close()
+        return
+    connection.send(("ready",))
+
+    segment: SharedMemory | None = None
+    try:
+        while True:
+            try:
+                message = connection.recv()
+            except EOFError:
+                break
+            if message[0] == "stop":
+                break
+            _kind, name, specs = message
+            if segment is None or segment.name != name:
+                if segment is not None:
+                    segment.close()
+                segment = SharedMemory(name=name)
+            images = [
+                np.ndarray(shape, dtype=dtype, buffer=segment.buf, offset=offset)
+                for offset, shape, dtype in specs
+            ]
+            try:
+                connection.send(("ok", engine.recognize_batch(images)))
+            except Exception as exc:
+                connection.send(("error", type(exc).__name__, str(exc)))
+            finally:
+                # shared memory を閉じる前に view を解放しておく。
+                del images
+    finally:
+        if segment is not None:
+            segment.close()
+        connection.close()
@@ -3,7 +3,8 @@
 import cv2
 
 from .exceptions import InvalidImageError
-from .ocr_engine import OCRProcessor
+from .ocr_engine import OCRBackend, OCRProcessor
+from .template_bank import TemplateBank
 from .template_matcher import MatchResult, contains_template, find_template
 from .utils import ImagePreprocessor
 
@@ -26,6 +27,7 @@ class ImageProcessor:
             raise InvalidImageError("画像が無効です")
         self.image = image
         self.preprocessor = ImagePreprocessor()
+        self._template_source: cv2.typing.MatLike | None = None
 
     def contains_template(
         self,
@@ -50,7 +52,7 @@ class ImageProcessor:
         template_img = template
 
         if preprocess:
-            source_img = self.preprocessor.enhance_for_template_matching(source_img)
+            source_img = self._preprocessed_template_source()
             template_img = self.preprocessor.enhance_for_template_matching(template_img)
 
         return contains_template(source_img, template_img, threshold, method)
@@ -78,16 +80,40 @@ class ImageProcessor:
         template_img = template
 
         if preprocess:
-            source_img = self.preprocessor.enhance_for_template_matching(source_img)
+            source_img = self._preprocessed_template_source()
             template_img = self.preprocessor.enhance_for_template_matching(template_img)
 
         return find_template(source_img, template_img, threshold, method)
 
+    def match_templates(
+        self,
+        bank: TemplateBank,
+        names: list[str] | tuple[str, ...] | None = None,
+    ) -> dict[str, MatchResult]:
+        """`TemplateBank` の登録テンプレートをまとめて照合します。
+
+        Args:
+            bank: 照合するテンプレートを登録した bank。
+            names: 照合するテンプレート名。`None` の場合は全テンプレート。
+
+        Returns:
+            閾値を満たしたテンプレート名から `MatchResult` への dict。
+
+        """
+        return bank.match_all(self.image, names)
+
+    def _preprocessed_template_source(self) -> cv2.typing.MatLike:
+        # 前処理は重いため、同じ画像への複数テンプレート照合では 1 回だけ行う。
+        if self._template_source is None:
+            self._template_source = self.preprocessor.enhance_for_template_matching(self.image)
+        return self._template_source
+
     def get_text(
         self,
         language: str = "ja",
         region: tuple[int, int, int, int] | None = None,
         preprocess: bool = False,
+        backend: OCRBackend | None = None,
     ) -> str:
         """画像からテキストを認識し、最も信頼度の高い文字列を返します。
 
@@ -95,13 +121,14 @@ class ImageProcessor:
             language: 認識言語。`"ja"` または `"en"`。
             region: 認識領域 `(x, y, width, height)`。指定しない場合は全体。
             preprocess: OCR 用前処理を行うか。
+            backend: 認識に使う OCR backend。`None` の場合は `language` の PaddleOCR を使います。
 
         Returns:
             認識されたテキスト。見つからない場合は空文字列。
 
         """
         # OCRプロセッサーの取得（言語ごとにキャッシュされたシングルトン）
-        ocr = OCRProcessor.get_instance(language)
+        ocr = backend or OCRProcessor.get_instance(language)
 
         # 認識対象画像の決定
         target_image = self.image
@@ -121,6 +148,7 @@ class ImageProcessor:
         language: str = "en",
         region: tuple[int, int, int, int] | None = None,
         preprocess: bool = False,
+        backend: OCRBackend | None = None,
     ) -> str:
         """画像から数字のみを認識して返します。
 
@@ -128,13 +156,15 @@ class ImageProcessor:
             language: 認識言語。`"ja"` または `"en"`。
             region: 認識領域 `(x, y, width, height)`。指定しない場合は全体。
             preprocess: OCR 用前処理を行うか。
+            backend: 認識に使う OCR backend。`GlyphDigitRecognizer` などを指定すると
+                PaddleOCR を読み込まずに認識します。`None` の場合は `language` の PaddleOCR を使います。
 
         Returns:
             認識された数字文字列。
 
         """
         # OCRプロセッサーの取得（言語ごとにキャッシュされたシングルトン）
-        ocr = OCRProcessor.get_instance(language)
+        ocr = backend or OCRProcessor.get_instance(language)
 
         # 認識対象画像の決定
         target_image = self.image
@@ -0,0 +1,234 @@
+"""複数テンプレートを 1 frame に対してまとめて照合する template bank。"""
+
+from __future__ import annotations
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+
+import cv2
+
+from .exceptions import InvalidImageError, TemplateMatchingError
+from .template_matcher import MatchResult, _build_pyramid, _match_pyramid, _validate_images
+from .utils import ImagePreprocessor
+
+
+@dataclass(frozen=True)
+class _RegisteredTemplate:
+    name: str
+    image: cv2.typing.MatLike
+    pyramid: tuple[cv2.typing.MatLike, ...]
+    roi: tuple[int, int, int, int] | None
+    threshold: float
+    method: int
+
+
+class TemplateBank:
+    """登録済みテンプレートを 1 枚の画像へまとめて照合します。
+
+    テンプレートは登録時にグレースケール変換・前処理・縮小版を作成して保持し、
+    `match_all()` では検索対象画像の変換と縮小を 1 回だけ行ってから全テンプレートを
+    照合します。画面状態の判定のように 1 frame で多数のテンプレートを確認する用途向けです。
+
+    `max_workers` に 2 以上を指定すると、OpenCV が GIL を解放する間に複数テンプレートを
+    thread pool で並列に照合します。thread pool を使う場合は `close()` または
+    `with` 文で解放します。
+    """
+
+    def __init__(
+        self,
+        *,
+        grayscale: bool = True,
+        preprocess: bool = False,
+        pyramid_levels: int = 0,
+        candidates: int = 1,
+        max_workers: int | None = None,
+    ) -> None:
+        """照合条件を設定します。
+
+        Args:
+            grayscale: テンプレートと検索対象をグレースケールで照合するか。
+            preprocess: `ImagePreprocessor.enhance_for_template_matching()` を適用するか。
+            pyramid_levels: 縮小画像で候補位置を求めてから原寸で再照合する段数。
+                0 の場合は原寸だけで照合します。1 段ごとに縦横 1/2 に縮小します。
+            candidates: 縮小画像から原寸で再照合する候補数。
+            max_workers: 並列照合に使う thread 数。`None` または 1 の場合は逐次照合します。
+
+        """
+        if pyramid_levels < 0:
+            raise ValueError("pyramid_levels must be greater than or equal to 0")
+        if candidates < 1:
+            raise ValueError("candidates must be greater than or equal to 1")
+        if max_workers is not None and max_workers < 1:
+            raise ValueError("max_workers must be greater than or equal to 1")
+        self.grayscale = grayscale
+        self.preprocess = preprocess
+        self.pyramid_levels = pyramid_levels
+        self.candidates = candidates
+        self._max_workers = max_workers or 1
+        self._templates: dict[str, _RegisteredTemplate] = {}
+        self._executor: ThreadPoolExecutor | None = None
+        self._lock = threading.Lock()
+
+    @property
+    def names(self) -> tuple[str, ...]:
+        """登録順のテンプレート名。"""
+        return tuple(self._templates)
+
+    def __enter__(self) -> TemplateBank:
+        """`with` 文の開始時に bank 自身を返します。"""
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        """`with` 文の終了時に thread pool を停止します。"""
+        self.close()
+
+    def register(
+        self,
+        name: str,
+        template: cv2.typing.MatLike,
+        *,
+        roi: tuple[int, int, int, int] | None = None,
+        threshold: float = 0.8,
+        method: int = cv2.TM_CCOEFF_NORMED,
+    ) -> None:
+        """テンプレートを登録します。同じ名前の登録は置き換えます。
+
+        Args:
+            name: 結果 dict のキーに使うテンプレート名。
+            template: テンプレート画像。
+            roi: 検索対象画像上の探索領域 `(x, y, width, height)`。`None` の場合は全体。
+            threshold: マッチング閾値。範囲は 0.0-1.0。
+            method: マッチング手法。`cv2.TM_*` 定数。
+
+        Raises:
+            InvalidImageError: テンプレートが無効な場合、または `roi` より大きい場合。
+
+        """
+        if template is None or template.size == 0:
+            raise InvalidImageError("Template image is None or empty")
+        if roi is not None:
+            _x, _y, roi_w, roi_h = roi
+            if template.shape[0] > roi_h or template.shape[1] > roi_w:
+                raise InvalidImageError("Template image is larger than search region")
+        image = self._prepare(template)
+        self._templates[name] = _RegisteredTemplate(
+            name=name,
+            image=image,
+            pyramid=_build_pyramid(image, self.pyramid_levels)[1:],
+            roi=roi,
+            threshold=threshold,
+            method=method,
+        )
+
+    def unregister(self, name: str) -> None:
+        """テンプレートの登録を解除します。未登録の名前は無視します。"""
+        self._templates.pop(name, None)
+
+    def match_all(
+        self,
+        source_image: cv2.typing.MatLike,
+        names: list[str] | tuple[str, ...] | None = None,
+    ) -> dict[str, MatchResult]:
+        """登録済みテンプレートを照合し、閾値を満たしたものを返します。
+
+        Args:
+            source_image: 検索対象の画像。
+            names: 照合するテンプレート名。`None` の場合は全テンプレート。
+
+        Returns:
+            テンプレート名から `MatchResult` への dict。閾値未達のテンプレートは含みません。
+            座標は `roi` に関係なく `source_image` 上の座標です。
+
+        Raises:
+            InvalidImageError: 画像が無効な場合、または `roi` が画像外の場合。
+            KeyError: 未登録の名前を `names` に指定した場合。
+            TemplateMatchingError: OpenCV の処理に失敗した場合。
+
+        """
+        if source_image is None or source_image.size == 0:
+            raise InvalidImageError("Source image is None or empty")
+        templates = (
+            list(self._templates.values())
+            if names is None
+            else [self._templates[name] for name in names]
+        )
+        if not templates:
+            return {}
+        source_pyramid = _build_pyramid(
+            self._prepare(source_image),
+            max(len(template.pyramid) for template in templates),
+            min_size=1,
+        )
+
+        executor = self._get_executor() if len(templates) > 1 else None
+        if executor is None:
+            results = [self._match_one(source_pyramid, template) for template in templates]
+        else:
+            results = list(
+                executor.map(lambda template: self._match_one(source_pyramid, template), templates)
+            )
+        return {
+            template.name: result
+            for template, result in zip(templates, results, strict=True)
+            if result is not None
+        }
+
+    def close(self) -> None:
+        """並列照合用の thread pool を停止します。"""
+        with self._lock:
+            executor = self._executor
+            self._executor = None
+        if executor is not None:
+            executor.shutdown(wait=True)
+
+    def _prepare(self, image: cv2.typing.MatLike) -> cv2.typing.MatLike:
+        prepared = image
+        if self.preprocess:
+            prepared = ImagePreprocessor.enhance_for_template_matching(prepared)
+        if self.grayscale and len(prepared.shape) == 3:
+            prepared = cv2.cvtColor(prepared, cv2.COLOR_BGR2GRAY)
+        return prepared
+
+    def _get_executor(self) -> ThreadPoolExecutor | None:
+        if self._max_workers <= 1:
+            return None
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self._max_workers,
+                    thread_name_prefix="TemplateBank",
+                )
+            return self._executor
+
+    def _match_one(
+        self,
+        source_pyramid: tuple[cv2.typing.MatLike, ...],
+        template: _RegisteredTemplate,
+    ) -> MatchResult | None:
+        source = source_pyramid[0]
+        region = template.roi or (0, 0, source.shape[1], source.shape[0])
+        x, y, w, h = region
+        if x < 0 or y < 0 or x + w > source.shape[1] or y + h > source.shape[0]:
+            raise InvalidImageError(f"Search region of {template.name!r} exceeds source image")
+        _validate_images(source[y : y + h, x : x + w], template.image)
+
+        try:
+            confidence, position = _match_pyramid(
+                source_pyramid,
+                (template.image, *template.pyramid),
+                template.method,
+                region,
+                candidates=self.candidates,
+            )
+        except cv2.error as e:
+            raise TemplateMatchingError(f"OpenCV template matching failed: {e}")
+
+        if confidence < template.threshold:
+            return None
+        h, w = template.image.shape[:2]
+        return MatchResult(
+            position=position,
+            confidence=confidence,
+            bounding_box=(position[0], position[1], w, h),
+        )
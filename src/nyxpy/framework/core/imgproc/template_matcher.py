@@ -3,9 +3,13 @@
 from dataclasses import dataclass
 
 import cv2
+import numpy as np
 
 from .exceptions import InvalidImageError, TemplateMatchingError, ThresholdNotMetError
 
+# pyramid 探索で縮小後のテンプレートに必要な最小辺長（px）。
+_MIN_PYRAMID_TEMPLATE_SIZE = 8
+
 
 @dataclass
 class MatchResult:
@@ -21,14 +25,26 @@ def find_template(
     template_image: cv2.typing.MatLike,
     threshold: float = 0.8,
     method: int = cv2.TM_CCOEFF_NORMED,
+    *,
+    pyramid_levels: int = 0,
+    candidates: int = 1,
 ) -> MatchResult:
     """テンプレートマッチングを実行し、最良の一致を返します。
 
+    `pyramid_levels` を指定すると、縦横 1/2 ずつ縮小した画像で候補位置を求め、
+    原寸では候補近傍だけを照合する coarse-to-fine 探索を行います。段数を増やすほど
+    高速になりますが、細かい模様のテンプレートでは縮小時に特徴が失われて誤検出しやすく
+    なります。`candidates` を増やすと原寸で再照合する候補が増え、速度と引き換えに
+    取りこぼしを減らせます。
+
     Args:
         source_image: 検索対象の画像。
         template_image: テンプレート画像。
         threshold: マッチング閾値。範囲は 0.0-1.0。
         method: マッチング手法。`cv2.TM_*` 定数。
+        pyramid_levels: 縮小画像で探索する段数。0 の場合は原寸だけで照合します。
+            1 は 1/2、2 は 1/4 に縮小した画像で候補を探します。
+        candidates: 縮小画像から原寸で再照合する候補数。
 
     Returns:
         マッチング結果。
@@ -37,57 +53,42 @@ def find_template(
         InvalidImageError: 画像データが無効な場合。
         ThresholdNotMetError: 閾値を満たす結果が見つからない場合。
         TemplateMatchingError: OpenCV の処理に失敗した場合。
+        ValueError: `pyramid_levels` が負、または `candidates` が 1 未満の場合。
 
     """
-    if source_image is None or template_image is None:
-        raise InvalidImageError("Source image or template image is None")
-
-    if source_image.size == 0 or template_image.size == 0:
-        raise InvalidImageError("Source image or template image is empty")
-
-    # 画像サイズチェック
-    if (
-        template_image.shape[0] > source_image.shape[0]
-        or template_image.shape[1] > source_image.shape[1]
-    ):
-        raise InvalidImageError("Template image is larger than source image")
+    _validate_images(source_image, template_image)
+    if pyramid_levels < 0:
+        raise ValueError("pyramid_levels must be greater than or equal to 0")
+    if candidates < 1:
+        raise ValueError("candidates must be greater than or equal to 1")
 
     try:
-        # テンプレートマッチング実行
-        result = cv2.matchTemplate(source_image, template_image, method)
-
-        # 最大値または最小値とその位置を取得
-        if method in [cv2.TM_SQDIFF, cv2.TM_SQDIFF_NORMED]:
-            min_val, max_val, min_loc, max_loc = cv2.minMaxLoc(result)
-            match_val = min_val
-            match_loc = min_loc
-            # SQDIFF系は値が小さいほど良いマッチ
-            confidence = (
-                1.0 - match_val if method == cv2.TM_SQDIFF_NORMED else 1.0 / (1.0 + match_val)
-            )
+        if pyramid_levels == 0:
+            # テンプレートマッチング実行
+            result = cv2.matchTemplate(source_image, template_image, method)
+            confidence, match_position = _best_match(result, method)
         else:
-            min_val, max_val, min_loc, max_loc = cv2.minMaxLoc(result)
-            match_val = max_val
-            match_loc = max_loc
-            confidence = match_val
-
-        # 閾値チェック
-        if confidence < threshold:
-            raise ThresholdNotMetError(
-                f"Template matching confidence {confidence:.3f} is below threshold {threshold:.3f}"
+            confidence, match_position = _match_pyramid(
+                _build_pyramid(source_image, pyramid_levels, min_size=1),
+                _build_pyramid(template_image, pyramid_levels),
+                method,
+                (0, 0, source_image.shape[1], source_image.shape[0]),
+                candidates=candidates,
             )
+    except cv2.error as e:
+        raise TemplateMatchingError(f"OpenCV template matching failed: {e}")
 
-        # バウンディングボックス計算
-        h, w = template_image.shape[:2]
-        match_position = (int(match_loc[0]), int(match_loc[1]))
-        bounding_box = (match_position[0], match_position[1], w, h)
-
-        return MatchResult(
-            position=match_position, confidence=confidence, bounding_box=bounding_box
+    # 閾値チェック
+    if confidence < threshold:
+        raise ThresholdNotMetError(
+            f"Template matching confidence {confidence:.3f} is below threshold {threshold:.3f}"
         )
 
-    except cv2.error as e:
-        raise TemplateMatchingError(f"OpenCV template matching failed: {e}")
+    # バウンディングボックス計算
+    h, w = template_image.shape[:2]
+    bounding_box = (match_position[0], match_position[1], w, h)
+
+    return MatchResult(position=match_position, confidence=confidence, bounding_box=bounding_box)
 
 
 def contains_template(
@@ -95,6 +96,9 @@ def contains_template(
     template_image: cv2.typing.MatLike,
     threshold: float = 0.8,
     method: int = cv2.TM_CCOEFF_NORMED,
+    *,
+    pyramid_levels: int = 0,
+    candidates: int = 1,
 ) -> bool:
     """指定されたテンプレートが画像内に含まれるかを判定します。
 
@@ -103,13 +107,150 @@ def contains_template(
         template_image: テンプレート画像。
         threshold: マッチング閾値。範囲は 0.0-1.0。
         method: マッチング手法。`cv2.TM_*` 定数。
+        pyramid_levels: 縮小画像で探索する段数。`find_template()` と同じです。
+        candidates: 縮小画像から原寸で再照合する候補数。`find_template()` と同じです。
 
     Returns:
         テンプレートが含まれている場合は `True`。閾値未達は `False`。
 
     """
     try:
-        find_template(source_image, template_image, threshold, method)
+        find_template(
+            source_image,
+            template_image,
+            threshold,
+            method,
+            pyramid_levels=pyramid_levels,
+            candidates=candidates,
+        )
         return True
     except ThresholdNotMetError:
         return False
+
+
+def _validate_images(
+    source_image: cv2.typing.MatLike,
+    template_image: cv2.typing.MatLike,
+) -> None:
+    if source_image is None or template_image is None:
+        raise InvalidImageError("Source image or template image is None")
+
+    if source_image.size == 0 or template_image.size == 0:
+        raise InvalidImageError("Source image or template image is empty")
+
+    # 画像サイズチェック
+    if (
+        template_image.shape[0] > source_image.shape[0]
+        or template_image.shape[1] > source_image.shape[1]
+    ):
+        raise InvalidImageError("Template image is larger than source image")
+
+
+def _best_match(result: cv2.typing.MatLike, method: int) -> tuple[float, tuple[int, int]]:
+    """`cv2.matchTemplate` の結果から信頼度と最良位置を返します。"""
+    min_val, max_val, min_loc, max_loc = cv2.minMaxLoc(result)
+    if method in [cv2.TM_SQDIFF, cv2.TM_SQDIFF_NORMED]:
+        # SQDIFF系は値が小さいほど良いマッチ
+        confidence = 1.0 - min_val if method == cv2.TM_SQDIFF_NORMED else 1.0 / (1.0 + min_val)
+        match_loc = min_loc
+    else:
+        confidence = max_val
+        match_loc = max_loc
+    return float(confidence), (int(match_loc[0]), int(match_loc[1]))
+
+
+def _build_pyramid(
+    image: cv2.typing.MatLike,
+    levels: int,
+    *,
+    min_size: int = _MIN_PYRAMID_TEMPLATE_SIZE,
+) -> tuple[cv2.typing.MatLike, ...]:
+    """原寸画像に続けて縦横 1/2 ずつ縮小した画像を最大 `levels` 段返します。
+
+    縮小後の短辺が `min_size` 未満になる段は作りません。
+    """
+    pyramid = [image]
+    for _ in range(levels):
+        reduced = cv2.pyrDown(pyramid[-1])
+        if min(reduced.shape[:2]) < min_size:
+            break
+        pyramid.append(reduced)
+    return tuple(pyramid)
+
+
+def _match_pyramid(
+    source_pyramid: tuple[cv2.typing.MatLike, ...],
+    template_pyramid: tuple[cv2.typing.MatLike, ...],
+    method: int,
+    region: tuple[int, int, int, int],
+    *,
+    candidates: int = 1,
+) -> tuple[float, tuple[int, int]]:
+    """縮小画像で候補位置を求め、原寸では候補近傍だけを照合します。
+
+    `region` は原寸画像上の探索領域です。使える縮小段がない場合は `region` 全体を
+    原寸で照合します。返す位置は原寸画像上の座標です。
+    """
+    x, y, w, h = region
+    template = template_pyramid[0]
+    th, tw = template.shape[:2]
+    level = min(len(source_pyramid), len(template_pyramid)) - 1
+    while level > 0:
+        scale = 1 << level
+        coarse_x, coarse_y = x // scale, y // scale
+        coarse_source = source_pyramid[level][
+            coarse_y : (y + h) // scale,
+            coarse_x : (x + w) // scale,
+        ]
+        coarse_template = template_pyramid[level]
+        if (
+            coarse_template.shape[0] <= coarse_source.shape[0]
+            and coarse_template.shape[1] <= coarse_source.shape[1]
+        ):
+            break
+        level -= 1
+
+    if level == 0:
+        result = cv2.matchTemplate(source_pyramid[0][y : y + h, x : x + w], template, method)
+        confidence, (match_x, match_y) = _best_match(result, method)
+        return confidence, (x + match_x, y + match_y)
+
+    coarse_result = cv2.matchTemplate(coarse_source, coarse_template, method)
+    refined: list[tuple[float, tuple[int, int]]] = []
+    for match_x, match_y in _top_locations(coarse_result, method, candidates, coarse_template):
+        # 縮小段の 1px は原寸の `scale` px に相当するため、その幅だけ周辺も再照合する。
+        candidate_x = min(max((coarse_x + match_x) * scale, x), x + w - tw)
+        candidate_y = min(max((coarse_y + match_y) * scale, y), y + h - th)
+        left = max(x, candidate_x - scale)
+        top = max(y, candidate_y - scale)
+        right = min(x + w, candidate_x + tw + scale)
+        bottom = min(y + h, candidate_y + th + scale)
+        result = cv2.matchTemplate(source_pyramid[0][top:bottom, left:right], template, method)
+        confidence, (refined_x, refined_y) = _best_match(result, method)
+        refined.append((confidence, (left + refined_x, top + refined_y)))
+    return max(refined, key=lambda candidate: candidate[0])
+
+
+def _top_locations(
+    result: cv2.typing.MatLike,
+    method: int,
+    count: int,
+    template: cv2.typing.MatLike,
+) -> list[tuple[int, int]]:
+    """一致度の高い順に、互いにテンプレート寸法以上離れた位置を最大 `count` 件返します。"""
+    if count == 1:
+        return [_best_match(result, method)[1]]
+    # SQDIFF 系は値が小さいほど良いため、符号を反転して最大値探索にそろえる。
+    scores = -result if method in [cv2.TM_SQDIFF, cv2.TM_SQDIFF_NORMED] else result.copy()
+    th, tw = template.shape[:2]
+    locations: list[tuple[int, int]] = []
+    for _ in range(count):
+        _min_val, max_val, _min_loc, (loc_x, loc_y) = cv2.minMaxLoc(scores)
+        if locations and not np.isfinite(max_val):
+            break
+        locations.append((int(loc_x), int(loc_y)))
+        scores[
+            max(0, loc_y - th // 2) : loc_y + th // 2 + 1,
+            max(0, loc_x - tw // 2) : loc_x + tw // 2 + 1,
+        ] = -np.inf
+    return locations
@@ -25,6 +25,16 @@ from nyxpy.framework.core.io.ports import (
     FrameReadError,
     FrameSourcePort,
     NotificationPort,
+    StickPathResult,
+    TapResult,
+)
+from nyxpy.framework.core.io.recording import (
+    InputTrace,
+    RecordingControllerOutputPort,
+    ReplayResult,
+    TraceEvent,
+    TraceOp,
+    replay_input_trace,
 )
 from nyxpy.framework.core.io.resources import (
     DefaultResourcePathGuard,
@@ -59,11 +69,14 @@ __all__ = [
     "LocalResourceStore",
     "LocalRunArtifactStore",
     "FrameSourcePort",
+    "InputTrace",
     "MacroResourceScope",
     "NoopNotificationAdapter",
     "NotificationHandlerAdapter",
     "NotificationPort",
     "OverwritePolicy",
+    "RecordingControllerOutputPort",
+    "ReplayResult",
     "ResourceAlreadyExistsError",
     "ResourceConfigurationError",
     "ResourceKind",
@@ -79,7 +92,12 @@ __all__ = [
     "SerialControllerOutputPort",
     "SerialControllerConfig",
     "SerialControllerOutputPortFactory",
+    "StickPathResult",
+    "TapResult",
+    "TraceEvent",
+    "TraceOp",
     "controller_config_from_overrides",
     "controller_config_from_settings",
     "parse_controller_backend",
+    "replay_input_trace",
 ]
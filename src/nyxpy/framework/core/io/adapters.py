@@ -1,16 +1,21 @@
 """Runtime port を既存 framework 実装へ接続する adapter。"""
 
+import threading
 import time
+from collections.abc import Callable
+from dataclasses import dataclass, replace
+from functools import partial
 from threading import Lock
 
 import cv2
-import numpy as np
 
 from nyxpy.framework.core.constants import KeyboardOp, KeyCode, KeyType, SpecialKeyCode
 from nyxpy.framework.core.hardware.camera_capture import (
     CaptureDeviceNotReady,
     CaptureDeviceReadFailed,
+    DummyCaptureDevice,
 )
+from nyxpy.framework.core.hardware.frame_buffer import CapturedFrame, readonly_view
 from nyxpy.framework.core.hardware.protocol import SerialProtocolInterface
 from nyxpy.framework.core.io.ports import (
     ControllerOutputPort,
@@ -18,33 +23,213 @@ from nyxpy.framework.core.io.ports import (
     FrameReadError,
     FrameSourcePort,
     NotificationPort,
+    StickPosition,
+    TapAction,
 )
+from nyxpy.framework.core.logger.ports import LoggerPort
 from nyxpy.framework.core.macro.text_input import validate_keyboard_text
 
 
+@dataclass(frozen=True, slots=True)
+class SerialFrameStats:
+    """状態 frame の送信件数。
+
+    `sent` は device へ渡した frame 数で `keep_alive` を含みます。`suppressed` は直前に
+    送った frame と同じだったため送らなかった frame 数です。
+    """
+
+    sent: int = 0
+    suppressed: int = 0
+    keep_alive: int = 0
+
+
+class SerialStateFrameFilter:
+    """直前に送った状態 frame と同じ frame の送信を省略します。
+
+    CH552、PokeCon、3DS のように 1 frame がコントローラー全体の状態を表す protocol では、
+    同じ frame を再送しても device の状態は変わりません。押していないキーの解除や loop 内の
+    同じ `hold()` を送らないことで、9600 baud のような遅い回線の送信待ちを減らします。
+
+    同じ device を使う controller port の間で共有し、最後に送った frame を device ごとに
+    1 つだけ保持します。`keep_alive_sec` を指定すると、その秒数だけ送信がない間は最後の
+    frame を専用 thread から送り直します。
+    """
+
+    def __init__(
+        self,
+        send: Callable[[bytes], None],
+        *,
+        keep_alive_sec: float | None = None,
+        logger: LoggerPort | None = None,
+    ) -> None:
+        """状態 frame の送信関数と keep-alive の間隔を設定します。
+
+        Args:
+            send: 状態 frame を device へ送る関数。
+            keep_alive_sec: 最後の frame を送り直すまでの無送信時間（秒）。`None` の場合は
+                送り直しません。
+            logger: `close()` で送信件数を記録する logger。
+
+        Raises:
+            ValueError: `keep_alive_sec` が 0 以下の場合。
+
+        """
+        if keep_alive_sec is not None and keep_alive_sec <= 0:
+            raise ValueError("keep_alive_sec must be greater than 0")
+        self._send = send
+        self._keep_alive_sec = keep_alive_sec
+        self._logger = logger
+        self._lock = Lock()
+        self._last_frame: bytes | None = None
+        self._last_sent_at = time.perf_counter()
+        self._sent = 0
+        self._suppressed = 0
+        self._keep_alive = 0
+        self._stopped = threading.Event()
+        self._thread: threading.Thread | None = None
+        if keep_alive_sec is not None:
+            self._thread = threading.Thread(
+                target=self._keep_alive_loop, name="nyx-serial-keep-alive", daemon=True
+            )
+            self._thread.start()
+
+    def send_state(self, frame: bytes) -> bool:
+        """Frame が直前の frame と異なる場合だけ送ります。
+
+        Returns:
+            Device へ送った場合は `True`、省略した場合は `False`。
+
+        """
+        with self._lock:
+            if frame == self._last_frame:
+                self._suppressed += 1
+                return False
+            self._send(frame)
+            self._last_frame = frame
+            self._last_sent_at = time.perf_counter()
+            self._sent += 1
+            return True
+
+    def invalidate(self) -> None:
+        """状態 frame 以外の送信後に呼び、次の状態 frame を必ず送るようにします。"""
+        with self._lock:
+            self._last_frame = None
+            self._last_sent_at = time.perf_counter()
+
+    def stats(self) -> SerialFrameStats:
+        """現在までの送信件数を返します。"""
+        with self._lock:
+            return SerialFrameStats(self._sent, self._suppressed, self._keep_alive)
+
+    def close(self) -> None:
+        """Keep-alive thread を止め、送信件数を DEBUG ログへ記録します。"""
+        self._stopped.set()
+        if self._thread is not None:
+            self._thread.join(1.0)
+        if self._logger is not None:
+            stats = self.stats()
+            self._logger.technical(
+                "DEBUG",
+                "Serial state frame statistics.",
+                component="SerialStateFrameFilter",
+                event="serial.frame_stats",
+                extra={
+                    "sent": stats.sent,
+                    "suppressed": stats.suppressed,
+                    "keep_alive": stats.keep_alive,
+                },
+            )
+
+    def _keep_alive_loop(self) -> None:
+        interval = self._keep_alive_sec
+        assert interval is not None
+        timeout = interval
+        while not self._stopped.wait(timeout):
+            with self._lock:
+                idle = time.perf_counter() - self._last_sent_at
+                if idle >= interval and self._last_frame is not None:
+                    self._send(self._last_frame)
+                    self._last_sent_at = time.perf_counter()
+                    self._sent += 1
+                    self._keep_alive += 1
+                    idle = 0.0
+            timeout = max(interval - idle, 0.001)
+
+
+def serial_state_sender(
+    serial_device, protocol: SerialProtocolInterface
+) -> Callable[[bytes], None]:
+    """Protocol に合わせて、状態 frame を送る device の method を返します。"""
+    send_state = getattr(serial_device, "send_state", None)
+    # 全状態 frame の protocol では、送信 thread が未送信の古い frame を省略できる。
+    if send_state is not None and getattr(protocol, "full_state_frames", False):
+        return send_state
+    return serial_device.send
+
+
 class SerialControllerOutputPort(ControllerOutputPort):
     """SerialComm と SerialProtocol を controller output port へ接続します。"""
 
-    def __init__(self, serial_device, protocol: SerialProtocolInterface) -> None:
-        """送信先 serial device と command builder protocol を保持します。"""
+    def __init__(
+        self,
+        serial_device,
+        protocol: SerialProtocolInterface,
+        *,
+        frame_filter: SerialStateFrameFilter | None = None,
+    ) -> None:
+        """送信先 serial device と command builder protocol を保持します。
+
+        `frame_filter` を指定すると、press / hold / release / touch の frame を filter 経由で
+        送り、直前と同じ frame を省略します。全状態 frame ではない protocol では、同じ frame
+        でも意味が変わるため指定を無視します。
+        """
         self.serial_device = serial_device
         self.protocol = protocol
+        if not getattr(protocol, "full_state_frames", False):
+            frame_filter = None
+        self.frame_filter = frame_filter
+        self._send_state = (
+            frame_filter.send_state
+            if frame_filter is not None
+            else serial_state_sender(serial_device, protocol)
+        )
+
+    @property
+    def frame_stats(self) -> SerialFrameStats | None:
+        """状態 frame の送信件数。`frame_filter` がない場合は `None`。"""
+        return None if self.frame_filter is None else self.frame_filter.stats()
 
     @property
     def supports_touch(self) -> bool:
         return bool(getattr(self.protocol, "supports_touch", False))
 
     def press(self, keys: tuple[KeyType, ...]) -> None:
-        self.serial_device.send(self.protocol.build_press_command(keys))
+        self._send_state(self.protocol.build_press_command(keys))
 
     def hold(self, keys: tuple[KeyType, ...]) -> None:
-        self.serial_device.send(self.protocol.build_hold_command(keys))
+        self._send_state(self.protocol.build_hold_command(keys))
 
     def release(self, keys: tuple[KeyType, ...] = ()) -> None:
-        self.serial_device.send(self.protocol.build_release_command(keys))
+        self._send_state(self.protocol.build_release_command(keys))
+
+    def _tap_actions(self, keys: tuple[KeyType, ...]) -> tuple[TapAction, TapAction]:
+        # 押下と解放の frame を 1 回だけ組み立て、繰り返しでは送信だけを行う。
+        press_frame = self.protocol.build_press_command(keys)
+        release_frame = self.protocol.build_release_command(keys)
+        send_state = self._send_state
+        return partial(send_state, press_frame), partial(send_state, release_frame)
+
+    def _stick_path_actions(self, positions: tuple[StickPosition, ...]) -> list[TapAction]:
+        # 全位置の frame を先に組み立て、再生中は送信だけを行う。
+        send_state = self._send_state
+        return [
+            partial(send_state, self.protocol.build_press_command((position,)))
+            for position in positions
+        ]
 
     def keyboard(self, text: str) -> None:
         text = validate_keyboard_text(text)
+        self._invalidate_state()
         try:
             self.serial_device.send(self.protocol.build_keyboard_command(text))
         except (ValueError, NotImplementedError):
@@ -67,31 +252,46 @@ class SerialControllerOutputPort(ControllerOutputPort):
                 release_op = KeyboardOp.SPECIAL_RELEASE
             case _:
                 raise ValueError(f"Invalid key type: {type(key)}")
+        self._invalidate_state()
         self.serial_device.send(self.protocol.build_keytype_command(key, press_op))
         self.serial_device.send(self.protocol.build_keytype_command(key, release_op))
 
     def touch_down(self, x: int, y: int) -> None:
         if not self.supports_touch:
             raise NotImplementedError("Current serial protocol does not support touch input.")
-        self.serial_device.send(self.protocol.build_touch_down_command(x, y))
+        self._send_state(self.protocol.build_touch_down_command(x, y))
 
     def touch_up(self) -> None:
         if not self.supports_touch:
             raise NotImplementedError("Current serial protocol does not support touch input.")
-        self.serial_device.send(self.protocol.build_touch_up_command())
+        self._send_state(self.protocol.build_touch_up_command())
 
     def disable_sleep(self, enabled: bool = True) -> None:
         builder = getattr(self.protocol, "build_disable_sleep_command", None)
         if builder is None:
             raise NotImplementedError("Current serial protocol does not support sleep control.")
+        self._invalidate_state()
         self.serial_device.send(builder(enabled))
 
+    def flush(self, timeout: float | None = None) -> bool:
+        flush = getattr(self.serial_device, "flush", None)
+        return True if flush is None else bool(flush(timeout))
+
     def close(self) -> None:
         pass
 
+    def _invalidate_state(self) -> None:
+        # 状態 frame 以外の送信で device 側の状態が変わる protocol があるため、次の状態
+        # frame は直前と同じでも送る。
+        if self.frame_filter is not None:
+            self.frame_filter.invalidate()
+
 
 class CaptureFrameSourcePort(FrameSourcePort):
-    """CaptureDeviceInterface を frame source port として扱う adapter。"""
+    """CaptureDeviceInterface を frame source port として扱う adapter。
+
+    Device が返す frame は copy せず、読み取り専用 view として返します。
+    """
 
     def __init__(self, capture_device) -> None:
         """Frame 取得元 device と読み出し lock を保持します。"""
@@ -124,10 +324,21 @@ class CaptureFrameSourcePort(FrameSourcePort):
             time.sleep(0.01)
 
     def latest_frame(self) -> cv2.typing.MatLike:
+        return self.latest_captured_frame().image
+
+    def latest_captured_frame(self) -> CapturedFrame:
         if not self._frame_lock.acquire(timeout=0.1):
             raise FrameReadError("Frame source lock acquisition timed out.")
         try:
-            frame = self.capture_device.get_frame()
+            get_captured_frame = getattr(self.capture_device, "get_captured_frame", None)
+            if get_captured_frame is None:
+                captured = CapturedFrame(
+                    image=self.capture_device.get_frame(),
+                    seq=0,
+                    timestamp=time.perf_counter(),
+                )
+            else:
+                captured = get_captured_frame()
         except CaptureDeviceReadFailed as exc:
             raise FrameReadError() from exc
         except CaptureDeviceNotReady as exc:
@@ -136,7 +347,21 @@ class CaptureFrameSourcePort(FrameSourcePort):
             raise FrameNotReadyError() from exc
         finally:
             self._frame_lock.release()
-        return self._copy_ready_frame(frame)
+        return replace(captured, image=self._ready_frame(captured.image))
+
+    def wait_for_next_frame(self, after_seq: int, timeout: float) -> CapturedFrame | None:
+        if timeout is None or timeout < 0:
+            raise ValueError("timeout must be greater than or equal to 0")
+        wait_for_next_frame = getattr(self.capture_device, "wait_for_next_frame", None)
+        if wait_for_next_frame is None:
+            raise NotImplementedError("Current frame source does not support frame sequence.")
+        try:
+            captured = wait_for_next_frame(after_seq, timeout)
+        except CaptureDeviceReadFailed as exc:
+            raise FrameReadError() from exc
+        if captured is None:
+            return None
+        return replace(captured, image=self._ready_frame(captured.image))
 
     def try_latest_frame(self) -> cv2.typing.MatLike | None:
         if not self._frame_lock.acquire(blocking=False):
@@ -150,12 +375,12 @@ class CaptureFrameSourcePort(FrameSourcePort):
             self._frame_lock.release()
         if frame is None:
             return None
-        return frame.copy()
+        return readonly_view(frame)
 
-    def _copy_ready_frame(self, frame) -> cv2.typing.MatLike:
+    def _ready_frame(self, frame) -> cv2.typing.MatLike:
         if frame is None:
             raise FrameNotReadyError()
-        return frame.copy()
+        return readonly_view(frame)
 
     def close(self) -> None:
         pass
@@ -166,7 +391,7 @@ class DummyFrameSourcePort(FrameSourcePort):
 
     def __init__(self, frame: cv2.typing.MatLike | None = None) -> None:
         """指定 frame または 1280x720 黒画像を保持します。"""
-        self._frame = frame if frame is not None else np.zeros((720, 1280, 3), dtype=np.uint8)
+        self._device = DummyCaptureDevice(frame)
         self.initialized = False
         self.closed = False
 
@@ -179,14 +404,24 @@ class DummyFrameSourcePort(FrameSourcePort):
         return self.initialized
 
     def latest_frame(self) -> cv2.typing.MatLike:
+        return self.latest_captured_frame().image
+
+    def try_latest_frame(self) -> cv2.typing.MatLike | None:
+        if not self.initialized:
+            return None
+        return self._device.get_frame()
+
+    def latest_captured_frame(self) -> CapturedFrame:
         if not self.initialized:
             raise FrameNotReadyError()
-        return self._frame.copy()
+        return self._device.get_captured_frame()
 
-    def try_latest_frame(self) -> cv2.typing.MatLike | None:
+    def wait_for_next_frame(self, after_seq: int, timeout: float) -> CapturedFrame | None:
+        if timeout is None or timeout < 0:
+            raise ValueError("timeout must be greater than or equal to 0")
         if not self.initialized:
             return None
-        return self._frame.copy()
+        return self._device.wait_for_next_frame(after_seq, timeout)
 
     def close(self) -> None:
         self.closed = True
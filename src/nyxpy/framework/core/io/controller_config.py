@@ -32,6 +32,9 @@ class SerialControllerConfig:
     device: str | None
     protocol: str = "CH552"
     baudrate: int = 9600
+    writer_thread: bool = False
+    suppress_duplicate_frames: bool = True
+    keep_alive_sec: float | None = None
 
 
 type ControllerConfig = SerialControllerConfig | SwbtControllerConfig
@@ -53,6 +56,14 @@ def controller_config_from_settings(
                 dotted_get(settings, "controller.serial.baudrate", 9600),
                 key="controller.serial.baudrate",
             ),
+            writer_thread=bool(dotted_get(settings, "controller.serial.writer_thread", False)),
+            suppress_duplicate_frames=bool(
+                dotted_get(settings, "controller.serial.suppress_duplicate_frames", True)
+            ),
+            keep_alive_sec=_optional_positive_float(
+                dotted_get(settings, "controller.serial.keep_alive_sec", None),
+                key="controller.serial.keep_alive_sec",
+            ),
         )
 
     model = resolve_controller_model(
@@ -75,6 +86,7 @@ def controller_config_from_settings(
             dotted_get(settings, "controller.swbt.report_period_us", 8000),
             key="controller.swbt.report_period_us",
         ),
+        async_apply=bool(dotted_get(settings, "controller.swbt.async_apply", False)),
     )
 
 
@@ -185,6 +197,12 @@ def _positive_float(value: object, *, key: str) -> float:
     return result
 
 
+def _optional_positive_float(value: object, *, key: str) -> float | None:
+    if value in (None, ""):
+        return None
+    return _positive_float(value, key=key)
+
+
 def _invalid_positive(key: str) -> ConfigurationError:
     return ConfigurationError(
         f"{key} must be greater than 0",
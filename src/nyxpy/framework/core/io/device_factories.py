@@ -1,6 +1,8 @@
 """Runtime 用 device port factory。"""
 
+import time
 from collections.abc import Callable
+from dataclasses import replace
 from threading import Lock
 from typing import Any
 
@@ -18,6 +20,7 @@ from nyxpy.framework.core.hardware.device_discovery import (
     DeviceDiscoveryService,
     DeviceInfo,
 )
+from nyxpy.framework.core.hardware.frame_buffer import CapturedFrame, readonly_view
 from nyxpy.framework.core.hardware.frame_transform import FrameTransformer
 from nyxpy.framework.core.hardware.ponkan_capture import PonkanCaptureDevice
 from nyxpy.framework.core.hardware.protocol import SerialProtocolInterface
@@ -25,13 +28,19 @@ from nyxpy.framework.core.hardware.serial_comm import (
     DummySerialComm,
     SerialComm,
     SerialCommInterface,
+    ThreadedSerialComm,
 )
 from nyxpy.framework.core.hardware.window_capture import (
     WindowCaptureBackend,
     WindowCaptureDevice,
 )
 from nyxpy.framework.core.hardware.window_discovery import WindowLocatorBackend
-from nyxpy.framework.core.io.adapters import CaptureFrameSourcePort, SerialControllerOutputPort
+from nyxpy.framework.core.io.adapters import (
+    CaptureFrameSourcePort,
+    SerialControllerOutputPort,
+    SerialStateFrameFilter,
+    serial_state_sender,
+)
 from nyxpy.framework.core.io.ports import ControllerOutputPort, FrameSourcePort
 from nyxpy.framework.core.logger import LoggerPort, NullLoggerPort
 from nyxpy.framework.core.macro.exceptions import ConfigurationError
@@ -46,12 +55,27 @@ class SerialControllerOutputPortFactory:
         discovery: DeviceDiscoveryService,
         protocol: SerialProtocolInterface,
         serial_factory: Callable[[str], SerialCommInterface] = SerialComm,
+        writer_thread: bool = False,
+        suppress_duplicate_frames: bool = True,
+        keep_alive_sec: float | None = None,
+        logger: LoggerPort | None = None,
     ) -> None:
-        """Device discovery、protocol、serial factory を保持します。"""
+        """Device discovery、protocol、serial factory を保持します。
+
+        `writer_thread` が `True` の場合、open した device を `ThreadedSerialComm` で包み、
+        書き込みを専用 thread で行います。`suppress_duplicate_frames` が `True` の場合、
+        device ごとの `SerialStateFrameFilter` で直前と同じ状態 frame の送信を省略し、
+        `keep_alive_sec` を指定するとその間隔で最後の frame を送り直します。
+        """
         self.discovery = discovery
         self.protocol = protocol
         self.serial_factory = serial_factory
+        self.writer_thread = writer_thread
+        self.suppress_duplicate_frames = suppress_duplicate_frames
+        self.keep_alive_sec = keep_alive_sec
+        self.logger = logger or NullLoggerPort()
         self._devices: dict[str, SerialCommInterface] = {}
+        self._frame_filters: dict[str, SerialStateFrameFilter] = {}
 
     def create(
         self,
@@ -89,11 +113,20 @@ class SerialControllerOutputPortFactory:
                 if allow_dummy:
                     return SerialControllerOutputPort(self._dummy_serial(), self.protocol)
                 raise _device_open_failed("serial", selection.requested, exc) from exc
+            if self.writer_thread:
+                device = ThreadedSerialComm(device, logger=self.logger)
+                device.start()
             self._devices[device_key] = device
-        return SerialControllerOutputPort(device, self.protocol)
+        return SerialControllerOutputPort(
+            device, self.protocol, frame_filter=self._frame_filter(device_key, device)
+        )
 
     def close(self) -> None:
         errors: list[Exception] = []
+        # keep-alive thread が閉じた device へ書き込まないよう、filter を先に止める。
+        for frame_filter in self._frame_filters.values():
+            frame_filter.close()
+        self._frame_filters.clear()
         for device in self._devices.values():
             try:
                 device.close()
@@ -103,6 +136,23 @@ class SerialControllerOutputPortFactory:
         if errors:
             raise ExceptionGroup("SerialControllerOutputPortFactory close failed", errors)
 
+    def _frame_filter(
+        self, device_key: str, device: SerialCommInterface
+    ) -> SerialStateFrameFilter | None:
+        if not self.suppress_duplicate_frames or not getattr(
+            self.protocol, "full_state_frames", False
+        ):
+            return None
+        frame_filter = self._frame_filters.get(device_key)
+        if frame_filter is None:
+            frame_filter = SerialStateFrameFilter(
+                serial_state_sender(device, self.protocol),
+                keep_alive_sec=self.keep_alive_sec,
+                logger=self.logger,
+            )
+            self._frame_filters[device_key] = frame_filter
+        return frame_filter
+
     def _dummy_serial(self) -> SerialCommInterface:
         device = self._devices.get(DUMMY_DEVICE_NAME)
         if device is None:
@@ -319,6 +369,12 @@ class _SharedCaptureDevice:
     def get_frame(self):
         return self._device.get_frame()
 
+    def get_captured_frame(self) -> CapturedFrame:
+        return self._device.get_captured_frame()
+
+    def wait_for_next_frame(self, after_seq: int, timeout: float) -> CapturedFrame | None:
+        return self._device.wait_for_next_frame(after_seq, timeout)
+
     def release(self) -> None:
         with self._lock:
             if not self._initialized:
@@ -356,6 +412,12 @@ class _FallbackCaptureDevice:
     def get_frame(self):
         return self._active.get_frame()
 
+    def get_captured_frame(self) -> CapturedFrame:
+        return self._active.get_captured_frame()
+
+    def wait_for_next_frame(self, after_seq: int, timeout: float) -> CapturedFrame | None:
+        return self._active.wait_for_next_frame(after_seq, timeout)
+
     def release(self) -> None:
         self._active.release()
 
@@ -365,6 +427,7 @@ class _TransformingCaptureDevice:
         self._device = device
         self._transform = transform
         self._transformer = FrameTransformer()
+        self._transformed: CapturedFrame | None = None
 
     def __getattr__(self, name: str):
         return getattr(self._device, name)
@@ -375,6 +438,31 @@ class _TransformingCaptureDevice:
     def get_frame(self):
         return self._transformer.transform(self._device.get_frame(), self._transform)
 
+    def get_captured_frame(self) -> CapturedFrame:
+        get_captured_frame = getattr(self._device, "get_captured_frame", None)
+        if get_captured_frame is None:
+            return CapturedFrame(image=self.get_frame(), seq=0, timestamp=time.perf_counter())
+        return self._transform_captured(get_captured_frame())
+
+    def wait_for_next_frame(self, after_seq: int, timeout: float) -> CapturedFrame | None:
+        wait_for_next_frame = getattr(self._device, "wait_for_next_frame", None)
+        if wait_for_next_frame is None:
+            raise NotImplementedError("Current capture device does not support frame sequence.")
+        captured = wait_for_next_frame(after_seq, timeout)
+        return None if captured is None else self._transform_captured(captured)
+
+    def _transform_captured(self, captured: CapturedFrame) -> CapturedFrame:
+        cached = self._transformed
+        if cached is not None and captured.seq > 0 and cached.seq == captured.seq:
+            return cached
+        image = self._transformer.transform(captured.image, self._transform)
+        if image is captured.image:
+            return captured
+        # 同じ sequence の frame を複数回読む場合に aspect box 変換を繰り返さない。
+        transformed = replace(captured, image=readonly_view(image))
+        self._transformed = transformed
+        return transformed
+
     def release(self) -> None:
         self._device.release()
 
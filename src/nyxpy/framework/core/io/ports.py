@@ -1,11 +1,32 @@
 """Runtime が依存する入出力 port interface。"""
 
+import time
 from abc import ABC, abstractmethod
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+from functools import partial
 
 import cv2
 
-from nyxpy.framework.core.constants import IMUFrame, KeyCode, KeyType, SpecialKeyCode
+from nyxpy.framework.core.constants import (
+    IMUFrame,
+    KeyCode,
+    KeyType,
+    LStick,
+    RStick,
+    SpecialKeyCode,
+)
+from nyxpy.framework.core.hardware.frame_buffer import CapturedFrame
 from nyxpy.framework.core.macro.exceptions import DeviceError
+from nyxpy.framework.core.utils.cancellation import (
+    DEFAULT_SPIN_MARGIN_SEC,
+    CancellationToken,
+    wait_until,
+)
+
+# 戻り値は使わないため、frame filter の送信有無 (`bool`) を返す関数もそのまま渡せる。
+type TapAction = Callable[[], object]
+type StickPosition = LStick | RStick
 
 
 class FrameNotReadyError(DeviceError):
@@ -32,6 +53,32 @@ class FrameReadError(DeviceError):
         )
 
 
+@dataclass(frozen=True, slots=True)
+class TapResult:
+    """`ControllerOutputPort.tap()` の結果。
+
+    `max_lateness_sec` は押下を予定時刻より遅れて送った時間の最大値です。
+    """
+
+    taps: int
+    cancelled: bool
+    elapsed_sec: float
+    max_lateness_sec: float
+
+
+@dataclass(frozen=True, slots=True)
+class StickPathResult:
+    """`ControllerOutputPort.stick_path()` の結果。
+
+    `max_lateness_sec` は各位置を予定時刻より遅れて送った時間の最大値です。
+    """
+
+    frames: int
+    cancelled: bool
+    elapsed_sec: float
+    max_lateness_sec: float
+
+
 class ControllerOutputPort(ABC):
     """Runtime が controller 入力を送るための出力 port。"""
 
@@ -73,9 +120,163 @@ class ControllerOutputPort(ABC):
     def imu(self, *frames: IMUFrame) -> None:
         raise NotImplementedError("Current controller output does not support IMU input.")
 
+    def tap(
+        self,
+        keys: tuple[KeyType, ...],
+        dur: float = 0.1,
+        wait: float = 0.1,
+        *,
+        repeat: int = 1,
+        token: CancellationToken | None = None,
+        spin_margin: float = DEFAULT_SPIN_MARGIN_SEC,
+    ) -> TapResult:
+        """`keys` の押下と解放を `repeat` 回繰り返します。
+
+        押下と解放の送信内容は最初に 1 回だけ用意し、各押下は開始時刻から
+        `(dur + wait)` 秒ごとの予定時刻に送ります。送信にかかった時間は後続の押下へ
+        積み重なりません。中断要求で止まった場合も押したままのキーは解放します。
+
+        Args:
+            keys: 押すキー。
+            dur: 押し続ける秒数。
+            wait: 解放後、次の押下または終了までの秒数。
+            repeat: 押下の回数。
+            token: 繰り返しを止める中断 token。
+            spin_margin: 予定時刻の何秒前から spin に切り替えるか。0 の場合は spin せず
+                中断 event の待機だけで待ちます。
+
+        Raises:
+            ValueError: `dur`、`wait`、`repeat` のいずれかが負の場合。
+
+        """
+        if dur < 0 or wait < 0 or repeat < 0:
+            raise ValueError("tap dur, wait and repeat must be greater than or equal to 0")
+        press, release = self._tap_actions(keys)
+        return _run_taps(
+            press,
+            release,
+            dur,
+            wait,
+            repeat,
+            token or CancellationToken(),
+            spin_margin,
+        )
+
+    def _tap_actions(self, keys: tuple[KeyType, ...]) -> tuple[TapAction, TapAction]:
+        """`tap()` が繰り返し呼ぶ押下と解放の処理を返します。
+
+        送信内容を事前に組み立てられる port は override し、押下ごとの変換を省きます。
+        """
+        return partial(self.press, keys), partial(self.release, keys)
+
+    def stick_path(
+        self,
+        positions: Sequence[StickPosition],
+        interval: float,
+        *,
+        release: bool = True,
+        token: CancellationToken | None = None,
+        spin_margin: float = DEFAULT_SPIN_MARGIN_SEC,
+    ) -> StickPathResult:
+        """Stick の位置を `interval` 秒ごとに順に送ります。
+
+        すべての位置の送信内容を最初に用意し、`i` 番目の位置は開始時刻から
+        `i * interval` 秒後の予定時刻に送ります。`release` が `True` の場合は最後の位置を
+        `interval` 秒保持した後、使った stick を中央へ戻します。中断要求で止まった場合も
+        `release` に従って stick を戻します。
+
+        Args:
+            positions: 送る stick の位置。`LStick` と `RStick` を混在させられます。
+            interval: 位置を送る間隔（秒）。
+            release: 終了時に stick を中央へ戻すかどうか。
+            token: 送信を止める中断 token。
+            spin_margin: 予定時刻の何秒前から spin に切り替えるか。
+
+        Raises:
+            ValueError: `interval` が 0 以下の場合。
+
+        """
+        if interval <= 0:
+            raise ValueError("stick path interval must be greater than 0")
+        positions = tuple(positions)
+        actions = self._stick_path_actions(positions)
+        result = _run_stick_path(actions, interval, token or CancellationToken(), spin_margin)
+        if release and positions:
+            self.release(tuple({type(position): position for position in positions}.values()))
+        return result
+
+    def _stick_path_actions(self, positions: tuple[StickPosition, ...]) -> list[TapAction]:
+        """`stick_path()` が予定時刻ごとに呼ぶ送信処理を返します。
+
+        送信内容を事前に組み立てられる port は override し、位置ごとの変換を省きます。
+        """
+        return [partial(self.press, (position,)) for position in positions]
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """送信済みの入力がデバイスへ書き込まれるまで待機します。
+
+        送信を別 thread で行う出力では、入力タイミングをそろえる barrier として使います。
+        同期的に送信する出力では何もせず `True` を返します。
+
+        Returns:
+            `timeout` 秒以内に書き込みが完了した場合は `True`。
+
+        """
+        return True
+
+
+def _run_taps(
+    press: TapAction,
+    release: TapAction,
+    dur: float,
+    wait: float,
+    repeat: int,
+    token: CancellationToken,
+    spin_margin: float,
+) -> TapResult:
+    started = time.perf_counter()
+    period = dur + wait
+    max_lateness = 0.0
+    for index in range(repeat):
+        pressed_at = started + index * period
+        if not wait_until(pressed_at, token, spin_margin=spin_margin):
+            return TapResult(index, True, time.perf_counter() - started, max_lateness)
+        max_lateness = max(max_lateness, time.perf_counter() - pressed_at)
+        press()
+        completed = wait_until(pressed_at + dur, token, spin_margin=spin_margin)
+        release()
+        if not completed:
+            return TapResult(index + 1, True, time.perf_counter() - started, max_lateness)
+    completed = wait_until(started + repeat * period, token, spin_margin=spin_margin)
+    return TapResult(repeat, not completed, time.perf_counter() - started, max_lateness)
+
+
+def _run_stick_path(
+    actions: list[TapAction],
+    interval: float,
+    token: CancellationToken,
+    spin_margin: float,
+) -> StickPathResult:
+    started = time.perf_counter()
+    max_lateness = 0.0
+    for index, action in enumerate(actions):
+        scheduled_at = started + index * interval
+        if not wait_until(scheduled_at, token, spin_margin=spin_margin):
+            return StickPathResult(index, True, time.perf_counter() - started, max_lateness)
+        max_lateness = max(max_lateness, time.perf_counter() - scheduled_at)
+        action()
+    completed = wait_until(started + len(actions) * interval, token, spin_margin=spin_margin)
+    return StickPathResult(len(actions), not completed, time.perf_counter() - started, max_lateness)
+
 
 class FrameSourcePort(ABC):
-    """Runtime が最新 frame を取得するための入力 port。"""
+    """Runtime が最新 frame を取得するための入力 port。
+
+    `latest_frame()` と `try_latest_frame()` は capture buffer を共有する読み取り専用
+    frame を返すことがあります。画像を書き換える場合は呼び出し側で copy します。
+    `latest_captured_frame()` と `wait_for_next_frame()` は frame の sequence 番号と
+    取得時刻を返し、sequence を持たない frame source では `seq=0` になります。
+    """
 
     @abstractmethod
     def initialize(self) -> None: ...
@@ -92,6 +293,12 @@ class FrameSourcePort(ABC):
     @abstractmethod
     def close(self) -> None: ...
 
+    def latest_captured_frame(self) -> CapturedFrame:
+        return CapturedFrame(image=self.latest_frame(), seq=0, timestamp=time.perf_counter())
+
+    def wait_for_next_frame(self, after_seq: int, timeout: float) -> CapturedFrame | None:
+        raise NotImplementedError("Current frame source does not support frame sequence.")
+
 
 class NotificationPort(ABC):
     """Runtime が外部通知を送るための port。"""
@@ -0,0 +1,462 @@
+"""Controller 入力の記録と再生。"""
+
+from __future__ import annotations
+
+import math
+import struct
+import sys
+import threading
+import time
+from array import array
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass
+from enum import IntEnum
+from pathlib import Path
+from typing import cast
+
+from nyxpy.framework.core.constants import (
+    Button,
+    Hat,
+    IMUFrame,
+    KeyCode,
+    KeyType,
+    LStick,
+    RStick,
+    SpecialKeyCode,
+    ThreeDSButton,
+    TouchState,
+)
+from nyxpy.framework.core.io.ports import ControllerOutputPort
+from nyxpy.framework.core.utils.cancellation import (
+    DEFAULT_SPIN_MARGIN_SEC,
+    CancellationToken,
+    wait_until,
+)
+
+INPUT_TRACE_SUFFIX = ".nyxtrace"
+
+_MAGIC = b"NYXTRACE"
+_VERSION = 1
+# magic, version, event 数, 引数の int 数, 文字列領域の byte 数
+_HEADER = struct.Struct("<8sHIII")
+_LITTLE_ENDIAN = sys.byteorder == "little"
+
+
+class TraceOp(IntEnum):
+    """Trace に記録する controller port の操作。"""
+
+    PRESS = 1
+    HOLD = 2
+    RELEASE = 3
+    KEYBOARD = 4
+    TYPE_KEY = 5
+    TOUCH_DOWN = 6
+    TOUCH_UP = 7
+    IMU = 8
+    DISABLE_SLEEP = 9
+
+
+class _KeyKind(IntEnum):
+    BUTTON = 1
+    HAT = 2
+    LSTICK = 3
+    RSTICK = 4
+    THREEDS_BUTTON = 5
+    TOUCH = 6
+    KEY_CODE = 7
+    SPECIAL_KEY = 8
+
+
+@dataclass(frozen=True, slots=True)
+class TraceEvent:
+    """Trace から復元した 1 件の操作。
+
+    `value` の型は `op` によって異なります。
+
+    - `PRESS` / `HOLD` / `RELEASE`: キーの tuple
+    - `KEYBOARD`: 入力文字列
+    - `TYPE_KEY`: `KeyCode` または `SpecialKeyCode`
+    - `TOUCH_DOWN`: `(x, y)`
+    - `TOUCH_UP`: `None`
+    - `IMU`: `IMUFrame` の tuple
+    - `DISABLE_SLEEP`: `bool`
+    """
+
+    at: float
+    op: TraceOp
+    value: object = None
+
+
+class InputTrace:
+    """Controller 入力を時刻つきで保持する compact な trace。
+
+    操作ごとの Python object は作らず、時刻・操作種別・引数を `array` の列へ追記します。
+    引数はキー 1 個につき 3 つの int で表し、`keyboard()` の文字列だけ UTF-8 の byte 列と
+    して別領域に置きます。`to_bytes()` の結果は列をそのまま連結した binary です。
+    """
+
+    def __init__(self) -> None:
+        """空の trace を作ります。"""
+        self.times = array("d")
+        self.ops = array("B")
+        self.arg_ends = array("I")
+        self.args = array("i")
+        self.text = bytearray()
+
+    def __len__(self) -> int:
+        """記録した操作の件数を返します。"""
+        return len(self.ops)
+
+    @property
+    def duration(self) -> float:
+        """最後の操作の時刻（秒）。操作がない場合は 0。"""
+        return self.times[-1] if self.times else 0.0
+
+    def append(self, at: float, op: TraceOp, args: tuple[int, ...] = ()) -> None:
+        """`at` 秒の時点の操作を追記します。`args` は符号化済みの引数です。"""
+        self.args.extend(args)
+        self.times.append(at)
+        self.ops.append(op)
+        self.arg_ends.append(len(self.args))
+
+    def append_keys(self, at: float, op: TraceOp, keys: tuple[KeyType, ...]) -> None:
+        """キーを引数に持つ操作を追記します。"""
+        args: list[int] = []
+        for key in keys:
+            args.extend(_encode_key(key))
+        self.append(at, op, tuple(args))
+
+    def append_text(self, at: float, text: str) -> None:
+        """`keyboard()` の操作を追記します。"""
+        encoded = text.encode("utf-8")
+        start = len(self.text)
+        self.text += encoded
+        self.append(at, TraceOp.KEYBOARD, (start, len(encoded)))
+
+    def events(self) -> Iterator[TraceEvent]:
+        """記録順に操作を復元して返します。"""
+        start = 0
+        for at, op, end in zip(self.times, self.ops, self.arg_ends, strict=True):
+            yield TraceEvent(at, TraceOp(op), self._decode(op, self.args[start:end]))
+            start = end
+
+    def to_bytes(self) -> bytes:
+        """Trace を little endian の binary に変換します。"""
+        header = _HEADER.pack(_MAGIC, _VERSION, len(self.ops), len(self.args), len(self.text))
+        columns = (self.times, self.ops, self.arg_ends, self.args)
+        return b"".join(
+            (header, *(_little_endian(column).tobytes() for column in columns), bytes(self.text))
+        )
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> InputTrace:
+        """`to_bytes()` の binary から trace を復元します。
+
+        Raises:
+            ValueError: Trace の binary ではない場合、または途中で切れている場合。
+
+        """
+        if len(data) < _HEADER.size:
+            raise ValueError("input trace is truncated")
+        magic, version, count, arg_count, text_size = _HEADER.unpack_from(data)
+        if magic != _MAGIC:
+            raise ValueError("data is not a NyX input trace")
+        if version != _VERSION:
+            raise ValueError(f"unsupported input trace version: {version}")
+        trace = cls()
+        view = memoryview(data)[_HEADER.size :]
+        for column, length in (
+            (trace.times, count),
+            (trace.ops, count),
+            (trace.arg_ends, count),
+            (trace.args, arg_count),
+        ):
+            size = length * column.itemsize
+            if len(view) < size:
+                raise ValueError("input trace is truncated")
+            column.frombytes(view[:size])
+            view = view[size:]
+            if not _LITTLE_ENDIAN:
+                column.byteswap()
+        if len(view) != text_size:
+            raise ValueError("input trace is truncated")
+        trace.text = bytearray(view)
+        return trace
+
+    def save(self, path: str | Path) -> Path:
+        """Trace を file へ保存し、保存先を返します。"""
+        target = Path(path)
+        target.write_bytes(self.to_bytes())
+        return target
+
+    @classmethod
+    def load(cls, path: str | Path) -> InputTrace:
+        """`save()` で保存した trace を読み込みます。"""
+        return cls.from_bytes(Path(path).read_bytes())
+
+    def _decode(self, op: int, args: array) -> object:
+        match op:
+            case TraceOp.PRESS | TraceOp.HOLD | TraceOp.RELEASE:
+                return tuple(
+                    _decode_key(*args[index : index + 3]) for index in range(0, len(args), 3)
+                )
+            case TraceOp.KEYBOARD:
+                start, size = args
+                return self.text[start : start + size].decode("utf-8")
+            case TraceOp.TYPE_KEY:
+                return _decode_key(*args)
+            case TraceOp.TOUCH_DOWN:
+                return (args[0], args[1])
+            case TraceOp.IMU:
+                return tuple(
+                    IMUFrame(
+                        accelerometer=(args[index], args[index + 1], args[index + 2]),
+                        gyroscope=(args[index + 3], args[index + 4], args[index + 5]),
+                    )
+                    for index in range(0, len(args), 6)
+                )
+            case TraceOp.DISABLE_SLEEP:
+                return bool(args[0])
+        return None
+
+
+class RecordingControllerOutputPort(ControllerOutputPort):
+    """入力を別の controller port へ渡しつつ、`InputTrace` へ記録する decorator。
+
+    各操作は `time.perf_counter()` で計った記録開始からの秒数とともに、送信先へ渡す前に
+    記録します。記録は lock 内の `array` への追記だけなので、入力タイミングへの影響は
+    数 µs 程度です。
+    """
+
+    def __init__(
+        self,
+        inner: ControllerOutputPort,
+        *,
+        trace: InputTrace | None = None,
+        on_close: Callable[[InputTrace], None] | None = None,
+    ) -> None:
+        """送信先の port と記録先を設定し、記録を開始します。
+
+        Args:
+            inner: 実際に入力を送る controller port。
+            trace: 記録先。`None` の場合は新しい trace を作ります。
+            on_close: `close()` で送信先を閉じた後、記録した trace を受け取る callback。
+
+        """
+        self.inner = inner
+        self.trace = trace if trace is not None else InputTrace()
+        self.started_at = time.perf_counter()
+        self._on_close = on_close
+        self._lock = threading.Lock()
+
+    @property
+    def supports_touch(self) -> bool:
+        return self.inner.supports_touch
+
+    @property
+    def supports_imu(self) -> bool:
+        return self.inner.supports_imu
+
+    def press(self, keys: tuple[KeyType, ...]) -> None:
+        self._record_keys(TraceOp.PRESS, keys)
+        self.inner.press(keys)
+
+    def hold(self, keys: tuple[KeyType, ...]) -> None:
+        self._record_keys(TraceOp.HOLD, keys)
+        self.inner.hold(keys)
+
+    def release(self, keys: tuple[KeyType, ...] = ()) -> None:
+        self._record_keys(TraceOp.RELEASE, keys)
+        self.inner.release(keys)
+
+    def keyboard(self, text: str) -> None:
+        at = time.perf_counter() - self.started_at
+        with self._lock:
+            self.trace.append_text(at, text)
+        self.inner.keyboard(text)
+
+    def type_key(self, key: KeyCode | SpecialKeyCode) -> None:
+        self._record(TraceOp.TYPE_KEY, _encode_key(key))
+        self.inner.type_key(key)
+
+    def touch_down(self, x: int, y: int) -> None:
+        self._record(TraceOp.TOUCH_DOWN, (x, y))
+        self.inner.touch_down(x, y)
+
+    def touch_up(self) -> None:
+        self._record(TraceOp.TOUCH_UP)
+        self.inner.touch_up()
+
+    def disable_sleep(self, enabled: bool = True) -> None:
+        self._record(TraceOp.DISABLE_SLEEP, (int(enabled),))
+        self.inner.disable_sleep(enabled)
+
+    def imu(self, *frames: IMUFrame) -> None:
+        args: list[int] = []
+        for frame in frames:
+            args.extend(frame.accelerometer)
+            args.extend(frame.gyroscope)
+        self._record(TraceOp.IMU, tuple(args))
+        self.inner.imu(*frames)
+
+    def flush(self, timeout: float | None = None) -> bool:
+        return self.inner.flush(timeout)
+
+    def close(self) -> None:
+        try:
+            self.inner.close()
+        finally:
+            if self._on_close is not None:
+                self._on_close(self.trace)
+
+    def _record(self, op: TraceOp, args: tuple[int, ...] = ()) -> None:
+        at = time.perf_counter() - self.started_at
+        with self._lock:
+            self.trace.append(at, op, args)
+
+    def _record_keys(self, op: TraceOp, keys: tuple[KeyType, ...]) -> None:
+        at = time.perf_counter() - self.started_at
+        with self._lock:
+            self.trace.append_keys(at, op, keys)
+
+
+@dataclass(frozen=True, slots=True)
+class ReplayResult:
+    """Trace を再生した結果。遅れは記録時の時刻を `speed` で割った予定時刻との差です。"""
+
+    sent: int
+    cancelled: bool
+    max_jitter_sec: float
+    mean_jitter_sec: float
+
+
+def replay_input_trace(
+    trace: InputTrace,
+    controller: ControllerOutputPort,
+    *,
+    token: CancellationToken | None = None,
+    speed: float = 1.0,
+    spin_margin: float = DEFAULT_SPIN_MARGIN_SEC,
+) -> ReplayResult:
+    """記録時と同じ間隔で trace の操作を `controller` へ送ります。
+
+    呼び出した時刻を記録開始時刻に合わせ、各操作の時刻まで `wait_until()` で待ってから
+    送ります。実機を使わずに入力列を再現する場合は fake や dummy の port を渡します。
+
+    Args:
+        trace: 再生する trace。
+        controller: 入力の送信先。
+        token: 再生を止める中断 token。
+        speed: 再生速度の倍率。2.0 の場合は記録時の半分の間隔で送ります。
+        spin_margin: 予定時刻の何秒前から spin に切り替えるか。
+
+    Returns:
+        送った操作の件数と予定時刻からの遅れ。
+
+    Raises:
+        ValueError: `speed` が 0 以下の場合。
+
+    """
+    if speed <= 0:
+        raise ValueError("replay speed must be greater than 0")
+    token = token or CancellationToken()
+    start_at = time.perf_counter()
+    sent = 0
+    max_jitter = 0.0
+    total_jitter = 0.0
+    for event in trace.events():
+        scheduled = event.at / speed
+        if not wait_until(start_at + scheduled, token, spin_margin=spin_margin):
+            return ReplayResult(sent, True, max_jitter, total_jitter / sent if sent else 0.0)
+        jitter = time.perf_counter() - start_at - scheduled
+        _send(controller, event)
+        sent += 1
+        max_jitter = max(max_jitter, jitter)
+        total_jitter += jitter
+    return ReplayResult(sent, False, max_jitter, total_jitter / sent if sent else 0.0)
+
+
+def _send(controller: ControllerOutputPort, event: TraceEvent) -> None:
+    # `value` の型は `TraceEvent` の docstring のとおり `op` で決まる。
+    value = event.value
+    match event.op:
+        case TraceOp.PRESS:
+            controller.press(cast(tuple[KeyType, ...], value))
+        case TraceOp.HOLD:
+            controller.hold(cast(tuple[KeyType, ...], value))
+        case TraceOp.RELEASE:
+            controller.release(cast(tuple[KeyType, ...], value))
+        case TraceOp.KEYBOARD:
+            controller.keyboard(cast(str, value))
+        case TraceOp.TYPE_KEY:
+            controller.type_key(cast(KeyCode | SpecialKeyCode, value))
+        case TraceOp.TOUCH_DOWN:
+            controller.touch_down(*cast(tuple[int, int], value))
+        case TraceOp.TOUCH_UP:
+            controller.touch_up()
+        case TraceOp.IMU:
+            controller.imu(*cast(tuple[IMUFrame, ...], value))
+        case TraceOp.DISABLE_SLEEP:
+            controller.disable_sleep(cast(bool, value))
+
+
+# キーは `(種類, 値1, 値2)` の 3 つの int で表す。
+def _encode_key(key: object) -> tuple[int, int, int]:
+    match key:
+        case Button():
+            return (_KeyKind.BUTTON, int(key), 0)
+        case Hat():
+            return (_KeyKind.HAT, int(key), 0)
+        case ThreeDSButton():
+            return (_KeyKind.THREEDS_BUTTON, int(key), 0)
+        case LStick():
+            return (_KeyKind.LSTICK, key.x, key.y)
+        case RStick():
+            return (_KeyKind.RSTICK, key.x, key.y)
+        case TouchState():
+            return (_KeyKind.TOUCH, key.x if key.pressed else -1, key.y)
+        case KeyCode():
+            return (_KeyKind.KEY_CODE, int(key), 0)
+        case SpecialKeyCode():
+            return (_KeyKind.SPECIAL_KEY, int(key), 0)
+    raise TypeError(f"unsupported key type for input trace: {type(key).__name__}")
+
+
+def _decode_key(kind: int, first: int, second: int) -> KeyType | KeyCode | SpecialKeyCode:
+    match kind:
+        case _KeyKind.BUTTON:
+            return Button(first)
+        case _KeyKind.HAT:
+            return Hat(first)
+        case _KeyKind.THREEDS_BUTTON:
+            return ThreeDSButton(first)
+        case _KeyKind.LSTICK:
+            return _stick(LStick, first, second)
+        case _KeyKind.RSTICK:
+            return _stick(RStick, first, second)
+        case _KeyKind.TOUCH:
+            return TouchState.up() if first < 0 else TouchState.down(first, second)
+        case _KeyKind.KEY_CODE:
+            return KeyCode(chr(first))
+        case _KeyKind.SPECIAL_KEY:
+            return SpecialKeyCode(first)
+    raise ValueError(f"unknown key kind in input trace: {kind}")
+
+
+def _stick[T: (LStick, RStick)](stick_type: type[T], x: int, y: int) -> T:
+    # 記録したのは丸めた座標なので、角度と傾きは座標から逆算して復元する。
+    stick = stick_type.__new__(stick_type)
+    dx, dy = x - 127.5, 127.5 - y
+    stick.rad = math.atan2(dy, dx)
+    stick.mag = min(1.0, math.hypot(dx, dy) / 127.5)
+    stick.x = x
+    stick.y = y
+    return stick
+
+
+def _little_endian(column: array) -> array:
+    if _LITTLE_ENDIAN:
+        return column
+    swapped = array(column.typecode, column)
+    swapped.byteswap()
+    return swapped
@@ -2,7 +2,11 @@
 
 from nyxpy.framework.core.logger.backend import JsonlLogBackend, NullLogBackend
 from nyxpy.framework.core.logger.default_logger import DefaultLogger, NullLoggerPort
-from nyxpy.framework.core.logger.dispatcher import LogSinkDispatcher
+from nyxpy.framework.core.logger.dispatcher import (
+    LogDispatchStats,
+    LogSinkDispatcher,
+    OverflowPolicy,
+)
 from nyxpy.framework.core.logger.events import (
     LogEvent,
     LogExtraValue,
@@ -13,11 +17,13 @@ from nyxpy.framework.core.logger.events import (
 )
 from nyxpy.framework.core.logger.factory import LoggingComponents, create_default_logging
 from nyxpy.framework.core.logger.ports import LoggerPort, LogSink
+from nyxpy.framework.core.logger.run_trace import RunTrace
 from nyxpy.framework.core.logger.sanitizer import LogSanitizer
 from nyxpy.framework.core.logger.sinks import TestLogSink
 
 __all__ = [
     "DefaultLogger",
+    "LogDispatchStats",
     "LogEvent",
     "LogExtraValue",
     "LoggingComponents",
@@ -29,7 +35,9 @@ __all__ = [
     "JsonlLogBackend",
     "NullLoggerPort",
     "NullLogBackend",
+    "OverflowPolicy",
     "RunLogContext",
+    "RunTrace",
     "TestLogSink",
     "TechnicalLog",
     "UserEvent",
@@ -7,6 +7,7 @@ from threading import RLock
 
 from nyxpy.framework.core.logger.events import (
     LogEvent,
+    LogLevel,
     TechnicalLog,
     level_enabled,
     normalize_level,
@@ -17,6 +18,9 @@ from nyxpy.framework.core.logger.rotation import RotationPolicy, rotate_if_neede
 class NullLogBackend:
     """技術ログを破棄する backend。"""
 
+    def is_enabled(self, level: LogLevel) -> bool:
+        return False
+
     def emit_technical(self, event: TechnicalLog) -> None:
         pass
 
@@ -55,6 +59,9 @@ class JsonlLogBackend:
     def set_level(self, level: str) -> None:
         self.minimum_level = normalize_level(level)
 
+    def is_enabled(self, level: LogLevel) -> bool:
+        return level_enabled(level, self.minimum_level)
+
     def emit_technical(self, event: TechnicalLog) -> None:
         if not level_enabled(event.event.level, self.minimum_level):
             return
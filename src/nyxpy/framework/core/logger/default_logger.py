@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import traceback
+from collections.abc import Callable
 from datetime import datetime
 
 from nyxpy.framework.core.logger.backend import NullLogBackend
@@ -10,6 +11,7 @@ from nyxpy.framework.core.logger.dispatcher import LogSinkDispatcher
 from nyxpy.framework.core.logger.events import (
     LogEvent,
     LogExtraValue,
+    LogLevel,
     RunLogContext,
     TechnicalLog,
     UserEvent,
@@ -21,7 +23,11 @@ from nyxpy.framework.core.macro.exceptions import FrameworkError
 
 
 class DefaultLogger:
-    """User event と technical log を sink/backend へ配送する logger。"""
+    """User event と technical log を sink/backend へ配送する logger。
+
+    どの sink と backend も受け取らない level の log は、event の組み立て、秘密情報の
+    mask、traceback の整形を行わずに捨てます。
+    """
 
     def __init__(
         self,
@@ -35,10 +41,17 @@ class DefaultLogger:
         self.sanitizer = sanitizer
         self.backend = backend or NullLogBackend()
         self.context = context
+        self._backend_is_enabled: Callable[[LogLevel], bool] | None = getattr(
+            self.backend, "is_enabled", None
+        )
 
     def bind_context(self, context: RunLogContext) -> DefaultLogger:
         return DefaultLogger(self.dispatcher, self.sanitizer, self.backend, context)
 
+    def is_enabled(self, level: str) -> bool:
+        log_level = normalize_level(level)
+        return self.dispatcher.is_enabled(log_level) or self._backend_enabled(log_level)
+
     def technical(
         self,
         level: str,
@@ -50,6 +63,8 @@ class DefaultLogger:
         exc: BaseException | None = None,
     ) -> None:
         log_level = normalize_level(level)
+        if not (self.dispatcher.is_enabled(log_level) or self._backend_enabled(log_level)):
+            return
         technical_extra = self._technical_extra(extra, exc)
         log_event = LogEvent(
             timestamp=datetime.now(),
@@ -93,6 +108,8 @@ class DefaultLogger:
         extra: dict[str, LogExtraValue] | None = None,
     ) -> None:
         log_level = normalize_level(level)
+        if not self.dispatcher.is_enabled(log_level):
+            return
         timestamp = datetime.now()
         user_event = UserEvent(
             timestamp=timestamp,
@@ -107,6 +124,10 @@ class DefaultLogger:
         )
         self.dispatcher.emit_user(user_event)
 
+    def _backend_enabled(self, level: LogLevel) -> bool:
+        is_enabled = self._backend_is_enabled
+        return is_enabled is None or is_enabled(level)
+
     def _emit_backend(self, log: TechnicalLog) -> None:
         try:
             self.backend.emit_technical(log)
@@ -140,6 +161,9 @@ class NullLoggerPort:
     def bind_context(self, context: RunLogContext) -> NullLoggerPort:
         return self
 
+    def is_enabled(self, level: str) -> bool:
+        return False
+
     def technical(
         self,
         level: str,
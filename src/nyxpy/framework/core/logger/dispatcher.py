@@ -4,8 +4,10 @@ from __future__ import annotations
 
 import sys
 import threading
+from collections import deque
 from dataclasses import dataclass
 from datetime import datetime
+from typing import Literal
 from uuid import uuid4
 
 from nyxpy.framework.core.logger.events import (
@@ -19,6 +21,13 @@ from nyxpy.framework.core.logger.events import (
 from nyxpy.framework.core.logger.ports import LogSink
 from nyxpy.framework.core.logger.sanitizer import LogSanitizer
 
+type OverflowPolicy = Literal["drop", "block"]
+
+OVERFLOW_POLICIES: tuple[OverflowPolicy, ...] = ("drop", "block")
+
+# writer thread が新しい event を待つ間隔の上限（秒）。
+_WRITER_IDLE_WAIT_SEC = 0.5
+
 
 @dataclass(frozen=True)
 class _SinkRegistration:
@@ -27,24 +36,88 @@ class _SinkRegistration:
     level: LogLevel
 
 
+@dataclass(frozen=True, slots=True)
+class LogDispatchStats:
+    """非同期配送の件数。
+
+    `dropped` は queue が上限に達して破棄した event の件数です。`queued` は現在
+    queue に残っている event の件数です。
+    """
+
+    delivered: int
+    dropped: int
+    queued: int
+
+
+type _Registrations = tuple[_SinkRegistration, ...]
+type _QueueItem = (
+    tuple[Literal["technical"], TechnicalLog, _Registrations]
+    | tuple[Literal["user"], UserEvent, _Registrations]
+    | tuple[Literal["barrier"], threading.Event, None]
+    | tuple[Literal["stop"], None, None]
+)
+
+
 class LogSinkDispatcher:
-    """LogSink の登録、level 判定、配送失敗時の隔離を担当します。"""
+    """LogSink の登録、level 判定、配送失敗時の隔離を担当します。
+
+    `async_dispatch=True` の場合、`emit_technical()` / `emit_user()` は event を queue に
+    積んですぐに戻り、専用の writer thread が sink へ配送します。queue が `queue_size`
+    件に達した場合、`overflow_policy="drop"` では新しい event を破棄して件数を数え、
+    `"block"` では空きができるまで最大 `block_timeout_sec` 秒待ちます。
+    """
+
+    def __init__(
+        self,
+        sanitizer: LogSanitizer,
+        *,
+        lock_timeout_sec: float = 1.0,
+        async_dispatch: bool = False,
+        queue_size: int = 4096,
+        overflow_policy: OverflowPolicy = "drop",
+        block_timeout_sec: float = 1.0,
+    ) -> None:
+        """Sanitizer、lock timeout、sink 登録 table を初期化します。
 
-    def __init__(self, sanitizer: LogSanitizer, *, lock_timeout_sec: float = 1.0) -> None:
-        """Sanitizer、lock timeout、sink 登録 table を初期化します。"""
+        Raises:
+            ValueError: `queue_size` が 1 未満、または `overflow_policy` が不正な場合。
+
+        """
+        if queue_size < 1:
+            raise ValueError("queue_size must be greater than or equal to 1")
+        if overflow_policy not in OVERFLOW_POLICIES:
+            raise ValueError(f"invalid overflow policy: {overflow_policy}")
         self.sanitizer = sanitizer
         self.lock_timeout_sec = lock_timeout_sec
+        self.async_dispatch = async_dispatch
+        self.queue_size = queue_size
+        self.overflow_policy: OverflowPolicy = overflow_policy
+        self.block_timeout_sec = block_timeout_sec
         self._sink_lock = threading.RLock()
         self._sinks: dict[str, _SinkRegistration] = {}
+        # emit は lock を取らずにこの snapshot を読む。登録の変更時だけ作り直す。
+        self._all_registrations: _Registrations = ()
+        self._registrations_by_level: dict[LogLevel, _Registrations] = dict.fromkeys(LogLevel, ())
+        self._minimum_level: LogLevel | None = None
         self._failure_state = threading.local()
+        self._queue: deque[_QueueItem] = deque()
+        self._queue_condition = threading.Condition(threading.Lock())
+        self._writer: threading.Thread | None = None
+        self._writer_waiting = False
+        self._space_waiters = 0
+        self._closed = False
+        self._delivered = 0
+        self._dropped = 0
+        self._reported_dropped = 0
 
     def add_sink(self, sink: LogSink, *, level: str = "INFO") -> str:
         sink_id = uuid4().hex
-        self._with_lock(
-            lambda: self._sinks.__setitem__(
-                sink_id, _SinkRegistration(sink_id, sink, normalize_level(level))
-            )
-        )
+
+        def add() -> None:
+            self._sinks[sink_id] = _SinkRegistration(sink_id, sink, normalize_level(level))
+            self._rebuild_snapshot()
+
+        self._with_lock(add)
         return sink_id
 
     def set_level(self, sink_id: str, level: str) -> None:
@@ -55,56 +128,215 @@ class LogSinkDispatcher:
                 registration.sink,
                 normalize_level(level),
             )
+            self._rebuild_snapshot()
 
         self._with_lock(update)
 
     def remove_sink(self, sink_id: str) -> None:
-        self._with_lock(lambda: self._sinks.pop(sink_id, None))
+        def remove() -> None:
+            self._sinks.pop(sink_id, None)
+            self._rebuild_snapshot()
+
+        self._with_lock(remove)
+
+    def is_enabled(self, level: LogLevel) -> bool:
+        """指定 level の event を受け取る sink があるかを返します。"""
+        return bool(self._registrations_by_level[level])
+
+    @property
+    def minimum_level(self) -> LogLevel | None:
+        """登録済み sink が受け取る最も低い level。sink がない場合は `None`。"""
+        return self._minimum_level
 
     def emit_technical(self, event: TechnicalLog) -> None:
-        for registration in self._snapshot(event.event.level):
-            try:
-                registration.sink.emit_technical(event)
-            except Exception as exc:
-                self._record_sink_failure(registration, event.event.event, exc)
+        registrations = self._snapshot(event.event.level)
+        if not registrations:
+            return
+        if self.async_dispatch and not self._closed:
+            self._enqueue(("technical", event, registrations))
+            return
+        self._deliver_technical(event, registrations)
 
     def emit_user(self, event: UserEvent) -> None:
-        for registration in self._snapshot(event.level):
-            try:
-                registration.sink.emit_user(event)
-            except Exception as exc:
-                self._record_sink_failure(registration, event.event, exc)
+        registrations = self._snapshot(event.level)
+        if not registrations:
+            return
+        if self.async_dispatch and not self._closed:
+            self._enqueue(("user", event, registrations))
+            return
+        self._deliver_user(event, registrations)
+
+    def stats(self) -> LogDispatchStats:
+        """非同期配送の件数を返します。"""
+        with self._queue_condition:
+            return LogDispatchStats(
+                delivered=self._delivered,
+                dropped=self._dropped,
+                queued=len(self._queue),
+            )
 
-    def flush(self) -> None:
+    def flush(self, timeout: float | None = None) -> bool:
+        """Queue に積んだ event を配送し終えるまで待ってから各 sink を flush します。
+
+        Returns:
+            `timeout` 秒以内に queue が空になった場合は `True`。同期配送では常に `True`。
+
+        """
+        drained = self._drain(timeout)
+        self._report_dropped()
         for registration in self._snapshot_all():
             try:
                 registration.sink.flush()
             except Exception as exc:
                 self._record_sink_failure(registration, "sink.flush", exc)
+        return drained
 
     def close(self) -> None:
+        self._drain(self.lock_timeout_sec)
+        self._stop_writer()
+        self._report_dropped()
         for registration in self._snapshot_all():
             try:
                 registration.sink.close()
             except Exception as exc:
                 self._record_sink_failure(registration, "sink.close", exc)
 
-    def _snapshot(self, level: LogLevel) -> tuple[_SinkRegistration, ...]:
-        return tuple(
-            registration
-            for registration in self._snapshot_all()
-            if level_enabled(level, registration.level)
+    def _deliver_technical(self, event: TechnicalLog, registrations: _Registrations) -> None:
+        for registration in registrations:
+            try:
+                registration.sink.emit_technical(event)
+            except Exception as exc:
+                self._record_sink_failure(registration, event.event.event, exc)
+
+    def _deliver_user(self, event: UserEvent, registrations: _Registrations) -> None:
+        for registration in registrations:
+            try:
+                registration.sink.emit_user(event)
+            except Exception as exc:
+                self._record_sink_failure(registration, event.event, exc)
+
+    def _enqueue(self, item: _QueueItem) -> None:
+        queue = self._queue
+        if len(queue) >= self.queue_size and not self._wait_for_space():
+            with self._queue_condition:
+                self._dropped += 1
+            return
+        queue.append(item)
+        if self._writer is None:
+            self._start_writer()
+        if self._writer_waiting:
+            with self._queue_condition:
+                self._queue_condition.notify_all()
+
+    def _wait_for_space(self) -> bool:
+        if self.overflow_policy == "drop" or threading.current_thread() is self._writer:
+            return False
+        with self._queue_condition:
+            self._space_waiters += 1
+            try:
+                return self._queue_condition.wait_for(
+                    lambda: len(self._queue) < self.queue_size, self.block_timeout_sec
+                )
+            finally:
+                self._space_waiters -= 1
+
+    def _start_writer(self) -> None:
+        with self._queue_condition:
+            if self._writer is not None:
+                return
+            self._writer = threading.Thread(
+                target=self._run_writer, name="nyx-log-dispatcher", daemon=True
+            )
+            self._writer.start()
+
+    def _run_writer(self) -> None:
+        queue = self._queue
+        condition = self._queue_condition
+        while True:
+            try:
+                item = queue.popleft()
+            except IndexError:
+                with condition:
+                    self._writer_waiting = True
+                    if not queue:
+                        condition.wait(_WRITER_IDLE_WAIT_SEC)
+                    self._writer_waiting = False
+                continue
+            if self._space_waiters:
+                with condition:
+                    condition.notify_all()
+            match item:
+                case ("technical", event, registrations):
+                    self._deliver_technical(event, registrations)
+                case ("user", event, registrations):
+                    self._deliver_user(event, registrations)
+                case ("barrier", barrier, None):
+                    barrier.set()
+                    continue
+                case ("stop", None, None):
+                    return
+            self._delivered += 1
+
+    def _drain(self, timeout: float | None) -> bool:
+        writer = self._writer
+        if writer is None or not writer.is_alive() or writer is threading.current_thread():
+            return True
+        barrier = threading.Event()
+        self._queue.append(("barrier", barrier, None))
+        if self._writer_waiting:
+            with self._queue_condition:
+                self._queue_condition.notify_all()
+        return barrier.wait(timeout)
+
+    def _stop_writer(self) -> None:
+        self._closed = True
+        writer = self._writer
+        if writer is None or writer is threading.current_thread():
+            return
+        self._queue.append(("stop", None, None))
+        with self._queue_condition:
+            self._queue_condition.notify_all()
+        writer.join(self.lock_timeout_sec)
+
+    def _report_dropped(self) -> None:
+        with self._queue_condition:
+            dropped = self._dropped - self._reported_dropped
+            self._reported_dropped = self._dropped
+        if dropped <= 0:
+            return
+        warning = TechnicalLog(
+            LogEvent(
+                timestamp=datetime.now(),
+                level=LogLevel.WARNING,
+                component="LogSinkDispatcher",
+                event="logging.events_dropped",
+                message="Log events were dropped because the dispatch queue was full",
+                extra={"dropped": dropped, "queue_size": self.queue_size},
+            ),
+            include_traceback=False,
         )
+        self._deliver_technical(warning, self._snapshot(LogLevel.WARNING))
 
-    def _snapshot_all(self) -> tuple[_SinkRegistration, ...]:
-        registrations: tuple[_SinkRegistration, ...] = ()
+    def _snapshot(self, level: LogLevel) -> _Registrations:
+        return self._registrations_by_level[level]
 
-        def copy() -> None:
-            nonlocal registrations
-            registrations = tuple(self._sinks.values())
+    def _snapshot_all(self) -> _Registrations:
+        return self._all_registrations
 
-        self._with_lock(copy)
-        return registrations
+    def _rebuild_snapshot(self) -> None:
+        registrations = tuple(self._sinks.values())
+        self._registrations_by_level = {
+            level: tuple(
+                registration
+                for registration in registrations
+                if level_enabled(level, registration.level)
+            )
+            for level in LogLevel
+        }
+        self._all_registrations = registrations
+        self._minimum_level = next(
+            (level for level in LogLevel if self._registrations_by_level[level]), None
+        )
 
     def _with_lock(self, callback) -> None:
         acquired = self._sink_lock.acquire(timeout=self.lock_timeout_sec)
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+from dataclasses import asdict, dataclass, field
 from datetime import datetime
 from enum import StrEnum
 
@@ -21,6 +21,8 @@ class LogLevel(StrEnum):
     CRITICAL = "CRITICAL"
 
 
+_LEVELS_BY_NAME: dict[str, LogLevel] = {level.value: level for level in LogLevel}
+
 _LEVEL_ORDER = {
     LogLevel.DEBUG: 10,
     LogLevel.INFO: 20,
@@ -32,6 +34,9 @@ _LEVEL_ORDER = {
 
 def normalize_level(level: str | LogLevel) -> LogLevel:
     """文字列または `LogLevel` を正規化します。"""
+    found = _LEVELS_BY_NAME.get(level)
+    if found is not None:
+        return found
     try:
         return level if isinstance(level, LogLevel) else LogLevel(level.upper())
     except ValueError as exc:
@@ -91,3 +96,21 @@ class UserEvent:
     macro_id: str | None = None
     code: str | None = None
     extra: dict[str, LogExtraValue] = field(default_factory=dict)
+
+
+def event_to_json_payload(event: TechnicalLog | UserEvent) -> dict:
+    """JSONL へ書き出す 1 行分の dict を返します。
+
+    `kind` に `"technical"` または `"user"` を付けます。JSONL sink と run trace の
+    export はこの形式を共有します。
+    """
+    if isinstance(event, UserEvent):
+        payload = asdict(event)
+        kind = "user"
+    else:
+        payload = asdict(event.event)
+        kind = "technical"
+    payload["timestamp"] = payload["timestamp"].isoformat()
+    payload["level"] = payload["level"].value
+    payload["kind"] = kind
+    return payload
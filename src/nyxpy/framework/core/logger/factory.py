@@ -7,12 +7,14 @@ from pathlib import Path
 
 from nyxpy.framework.core.logger.backend import JsonlLogBackend
 from nyxpy.framework.core.logger.default_logger import DefaultLogger
-from nyxpy.framework.core.logger.dispatcher import LogSinkDispatcher
+from nyxpy.framework.core.logger.dispatcher import LogSinkDispatcher, OverflowPolicy
 from nyxpy.framework.core.logger.ports import LogBackend, LogSink
 from nyxpy.framework.core.logger.sanitizer import LogSanitizer
 from nyxpy.framework.core.logger.sinks import (
+    DEFAULT_FLUSH_INTERVAL_SEC,
     ConsoleLogSink,
     RunJsonlFileSink,
+    RunTraceFileSink,
     TextFileLogSink,
 )
 
@@ -39,7 +41,7 @@ class LoggingComponents:
 
     def set_file_level(self, level: str) -> None:
         _set_backend_level(self.backend, level)
-        for name in ("human_file", "run_jsonl"):
+        for name in ("human_file", "run_jsonl", "run_trace"):
             sink_id = self.sink_ids.get(name)
             if sink_id is not None:
                 self.dispatcher.set_level(sink_id, level)
@@ -66,11 +68,21 @@ def create_default_logging(
     file_backup_count: int = 3,
     file_retention_days: int = 14,
     run_retention_days: int = 30,
+    file_flush_interval_sec: float = DEFAULT_FLUSH_INTERVAL_SEC,
+    run_trace_enabled: bool = False,
     mask_secret_keys: list[str] | None = None,
+    async_dispatch: bool = False,
+    dispatch_queue_size: int = 4096,
+    dispatch_overflow: OverflowPolicy = "drop",
 ) -> LoggingComponents:
     """標準の logger、dispatcher、backend を作成します。"""
     sanitizer = LogSanitizer(mask_secret_keys)
-    dispatcher = LogSinkDispatcher(sanitizer)
+    dispatcher = LogSinkDispatcher(
+        sanitizer,
+        async_dispatch=async_dispatch,
+        queue_size=dispatch_queue_size,
+        overflow_policy=dispatch_overflow,
+    )
     backend = JsonlLogBackend(
         Path(base_dir) / "framework.jsonl",
         level=file_level,
@@ -89,6 +101,7 @@ def create_default_logging(
             max_bytes=file_max_bytes,
             backup_count=file_backup_count,
             retention_days=file_retention_days,
+            flush_interval_sec=file_flush_interval_sec,
         ),
         level=file_level,
     )
@@ -98,9 +111,19 @@ def create_default_logging(
             max_bytes=file_max_bytes,
             backup_count=file_backup_count,
             retention_days=run_retention_days,
+            flush_interval_sec=file_flush_interval_sec,
         ),
         level=file_level,
     )
+    if run_trace_enabled:
+        sink_ids["run_trace"] = dispatcher.add_sink(
+            RunTraceFileSink(
+                Path(base_dir) / "runs",
+                retention_days=run_retention_days,
+                flush_interval_sec=file_flush_interval_sec,
+            ),
+            level=file_level,
+        )
     return LoggingComponents(logger, dispatcher, sanitizer, backend, sink_ids)
 
 
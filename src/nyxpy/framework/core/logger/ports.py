@@ -20,6 +20,14 @@ class LoggerPort(Protocol):
 
     def bind_context(self, context: RunLogContext) -> LoggerPort: ...
 
+    def is_enabled(self, level: str) -> bool:
+        """指定 level の log を受け取る出力先があるかを返します。
+
+        `False` の場合、呼び出し側は message や extra を組み立てずに省略できます。
+        判定できない実装は `True` を返します。
+        """
+        return True
+
     def technical(
         self,
         level: str,
@@ -5,6 +5,10 @@ from __future__ import annotations
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 from pathlib import Path
+from typing import BinaryIO
+
+# 追記用 handle の write buffer サイズ（byte）。
+_WRITE_BUFFER_BYTES = 64 * 1024
 
 
 @dataclass(frozen=True)
@@ -22,6 +26,14 @@ def rotate_if_needed(path: Path, policy: RotationPolicy) -> None:
     cleanup_retention(path, policy)
     if policy.max_bytes <= 0 or not path.exists() or path.stat().st_size < policy.max_bytes:
         return
+    rotate_file(path, policy)
+
+
+def rotate_file(path: Path, policy: RotationPolicy) -> None:
+    """サイズを確認せずにログファイルを 1 世代ずらします。"""
+    path = Path(path)
+    if not path.exists():
+        return
     if policy.backup_count <= 0:
         path.unlink()
         return
@@ -56,5 +68,64 @@ def cleanup_retention_glob(base_dir: Path, pattern: str, retention_days: int) ->
             candidate.unlink()
 
 
+class RotatingLogFile:
+    """開いたままの handle でログファイルへ追記する writer。
+
+    書き込みは buffer に溜め、`flush()` または `close()` でファイルへ書き出します。
+    ファイルサイズは書き込んだ byte 数から数えるため、rotation の判定でファイルを
+    stat しません。lock は持たないため、呼び出し側で排他してください。
+    """
+
+    def __init__(self, path: Path, policy: RotationPolicy) -> None:
+        """出力 path と rotation 方針を保持します。ファイルは最初の書き込みで開きます。"""
+        self.path = Path(path)
+        self.policy = policy
+        self._file: BinaryIO | None = None
+        self._size = 0
+        self._dirty = False
+
+    @property
+    def size(self) -> int:
+        """書き込み済み（buffer 内を含む）のファイルサイズ。"""
+        return self._size
+
+    def write(self, line: str) -> None:
+        """1 行を buffer へ追記します。必要なら先に rotation します。"""
+        if self._file is None:
+            self._open()
+        if self.policy.max_bytes > 0 and self._size >= self.policy.max_bytes:
+            self._rotate()
+        data = (line + "\n").encode("utf-8")
+        file = self._file
+        assert file is not None
+        file.write(data)
+        self._size += len(data)
+        self._dirty = True
+
+    def flush(self) -> None:
+        """Buffer 内の行をファイルへ書き出します。"""
+        if self._file is not None and self._dirty:
+            self._file.flush()
+            self._dirty = False
+
+    def close(self) -> None:
+        """Buffer を書き出して handle を閉じます。"""
+        if self._file is None:
+            return
+        self._file.close()
+        self._file = None
+        self._dirty = False
+
+    def _open(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = self.path.open("ab", buffering=_WRITE_BUFFER_BYTES)
+        self._size = self._file.tell()
+
+    def _rotate(self) -> None:
+        self.close()
+        rotate_file(self.path, self.policy)
+        self._open()
+
+
 def _rotated_path(path: Path, index: int) -> Path:
     return path.with_name(f"{path.name}.{index}")
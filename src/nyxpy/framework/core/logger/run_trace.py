@@ -0,0 +1,436 @@
+"""Run ごとのログを固定長 record で保存する binary run trace。
+
+1 つの run trace は次の 3 つの追記専用ファイルからなります。
+
+- `<run_id>.nyxlog`: header と固定長 record。1 event が 1 record です。
+- `<run_id>.nyxlog.names`: component、event 名などの intern 済み文字列。
+- `<run_id>.nyxlog.data`: message、extra (JSON)、traceback の本文。
+
+record は `numpy.fromfile()` でそのまま列ごとの配列として読めます。文字列の列は
+`.names` の通し番号、本文の列は `.data` の byte 位置を持ちます。書き込みは
+`.names`、`.data`、record の順に行うため、途中で止まった場合は末尾の不完全な
+record を読み飛ばします。
+"""
+
+from __future__ import annotations
+
+import json
+import struct
+from collections.abc import Iterator
+from datetime import datetime
+from pathlib import Path
+from typing import BinaryIO, TextIO, cast
+
+import numpy as np
+import numpy.typing as npt
+
+from nyxpy.framework.core.logger.events import (
+    LogEvent,
+    LogLevel,
+    TechnicalLog,
+    UserEvent,
+    event_to_json_payload,
+)
+
+RUN_TRACE_SUFFIX = ".nyxlog"
+NAMES_SUFFIX = ".names"
+DATA_SUFFIX = ".data"
+
+_MAGIC = b"NYXRLOG\x00"
+_VERSION = 1
+# magic, version, record の byte 数
+_HEADER = struct.Struct("<8sHH")
+_NAME_LENGTH = struct.Struct("<I")
+# intern 済み文字列がないことを表す id。
+NO_NAME = 0xFFFFFFFF
+
+KIND_TECHNICAL = 0
+KIND_USER = 1
+
+_LEVELS = tuple(LogLevel)
+_LEVEL_CODES = {level: index for index, level in enumerate(_LEVELS)}
+
+RECORD_DTYPE = np.dtype(
+    [
+        ("timestamp_ns", "<i8"),
+        ("kind", "u1"),
+        ("level", "u1"),
+        ("include_traceback", "u1"),
+        ("reserved", "u1"),
+        ("component", "<u4"),
+        ("event", "<u4"),
+        ("run_id", "<u4"),
+        ("macro_id", "<u4"),
+        ("code", "<u4"),
+        ("exception_type", "<u4"),
+        ("data_offset", "<u8"),
+        ("message_length", "<u4"),
+        ("extra_length", "<u4"),
+        ("traceback_length", "<u4"),
+    ]
+)
+_RECORD = struct.Struct("<qBBBBIIIIIIQIII")
+assert _RECORD.size == RECORD_DTYPE.itemsize
+_NAME_FIELDS = ("component", "event", "run_id", "macro_id", "code", "exception_type")
+
+
+def run_trace_paths(path: Path) -> tuple[Path, Path, Path]:
+    """Record、intern 文字列、本文のファイル path を返します。"""
+    path = Path(path)
+    return (
+        path,
+        path.with_name(path.name + NAMES_SUFFIX),
+        path.with_name(path.name + DATA_SUFFIX),
+    )
+
+
+class RunTraceWriter:
+    """1 run 分の run trace へ event を追記する writer。
+
+    各ファイルの handle は開いたまま buffer に書き込み、`flush()` または `close()` で
+    書き出します。lock は持たないため、呼び出し側で排他してください。
+    """
+
+    def __init__(self, path: Path) -> None:
+        """出力 path を保持します。ファイルは最初の書き込みで開きます。"""
+        self.path = Path(path)
+        self._records: BinaryIO | None = None
+        self._names_file: BinaryIO | None = None
+        self._data_file: BinaryIO | None = None
+        self._names: dict[str, int] = {}
+        self._data_size = 0
+        self._dirty = False
+
+    def write_technical(self, log: TechnicalLog) -> None:
+        """Technical log を 1 record 追記します。"""
+        event = log.event
+        self._write(
+            event.timestamp,
+            kind=KIND_TECHNICAL,
+            level=event.level,
+            include_traceback=log.include_traceback,
+            component=event.component,
+            event=event.event,
+            run_id=event.run_id,
+            macro_id=event.macro_id,
+            code=None,
+            exception_type=event.exception_type,
+            message=event.message,
+            extra=event.extra,
+            traceback=event.traceback,
+        )
+
+    def write_user(self, event: UserEvent) -> None:
+        """User event を 1 record 追記します。"""
+        self._write(
+            event.timestamp,
+            kind=KIND_USER,
+            level=event.level,
+            include_traceback=False,
+            component=event.component,
+            event=event.event,
+            run_id=event.run_id,
+            macro_id=event.macro_id,
+            code=event.code,
+            exception_type=None,
+            message=event.message,
+            extra=event.extra,
+            traceback=None,
+        )
+
+    def flush(self) -> None:
+        """Buffer 内の内容をファイルへ書き出します。"""
+        if not self._dirty:
+            return
+        for file in (self._names_file, self._data_file, self._records):
+            if file is not None:
+                file.flush()
+        self._dirty = False
+
+    def close(self) -> None:
+        """Buffer を書き出して handle を閉じます。"""
+        for file in (self._names_file, self._data_file, self._records):
+            if file is not None:
+                file.close()
+        self._records = self._names_file = self._data_file = None
+        self._dirty = False
+
+    def _write(
+        self,
+        timestamp: datetime,
+        *,
+        kind: int,
+        level: LogLevel,
+        include_traceback: bool,
+        component: str,
+        event: str,
+        run_id: str | None,
+        macro_id: str | None,
+        code: str | None,
+        exception_type: str | None,
+        message: str,
+        extra: dict,
+        traceback: str | None,
+    ) -> None:
+        if self._records is None:
+            self._open()
+        message_bytes = message.encode("utf-8")
+        extra_bytes = (
+            json.dumps(extra, ensure_ascii=False, separators=(",", ":"), default=repr).encode(
+                "utf-8"
+            )
+            if extra
+            else b""
+        )
+        traceback_bytes = traceback.encode("utf-8") if traceback else b""
+        record = _RECORD.pack(
+            _timestamp_ns(timestamp),
+            kind,
+            _LEVEL_CODES[level],
+            include_traceback,
+            0,
+            self._intern(component),
+            self._intern(event),
+            self._intern(run_id),
+            self._intern(macro_id),
+            self._intern(code),
+            self._intern(exception_type),
+            self._data_size,
+            len(message_bytes),
+            len(extra_bytes),
+            len(traceback_bytes),
+        )
+        data_file = self._data_file
+        records = self._records
+        assert data_file is not None and records is not None
+        data_file.write(message_bytes + extra_bytes + traceback_bytes)
+        self._data_size += len(message_bytes) + len(extra_bytes) + len(traceback_bytes)
+        records.write(record)
+        self._dirty = True
+
+    def _intern(self, text: str | None) -> int:
+        if text is None:
+            return NO_NAME
+        name_id = self._names.get(text)
+        if name_id is not None:
+            return name_id
+        name_id = len(self._names)
+        encoded = text.encode("utf-8")
+        names_file = self._names_file
+        assert names_file is not None
+        names_file.write(_NAME_LENGTH.pack(len(encoded)) + encoded)
+        # record より先に文字列がディスクへ届くよう、新しい文字列はすぐ書き出す。
+        # 文字列の追加は種類の数だけなので、event ごとの書き込みは buffer のまま。
+        names_file.flush()
+        self._names[text] = name_id
+        return name_id
+
+    def _open(self) -> None:
+        records_path, names_path, data_path = run_trace_paths(self.path)
+        records_path.parent.mkdir(parents=True, exist_ok=True)
+        # 既存の trace へ追記する場合は intern 表と本文の位置を引き継ぐ。
+        existing = (
+            RunTrace.load(records_path)
+            if records_path.exists() and records_path.stat().st_size >= _HEADER.size
+            else None
+        )
+        self._names_file = names_path.open("ab")
+        self._data_file = data_path.open("ab")
+        self._records = records_path.open("ab")
+        if existing is None:
+            self._records.truncate(0)
+            self._names_file.truncate(0)
+            self._data_file.truncate(0)
+            self._records.write(_HEADER.pack(_MAGIC, _VERSION, _RECORD.size))
+            self._data_size = 0
+            return
+        # 途中で止まった record と文字列の残りを捨て、境界から追記する。
+        names, consumed = _read_names(names_path)
+        self._names = {name: index for index, name in enumerate(names)}
+        self._names_file.truncate(consumed)
+        self._records.truncate(_HEADER.size + len(existing) * _RECORD.size)
+        self._data_size = self._data_file.tell()
+
+
+class RunTrace:
+    """読み込んだ run trace。
+
+    `records` は `RECORD_DTYPE` の構造化配列で、`trace.records["timestamp_ns"]` のように
+    列ごとに numpy 配列として扱えます。文字列の列は `names` の index、`level` の列は
+    `tuple(LogLevel)` の index です。
+
+    ```python
+    trace = RunTrace.load(Path("logs/runs/20260526/run-1.nyxlog"))
+    errors = trace.records["level"] >= list(LogLevel).index(LogLevel.ERROR)
+    ```
+    """
+
+    def __init__(
+        self,
+        records: npt.NDArray[np.void],
+        names: tuple[str, ...],
+        data: bytes,
+    ) -> None:
+        """読み込み済みの record、intern 文字列、本文を保持します。"""
+        self.records = records
+        self.names = names
+        self.data = data
+
+    @classmethod
+    def load(cls, path: Path) -> RunTrace:
+        """`.nyxlog` file と付随するファイルを読み込みます。
+
+        Raises:
+            ValueError: ファイルが run trace でない、または version が未対応の場合。
+
+        """
+        records_path, names_path, data_path = run_trace_paths(path)
+        raw = records_path.read_bytes()
+        if len(raw) < _HEADER.size:
+            raise ValueError("run trace is truncated")
+        magic, version, record_size = _HEADER.unpack_from(raw)
+        if magic != _MAGIC:
+            raise ValueError("not a NyX run trace")
+        if version != _VERSION or record_size != _RECORD.size:
+            raise ValueError(f"unsupported run trace version: {version}")
+        count = (len(raw) - _HEADER.size) // _RECORD.size
+        records = cast(
+            npt.NDArray[np.void],
+            np.frombuffer(raw, dtype=RECORD_DTYPE, count=count, offset=_HEADER.size),
+        )
+        names, _consumed = _read_names(names_path) if names_path.exists() else ((), 0)
+        data = data_path.read_bytes() if data_path.exists() else b""
+        # 書き込み途中で止まり、本文や文字列が揃っていない record 以降は除く。
+        # 各ファイルは別々に書き出されるため、欠けた record が末尾とは限らない。
+        invalid = np.flatnonzero(_incomplete_records(records, len(names), len(data)))
+        complete = int(invalid[0]) if len(invalid) else len(records)
+        return cls(records[:complete].copy(), names, data)
+
+    def __len__(self) -> int:
+        """Record の件数を返します。"""
+        return len(self.records)
+
+    @property
+    def timestamps_ns(self) -> npt.NDArray[np.int64]:
+        """各 event の時刻 (UNIX epoch からの ns)。"""
+        return self.records["timestamp_ns"]
+
+    def name(self, name_id: int) -> str | None:
+        """Intern 済み文字列の id を文字列へ戻します。"""
+        return None if name_id == NO_NAME else self.names[name_id]
+
+    def events(self) -> Iterator[TechnicalLog | UserEvent]:
+        """Record を記録順に `TechnicalLog` または `UserEvent` として返します。"""
+        data = self.data
+        name = self.name
+        for row in self.records.tolist():
+            (
+                timestamp_ns,
+                kind,
+                level,
+                include_traceback,
+                _reserved,
+                component,
+                event,
+                run_id,
+                macro_id,
+                code,
+                exception_type,
+                offset,
+                message_length,
+                extra_length,
+                traceback_length,
+            ) = row
+            message_end = offset + message_length
+            extra_end = message_end + extra_length
+            message = data[offset:message_end].decode("utf-8")
+            extra = json.loads(data[message_end:extra_end]) if extra_length else {}
+            timestamp = _timestamp_from_ns(timestamp_ns)
+            if kind == KIND_USER:
+                yield UserEvent(
+                    timestamp=timestamp,
+                    level=_LEVELS[level],
+                    component=name(component) or "",
+                    event=name(event) or "",
+                    message=message,
+                    run_id=name(run_id),
+                    macro_id=name(macro_id),
+                    code=name(code),
+                    extra=extra,
+                )
+                continue
+            traceback = (
+                data[extra_end : extra_end + traceback_length].decode("utf-8")
+                if traceback_length
+                else None
+            )
+            yield TechnicalLog(
+                LogEvent(
+                    timestamp=timestamp,
+                    level=_LEVELS[level],
+                    component=name(component) or "",
+                    event=name(event) or "",
+                    message=message,
+                    run_id=name(run_id),
+                    macro_id=name(macro_id),
+                    extra=extra,
+                    exception_type=name(exception_type),
+                    traceback=traceback,
+                ),
+                include_traceback=bool(include_traceback),
+            )
+
+
+def export_run_trace_jsonl(path: Path, output: TextIO) -> int:
+    """Run trace を `RunJsonlFileSink` と同じ形式の JSONL として書き出します。
+
+    Returns:
+        書き出した event の件数。
+
+    """
+    count = 0
+    for event in RunTrace.load(path).events():
+        output.write(json.dumps(event_to_json_payload(event), ensure_ascii=False) + "\n")
+        count += 1
+    return count
+
+
+def _read_names(path: Path) -> tuple[tuple[str, ...], int]:
+    raw = path.read_bytes()
+    names: list[str] = []
+    offset = 0
+    while offset + _NAME_LENGTH.size <= len(raw):
+        (length,) = _NAME_LENGTH.unpack_from(raw, offset)
+        start = offset + _NAME_LENGTH.size
+        if start + length > len(raw):
+            break
+        names.append(raw[start : start + length].decode("utf-8"))
+        offset = start + length
+    return tuple(names), offset
+
+
+def _incomplete_records(
+    records: npt.NDArray[np.void], name_count: int, data_size: int
+) -> npt.NDArray[np.bool_]:
+    end = (
+        records["data_offset"]
+        + records["message_length"].astype(np.uint64)
+        + records["extra_length"].astype(np.uint64)
+        + records["traceback_length"].astype(np.uint64)
+    )
+    incomplete = end > data_size
+    for field in _NAME_FIELDS:
+        name_ids = records[field]
+        incomplete |= (name_ids != NO_NAME) & (name_ids >= name_count)
+    return incomplete
+
+
+def _timestamp_ns(timestamp: datetime) -> int:
+    # float の timestamp() は µs 精度を保てないため、秒と µs を分けて数える。
+    seconds = int(timestamp.replace(microsecond=0).timestamp())
+    return seconds * 1_000_000_000 + timestamp.microsecond * 1000
+
+
+def _timestamp_from_ns(timestamp_ns: int) -> datetime:
+    seconds, remainder = divmod(timestamp_ns, 1_000_000_000)
+    return datetime.fromtimestamp(seconds).replace(microsecond=remainder // 1000)
@@ -3,12 +3,21 @@
 import json
 import re
 from collections.abc import Mapping
+from functools import lru_cache
 
 from nyxpy.framework.core.logger.events import LogExtraValue
 
+# secret かどうかを記憶しておく key path の件数。
+_KEY_CACHE_SIZE = 1024
+
 
 class LogSanitizer:
-    """Log payload から secret らしい値を mask します。"""
+    """Log payload から secret らしい値を mask します。
+
+    message の mask は全 fragment をまとめた 1 つの正規表現で行い、fragment を
+    含まない message では正規表現を使いません。extra の key path の判定結果は
+    LRU に記憶します。
+    """
 
     def __init__(self, mask_secret_keys: list[str] | None = None) -> None:
         """既定の secret key fragment と追加 mask 対象を登録します。"""
@@ -25,6 +34,16 @@ class LogSanitizer:
                 *(mask_secret_keys or []),
             )
         )
+        # 長い fragment を先に試し、`authorization` が `auth` より優先されるようにする。
+        alternation = "|".join(
+            re.escape(fragment)
+            for fragment in sorted(set(self.secret_fragments), key=len, reverse=True)
+        )
+        # 値の中に別の fragment が現れても拾えるよう、先読みで重なった一致も列挙する。
+        self._secret_pattern = re.compile(
+            rf"(?=(?:{alternation})\s*[:=]\s*([^\s,;]+))", flags=re.IGNORECASE
+        )
+        self._is_secret_key = lru_cache(maxsize=_KEY_CACHE_SIZE)(self._classify_key_path)
 
     def sanitize_extra_for_technical(
         self, extra: Mapping[str, object] | None
@@ -47,14 +66,25 @@ class LogSanitizer:
 
     def mask_text(self, text: str) -> str:
         sanitized = text.replace("\r", "\\r").replace("\n", "\\n")
-        for fragment in self.secret_fragments:
-            sanitized = re.sub(
-                rf"({re.escape(fragment)}\s*[:=]\s*)[^\s,;]+",
-                r"\1***",
-                sanitized,
-                flags=re.IGNORECASE,
-            )
-        return sanitized
+        if "=" not in sanitized and ":" not in sanitized:
+            return sanitized
+        lowered = sanitized.lower()
+        if not any(fragment in lowered for fragment in self.secret_fragments):
+            return sanitized
+        parts: list[str] = []
+        masked_until = 0
+        for match in self._secret_pattern.finditer(sanitized):
+            start, end = match.span(1)
+            # 値はいずれも同じ区切り文字で終わるため、mask 済みの値の内側の一致は無視できる。
+            if start < masked_until:
+                continue
+            parts.append(sanitized[masked_until:start])
+            parts.append("***")
+            masked_until = end
+        if not parts:
+            return sanitized
+        parts.append(sanitized[masked_until:])
+        return "".join(parts)
 
     def _sanitize_value(
         self,
@@ -90,6 +120,6 @@ class LogSanitizer:
         json.dumps(text, ensure_ascii=False)
         return text
 
-    def _is_secret_key(self, key_path: tuple[str, ...]) -> bool:
+    def _classify_key_path(self, key_path: tuple[str, ...]) -> bool:
         key_text = ".".join(key_path).lower()
         return any(fragment in key_text for fragment in self.secret_fragments)
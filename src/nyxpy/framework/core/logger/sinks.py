@@ -2,18 +2,34 @@
 
 import json
 import sys
-from dataclasses import asdict
+import time
+from abc import abstractmethod
+from collections import OrderedDict
+from collections.abc import Iterable
 from pathlib import Path
-from threading import RLock
-from typing import TextIO
-
-from nyxpy.framework.core.logger.events import LogEvent, TechnicalLog, UserEvent
+from threading import RLock, Timer
+from typing import Protocol, TextIO
+
+from nyxpy.framework.core.logger.events import (
+    LogEvent,
+    TechnicalLog,
+    UserEvent,
+    event_to_json_payload,
+)
 from nyxpy.framework.core.logger.ports import LogSink
 from nyxpy.framework.core.logger.rotation import (
+    RotatingLogFile,
     RotationPolicy,
+    cleanup_retention,
     cleanup_retention_glob,
     rotate_if_needed,
 )
+from nyxpy.framework.core.logger.run_trace import RUN_TRACE_SUFFIX, RunTraceWriter
+
+# buffer に溜めた行をファイルへ書き出すまでの既定の最大間隔（秒）。
+DEFAULT_FLUSH_INTERVAL_SEC = 1.0
+# 保持期間を超えたファイルを削除する既定の間隔（秒）。
+DEFAULT_CLEANUP_INTERVAL_SEC = 3600.0
 
 
 class TestLogSink(LogSink):
@@ -66,7 +82,88 @@ class ConsoleLogSink(LogSink):
         )
 
 
-class TextFileLogSink(LogSink):
+class _BufferedFile(Protocol):
+    def flush(self) -> None: ...
+
+    def close(self) -> None: ...
+
+
+class _BufferedFileSink(LogSink):
+    """開いたままの handle へ buffer 付きで書き込む file sink の共通部分。
+
+    書き込んだ行は `flush_interval_sec` 秒以内にファイルへ書き出します。0 以下を
+    指定すると 1 行ごとに書き出します。保持期間を超えたファイルの削除は
+    `cleanup_interval_sec` 秒ごとに、書き込みのついでに行います。
+    """
+
+    def __init__(
+        self,
+        rotation: RotationPolicy,
+        *,
+        flush_interval_sec: float,
+        cleanup_interval_sec: float,
+    ) -> None:
+        self.rotation = rotation
+        self.flush_interval_sec = flush_interval_sec
+        self.cleanup_interval_sec = cleanup_interval_sec
+        self._lock = RLock()
+        self._closed = False
+        self._flush_timer: Timer | None = None
+        self._next_cleanup = time.monotonic() + cleanup_interval_sec
+
+    def flush(self) -> None:
+        with self._lock:
+            self._cancel_flush_timer()
+            for file in self._open_files():
+                file.flush()
+
+    def close(self) -> None:
+        with self._lock:
+            self._cancel_flush_timer()
+            for file in self._open_files():
+                file.close()
+            self._closed = True
+
+    def _write(self, file: RotatingLogFile, line: str) -> None:
+        file.write(line)
+        self._after_write(file)
+
+    def _after_write(self, file: _BufferedFile) -> None:
+        now = time.monotonic()
+        if now >= self._next_cleanup:
+            self._next_cleanup = now + self.cleanup_interval_sec
+            self._cleanup_retention()
+        if self.flush_interval_sec <= 0:
+            file.flush()
+        elif self._flush_timer is None:
+            self._flush_timer = Timer(self.flush_interval_sec, self._flush_from_timer)
+            self._flush_timer.name = "nyx-log-flush"
+            self._flush_timer.daemon = True
+            self._flush_timer.start()
+
+    def _flush_from_timer(self) -> None:
+        with self._lock:
+            self._flush_timer = None
+            if self._closed:
+                return
+            for file in self._open_files():
+                file.flush()
+
+    def _cancel_flush_timer(self) -> None:
+        if self._flush_timer is not None:
+            self._flush_timer.cancel()
+            self._flush_timer = None
+
+    @abstractmethod
+    def _open_files(self) -> Iterable[_BufferedFile]:
+        """開いている file handle を返す。"""
+
+    @abstractmethod
+    def _cleanup_retention(self) -> None:
+        """保持期間を超えたファイルを削除する。"""
+
+
+class TextFileLogSink(_BufferedFileSink):
     """User event と technical log を text file に保存する sink。"""
 
     def __init__(
@@ -76,18 +173,23 @@ class TextFileLogSink(LogSink):
         max_bytes: int = 10 * 1024 * 1024,
         backup_count: int = 3,
         retention_days: int = 14,
+        flush_interval_sec: float = DEFAULT_FLUSH_INTERVAL_SEC,
+        cleanup_interval_sec: float = DEFAULT_CLEANUP_INTERVAL_SEC,
     ) -> None:
         """出力 path と rotation 方針を保持し、親 directory を作成します。"""
-        self.path = Path(path)
-        self.rotation = RotationPolicy(
-            max_bytes=max_bytes,
-            backup_count=backup_count,
-            retention_days=retention_days,
+        super().__init__(
+            RotationPolicy(
+                max_bytes=max_bytes,
+                backup_count=backup_count,
+                retention_days=retention_days,
+            ),
+            flush_interval_sec=flush_interval_sec,
+            cleanup_interval_sec=cleanup_interval_sec,
         )
-        self._lock = RLock()
-        self._closed = False
+        self.path = Path(path)
         self.path.parent.mkdir(parents=True, exist_ok=True)
         rotate_if_needed(self.path, self.rotation)
+        self._file = RotatingLogFile(self.path, self.rotation)
 
     def emit_technical(self, event: TechnicalLog) -> None:
         log_event = event.event
@@ -108,19 +210,16 @@ class TextFileLogSink(LogSink):
         with self._lock:
             if self._closed:
                 return
-            rotate_if_needed(self.path, self.rotation)
-            with self.path.open("a", encoding="utf-8") as file:
-                file.write(line + "\n")
+            self._write(self._file, line)
 
-    def flush(self) -> None:
-        pass
+    def _open_files(self) -> Iterable[RotatingLogFile]:
+        return (self._file,)
 
-    def close(self) -> None:
-        with self._lock:
-            self._closed = True
+    def _cleanup_retention(self) -> None:
+        cleanup_retention(self.path, self.rotation)
 
 
-class JsonlFileSink(LogSink):
+class JsonlFileSink(_BufferedFileSink):
     """User event と technical log を単一 JSONL file に保存する sink。"""
 
     def __init__(
@@ -130,40 +229,49 @@ class JsonlFileSink(LogSink):
         max_bytes: int = 10 * 1024 * 1024,
         backup_count: int = 3,
         retention_days: int = 30,
+        flush_interval_sec: float = DEFAULT_FLUSH_INTERVAL_SEC,
+        cleanup_interval_sec: float = DEFAULT_CLEANUP_INTERVAL_SEC,
     ) -> None:
         """出力 path と rotation 方針を保持し、親 directory を作成します。"""
-        self.path = Path(path)
-        self.rotation = RotationPolicy(
-            max_bytes=max_bytes,
-            backup_count=backup_count,
-            retention_days=retention_days,
+        super().__init__(
+            RotationPolicy(
+                max_bytes=max_bytes,
+                backup_count=backup_count,
+                retention_days=retention_days,
+            ),
+            flush_interval_sec=flush_interval_sec,
+            cleanup_interval_sec=cleanup_interval_sec,
         )
-        self._lock = RLock()
-        self._closed = False
+        self.path = Path(path)
         self.path.parent.mkdir(parents=True, exist_ok=True)
         rotate_if_needed(self.path, self.rotation)
+        self._file = RotatingLogFile(self.path, self.rotation)
 
     def emit_technical(self, event: TechnicalLog) -> None:
-        self._write_event(_event_to_json(event.event, kind="technical"))
+        self._write_event(event_to_json_payload(event))
 
     def emit_user(self, event: UserEvent) -> None:
-        self._write_event(_user_event_to_json(event))
+        self._write_event(event_to_json_payload(event))
 
     def _write_event(self, payload: dict) -> None:
+        line = json.dumps(payload, ensure_ascii=False)
         with self._lock:
             if self._closed:
                 return
-            rotate_if_needed(self.path, self.rotation)
-            with self.path.open("a", encoding="utf-8") as file:
-                file.write(json.dumps(payload, ensure_ascii=False) + "\n")
+            self._write(self._file, line)
+
+    def _open_files(self) -> Iterable[RotatingLogFile]:
+        return (self._file,)
+
+    def _cleanup_retention(self) -> None:
+        cleanup_retention(self.path, self.rotation)
 
-    def close(self) -> None:
-        with self._lock:
-            self._closed = True
 
+class RunJsonlFileSink(_BufferedFileSink):
+    """Run ごとの日付 directory 配下へ JSONL log を保存する sink。
 
-class RunJsonlFileSink(LogSink):
-    """Run ごとの日付 directory 配下へ JSONL log を保存する sink。"""
+    直近に書き込んだ `max_open_files` 件の run file の handle を開いたままにします。
+    """
 
     def __init__(
         self,
@@ -172,16 +280,23 @@ class RunJsonlFileSink(LogSink):
         max_bytes: int = 10 * 1024 * 1024,
         backup_count: int = 3,
         retention_days: int = 30,
+        flush_interval_sec: float = DEFAULT_FLUSH_INTERVAL_SEC,
+        cleanup_interval_sec: float = DEFAULT_CLEANUP_INTERVAL_SEC,
+        max_open_files: int = 4,
     ) -> None:
         """出力 base directory と rotation 方針を保持します。"""
-        self.base_dir = Path(base_dir)
-        self.rotation = RotationPolicy(
-            max_bytes=max_bytes,
-            backup_count=backup_count,
-            retention_days=retention_days,
+        super().__init__(
+            RotationPolicy(
+                max_bytes=max_bytes,
+                backup_count=backup_count,
+                retention_days=retention_days,
+            ),
+            flush_interval_sec=flush_interval_sec,
+            cleanup_interval_sec=cleanup_interval_sec,
         )
-        self._lock = RLock()
-        self._closed = False
+        self.base_dir = Path(base_dir)
+        self.max_open_files = max(1, max_open_files)
+        self._files: OrderedDict[Path, RotatingLogFile] = OrderedDict()
         self.base_dir.mkdir(parents=True, exist_ok=True)
         self._cleanup_retention()
 
@@ -192,7 +307,7 @@ class RunJsonlFileSink(LogSink):
         self._write_event(
             timestamp=log_event.timestamp,
             run_id=log_event.run_id,
-            payload=_event_to_json(log_event, kind="technical"),
+            payload=event_to_json_payload(event),
         )
 
     def emit_user(self, event: UserEvent) -> None:
@@ -201,40 +316,106 @@ class RunJsonlFileSink(LogSink):
         self._write_event(
             timestamp=event.timestamp,
             run_id=event.run_id,
-            payload=_user_event_to_json(event),
+            payload=event_to_json_payload(event),
         )
 
     def _write_event(self, *, timestamp, run_id: str, payload: dict) -> None:
-        day_dir = self.base_dir / f"{timestamp:%Y%m%d}"
-        path = day_dir / f"{run_id}.jsonl"
+        path = self.base_dir / f"{timestamp:%Y%m%d}" / f"{run_id}.jsonl"
+        line = json.dumps(payload, ensure_ascii=False)
         with self._lock:
             if self._closed:
                 return
-            day_dir.mkdir(parents=True, exist_ok=True)
-            rotate_if_needed(path, self.rotation)
-            with path.open("a", encoding="utf-8") as file:
-                file.write(json.dumps(payload, ensure_ascii=False) + "\n")
-
-    def close(self) -> None:
-        with self._lock:
-            self._closed = True
+            self._write(self._run_file(path), line)
+
+    def _run_file(self, path: Path) -> RotatingLogFile:
+        file = self._files.get(path)
+        if file is not None:
+            self._files.move_to_end(path)
+            return file
+        if len(self._files) >= self.max_open_files:
+            _oldest_path, oldest = self._files.popitem(last=False)
+            oldest.close()
+        file = RotatingLogFile(path, self.rotation)
+        self._files[path] = file
+        return file
+
+    def _open_files(self) -> Iterable[RotatingLogFile]:
+        return tuple(self._files.values())
 
     def _cleanup_retention(self) -> None:
         cleanup_retention_glob(self.base_dir, "*/*.jsonl*", self.rotation.retention_days)
 
 
-def _event_to_json(event: LogEvent, *, kind: str | None = None) -> dict:
-    payload = asdict(event)
-    payload["timestamp"] = event.timestamp.isoformat()
-    payload["level"] = event.level.value
-    if kind is not None:
-        payload["kind"] = kind
-    return payload
+class RunTraceFileSink(_BufferedFileSink):
+    """Run ごとの日付 directory 配下へ binary run trace を保存する sink。
+
+    `RunJsonlFileSink` と同じ directory に `<run_id>.nyxlog` を作ります。形式と読み込み
+    方法は `nyxpy.framework.core.logger.run_trace` を参照してください。run trace は
+    1 run を 1 つのファイルにまとめるため、サイズによる rotation は行いません。
+    """
+
+    def __init__(
+        self,
+        base_dir: Path,
+        *,
+        retention_days: int = 30,
+        flush_interval_sec: float = DEFAULT_FLUSH_INTERVAL_SEC,
+        cleanup_interval_sec: float = DEFAULT_CLEANUP_INTERVAL_SEC,
+        max_open_files: int = 4,
+    ) -> None:
+        """出力 base directory と保持日数を保持します。"""
+        super().__init__(
+            RotationPolicy(max_bytes=0, backup_count=0, retention_days=retention_days),
+            flush_interval_sec=flush_interval_sec,
+            cleanup_interval_sec=cleanup_interval_sec,
+        )
+        self.base_dir = Path(base_dir)
+        self.max_open_files = max(1, max_open_files)
+        self._writers: OrderedDict[tuple[int, int, int, str], RunTraceWriter] = OrderedDict()
+        self.base_dir.mkdir(parents=True, exist_ok=True)
+        self._cleanup_retention()
+
+    def emit_technical(self, event: TechnicalLog) -> None:
+        log_event = event.event
+        if log_event.run_id is None:
+            return
+        with self._lock:
+            if self._closed:
+                return
+            writer = self._run_writer(log_event.timestamp, log_event.run_id)
+            writer.write_technical(event)
+            self._after_write(writer)
+
+    def emit_user(self, event: UserEvent) -> None:
+        if event.run_id is None:
+            return
+        with self._lock:
+            if self._closed:
+                return
+            writer = self._run_writer(event.timestamp, event.run_id)
+            writer.write_user(event)
+            self._after_write(writer)
+
+    def _run_writer(self, timestamp, run_id: str) -> RunTraceWriter:
+        # Path の組み立てと hash は event ごとには重いため、日付と run id で引く。
+        key = (timestamp.year, timestamp.month, timestamp.day, run_id)
+        writer = self._writers.get(key)
+        if writer is not None:
+            self._writers.move_to_end(key)
+            return writer
+        if len(self._writers) >= self.max_open_files:
+            _oldest_key, oldest = self._writers.popitem(last=False)
+            oldest.close()
+        writer = RunTraceWriter(
+            self.base_dir / f"{timestamp:%Y%m%d}" / f"{run_id}{RUN_TRACE_SUFFIX}"
+        )
+        self._writers[key] = writer
+        return writer
 
+    def _open_files(self) -> Iterable[RunTraceWriter]:
+        return tuple(self._writers.values())
 
-def _user_event_to_json(event: UserEvent) -> dict:
-    payload = asdict(event)
-    payload["timestamp"] = event.timestamp.isoformat()
-    payload["level"] = event.level.value
-    payload["kind"] = "user"
-    return payload
+    def _cleanup_retention(self) -> None:
+        cleanup_retention_glob(
+            self.base_dir, f"*/*{RUN_TRACE_SUFFIX}*", self.rotation.retention_days
+        )
@@ -14,8 +14,8 @@ class MacroBase(ABC):
     """NyX マクロの基底クラス。
 
     サブクラスは `initialize()`, `run()`, `finalize()` を実装します。
-    `description`, `display_name`, `tags`, `args_schema`, `settings_path`
-    は一覧表示、検索、設定読み込みに使うメタデータです。
+    `description`, `display_name`, `tags`, `args_schema`, `settings_path`,
+    `ocr_languages` は一覧表示、検索、設定読み込み、実行準備に使うメタデータです。
     """
 
     description: str = ""
@@ -27,6 +27,9 @@ class MacroBase(ABC):
     tags: list[str] = []
     """検索・分類用のタグ。"""
 
+    ocr_languages: list[str] = []
+    """マクロが使う OCR の認識言語。指定した言語の OCR エンジンは選択時・実行開始時に warm-up されます。"""
+
     args_schema: "SettingsSchema | None" = None
     """実行引数を検証する schema。未指定の場合は raw args が渡ります。"""
 
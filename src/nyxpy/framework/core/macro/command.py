@@ -4,20 +4,40 @@ from __future__ import annotations
 
 import inspect
 import pathlib
+import time
 from abc import ABC, abstractmethod
+from collections.abc import Iterable
+from fractions import Fraction
 from typing import TYPE_CHECKING
 
 import cv2
 
 from nyxpy.framework.core.constants import IMUFrame, KeyCode, KeyType, SpecialKeyCode
+from nyxpy.framework.core.io.ports import CapturedFrame, FrameNotReadyError, TapResult
 from nyxpy.framework.core.io.resources import ArtifactScope, OverwritePolicy, ResourceRef
 from nyxpy.framework.core.macro.decorators import check_interrupt
+from nyxpy.framework.core.macro.exceptions import ConfigurationError
+from nyxpy.framework.core.macro.stick_path import StickPath, StickPathPlayback
 from nyxpy.framework.core.macro.text_input import validate_keyboard_text
-from nyxpy.framework.core.utils.cancellation import CancellationToken, cancellation_aware_wait
+from nyxpy.framework.core.macro.timeline import InputTimeline, TimelinePlayback, TimelineState
+from nyxpy.framework.core.utils.cancellation import (
+    CancellationToken,
+    WaitErrorStats,
+    cancellation_aware_wait,
+)
 
 if TYPE_CHECKING:
     from nyxpy.framework.core.runtime.context import ExecutionContext
 
+# 新しい frame 待機中に中断要求を確認する間隔（秒）。
+_FRESH_FRAME_POLL_SECONDS = 0.05
+# `capture()` が返す画像の基準解像度 (width, height)。
+_CAPTURE_RESOLUTION = (1280, 720)
+# 同一 frame から派生した画像を保持する最大件数。
+_CAPTURE_CACHE_MAX_ENTRIES = 16
+
+type _CaptureCacheKey = tuple[tuple[int, int, int, int] | None, bool]
+
 
 def _get_caller_class_name() -> str | None:
     frame = inspect.currentframe()
@@ -76,7 +96,7 @@ class Command(ABC):
         pass
 
     @abstractmethod
-    def wait(self, wait: float) -> None:
+    def wait(self, wait: float, *, precise: bool | None = None) -> None:
         """指定秒数だけ待機します。
 
         実装は待機中も中断要求を確認します。長い処理では `time.sleep()` を直接使わず、
@@ -84,6 +104,8 @@ class Command(ABC):
 
         Args:
             wait: 待機時間（秒）。
+            precise: `True` の場合、期限直前を spin で待ち、サブミリ秒の精度で戻ります。
+                `None` の場合はグローバル設定 `runtime.precise_wait` に従います。
 
         """
         pass
@@ -111,7 +133,11 @@ class Command(ABC):
 
     @abstractmethod
     def capture(
-        self, crop_region: tuple[int, int, int, int] | None = None, grayscale: bool = False
+        self,
+        crop_region: tuple[int, int, int, int] | None = None,
+        grayscale: bool = False,
+        *,
+        fresh: bool = False,
     ) -> cv2.typing.MatLike:
         """キャプチャデバイスからHD解像度(1280x720) にリスケールしたスクリーンショットを取得し、必要に応じてクロップ及びグレースケール変換を行います。
 
@@ -121,12 +147,14 @@ class Command(ABC):
         Args:
             crop_region: クロップする領域の指定 `(x, y, width, height)`。
             grayscale: グレースケール変換を行うか。
+            fresh: `True` の場合、前回の `capture()` より新しいフレームが届くまで待機します。
 
         Returns:
             キャプチャした画像データ。
 
         Raises:
-            FrameNotReadyError: フレームがまだ取得できない場合。
+            FrameNotReadyError: フレームがまだ取得できない場合。`fresh=True` で
+                新しいフレームが `frame_ready_timeout_sec` 内に届かない場合も含みます。
             ValueError: クロップ領域がフレームサイズ (1280x720) を超える場合。
 
         """
@@ -351,6 +379,38 @@ class Command(ABC):
         """外部サービスへ通知を送信する"""
         pass
 
+    def tap(
+        self,
+        *keys: KeyType,
+        dur: float = 0.1,
+        wait: float = 0.1,
+        repeat: int = 1,
+        precise: bool | None = None,
+    ) -> TapResult:
+        """`keys` の押下と解放を `repeat` 回繰り返します。
+
+        `press()` を loop で呼ぶ場合と同じ入力を送りますが、押下と解放の送信内容は最初に
+        1 回だけ組み立て、各押下は開始時刻から `(dur + wait)` 秒ごとの予定時刻に送ります。
+        ログも押下ごとではなく、最後に `command.tap` を 1 件だけ記録します。
+
+        Args:
+            keys: 押すキー。
+            dur: 押し続ける秒数。
+            wait: 解放後、次の押下または終了までの秒数。
+            repeat: 押下の回数。
+            precise: 予定時刻の直前を spin で待つかどうか。`None` の場合は `cmd.wait()` と
+                同じく設定 `runtime.precise_wait` に従います。
+
+        Returns:
+            押下した回数と予定時刻からの遅れ。
+
+        Raises:
+            ConfigurationError: `dur`、`wait`、`repeat` のいずれかが負の場合。
+            MacroCancelled: 繰り返し中に中断要求があった場合。
+
+        """
+        raise NotImplementedError("Current command does not support tap.")
+
     def touch(self, x: int, y: int, dur: float = 0.1, wait: float = 0.1) -> None:
         """3DS touch 対応プロトコルで touch down / wait / touch up を行います。"""
         raise NotImplementedError("Current serial protocol does not support touch input.")
@@ -371,6 +431,70 @@ class Command(ABC):
         """IMU 入力を現在状態へ反映します。対応しない backend は失敗します。"""
         raise NotImplementedError("Current controller output does not support IMU input.")
 
+    def schedule(
+        self,
+        timeline: InputTimeline | Iterable[TimelineState],
+        *,
+        wait: bool = True,
+        precise: bool | None = None,
+    ) -> TimelinePlayback:
+        """開始時刻からの offset で入力を送る timeline を専用 thread で再生します。
+
+        `press()` と `wait()` を繰り返す場合と違い、各入力は開始時刻を基準にした予定時刻へ
+        送られるため、入力ごとの処理時間が後続の入力へ積み重なりません。`precise` を有効にすると
+        予定時刻の直前は `time.perf_counter()` を spin して待つため、フレーム単位の入力に向きます。
+
+        再生中は同じ controller へ他の入力を送らないでください。
+
+        Args:
+            timeline: 再生する `InputTimeline`、または `(offset 秒, 押下中のキー)` の並び。
+            wait: `True` の場合は再生が終わるまで待機します。`False` の場合はすぐに戻り、
+                返り値の `result()` で終了を待てます。
+            precise: 予定時刻の直前を spin で待つかどうか。`None` の場合は `cmd.wait()` と
+                同じく設定 `runtime.precise_wait` に従います。
+
+        Returns:
+            再生の handle。`result()` で入力ごとの予定時刻からの遅れを取得できます。
+
+        Raises:
+            MacroCancelled: `wait=True` で再生中に中断要求があった場合。
+
+        """
+        raise NotImplementedError("Current command does not support input timelines.")
+
+    def stick_path(
+        self,
+        path: StickPath,
+        *,
+        wait: bool = True,
+        release: bool = True,
+        precise: bool | None = None,
+    ) -> StickPathPlayback:
+        """Stick の位置を `path.interval` 秒ごとに専用 thread から送ります。
+
+        `press()` を loop で呼ぶ場合と違い、全位置の送信内容を最初にまとめて組み立て、
+        各位置は開始時刻から `i * interval` 秒後の予定時刻に送ります。ログも位置ごとでは
+        なく、終了時に `command.stick_path` を 1 件だけ記録します。
+
+        再生中は同じ controller へ他の入力を送らないでください。
+
+        Args:
+            path: 再生する `StickPath`。
+            wait: `True` の場合は再生が終わるまで待機します。`False` の場合はすぐに戻り、
+                返り値の `result()` で終了を待てます。
+            release: 終了時に stick を中央へ戻すかどうか。
+            precise: 予定時刻の直前を spin で待つかどうか。`None` の場合は `cmd.wait()` と
+                同じく設定 `runtime.precise_wait` に従います。
+
+        Returns:
+            再生の handle。`result()` で送信した位置の数と予定時刻からの遅れを取得できます。
+
+        Raises:
+            MacroCancelled: `wait=True` で再生中に中断要求があった場合。
+
+        """
+        raise NotImplementedError("Current command does not support stick paths.")
+
 
 class DefaultCommand(Command):
     """DefaultCommand は、フレームワーク側で提供するコマンド実装です。
@@ -386,6 +510,11 @@ class DefaultCommand(Command):
         """実行 context を受け取り、controller と cancellation token へ接続します。"""
         self.context = context
         self.ct: CancellationToken = context.cancellation_token
+        self._last_capture_seq = 0
+        self._capture_cache_seq = 0
+        self._capture_cache: dict[_CaptureCacheKey, cv2.typing.MatLike] = {}
+        self._playback: TimelinePlayback | StickPathPlayback | None = None
+        self.wait_stats = WaitErrorStats()
 
     @check_interrupt
     def press(self, *keys: KeyType, dur: float = 0.1, wait: float = 0.1) -> None:
@@ -398,6 +527,50 @@ class DefaultCommand(Command):
         if wait > 0:
             self.wait(wait)
 
+    @check_interrupt
+    def tap(
+        self,
+        *keys: KeyType,
+        dur: float = 0.1,
+        wait: float = 0.1,
+        repeat: int = 1,
+        precise: bool | None = None,
+    ) -> TapResult:
+        if dur < 0 or wait < 0 or repeat < 0:
+            raise ConfigurationError(
+                "tap dur, wait and repeat must be greater than or equal to 0",
+                code="NYX_INVALID_TAP",
+                component="Command.tap",
+                details={"dur": dur, "wait": wait, "repeat": repeat},
+            )
+        options = self.context.options
+        if precise is None:
+            precise = options.precise_wait
+        result = self.context.controller.tap(
+            keys,
+            dur,
+            wait,
+            repeat=repeat,
+            token=self.ct,
+            spin_margin=options.precise_wait_margin_sec if precise else 0.0,
+        )
+        self.context.logger.technical(
+            "DEBUG",
+            f"Tapped keys: {keys}",
+            component="Command",
+            event="command.tap",
+            extra={
+                "keys": [repr(key) for key in keys],
+                "repeat": repeat,
+                "taps": result.taps,
+                "cancelled": result.cancelled,
+                "elapsed_ms": round(result.elapsed_sec * 1000, 3),
+                "max_lateness_ms": round(result.max_lateness_sec * 1000, 3),
+            },
+        )
+        self.ct.throw_if_requested()
+        return result
+
     @check_interrupt
     def hold(self, *keys: KeyType) -> None:
         self._debug_command(f"Holding keys: {keys}")
@@ -436,9 +609,81 @@ class DefaultCommand(Command):
         self.context.controller.imu(*frames)
 
     @check_interrupt
-    def wait(self, wait: float) -> None:
+    def schedule(
+        self,
+        timeline: InputTimeline | Iterable[TimelineState],
+        *,
+        wait: bool = True,
+        precise: bool | None = None,
+    ) -> TimelinePlayback:
+        self._ensure_no_playback("Command.schedule")
+        options = self.context.options
+        if precise is None:
+            precise = options.precise_wait
+        if not isinstance(timeline, InputTimeline):
+            timeline = InputTimeline.from_states(timeline)
+        self._debug_command(f"Scheduling {len(timeline)} inputs over {timeline.duration} seconds")
+        playback = TimelinePlayback(
+            timeline,
+            self.context.controller,
+            self.ct,
+            start_at=time.perf_counter(),
+            spin_margin=options.precise_wait_margin_sec if precise else 0.0,
+            logger=self.context.logger,
+        )
+        self._playback = playback
+        playback.start()
+        if wait:
+            playback.result()
+            self.ct.throw_if_requested()
+        return playback
+
+    @check_interrupt
+    def stick_path(
+        self,
+        path: StickPath,
+        *,
+        wait: bool = True,
+        release: bool = True,
+        precise: bool | None = None,
+    ) -> StickPathPlayback:
+        self._ensure_no_playback("Command.stick_path")
+        options = self.context.options
+        if precise is None:
+            precise = options.precise_wait
+        self._debug_command(f"Streaming {len(path)} stick positions every {path.interval} seconds")
+        playback = StickPathPlayback(
+            path,
+            self.context.controller,
+            self.ct,
+            release=release,
+            spin_margin=options.precise_wait_margin_sec if precise else 0.0,
+            logger=self.context.logger,
+        )
+        self._playback = playback
+        playback.start()
+        if wait:
+            playback.result()
+            self.ct.throw_if_requested()
+        return playback
+
+    @check_interrupt
+    def wait(self, wait: float, *, precise: bool | None = None) -> None:
         self._debug_command(f"Waiting for {wait} seconds")
-        cancellation_aware_wait(wait, self.ct)
+        options = self.context.options
+        if precise is None:
+            precise = options.precise_wait
+        started = time.perf_counter()
+        completed = cancellation_aware_wait(
+            wait,
+            self.ct,
+            precise=precise,
+            spin_margin=options.precise_wait_margin_sec,
+        )
+        if completed:
+            self.wait_stats.record(
+                "precise" if precise else "coarse", time.perf_counter() - started - wait
+            )
         self.ct.throw_if_requested()
 
     def stop(self) -> None:
@@ -446,45 +691,123 @@ class DefaultCommand(Command):
         self.ct.request_cancel(reason="stop requested", source="macro")
 
     def log(self, *values: object, sep: str = " ", end: str = "\n", level: str = "DEBUG") -> None:
+        logger = self.context.logger
+        is_enabled = getattr(logger, "is_enabled", None)
+        if is_enabled is not None and not is_enabled(level):
+            return
         message = sep.join(map(str, values)) + end.rstrip("\n")
         caller_class = _get_caller_class_name() or "Command"
-        self.context.logger.user(
+        logger.user(
             level,
             message,
             component=caller_class,
             event="command.log",
         )
 
+    def _ensure_no_playback(self, component: str) -> None:
+        playback = self._playback
+        if playback is not None and not playback.done():
+            running = "stick path" if isinstance(playback, StickPathPlayback) else "input timeline"
+            raise ConfigurationError(
+                f"another {running} is still playing",
+                code="NYX_TIMELINE_ALREADY_RUNNING",
+                component=component,
+                details={"running": running},
+            )
+
     def _debug_command(self, message: str) -> None:
         if self.context.options.command_debug_enabled:
             self.log(message, level="DEBUG")
 
     @check_interrupt
     def capture(
-        self, crop_region: tuple[int, int, int, int] | None = None, grayscale: bool = False
+        self,
+        crop_region: tuple[int, int, int, int] | None = None,
+        grayscale: bool = False,
+        *,
+        fresh: bool = False,
     ) -> cv2.typing.MatLike:
         self._debug_command("Capturing screen...")
-        capture_data = self.context.frame_source.latest_frame()
-        frame = self._format_capture(capture_data, crop_region, grayscale)
+        if fresh:
+            captured = self._wait_for_fresh_frame()
+        else:
+            captured = self.context.frame_source.latest_captured_frame()
+        self._last_capture_seq = max(self._last_capture_seq, captured.seq)
+        frame = self._format_capture(captured.image, crop_region, grayscale, seq=captured.seq)
         self._debug_command("Capture successful")
         return frame
 
+    def _wait_for_fresh_frame(self) -> CapturedFrame:
+        deadline = time.monotonic() + self.context.options.frame_ready_timeout_sec
+        while True:
+            self.ct.throw_if_requested()
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise FrameNotReadyError("No new frame arrived before timeout.")
+            captured = self.context.frame_source.wait_for_next_frame(
+                self._last_capture_seq,
+                min(_FRESH_FRAME_POLL_SECONDS, remaining),
+            )
+            if captured is not None:
+                return captured
+
     def _format_capture(
         self,
         capture_data: cv2.typing.MatLike,
         crop_region: tuple[int, int, int, int] | None,
         grayscale: bool,
+        *,
+        seq: int = 0,
     ) -> cv2.typing.MatLike:
-        target_resolution = (1280, 720)
-        frame = cv2.resize(capture_data, target_resolution, interpolation=cv2.INTER_AREA)
+        """Frame を 1280x720 基準で crop・グレースケール変換した新しい配列を返します。
+
+        同じ `seq` の frame から作った画像は `(crop_region, grayscale)` ごとに保持し、
+        同一 frame に対する複数 ROI の capture では resize をやり直しません。
+        `seq` が 0 の frame は同一性を判定できないため保持しません。
+        """
         if crop_region is not None:
             x, y, w, h = crop_region
-            if x < 0 or y < 0 or x + w > frame.shape[1] or y + h > frame.shape[0]:
+            target_w, target_h = _CAPTURE_RESOLUTION
+            if x < 0 or y < 0 or x + w > target_w or y + h > target_h:
                 raise ValueError("Crop region exceeds frame size")
-            frame = frame[y : y + h, x : x + w]
+        if seq <= 0:
+            return self._derive_capture(capture_data, crop_region, grayscale, {})
+        if seq != self._capture_cache_seq:
+            self._capture_cache.clear()
+            self._capture_cache_seq = seq
+        key = (crop_region, grayscale)
+        frame = self._capture_cache.get(key)
+        if frame is None:
+            frame = self._derive_capture(capture_data, crop_region, grayscale, self._capture_cache)
+            _remember_capture(self._capture_cache, key, frame)
+        # 呼び出し側が返り値を書き換えても保持中の画像へ影響しないよう複製する。
+        return frame.copy()
+
+    def _derive_capture(
+        self,
+        capture_data: cv2.typing.MatLike,
+        crop_region: tuple[int, int, int, int] | None,
+        grayscale: bool,
+        cache: dict[_CaptureCacheKey, cv2.typing.MatLike],
+    ) -> cv2.typing.MatLike:
         if grayscale:
-            frame = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
-        return frame
+            color = cache.get((crop_region, False))
+            if color is None:
+                color = self._derive_capture(capture_data, crop_region, False, cache)
+            return cv2.cvtColor(color, cv2.COLOR_BGR2GRAY)
+        full_frame = cache.get((None, False))
+        if crop_region is None:
+            return full_frame if full_frame is not None else _resize_full_frame(capture_data)
+        x, y, w, h = crop_region
+        if full_frame is None:
+            source_region = _aligned_source_region(capture_data, crop_region)
+            if source_region is not None:
+                return _resize_source_region(capture_data, source_region, (w, h))
+            # 元解像度の pixel 境界に揃わない ROI は、全体を resize してから切り出す。
+            # 先に切り出すと INTER_AREA が平均する範囲が変わり、結果が一致しない。
+            full_frame = _resize_full_frame(capture_data)
+            _remember_capture(cache, (None, False), full_frame)
+        return full_frame[y : y + h, x : x + w].copy()
 
     @check_interrupt
     def load_img(
@@ -594,3 +917,58 @@ class DefaultCommand(Command):
                 extra={"message": str(exc)},
                 exc=exc,
             )
+
+
+def _remember_capture(
+    cache: dict[_CaptureCacheKey, cv2.typing.MatLike],
+    key: _CaptureCacheKey,
+    frame: cv2.typing.MatLike,
+) -> None:
+    if key not in cache and len(cache) >= _CAPTURE_CACHE_MAX_ENTRIES:
+        del cache[next(iter(cache))]
+    cache[key] = frame
+
+
+def _resize_full_frame(capture_data: cv2.typing.MatLike) -> cv2.typing.MatLike:
+    return cv2.resize(capture_data, _CAPTURE_RESOLUTION, interpolation=cv2.INTER_AREA)
+
+
+def _aligned_source_region(
+    capture_data: cv2.typing.MatLike,
+    region: tuple[int, int, int, int],
+) -> tuple[int, int, int, int] | None:
+    """1280x720 基準の `region` が元解像度の pixel 境界へ揃う場合、その範囲を返します。
+
+    縮小率が 2 進で正確に表せ、ROI の四辺が元画像の整数座標へ写る場合だけ、
+    切り出してから resize した結果が全体を resize して切り出した結果と一致します。
+    それ以外は `None` を返します。
+    """
+    x, y, w, h = region
+    if w <= 0 or h <= 0:
+        return None
+    source_h, source_w = capture_data.shape[:2]
+    target_w, target_h = _CAPTURE_RESOLUTION
+    bounds: list[int] = []
+    for source, target, start, length in ((source_w, target_w, x, w), (source_h, target_h, y, h)):
+        scale = Fraction(source, target)
+        if scale < 1 or scale.denominator & (scale.denominator - 1):
+            return None
+        first = start * scale
+        last = (start + length) * scale
+        if first.denominator != 1 or last.denominator != 1:
+            return None
+        bounds.extend((int(first), int(last)))
+    left, right, top, bottom = bounds
+    return left, top, right, bottom
+
+
+def _resize_source_region(
+    capture_data: cv2.typing.MatLike,
+    source_region: tuple[int, int, int, int],
+    size: tuple[int, int],
+) -> cv2.typing.MatLike:
+    left, top, right, bottom = source_region
+    crop = capture_data[top:bottom, left:right]
+    if crop.shape[1::-1] == size:
+        return crop.copy()
+    return cv2.resize(crop, size, interpolation=cv2.INTER_AREA)
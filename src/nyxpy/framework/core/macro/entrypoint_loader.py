@@ -81,6 +81,7 @@ class EntryPointLoader:
                 display_name=macro_table.get("display_name"),
                 description=macro_table.get("description"),
                 tags=macro_table.get("tags"),
+                ocr_languages=macro_table.get("ocr_languages"),
             )
         finally:
             self._clear_stale_module(self.module_prefix)
@@ -134,6 +135,7 @@ class EntryPointLoader:
                 display_name=getattr(macro_cls, "display_name", None),
                 description=getattr(macro_cls, "description", None),
                 tags=getattr(macro_cls, "tags", None),
+                ocr_languages=getattr(macro_cls, "ocr_languages", None),
             )
         finally:
             self._clear_stale_module(self.module_prefix)
@@ -211,12 +213,21 @@ class EntryPointLoader:
         display_name,
         description,
         tags,
+        ocr_languages,
     ) -> MacroDefinition:
         class_name = macro_cls.__name__
         description_value = self._description(macro_cls, description)
         tags_value = tuple(
             str(tag) for tag in (tags if tags is not None else getattr(macro_cls, "tags", ()))
         )
+        ocr_languages_value = tuple(
+            str(language)
+            for language in (
+                ocr_languages
+                if ocr_languages is not None
+                else getattr(macro_cls, "ocr_languages", ())
+            )
+        )
         return MacroDefinition(
             id=macro_id,
             aliases=(class_name,),
@@ -234,6 +245,7 @@ class EntryPointLoader:
             manifest_path=manifest_path.resolve() if manifest_path is not None else None,
             entrypoint_kind=entrypoint_kind,
             resources_root=(self.resources_dir / macro_id).resolve(),
+            ocr_languages=ocr_languages_value,
         )
 
     def _description(self, macro_cls: type[MacroBase], explicit_description) -> str:
@@ -112,6 +112,7 @@ class MacroDefinition:
     manifest_path: Path | None = None
     entrypoint_kind: str = "convention"
     resources_root: Path | None = None
+    ocr_languages: tuple[str, ...] = ()
 
 
 @dataclass(frozen=True)
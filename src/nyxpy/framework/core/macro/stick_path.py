@@ -0,0 +1,287 @@
+"""一定間隔で stick の位置を送る stick path。"""
+
+from __future__ import annotations
+
+import math
+import threading
+from collections.abc import Callable, Iterable
+from typing import cast
+
+import numpy as np
+import numpy.typing as npt
+
+from nyxpy.framework.core.constants import LStick, RStick
+from nyxpy.framework.core.io.ports import (
+    ControllerOutputPort,
+    StickPathResult,
+    StickPosition,
+)
+from nyxpy.framework.core.logger.ports import LoggerPort
+from nyxpy.framework.core.macro.exceptions import ConfigurationError
+from nyxpy.framework.core.utils.cancellation import DEFAULT_SPIN_MARGIN_SEC, CancellationToken
+
+type StickType = type[LStick] | type[RStick]
+type PolarPoint = tuple[float, float]
+
+
+class StickPath:
+    """`interval` 秒ごとに送る stick 位置の並び。
+
+    `cmd.stick_path()` へ渡すと専用 thread が各位置を予定時刻へ送ります。位置は
+    `LStick` / `RStick` の並びのほか、角度と傾きの配列や、時刻から角度と傾きを返す
+    関数から作れます。角度は右を 0、反時計回りを正とする radian です。
+
+    ```python
+    path = StickPath.circle(duration=2.0, interval=1 / 60, turns=2)
+    cmd.stick_path(path)
+    ```
+    """
+
+    def __init__(self, positions: Iterable[StickPosition], interval: float) -> None:
+        """位置の並びと送信間隔から stick path を作ります。
+
+        Raises:
+            ConfigurationError: `interval` が 0 以下、または位置が stick でない場合。
+
+        """
+        if not interval > 0:
+            raise _invalid_path("interval must be greater than 0", interval=interval)
+        positions = tuple(positions)
+        for position in positions:
+            if not isinstance(position, LStick | RStick):
+                raise _invalid_path(
+                    "stick path positions must be LStick or RStick",
+                    position=repr(position),
+                )
+        self.positions: tuple[StickPosition, ...] = positions
+        self.interval = float(interval)
+
+    @classmethod
+    def from_polar(
+        cls,
+        angles: npt.ArrayLike,
+        magnitudes: npt.ArrayLike = 1.0,
+        *,
+        interval: float,
+        stick: StickType = LStick,
+        degrees: bool = False,
+    ) -> StickPath:
+        """角度と傾きの配列から stick path を作ります。
+
+        Args:
+            angles: 各位置の角度。1 次元の配列または数値の並び。
+            magnitudes: 各位置の傾き (0.0〜1.0)。数値を渡すと全位置で同じ傾きです。
+            interval: 位置を送る間隔（秒）。
+            stick: 位置の型。`LStick` または `RStick`。
+            degrees: `angles` を度数法として扱うかどうか。
+
+        Raises:
+            ConfigurationError: 配列の形が合わない、または非有限値を含む場合。
+
+        """
+        angle_values = np.asarray(angles, dtype=np.float64)
+        if angle_values.ndim != 1:
+            raise _invalid_path(
+                "angles must be a 1-dimensional array", shape=list(angle_values.shape)
+            )
+        try:
+            magnitude_values = np.broadcast_to(
+                np.asarray(magnitudes, dtype=np.float64), angle_values.shape
+            )
+        except ValueError as exc:
+            raise _invalid_path(
+                "magnitudes must be a scalar or match the length of angles",
+                shape=list(np.shape(magnitudes)),
+            ) from exc
+        if degrees:
+            angle_values = np.radians(angle_values)
+        if not (np.isfinite(angle_values).all() and np.isfinite(magnitude_values).all()):
+            raise _invalid_path("angles and magnitudes must be finite")
+        return cls(
+            (
+                stick(angle, magnitude)
+                for angle, magnitude in zip(
+                    angle_values.tolist(), magnitude_values.tolist(), strict=True
+                )
+            ),
+            interval,
+        )
+
+    @classmethod
+    def from_function(
+        cls,
+        function: Callable[[float], PolarPoint],
+        duration: float,
+        *,
+        interval: float,
+        stick: StickType = LStick,
+        degrees: bool = False,
+    ) -> StickPath:
+        """開始からの秒数を受け取り `(角度, 傾き)` を返す関数を標本化します。
+
+        `0, interval, 2 * interval, ...` の `duration` 未満の各時刻で `function` を呼びます。
+        """
+        if duration < 0:
+            raise _invalid_path("duration must be greater than or equal to 0", duration=duration)
+        if not interval > 0:
+            raise _invalid_path("interval must be greater than 0", interval=interval)
+        count = math.ceil(duration / interval - 1e-9)
+        points = [function(index * interval) for index in range(count)]
+        return cls.from_polar(
+            [angle for angle, _magnitude in points],
+            [magnitude for _angle, magnitude in points],
+            interval=interval,
+            stick=stick,
+            degrees=degrees,
+        )
+
+    @classmethod
+    def circle(
+        cls,
+        duration: float,
+        *,
+        interval: float,
+        turns: float = 1.0,
+        magnitude: float = 1.0,
+        start_angle: float = 0.0,
+        clockwise: bool = False,
+        stick: StickType = LStick,
+    ) -> StickPath:
+        """`duration` 秒で `turns` 周する円を描く stick path を作ります。
+
+        `start_angle` は radian です。最後の位置は開始位置の 1 間隔手前になるため、
+        同じ path を続けて再生しても継ぎ目で同じ位置が重なりません。
+        """
+        if duration < 0:
+            raise _invalid_path("duration must be greater than or equal to 0", duration=duration)
+        if not interval > 0:
+            raise _invalid_path("interval must be greater than 0", interval=interval)
+        count = math.ceil(duration / interval - 1e-9)
+        direction = -1.0 if clockwise else 1.0
+        angles = start_angle + direction * math.tau * turns * np.arange(count) / max(count, 1)
+        return cls.from_polar(angles, magnitude, interval=interval, stick=stick)
+
+    @property
+    def duration(self) -> float:
+        """最後の位置を 1 間隔保持し終えるまでの秒数。"""
+        return len(self.positions) * self.interval
+
+    def __len__(self) -> int:
+        """位置の件数を返します。"""
+        return len(self.positions)
+
+
+class StickPathPlayback:
+    """専用 thread で再生中の stick path。
+
+    送信内容は再生開始時に controller port がまとめて組み立て、以後は予定時刻ごとに
+    送信だけを行います。再生は `CancellationToken` の中断要求で止まります。
+    """
+
+    def __init__(
+        self,
+        path: StickPath,
+        controller: ControllerOutputPort,
+        token: CancellationToken,
+        *,
+        release: bool = True,
+        spin_margin: float = DEFAULT_SPIN_MARGIN_SEC,
+        logger: LoggerPort | None = None,
+    ) -> None:
+        """再生する path と送信先を保持します。再生は `start()` で始まります。
+
+        Args:
+            path: 再生する stick path。
+            controller: 位置の送信先。
+            token: 再生を止める中断 token。
+            release: 終了時に stick を中央へ戻すかどうか。
+            spin_margin: 予定時刻の何秒前から spin に切り替えるか。
+            logger: 再生終了時に遅れの統計を記録する logger。
+
+        """
+        self.path = path
+        self._controller = controller
+        self._token = token
+        self._release = release
+        self._spin_margin = spin_margin
+        self._logger = logger
+        self._result: StickPathResult | None = None
+        self._error: BaseException | None = None
+        self._thread = threading.Thread(target=self._run, name="nyx-stick-path", daemon=True)
+
+    def start(self) -> None:
+        """再生 thread を起動します。"""
+        self._thread.start()
+
+    def done(self) -> bool:
+        """再生が終わったかを返します。"""
+        return self._thread.ident is not None and not self._thread.is_alive()
+
+    def wait(self, timeout: float | None = None) -> bool:
+        """再生の終了を待ちます。
+
+        Returns:
+            `timeout` 秒以内に再生が終わった場合は `True`。
+
+        """
+        self._thread.join(timeout)
+        return not self._thread.is_alive()
+
+    def result(self, timeout: float | None = None) -> StickPathResult:
+        """再生の終了を待ち、送信した位置の数と予定時刻からの遅れを返します。
+
+        Raises:
+            TimeoutError: `timeout` 秒以内に再生が終わらなかった場合。
+            Exception: 送信中に controller port が送出した例外。
+
+        """
+        if not self.wait(timeout):
+            raise TimeoutError("Stick path playback did not finish in time.")
+        if self._error is not None:
+            raise self._error
+        return cast(StickPathResult, self._result)
+
+    def _run(self) -> None:
+        try:
+            self._result = self._controller.stick_path(
+                self.path.positions,
+                self.path.interval,
+                release=self._release,
+                token=self._token,
+                spin_margin=self._spin_margin,
+            )
+        except BaseException as exc:
+            self._error = exc
+        finally:
+            self._log_result()
+
+    def _log_result(self) -> None:
+        if self._logger is None:
+            return
+        result = self._result
+        self._logger.technical(
+            "DEBUG",
+            "Stick path playback finished.",
+            component="StickPath",
+            event="command.stick_path",
+            extra={
+                "scheduled": len(self.path),
+                "sent": result.frames if result is not None else 0,
+                "interval_ms": round(self.path.interval * 1000, 3),
+                "cancelled": result.cancelled if result is not None else False,
+                "failed": self._error is not None,
+                "elapsed_ms": round(result.elapsed_sec * 1000, 3) if result is not None else 0.0,
+                "max_lateness_ms": (
+                    round(result.max_lateness_sec * 1000, 3) if result is not None else 0.0
+                ),
+            },
+        )
+
+
+def _invalid_path(message: str, **details: object) -> ConfigurationError:
+    return ConfigurationError(
+        f"stick path {message}",
+        code="NYX_INVALID_STICK_PATH",
+        component="StickPath",
+        details=details,
+    )
@@ -0,0 +1,269 @@
+"""開始時刻からの offset で入力を送る input timeline。"""
+
+from __future__ import annotations
+
+import statistics
+import threading
+import time
+from collections.abc import Iterable
+from dataclasses import dataclass
+from typing import Literal
+
+from nyxpy.framework.core.constants import KeyType
+from nyxpy.framework.core.io.ports import ControllerOutputPort
+from nyxpy.framework.core.logger.ports import LoggerPort
+from nyxpy.framework.core.macro.exceptions import ConfigurationError
+from nyxpy.framework.core.utils.cancellation import (
+    DEFAULT_SPIN_MARGIN_SEC,
+    CancellationToken,
+    wait_until,
+)
+
+type TimelineAction = Literal["press", "hold", "release"]
+type TimelineState = tuple[float, tuple[KeyType, ...]]
+
+
+@dataclass(frozen=True, slots=True)
+class TimelineEvent:
+    """開始時刻から `at` 秒後に送る 1 件の入力。
+
+    `action` は controller port の同名 method に対応します。`press` は現在の入力へ
+    `keys` を追加し、`hold` は入力状態を `keys` だけに置き換え、`release` は `keys` を
+    離します。`release` の `keys` が空の場合は全解除です。
+    """
+
+    at: float
+    action: TimelineAction
+    keys: tuple[KeyType, ...] = ()
+
+
+@dataclass(frozen=True, slots=True)
+class TimelineEventResult:
+    """1 件の入力を送った時刻の記録。
+
+    `scheduled_at` と `sent_at` は timeline 開始時刻からの秒数です。`sent_at` は
+    controller port への送信を呼び出した時刻です。
+    """
+
+    event: TimelineEvent
+    scheduled_at: float
+    sent_at: float
+
+    @property
+    def jitter_sec(self) -> float:
+        """予定時刻からの遅れ（秒）。"""
+        return self.sent_at - self.scheduled_at
+
+
+@dataclass(frozen=True, slots=True)
+class TimelineResult:
+    """Timeline を再生した結果。"""
+
+    events: tuple[TimelineEventResult, ...]
+    cancelled: bool = False
+
+    @property
+    def max_jitter_sec(self) -> float:
+        """予定時刻からの遅れの最大値（秒）。入力がない場合は 0。"""
+        return max((result.jitter_sec for result in self.events), default=0.0)
+
+    @property
+    def mean_jitter_sec(self) -> float:
+        """予定時刻からの遅れの平均値（秒）。入力がない場合は 0。"""
+        if not self.events:
+            return 0.0
+        return statistics.fmean(result.jitter_sec for result in self.events)
+
+
+class InputTimeline:
+    """開始時刻からの offset ごとに送る入力の並び。
+
+    `cmd.schedule()` へ渡すと専用 thread が `time.perf_counter()` を基準に再生します。
+    `press()` などの method は timeline 自身を返すため、続けて書けます。
+
+    ```python
+    timeline = InputTimeline().press(0.0, Button.A, dur=0.05).press(1.0, Button.A, dur=0.05)
+    result = cmd.schedule(timeline).result()
+    ```
+    """
+
+    def __init__(self, events: Iterable[TimelineEvent] = ()) -> None:
+        """入力を持たない timeline、または `events` を持つ timeline を作ります。"""
+        self._events: list[TimelineEvent] = []
+        for event in events:
+            self._add(event)
+
+    @classmethod
+    def from_states(cls, states: Iterable[TimelineState]) -> InputTimeline:
+        """`(offset 秒, 押下中のキー)` の並びから timeline を作ります。
+
+        各要素はその時刻の入力状態全体を表し、`hold` として送ります。キーが空の要素は
+        全解除です。
+        """
+        timeline = cls()
+        for at, keys in states:
+            if keys:
+                timeline.hold(at, *keys)
+            else:
+                timeline.release(at)
+        return timeline
+
+    @property
+    def events(self) -> tuple[TimelineEvent, ...]:
+        """送信順に並べた入力。同じ時刻の入力は追加した順です。"""
+        return tuple(sorted(self._events, key=lambda event: event.at))
+
+    @property
+    def duration(self) -> float:
+        """最後の入力の offset（秒）。"""
+        return max((event.at for event in self._events), default=0.0)
+
+    def press(self, at: float, *keys: KeyType, dur: float | None = None) -> InputTimeline:
+        """`at` 秒後に `keys` を押し、`dur` を指定した場合はその秒数後に離します。"""
+        self._add(TimelineEvent(at, "press", keys))
+        if dur is not None:
+            if dur < 0:
+                raise _invalid_offset("dur", dur)
+            self._add(TimelineEvent(at + dur, "release", keys))
+        return self
+
+    def hold(self, at: float, *keys: KeyType) -> InputTimeline:
+        """`at` 秒後に入力状態を `keys` だけを押した状態へ置き換えます。"""
+        self._add(TimelineEvent(at, "hold", keys))
+        return self
+
+    def release(self, at: float, *keys: KeyType) -> InputTimeline:
+        """`at` 秒後に `keys` を離します。省略時は全解除です。"""
+        self._add(TimelineEvent(at, "release", keys))
+        return self
+
+    def __len__(self) -> int:
+        """入力の件数を返します。"""
+        return len(self._events)
+
+    def _add(self, event: TimelineEvent) -> None:
+        if event.at < 0:
+            raise _invalid_offset("at", event.at)
+        self._events.append(event)
+
+
+class TimelinePlayback:
+    """専用 thread で再生中の timeline。
+
+    予定時刻の少し前までは中断 event で sleep し、直前は `time.perf_counter()` を spin して
+    入力を送ります。再生は `CancellationToken` の中断要求で止まります。
+    """
+
+    def __init__(
+        self,
+        timeline: InputTimeline,
+        controller: ControllerOutputPort,
+        token: CancellationToken,
+        *,
+        start_at: float,
+        spin_margin: float = DEFAULT_SPIN_MARGIN_SEC,
+        logger: LoggerPort | None = None,
+    ) -> None:
+        """再生する timeline と送信先を保持します。再生は `start()` で始まります。
+
+        Args:
+            timeline: 再生する入力。
+            controller: 入力の送信先。
+            token: 再生を止める中断 token。
+            start_at: timeline の offset 0 に対応する `time.perf_counter()` の値。
+            spin_margin: 予定時刻の何秒前から spin に切り替えるか。
+            logger: 再生終了時に遅れの統計を記録する logger。
+
+        """
+        self.events = timeline.events
+        self.start_at = start_at
+        self._controller = controller
+        self._token = token
+        self._spin_margin = spin_margin
+        self._logger = logger
+        self._results: list[TimelineEventResult] = []
+        self._cancelled = False
+        self._error: BaseException | None = None
+        self._thread = threading.Thread(target=self._run, name="nyx-input-timeline", daemon=True)
+
+    def start(self) -> None:
+        """再生 thread を起動します。"""
+        self._thread.start()
+
+    def done(self) -> bool:
+        """再生が終わったかを返します。"""
+        return self._thread.ident is not None and not self._thread.is_alive()
+
+    def wait(self, timeout: float | None = None) -> bool:
+        """再生の終了を待ちます。
+
+        Returns:
+            `timeout` 秒以内に再生が終わった場合は `True`。
+
+        """
+        self._thread.join(timeout)
+        return not self._thread.is_alive()
+
+    def result(self, timeout: float | None = None) -> TimelineResult:
+        """再生の終了を待ち、入力ごとの送信時刻を返します。
+
+        Raises:
+            TimeoutError: `timeout` 秒以内に再生が終わらなかった場合。
+            Exception: 入力の送信中に controller port が送出した例外。
+
+        """
+        if not self.wait(timeout):
+            raise TimeoutError("Input timeline playback did not finish in time.")
+        if self._error is not None:
+            raise self._error
+        return TimelineResult(tuple(self._results), cancelled=self._cancelled)
+
+    def _run(self) -> None:
+        controller = self._controller
+        start_at = self.start_at
+        try:
+            for event in self.events:
+                if not wait_until(start_at + event.at, self._token, spin_margin=self._spin_margin):
+                    self._cancelled = True
+                    return
+                sent_at = time.perf_counter() - start_at
+                match event.action:
+                    case "press":
+                        controller.press(event.keys)
+                    case "hold":
+                        controller.hold(event.keys)
+                    case "release":
+                        controller.release(event.keys)
+                self._results.append(TimelineEventResult(event, event.at, sent_at))
+        except BaseException as exc:
+            self._error = exc
+        finally:
+            self._log_result()
+
+    def _log_result(self) -> None:
+        if self._logger is None:
+            return
+        result = TimelineResult(tuple(self._results), cancelled=self._cancelled)
+        self._logger.technical(
+            "DEBUG",
+            "Input timeline playback finished.",
+            component="InputTimeline",
+            event="command.timeline_finished",
+            extra={
+                "scheduled": len(self.events),
+                "sent": len(result.events),
+                "cancelled": result.cancelled,
+                "failed": self._error is not None,
+                "max_jitter_ms": round(result.max_jitter_sec * 1000, 3),
+                "mean_jitter_ms": round(result.mean_jitter_sec * 1000, 3),
+            },
+        )
+
+
+def _invalid_offset(name: str, value: float) -> ConfigurationError:
+    return ConfigurationError(
+        f"timeline {name} must be greater than or equal to 0",
+        code="NYX_INVALID_TIMELINE_OFFSET",
+        component="InputTimeline",
+        details={name: value},
+    )
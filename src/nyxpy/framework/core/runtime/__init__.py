@@ -7,6 +7,7 @@ from nyxpy.framework.core.runtime.handle import RunHandle, ThreadRunHandle
 from nyxpy.framework.core.runtime.result import CleanupWarning, RunResult, RunStatus
 from nyxpy.framework.core.runtime.runner import MacroRunner, SupportsFinalizeOutcome
 from nyxpy.framework.core.runtime.runtime import MacroRuntime
+from nyxpy.framework.core.runtime.warmup import start_macro_warmup
 
 __all__ = [
     "CleanupWarning",
@@ -24,4 +25,5 @@ __all__ = [
     "RuntimeOptions",
     "SupportsFinalizeOutcome",
     "ThreadRunHandle",
+    "start_macro_warmup",
 ]
@@ -28,6 +28,11 @@ from nyxpy.framework.core.io.ports import (
     FrameSourcePort,
     NotificationPort,
 )
+from nyxpy.framework.core.io.recording import (
+    INPUT_TRACE_SUFFIX,
+    InputTrace,
+    RecordingControllerOutputPort,
+)
 from nyxpy.framework.core.io.resources import (
     LocalResourceStore,
     LocalRunArtifactStore,
@@ -132,6 +137,11 @@ class MacroRuntimeBuilder:
                 artifact_dir_name,
             )
             created.append(("artifacts", artifacts))
+            if dotted_get(self.settings, "runtime.record_input_trace", False):
+                controller = RecordingControllerOutputPort(
+                    controller,
+                    on_close=lambda trace: _save_input_trace(artifacts, trace),
+                )
             notifications = self._notification_factory(request, definition)
             base_logger = self._logger_factory(request, definition)
             logger = base_logger.bind_context(run_log_context)
@@ -157,6 +167,9 @@ class MacroRuntimeBuilder:
                         exec_args,
                         metadata,
                     ),
+                    ocr_worker_process=_ocr_worker_process(self.settings),
+                    precise_wait=bool(dotted_get(self.settings, "runtime.precise_wait", False)),
+                    precise_wait_margin_sec=_precise_wait_margin_sec(self.settings),
                 ),
             )
         except Exception as build_error:
@@ -331,6 +344,10 @@ def create_device_runtime_builder(
         serial_factory = SerialControllerOutputPortFactory(
             discovery=discovery,
             protocol=ProtocolFactory.create_protocol(controller_config.protocol),
+            writer_thread=controller_config.writer_thread,
+            suppress_duplicate_frames=controller_config.suppress_duplicate_frames,
+            keep_alive_sec=controller_config.keep_alive_sec,
+            logger=logger,
         )
     if isinstance(controller_config, SwbtControllerConfig) and swbt_factory is None:
         swbt_factory = SwbtControllerOutputPortFactory(
@@ -510,6 +527,22 @@ def _resource_atomic_write(settings: Mapping[str, Any]) -> bool:
     return bool(settings.get("resource.atomic_write", True))
 
 
+def _ocr_worker_process(settings: Mapping[str, Any]) -> bool:
+    return bool(dotted_get(settings, "runtime.ocr_worker_process", False))
+
+
+def _save_input_trace(artifacts: RunArtifactStore, trace: InputTrace) -> None:
+    if len(trace):
+        artifacts.save_blob(f"input_trace{INPUT_TRACE_SUFFIX}", trace.to_bytes())
+
+
+def _precise_wait_margin_sec(settings: Mapping[str, Any]) -> float:
+    value = float(dotted_get(settings, "runtime.precise_wait_margin_sec", 0.002))
+    if value < 0:
+        raise ValueError("runtime.precise_wait_margin_sec must be greater than or equal to 0")
+    return value
+
+
 def _command_debug_enabled(
     settings: Mapping[str, Any],
     exec_args: Mapping[str, Any],
@@ -26,6 +26,9 @@ class RuntimeOptions:
     frame_ready_timeout_sec: float = 3.0
     release_timeout_sec: float = 2.0
     command_debug_enabled: bool = False
+    ocr_worker_process: bool = False
+    precise_wait: bool = False
+    precise_wait_margin_sec: float = 0.002
 
 
 @dataclass(frozen=True)
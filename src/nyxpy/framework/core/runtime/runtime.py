@@ -19,6 +19,7 @@ from nyxpy.framework.core.runtime.context import ExecutionContext, RunContext
 from nyxpy.framework.core.runtime.handle import RunHandle, ThreadRunHandle
 from nyxpy.framework.core.runtime.result import CleanupWarning, RunResult, RunStatus
 from nyxpy.framework.core.runtime.runner import MacroRunner
+from nyxpy.framework.core.runtime.warmup import start_macro_warmup
 
 
 class MacroRuntime:
@@ -37,6 +38,7 @@ class MacroRuntime:
         started_at = context.run_log_context.started_at or datetime.now()
         result: RunResult | None = None
         cleanup_warnings: tuple[CleanupWarning, ...] = ()
+        cmd: DefaultCommand | None = None
         try:
             context.logger.user(
                 "INFO",
@@ -44,10 +46,16 @@ class MacroRuntime:
                 component="MacroRuntime",
                 event="macro.started",
             )
+            definition = self.registry.resolve(context.macro_id)
+            # OCR エンジンのロードを frame source の準備と並行して進める。
+            start_macro_warmup(
+                definition,
+                context.logger,
+                worker_process=context.options.ocr_worker_process,
+            )
             context.frame_source.initialize()
             if not context.frame_source.await_ready(context.options.frame_ready_timeout_sec):
                 raise FrameNotReadyError()
-            definition = self.registry.resolve(context.macro_id)
             macro = definition.factory.create()
             cmd = DefaultCommand(context=context)
             run_context = RunContext(
@@ -69,6 +77,8 @@ class MacroRuntime:
             result = self._result_from_exception(context, started_at, exc, RunStatus.FAILED)
         finally:
             cleanup_warnings = self._close_ports(context)
+            if cmd is not None:
+                self._emit_wait_stats_log(context, cmd)
 
         if cleanup_warnings:
             result = replace(
@@ -188,6 +198,24 @@ class MacroRuntime:
             extra=extra,
         )
 
+    def _emit_wait_stats_log(self, context: ExecutionContext, cmd: DefaultCommand) -> None:
+        summary = cmd.wait_stats.summary()
+        if not summary:
+            return
+        extra: dict[str, LogExtraValue] = {
+            "precise_wait": context.options.precise_wait,
+            "spin_margin_ms": round(context.options.precise_wait_margin_sec * 1000, 3),
+        }
+        for mode, stats in summary.items():
+            extra[mode] = {**stats}
+        context.logger.technical(
+            "INFO",
+            "command wait accuracy",
+            component="MacroRuntime",
+            event="command.wait_stats",
+            extra=extra,
+        )
+
     def _close_ports(self, context: ExecutionContext) -> tuple[CleanupWarning, ...]:
         warnings: list[CleanupWarning] = []
         for port_name, port in (
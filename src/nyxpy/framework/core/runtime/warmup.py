@@ -0,0 +1,67 @@
+"""マクロ実行前に重い依存を温める warm-up hook。"""
+
+from __future__ import annotations
+
+from nyxpy.framework.core.imgproc.ocr_engine import OCRProcessor, OCRWarmup, OCRWarmupReport
+from nyxpy.framework.core.logger.events import LogExtraValue
+from nyxpy.framework.core.logger.ports import LoggerPort
+from nyxpy.framework.core.macro.registry import MacroDefinition
+
+
+def start_macro_warmup(
+    definition: MacroDefinition,
+    logger: LoggerPort | None = None,
+    *,
+    worker_process: bool | None = None,
+) -> tuple[OCRWarmup, ...]:
+    """マクロが宣言した OCR 言語のエンジンをバックグラウンドでロードします。
+
+    `MacroDefinition.ocr_languages` の各言語について `OCRProcessor.warm_up()` を呼びます。
+    warm-up は言語ごとに process 内で 1 回だけ実行されるため、マクロ選択時と実行開始時の
+    両方から呼んでも重複してロードしません。
+
+    Args:
+        definition: warm-up 対象のマクロ定義。
+        logger: 新しく完了した warm-up の所要時間を記録する logger。
+        worker_process: 指定した場合は warm-up 前に `OCRProcessor.use_worker_process()` で
+            OCR を別 process で実行するかを切り替えます。`None` の場合は現在の設定のままです。
+
+    Returns:
+        言語ごとの warm-up handle。OCR を宣言していないマクロでは空 tuple。
+
+    """
+    if worker_process is not None:
+        OCRProcessor.use_worker_process(worker_process)
+    warmups = tuple(OCRProcessor.warm_up(language) for language in definition.ocr_languages)
+    if logger is not None:
+        for warmup in warmups:
+            if not warmup.done():
+                warmup.add_done_callback(
+                    lambda report, macro_id=definition.id: _log_report(logger, macro_id, report)
+                )
+    return warmups
+
+
+def _log_report(logger: LoggerPort, macro_id: str, report: OCRWarmupReport) -> None:
+    extra: dict[str, LogExtraValue] = {
+        "macro_id": macro_id,
+        "language": report.language,
+        "elapsed_ms": round(report.elapsed_sec * 1000, 1),
+    }
+    if report.succeeded:
+        logger.technical(
+            "INFO",
+            f"OCR warm-up finished: {report.language}",
+            component="OCRWarmup",
+            event="ocr.warmup_finished",
+            extra=extra,
+        )
+        return
+    logger.technical(
+        "WARNING",
+        f"OCR warm-up failed: {report.language}",
+        component="OCRWarmup",
+        event="ocr.warmup_failed",
+        extra=extra,
+        exc=report.error,
+    )
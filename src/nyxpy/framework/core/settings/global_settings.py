@@ -91,6 +91,15 @@ GLOBAL_SETTINGS_SCHEMA = SettingsSchema(
         "controller.serial.device": SettingField("controller.serial.device", str, ""),
         "controller.serial.protocol": SettingField("controller.serial.protocol", str, "CH552"),
         "controller.serial.baudrate": SettingField("controller.serial.baudrate", int, 9600),
+        "controller.serial.writer_thread": SettingField(
+            "controller.serial.writer_thread", bool, False
+        ),
+        "controller.serial.suppress_duplicate_frames": SettingField(
+            "controller.serial.suppress_duplicate_frames", bool, True
+        ),
+        "controller.serial.keep_alive_sec": SettingField(
+            "controller.serial.keep_alive_sec", (float, type(None)), None
+        ),
         "controller.swbt.controller_type": SettingField(
             "controller.swbt.controller_type",
             str,
@@ -117,10 +126,17 @@ GLOBAL_SETTINGS_SCHEMA = SettingsSchema(
             (int, type(None)),
             8000,
         ),
+        "controller.swbt.async_apply": SettingField("controller.swbt.async_apply", bool, False),
         "runtime.allow_dummy": SettingField("runtime.allow_dummy", bool, False),
         "runtime.frame_ready_timeout_sec": SettingField(
             "runtime.frame_ready_timeout_sec", float, 3.0
         ),
+        "runtime.ocr_worker_process": SettingField("runtime.ocr_worker_process", bool, False),
+        "runtime.record_input_trace": SettingField("runtime.record_input_trace", bool, False),
+        "runtime.precise_wait": SettingField("runtime.precise_wait", bool, False),
+        "runtime.precise_wait_margin_sec": SettingField(
+            "runtime.precise_wait_margin_sec", float, 0.002
+        ),
         "logging.file_level": SettingField(
             "logging.file_level",
             str,
@@ -137,11 +153,23 @@ GLOBAL_SETTINGS_SCHEMA = SettingsSchema(
         "logging.file_backup_count": SettingField("logging.file_backup_count", int, 3),
         "logging.file_retention_days": SettingField("logging.file_retention_days", int, 14),
         "logging.run_retention_days": SettingField("logging.run_retention_days", int, 30),
+        "logging.file_flush_interval_sec": SettingField(
+            "logging.file_flush_interval_sec", float, 1.0
+        ),
+        "logging.run_trace_enabled": SettingField("logging.run_trace_enabled", bool, False),
         "logging.command_debug_enabled": SettingField(
             "logging.command_debug_enabled",
             bool,
             False,
         ),
+        "logging.async_dispatch": SettingField("logging.async_dispatch", bool, False),
+        "logging.dispatch_queue_size": SettingField("logging.dispatch_queue_size", int, 4096),
+        "logging.dispatch_overflow": SettingField(
+            "logging.dispatch_overflow",
+            str,
+            "drop",
+            choices=("drop", "block"),
+        ),
         "gui.window_size_preset": SettingField("gui.window_size_preset", str, "full_hd"),
         "gui.preview_touch_enabled": SettingField("gui.preview_touch_enabled", bool, False),
     }
@@ -1,11 +1,20 @@
 """マクロ中断 token と中断可能 wait。"""
 
+import statistics
 import threading
 import time
+from collections import deque
 from datetime import datetime
 
 from nyxpy.framework.core.macro.exceptions import ConfigurationError, MacroCancelled
 
+# `wait_until()` が期限直前に spin で待つ既定の長さ（秒）。
+DEFAULT_SPIN_MARGIN_SEC = 0.002
+# event wait で中断要求を確認する最大間隔（秒）。
+_CANCEL_POLL_SEC = 0.05
+# `WaitErrorStats` が percentile 計算用に保持する直近の誤差の件数。
+_WAIT_ERROR_SAMPLES = 4096
+
 
 class CancellationToken:
     """中断要求を管理するためのクラス。
@@ -66,8 +75,34 @@ class CancellationToken:
         )
 
 
-def cancellation_aware_wait(seconds: float, token: CancellationToken) -> bool:
-    """中断要求を監視しながら指定秒数待機します。"""
+def cancellation_aware_wait(
+    seconds: float,
+    token: CancellationToken,
+    *,
+    precise: bool = False,
+    spin_margin: float = DEFAULT_SPIN_MARGIN_SEC,
+) -> bool:
+    """中断要求を監視しながら指定秒数待機します。
+
+    既定では中断 event を最大 50 ms ずつ待ちます。event wait の起床誤差は OS や負荷で
+    1〜2 ms 以上になるため、フレーム単位の待機では `precise=True` を指定します。
+    precise mode では期限の `spin_margin` 秒前まで event で待ち、残りを
+    `time.perf_counter()` の spin で待ちます。
+
+    Args:
+        seconds: 待機時間（秒）。
+        token: 中断要求を確認する token。
+        precise: 期限直前を spin で待ち、サブミリ秒の精度で戻るかどうか。
+        spin_margin: precise mode で spin に切り替える期限前の秒数。
+
+    Returns:
+        指定時間待機した場合は `True`、中断要求で待機を終えた場合は `False`。
+
+    Raises:
+        ConfigurationError: `seconds` が負の場合。
+        MacroCancelled: 待機開始時点または期限到達時点で中断要求がある場合。
+
+    """
     if seconds < 0:
         raise ConfigurationError(
             "wait seconds must be greater than or equal to 0",
@@ -76,11 +111,94 @@ def cancellation_aware_wait(seconds: float, token: CancellationToken) -> bool:
         )
 
     token.throw_if_requested()
+    if precise:
+        if not wait_until(time.perf_counter() + seconds, token, spin_margin=spin_margin):
+            return False
+        token.throw_if_requested()
+        return True
     deadline = time.monotonic() + seconds
     while True:
         remaining = deadline - time.monotonic()
         if remaining <= 0:
             token.throw_if_requested()
             return True
-        if token.wait(timeout=min(0.05, remaining)):
+        if token.wait(timeout=min(_CANCEL_POLL_SEC, remaining)):
             return False
+
+
+def wait_until(
+    deadline: float,
+    token: CancellationToken,
+    *,
+    spin_margin: float = DEFAULT_SPIN_MARGIN_SEC,
+) -> bool:
+    """`time.perf_counter()` 基準の時刻 `deadline` まで中断要求を監視しながら待機します。
+
+    期限の `spin_margin` 秒前までは中断 event で sleep し、残りは `time.perf_counter()` を
+    spin して待ちます。event wait の起床誤差は OS や負荷で数ミリ秒になるため、期限直前を
+    spin にすることでサブミリ秒の精度で戻ります。spin 中も中断要求を確認します。
+
+    Args:
+        deadline: 待機を終える `time.perf_counter()` の値。
+        token: 中断要求を確認する token。
+        spin_margin: 期限の何秒前から spin に切り替えるか。
+
+    Returns:
+        期限に達した場合は `True`、中断要求があった場合は `False`。
+
+    """
+    while True:
+        remaining = deadline - time.perf_counter()
+        if remaining <= spin_margin:
+            break
+        if token.wait(timeout=min(_CANCEL_POLL_SEC, remaining - spin_margin)):
+            return False
+    # time.sleep(0) は OS の scheduler 次第で数ミリ秒戻らないことがあるため、spin 中は
+    # 呼ばない。他の thread へは interpreter の switch interval ごとに GIL が渡る。
+    while time.perf_counter() < deadline:
+        if token.stop_requested():
+            return False
+    return not token.stop_requested()
+
+
+class WaitErrorStats:
+    """待機の誤差（実際の待機時間 − 指定時間）を mode ごとに集計します。
+
+    件数、平均、最大は全件から、percentile は直近 4096 件から計算します。
+    """
+
+    def __init__(self) -> None:
+        """空の集計を作ります。"""
+        self._lock = threading.Lock()
+        self._count: dict[str, int] = {}
+        self._total: dict[str, float] = {}
+        self._max: dict[str, float] = {}
+        self._samples: dict[str, deque[float]] = {}
+
+    def record(self, mode: str, error_sec: float) -> None:
+        """1 回の待機の誤差を記録します。"""
+        with self._lock:
+            if mode not in self._count:
+                self._count[mode] = 0
+                self._total[mode] = 0.0
+                self._max[mode] = error_sec
+                self._samples[mode] = deque(maxlen=_WAIT_ERROR_SAMPLES)
+            self._count[mode] += 1
+            self._total[mode] += error_sec
+            self._max[mode] = max(self._max[mode], error_sec)
+            self._samples[mode].append(error_sec)
+
+    def summary(self) -> dict[str, dict[str, float | int]]:
+        """Mode ごとの件数と誤差の平均、p50、p95、最大（ミリ秒）を返します。"""
+        with self._lock:
+            result: dict[str, dict[str, float | int]] = {}
+            for mode, count in self._count.items():
+                samples = sorted(self._samples[mode])
+                result[mode] = {
+                    "count": count,
+                    "mean_ms": round(self._total[mode] / count * 1000, 3),
+                    "p50_ms": round(statistics.median(samples) * 1000, 3),
+                    "p95_ms": round(samples[int(0.95 * (len(samples) - 1))] * 1000, 3),
+                    "max_ms": round(self._max[mode] * 1000, 3),
+                }
+            return result
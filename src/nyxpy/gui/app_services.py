@@ -7,7 +7,7 @@ from copy import deepcopy
 from dataclasses import dataclass, replace
 from pathlib import Path
 from threading import Event
-from typing import Any
+from typing import Any, cast
 
 from nyxpy.framework.core.hardware.capture_source import WindowCaptureSourceConfig
 from nyxpy.framework.core.hardware.device_discovery import (
@@ -32,7 +32,7 @@ from nyxpy.framework.core.io.device_factories import (
     FrameSourcePortFactory,
 )
 from nyxpy.framework.core.io.ports import ControllerOutputPort, FrameSourcePort
-from nyxpy.framework.core.logger import create_default_logging
+from nyxpy.framework.core.logger import OverflowPolicy, create_default_logging
 from nyxpy.framework.core.macro.exceptions import ConfigurationError
 from nyxpy.framework.core.macro.registry import MacroRegistry
 from nyxpy.framework.core.notifications.notification_handler import (
@@ -109,11 +109,15 @@ CONTROLLER_SETTING_KEYS = frozenset(
         "controller.serial.device",
         "controller.serial.baudrate",
         "controller.serial.protocol",
+        "controller.serial.writer_thread",
+        "controller.serial.suppress_duplicate_frames",
+        "controller.serial.keep_alive_sec",
         "controller.swbt.adapter",
         "controller.swbt.controller_type",
         "controller.swbt.profile_path",
         "controller.swbt.connect_timeout_sec",
         "controller.swbt.report_period_us",
+        "controller.swbt.async_apply",
     }
 )
 
@@ -123,6 +127,10 @@ RUNTIME_BUILDER_SETTING_KEYS = (
     | frozenset(
         {
             "runtime.allow_dummy",
+            "runtime.ocr_worker_process",
+            "runtime.precise_wait",
+            "runtime.record_input_trace",
+            "runtime.precise_wait_margin_sec",
             "logging.command_debug_enabled",
         }
     )
@@ -148,6 +156,15 @@ class GuiAppServices:
             file_backup_count=int(self.global_settings.get("logging.file_backup_count", 3)),
             file_retention_days=int(self.global_settings.get("logging.file_retention_days", 14)),
             run_retention_days=int(self.global_settings.get("logging.run_retention_days", 30)),
+            file_flush_interval_sec=float(
+                self.global_settings.get("logging.file_flush_interval_sec", 1.0)
+            ),
+            run_trace_enabled=bool(self.global_settings.get("logging.run_trace_enabled", False)),
+            async_dispatch=bool(self.global_settings.get("logging.async_dispatch", False)),
+            dispatch_queue_size=int(self.global_settings.get("logging.dispatch_queue_size", 4096)),
+            dispatch_overflow=cast(
+                OverflowPolicy, self.global_settings.get("logging.dispatch_overflow", "drop")
+            ),
         )
         self.logger = self.logging.logger
         for notice in self.global_settings.migration_notices:
@@ -51,6 +51,7 @@ from nyxpy.framework.core.runtime.device_selection import (
 from nyxpy.framework.core.runtime.exec_args import parse_define_args
 from nyxpy.framework.core.runtime.handle import RunHandle
 from nyxpy.framework.core.runtime.result import RunResult, RunStatus
+from nyxpy.framework.core.runtime.warmup import start_macro_warmup
 from nyxpy.framework.core.settings.schema import SettingValue
 from nyxpy.gui.app_services import GuiAppServices, SettingsApplyOutcome
 from nyxpy.gui.background_task import BackgroundTask
@@ -1388,6 +1389,7 @@ class MainWindow(QMainWindow):
     def setup_connections(self):
         # Connect pane signals fully delegated
         self.macro_browser.selection_changed.connect(self.control_pane.set_selection)
+        self.macro_browser.selection_changed.connect(self._warm_up_selected_macro)
         self.control_pane.run_requested.connect(self.execute_macro_immediate)
         self.control_pane.run_with_params_requested.connect(self.execute_macro_with_params)
         self.control_pane.cancel_requested.connect(self.cancel_macro)
@@ -1403,6 +1405,21 @@ class MainWindow(QMainWindow):
         # Set status to ready
         self.status_label.setText("準備完了")
 
+    def _warm_up_selected_macro(self, selected: bool) -> None:
+        # 実行ボタンを押す前に OCR エンジンのロードを始め、初回認識の待ち時間を隠す。
+        macro_id = self.macro_browser.selected_macro_id() if selected else None
+        if macro_id is None:
+            return
+        try:
+            definition = self.macro_catalog.get(macro_id)
+        except KeyError:
+            return
+        start_macro_warmup(
+            definition,
+            self.logger,
+            worker_process=bool(self.global_settings.get("runtime.ocr_worker_process", False)),
+        )
+
     def _set_preview_touch_enabled(self, enabled: bool, *, save: bool = True) -> None:
         enabled = bool(enabled)
         if self.touch_panel_checkbox.isChecked() != enabled:
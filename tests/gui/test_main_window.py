@@ -139,6 +139,7 @@ class FakeCatalog:
                 macro_root=Path("macros") / "dummy",
                 description="dummy desc",
                 tags=("Tag1", "Tag2"),
+                ocr_languages=(),
             )
         ]
         self.reloads = 0
@@ -0,0 +1,51 @@
+import math
+import statistics
+import time
+
+from nyxpy.framework.core.constants import LStick
+from nyxpy.framework.core.hardware.protocol import CH552SerialProtocol
+from nyxpy.framework.core.io.adapters import SerialControllerOutputPort
+from nyxpy.framework.core.macro.command import DefaultCommand
+from nyxpy.framework.core.macro.stick_path import StickPath
+from tests.support.fake_execution_context import make_fake_execution_context
+
+FRAMES = 100
+INTERVAL = 0.002
+# stick path 全体の終了時刻が予定からずれる時間の中央値の上限（秒）。
+MAX_PATH_DRIFT_SECONDS = 0.005
+
+
+class NullSerialDevice:
+    def send(self, data) -> None:
+        pass
+
+
+def _median_drift(run, repeats: int = 5) -> float:
+    samples = []
+    for _ in range(repeats):
+        started = time.perf_counter()
+        run()
+        samples.append(time.perf_counter() - started - FRAMES * INTERVAL)
+    return statistics.median(samples)
+
+
+def test_stick_path_keeps_fixed_rate_without_drift(tmp_path):
+    controller = SerialControllerOutputPort(NullSerialDevice(), CH552SerialProtocol())
+    cmd = DefaultCommand(context=make_fake_execution_context(tmp_path, controller=controller))
+    angles = [index / FRAMES * math.tau for index in range(FRAMES)]
+    path = StickPath.from_polar(angles, interval=INTERVAL)
+
+    def hold_loop() -> None:
+        for angle in angles:
+            cmd.hold(LStick(angle, 1.0))
+            cmd.wait(INTERVAL)
+        cmd.release()
+
+    def stick_path() -> None:
+        cmd.stick_path(path, precise=False)
+
+    loop_drift = _median_drift(hold_loop)
+    path_drift = _median_drift(stick_path)
+
+    assert path_drift < MAX_PATH_DRIFT_SECONDS
+    assert path_drift < loop_drift
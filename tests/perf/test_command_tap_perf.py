@@ -0,0 +1,42 @@
+import statistics
+import time
+
+from nyxpy.framework.core.constants import Button
+from nyxpy.framework.core.hardware.protocol import CH552SerialProtocol
+from nyxpy.framework.core.io.adapters import SerialControllerOutputPort
+from nyxpy.framework.core.macro.command import DefaultCommand
+from tests.support.fake_execution_context import make_fake_execution_context
+
+TAPS = 1000
+
+
+class NullSerialDevice:
+    def send(self, data) -> None:
+        pass
+
+
+def _per_tap_seconds(run, repeats: int = 7) -> float:
+    samples = []
+    for _ in range(repeats):
+        started = time.perf_counter()
+        run()
+        samples.append((time.perf_counter() - started) / TAPS)
+    return statistics.median(samples)
+
+
+def test_tap_overhead_is_lower_than_press_loop(tmp_path):
+    controller = SerialControllerOutputPort(NullSerialDevice(), CH552SerialProtocol())
+    cmd = DefaultCommand(context=make_fake_execution_context(tmp_path, controller=controller))
+
+    def press_loop() -> None:
+        for _ in range(TAPS):
+            cmd.press(Button.A, dur=0, wait=0)
+
+    def tap() -> None:
+        cmd.tap(Button.A, dur=0, wait=0, repeat=TAPS)
+
+    press_per_tap = _per_tap_seconds(press_loop)
+    tap_per_tap = _per_tap_seconds(tap)
+
+    assert tap_per_tap < 50e-6
+    assert tap_per_tap < press_per_tap
@@ -0,0 +1,29 @@
+from __future__ import annotations
+
+import statistics
+
+from nyxpy.framework.core.constants import Button
+from nyxpy.framework.core.macro.command import DefaultCommand
+from nyxpy.framework.core.macro.timeline import InputTimeline
+from tests.support.fake_execution_context import make_fake_execution_context
+
+# 1 frame (60fps) ごとに press / release する入力数。
+EVENTS = 120
+FRAME_SEC = 1 / 60
+# 予定時刻からの遅れの上限（秒）。
+MAX_MEDIAN_JITTER_SECONDS = 0.0005
+MAX_P95_JITTER_SECONDS = 0.002
+
+
+def test_schedule_sends_frame_aligned_inputs_with_submillisecond_jitter(tmp_path) -> None:
+    cmd = DefaultCommand(context=make_fake_execution_context(tmp_path))
+    timeline = InputTimeline()
+    for index in range(EVENTS // 2):
+        timeline.press(2 * index * FRAME_SEC, Button.A, dur=FRAME_SEC)
+
+    result = cmd.schedule(timeline, precise=True).result()
+
+    jitters = [item.jitter_sec for item in result.events]
+    assert len(jitters) == EVENTS
+    assert statistics.median(jitters) < MAX_MEDIAN_JITTER_SECONDS
+    assert statistics.quantiles(jitters, n=20)[-1] < MAX_P95_JITTER_SECONDS
@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+import statistics
+import time
+
+import cv2
+import numpy as np
+
+from nyxpy.framework.core.imgproc import GlyphDigitRecognizer
+
+ITERATIONS = 200
+# 1 ROI あたりの認識時間の上限（秒）。
+MAX_P95_SECONDS = 0.001
+
+
+def _render(text: str) -> np.ndarray:
+    image = np.full((40, 24 * len(text) + 16, 3), 255, dtype=np.uint8)
+    cv2.putText(image, text, (8, 30), cv2.FONT_HERSHEY_SIMPLEX, 1.0, (0, 0, 0), 2, cv2.LINE_8)
+    return image
+
+
+def test_glyph_recognizer_reads_stat_roi_under_one_millisecond() -> None:
+    recognizer = GlyphDigitRecognizer()
+    for digit in "0123456789":
+        recognizer.add_glyph(digit, _render(digit))
+    roi = _render("65535")
+    recognizer.recognize_text(roi)
+
+    samples: list[float] = []
+    for _ in range(ITERATIONS):
+        started = time.perf_counter()
+        text = recognizer.get_best_text(roi)
+        samples.append(time.perf_counter() - started)
+
+    assert text == "65535"
+    assert statistics.quantiles(samples, n=20)[-1] < MAX_P95_SECONDS
@@ -1,8 +1,21 @@
 from __future__ import annotations
 
+import statistics
 import time
+from datetime import datetime
 
-from nyxpy.framework.core.logger import DefaultLogger, LogSanitizer, LogSinkDispatcher, TestLogSink
+from nyxpy.framework.core.logger import (
+    DefaultLogger,
+    LogLevel,
+    LogSanitizer,
+    LogSinkDispatcher,
+    TestLogSink,
+    UserEvent,
+)
+from nyxpy.framework.core.logger.rotation import rotate_if_needed
+from nyxpy.framework.core.logger.sinks import TextFileLogSink
+from nyxpy.framework.core.macro.command import DefaultCommand
+from tests.support.fake_execution_context import make_fake_execution_context
 
 
 def test_log_handler_dispatch_thread_safety() -> None:
@@ -25,3 +38,86 @@ def test_log_handler_dispatch_thread_safety() -> None:
 
     assert elapsed / 100 < 0.005
     assert all(len(sink.technical_logs) == 100 for sink in sinks)
+
+
+class SlowSink(TestLogSink):
+    def emit_technical(self, event) -> None:
+        time.sleep(0.0005)
+        super().emit_technical(event)
+
+
+def _median_emit_sec(dispatcher: LogSinkDispatcher) -> float:
+    logger = DefaultLogger(dispatcher, dispatcher.sanitizer)
+    samples = []
+    for index in range(200):
+        started = time.perf_counter()
+        logger.technical("INFO", f"message {index}", component="perf", event="macro.message")
+        samples.append(time.perf_counter() - started)
+    dispatcher.close()
+    return statistics.median(samples)
+
+
+def test_async_dispatch_hides_slow_sink_latency() -> None:
+    sync_dispatcher = LogSinkDispatcher(LogSanitizer())
+    sync_dispatcher.add_sink(SlowSink(), level="DEBUG")
+    async_sink = SlowSink()
+    async_dispatcher = LogSinkDispatcher(LogSanitizer(), async_dispatch=True)
+    async_dispatcher.add_sink(async_sink, level="DEBUG")
+
+    sync_median = _median_emit_sec(sync_dispatcher)
+    async_median = _median_emit_sec(async_dispatcher)
+
+    assert async_median < sync_median / 2
+    assert len(async_sink.technical_logs) == 200
+
+
+def test_file_sink_write_is_cheaper_than_open_per_line(tmp_path) -> None:
+    sink = TextFileLogSink(tmp_path / "nyxpy.log", flush_interval_sec=60.0)
+    event = UserEvent(datetime.now(), LogLevel.INFO, "perf", "macro.message", "message")
+    buffered = []
+    for _ in range(500):
+        started = time.perf_counter()
+        sink.emit_user(event)
+        buffered.append(time.perf_counter() - started)
+    sink.close()
+
+    reopened_path = tmp_path / "reopen.log"
+    reopened = []
+    for _ in range(500):
+        started = time.perf_counter()
+        rotate_if_needed(reopened_path, sink.rotation)
+        with reopened_path.open("a", encoding="utf-8") as file:
+            file.write("message\n")
+        reopened.append(time.perf_counter() - started)
+
+    assert statistics.median(buffered) < statistics.median(reopened) / 3
+    assert (tmp_path / "nyxpy.log").read_text(encoding="utf-8").count("\n") == 500
+
+
+def test_disabled_log_is_cheaper_than_enabled_log(tmp_path) -> None:
+    sanitizer = LogSanitizer()
+    dispatcher = LogSinkDispatcher(sanitizer)
+    dispatcher.add_sink(TestLogSink(), level="INFO")
+    logger = DefaultLogger(dispatcher, sanitizer)
+    cmd = DefaultCommand(context=make_fake_execution_context(tmp_path, logger=logger))
+    extra = {"token": "secret", "attempt": 3}
+
+    def median_sec(call) -> float:
+        samples = []
+        for _ in range(2000):
+            started = time.perf_counter()
+            call()
+            samples.append(time.perf_counter() - started)
+        return statistics.median(samples)
+
+    disabled = median_sec(
+        lambda: logger.technical("DEBUG", "password=x", component="perf", extra=extra)
+    )
+    enabled = median_sec(
+        lambda: logger.technical("INFO", "password=x", component="perf", extra=extra)
+    )
+    disabled_command = median_sec(lambda: cmd.log("frame", 1, level="DEBUG"))
+
+    assert disabled < enabled / 5
+    assert disabled < 0.00002
+    assert disabled_command < 0.00002
@@ -0,0 +1,25 @@
+from __future__ import annotations
+
+import statistics
+import time
+
+from nyxpy.framework.core.utils.cancellation import CancellationToken, cancellation_aware_wait
+
+ITERATIONS = 60
+FRAME_SEC = 1 / 60
+# precise wait の誤差（実際の待機時間 − 指定時間）の上限（秒）。p95 は OS の preemption を含む。
+MAX_MEDIAN_ERROR_SECONDS = 0.0002
+MAX_P95_ERROR_SECONDS = 0.003
+
+
+def test_precise_wait_error_is_submillisecond_for_frame_waits() -> None:
+    token = CancellationToken()
+    errors: list[float] = []
+    for _ in range(ITERATIONS):
+        started = time.perf_counter()
+        cancellation_aware_wait(FRAME_SEC, token, precise=True)
+        errors.append(time.perf_counter() - started - FRAME_SEC)
+
+    assert min(errors) >= 0
+    assert statistics.median(errors) < MAX_MEDIAN_ERROR_SECONDS
+    assert statistics.quantiles(errors, n=20)[-1] < MAX_P95_ERROR_SECONDS
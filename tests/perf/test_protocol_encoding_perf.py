@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+import statistics
+import time
+
+import pytest
+
+from nyxpy.framework.core.constants import Button, Hat, LStick
+from nyxpy.framework.core.hardware.protocol import (
+    CH552SerialProtocol,
+    PokeConSerialProtocol,
+    ThreeDSSerialProtocol,
+)
+
+ITERATIONS = 2000
+# hold と release の 2 command を組み立てる時間の中央値の上限（秒）。
+MAX_MEDIAN_SECONDS = 0.00005
+
+
+@pytest.mark.parametrize(
+    "protocol_type", [CH552SerialProtocol, PokeConSerialProtocol, ThreeDSSerialProtocol]
+)
+def test_protocol_builds_hold_and_release_commands_quickly(protocol_type) -> None:
+    protocol = protocol_type()
+    keys = (Button.A, Button.B, Hat.UP, LStick.RIGHT)
+    protocol.build_hold_command(keys)
+    protocol.build_release_command(())
+
+    samples: list[float] = []
+    for _ in range(ITERATIONS):
+        started = time.perf_counter()
+        protocol.build_hold_command(keys)
+        protocol.build_release_command(keys)
+        samples.append(time.perf_counter() - started)
+
+    assert statistics.median(samples) < MAX_MEDIAN_SECONDS
@@ -0,0 +1,64 @@
+import json
+import time
+from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+
+from nyxpy.framework.core.logger import LogEvent, LogLevel, RunTrace, TechnicalLog
+from nyxpy.framework.core.logger.sinks import RunJsonlFileSink, RunTraceFileSink
+
+EVENTS = 20_000
+COMPONENTS = ("Command", "MacroRunner", "SerialControllerOutputPort")
+EVENT_NAMES = ("command.press", "command.wait", "serial.frame_sent", "macro.message")
+
+
+def _events() -> list[TechnicalLog]:
+    started = datetime(2026, 5, 26, 12, 0, 0)
+    return [
+        TechnicalLog(
+            LogEvent(
+                timestamp=started.replace(microsecond=index % 1_000_000),
+                level=LogLevel.DEBUG,
+                component=COMPONENTS[index % len(COMPONENTS)],
+                event=EVENT_NAMES[index % len(EVENT_NAMES)],
+                message=f"step {index}",
+                run_id="run-1",
+                macro_id="rng_hunt",
+                extra={"frame": index, "advance": index * 3},
+            )
+        )
+        for index in range(EVENTS)
+    ]
+
+
+def _write_sec(sink, events: list[TechnicalLog]) -> float:
+    started = time.perf_counter()
+    for event in events:
+        sink.emit_technical(event)
+    sink.close()
+    return time.perf_counter() - started
+
+
+def test_run_trace_writes_and_analyzes_faster_than_jsonl(tmp_path: Path) -> None:
+    events = _events()
+    jsonl_write = _write_sec(RunJsonlFileSink(tmp_path / "jsonl"), events)
+    trace_write = _write_sec(RunTraceFileSink(tmp_path / "trace"), events)
+
+    started = time.perf_counter()
+    lines = next((tmp_path / "jsonl").glob("*/run-1.jsonl")).read_text(encoding="utf-8")
+    jsonl_counts: dict[str, int] = {}
+    for line in lines.splitlines():
+        name = json.loads(line)["event"]
+        jsonl_counts[name] = jsonl_counts.get(name, 0) + 1
+    jsonl_analyze = time.perf_counter() - started
+
+    started = time.perf_counter()
+    trace = RunTrace.load(next((tmp_path / "trace").glob("*/run-1.nyxlog")))
+    ids, counts = np.unique(trace.records["event"], return_counts=True)
+    trace_counts = {trace.name(int(name_id)): int(count) for name_id, count in zip(ids, counts)}
+    trace_analyze = time.perf_counter() - started
+
+    assert trace_counts == jsonl_counts
+    assert trace_write < jsonl_write / 2
+    assert trace_analyze < jsonl_analyze / 5
@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+import math
+import statistics
+import time
+
+from nyxpy.framework.core.constants import Button, LStick
+from nyxpy.framework.core.hardware.swbt.config import resolve_controller_model
+from nyxpy.framework.core.hardware.swbt.mapper import NyxSwbtInputMapper
+
+# stick を 1 周させる 64 状態を繰り返し送る macro を想定する。
+SWEEP_STEPS = 64
+ROUNDS = 20
+# cache が効いた状態での 1 apply あたり変換時間の中央値の上限（秒）。
+MAX_CACHED_MEDIAN_SECONDS = 0.00002
+
+
+def _sweep_states(mapper: NyxSwbtInputMapper):
+    return [
+        mapper.hold((LStick(index / SWEEP_STEPS * math.tau, 1.0), Button.A))
+        for index in range(SWEEP_STEPS)
+    ]
+
+
+def _per_apply_samples(mapper: NyxSwbtInputMapper) -> list[float]:
+    samples: list[float] = []
+    for _ in range(ROUNDS):
+        # press のたびに作り直される状態を毎周新しく作る。
+        for state in _sweep_states(mapper):
+            started = time.perf_counter()
+            mapper.to_input_state(state)
+            samples.append(time.perf_counter() - started)
+    return samples
+
+
+def test_cached_stick_sweep_conversion_is_cheaper_than_rebuilding() -> None:
+    model = resolve_controller_model("pro-controller")
+    cached = NyxSwbtInputMapper(model)
+    uncached = NyxSwbtInputMapper(model, cache_size=0)
+    _per_apply_samples(cached)
+
+    cached_median = statistics.median(_per_apply_samples(cached))
+    uncached_median = statistics.median(_per_apply_samples(uncached))
+
+    assert cached_median < MAX_CACHED_MEDIAN_SECONDS
+    assert cached_median < uncached_median
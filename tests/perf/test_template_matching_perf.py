@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+import statistics
+import time
+
+import cv2
+import numpy as np
+import pytest
+
+from nyxpy.framework.core.imgproc import find_template
+
+ITERATIONS = 20
+# pyramid 探索は原寸探索に対して少なくともこの比率まで短縮されること。
+MAX_PYRAMID_RATIO = 0.6
+
+
+def _representative_frame() -> np.ndarray:
+    """ゲーム画面のように大きな色面と細かい模様が混在する 1280x720 frame を作ります。"""
+    rng = np.random.default_rng(2024)
+    coarse = rng.integers(0, 256, size=(45, 80, 3), dtype=np.uint8)
+    frame = cv2.resize(coarse, (1280, 720), interpolation=cv2.INTER_NEAREST)
+    detail = rng.integers(0, 256, size=(180, 320, 3), dtype=np.uint8)
+    detail = cv2.resize(detail, (1280, 720), interpolation=cv2.INTER_CUBIC)
+    frame = cv2.addWeighted(frame, 0.5, detail, 0.5, 0)
+    cv2.rectangle(frame, (380, 540), (900, 700), (240, 240, 240), -1)
+    cv2.putText(frame, "NyX 123", (420, 640), cv2.FONT_HERSHEY_SIMPLEX, 2.0, (20, 20, 20), 4)
+    return frame
+
+
+def _measure(func, iterations: int = ITERATIONS) -> list[float]:
+    func()
+    samples: list[float] = []
+    for _ in range(iterations):
+        started = time.perf_counter()
+        func()
+        samples.append(time.perf_counter() - started)
+    return samples
+
+
+def _p95(samples: list[float]) -> float:
+    return statistics.quantiles(samples, n=20)[-1]
+
+
+@pytest.mark.parametrize(
+    ("region", "grayscale"),
+    [
+        ((420, 580, 240, 80), False),
+        ((100, 100, 96, 64), True),
+        ((960, 300, 160, 120), True),
+    ],
+)
+@pytest.mark.parametrize("pyramid_levels", [1, 2])
+def test_find_template_pyramid_is_faster_than_full_search(
+    region, grayscale, pyramid_levels
+) -> None:
+    frame = _representative_frame()
+    if grayscale:
+        frame = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+    x, y, w, h = region
+    template = frame[y : y + h, x : x + w].copy()
+
+    full = find_template(frame, template)
+    pyramid = find_template(frame, template, pyramid_levels=pyramid_levels)
+    full_samples = _measure(lambda: find_template(frame, template))
+    pyramid_samples = _measure(
+        lambda: find_template(frame, template, pyramid_levels=pyramid_levels)
+    )
+
+    assert pyramid.position == full.position == (x, y)
+    assert statistics.median(pyramid_samples) < statistics.median(full_samples) * MAX_PYRAMID_RATIO
+    assert _p95(pyramid_samples) < _p95(full_samples)
@@ -2,12 +2,14 @@ from __future__ import annotations
 
 from datetime import datetime
 from pathlib import Path
-from threading import Lock
+from threading import Event, Lock
 
 import cv2
 import numpy as np
 
 from nyxpy.framework.core.constants import KeyCode, KeyType, SpecialKeyCode
+from nyxpy.framework.core.imgproc.exceptions import OCREngineNotFoundError
+from nyxpy.framework.core.imgproc.ocr_engine import OCRProcessor
 from nyxpy.framework.core.io.ports import (
     ControllerOutputPort,
     FrameNotReadyError,
@@ -383,3 +385,45 @@ class FakeLoggerPort(LoggerPort):
             extra=dict(extra or {}),
             exception_type=exception_type,
         )
+
+
+class FakePaddleEngine:
+    """入力画像の左上画素値を文字列として返す PaddleOCR 互換の fake。"""
+
+    def __init__(self) -> None:
+        self.calls: list[int] = []
+        self.active = 0
+        self.max_active = 0
+        self.release = Event()
+        self.release.set()
+        self._lock = Lock()
+
+    def predict(self, images, **kwargs):
+        with self._lock:
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        try:
+            self.release.wait(1.0)
+            batch = images if isinstance(images, list) else [images]
+            self.calls.append(len(batch))
+            return [
+                {"rec_texts": [str(int(image[0, 0, 0]))], "rec_scores": [0.9]} for image in batch
+            ]
+        finally:
+            with self._lock:
+                self.active -= 1
+
+
+class FakeOCRProcessor(OCRProcessor):
+    def _init_engine(self) -> None:
+        self._ocr_engine = FakePaddleEngine()
+
+
+def create_fake_ocr_engine(language: str) -> FakeOCRProcessor:
+    """`OCRWorkerProcess` の子 process で使う fake OCR engine factory。"""
+    return FakeOCRProcessor(language, cache_size=0)
+
+
+def create_failing_ocr_engine(language: str) -> FakeOCRProcessor:
+    """子 process でのエンジン初期化失敗を再現する factory。"""
+    raise OCREngineNotFoundError(f"engine unavailable: {language}")
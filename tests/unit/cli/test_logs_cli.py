@@ -0,0 +1,64 @@
+import io
+import json
+from datetime import datetime
+from pathlib import Path
+
+from nyxpy.__main__ import main, parse_arguments
+from nyxpy.cli.logs_cli import cli_main
+from nyxpy.framework.core.logger import LogLevel, UserEvent
+from nyxpy.framework.core.logger.run_trace import RunTraceWriter
+
+
+def _write_trace(path: Path) -> Path:
+    writer = RunTraceWriter(path)
+    writer.write_user(
+        UserEvent(
+            timestamp=datetime(2026, 5, 26, 12, 0, 0),
+            level=LogLevel.INFO,
+            component="Sample",
+            event="command.log",
+            message="hello",
+            run_id="run-1",
+            macro_id="sample",
+        )
+    )
+    writer.close()
+    return path
+
+
+def test_logs_export_writes_jsonl_to_stdout(tmp_path: Path) -> None:
+    trace = _write_trace(tmp_path / "run-1.nyxlog")
+    output = io.StringIO()
+
+    exit_code = cli_main(parse_arguments(["logs", "export", str(trace)]), stdout=output)
+
+    payload = json.loads(output.getvalue())
+    assert exit_code == 0
+    assert payload["kind"] == "user"
+    assert payload["message"] == "hello"
+    assert payload["timestamp"] == "2026-05-26T12:00:00"
+
+
+def test_logs_export_writes_output_file(tmp_path: Path) -> None:
+    trace = _write_trace(tmp_path / "run-1.nyxlog")
+    destination = tmp_path / "run-1.jsonl"
+    output = io.StringIO()
+
+    exit_code = cli_main(
+        parse_arguments(["logs", "export", str(trace), "--output", str(destination)]),
+        stdout=output,
+    )
+
+    assert exit_code == 0
+    assert "Exported 1 events" in output.getvalue()
+    assert json.loads(destination.read_text(encoding="utf-8"))["event"] == "command.log"
+
+
+def test_logs_export_reports_invalid_trace(tmp_path: Path, capsys) -> None:
+    broken = tmp_path / "broken.nyxlog"
+    broken.write_bytes(b"NOTTRACE" + bytes(4))
+
+    exit_code = main(["logs", "export", str(broken)])
+
+    assert exit_code == 1
+    assert "not a NyX run trace" in capsys.readouterr().out
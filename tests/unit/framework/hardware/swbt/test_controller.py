@@ -1,7 +1,8 @@
 import pytest
 from swbt import Button as SwbtButton
+from swbt import Stick as SwbtStick
 
-from nyxpy.framework.core.constants import Button, IMUFrame
+from nyxpy.framework.core.constants import Button, IMUFrame, LStick
 from nyxpy.framework.core.hardware.swbt.config import resolve_controller_model
 from nyxpy.framework.core.hardware.swbt.controller import SwbtControllerOutputPort
 from nyxpy.framework.core.macro.exceptions import DeviceError
@@ -139,3 +140,32 @@ def test_port_rejects_backend_unsupported_apis() -> None:
         controller.touch_down(1, 2)
     with pytest.raises(NotImplementedError, match="sleep control"):
         controller.disable_sleep(True)
+
+
+def test_port_tap_reuses_precomputed_states() -> None:
+    controller, session = port()
+    controller.press((Button.B,))
+
+    result = controller.tap((Button.A,), 0, 0, repeat=3)
+
+    assert result.taps == 3
+    assert [state.buttons for state in session.applied[1:]] == [
+        frozenset({SwbtButton.A, SwbtButton.B}),
+        frozenset({SwbtButton.B}),
+    ] * 3
+    assert session.applied[1] is session.applied[3]
+    controller.release()
+    assert session.neutral_calls == 2
+
+
+def test_port_stick_path_applies_precomputed_states() -> None:
+    controller, session = port()
+    controller.press((Button.B,))
+
+    result = controller.stick_path((LStick.UP, LStick.LEFT), 0.001)
+
+    assert result.frames == 2
+    applied = session.applied[1:]
+    assert [state.buttons for state in applied] == [frozenset({SwbtButton.B})] * 3
+    assert applied[0].left_stick != applied[1].left_stick
+    assert applied[2].left_stick == SwbtStick.center()
@@ -96,3 +96,50 @@ def test_mapper_normalizes_imu_one_or_three_frames() -> None:
     with pytest.raises(Exception) as exc_info:
         normalize_imu_frames((first, second))
     assert getattr(exc_info.value, "code", None) == "NYX_IMU_FRAME_COUNT_INVALID"
+
+
+def test_mapper_state_compares_by_stick_coordinates() -> None:
+    first = mapper().hold((LStick(0.3, 0.7), Button.A))
+    second = mapper().hold((LStick(0.3, 0.7), Button.A))
+
+    assert first == second
+    assert hash(first) == hash(second)
+
+
+def test_mapper_reuses_input_state_for_equal_states() -> None:
+    m = mapper()
+    first = m.to_input_state(m.hold((LStick(1.0, 0.5), Hat.UP)))
+
+    second = m.to_input_state(m.hold((LStick(1.0, 0.5), Hat.UP)))
+
+    assert second is first
+
+
+def test_mapper_cache_evicts_least_recently_used_state() -> None:
+    m = NyxSwbtInputMapper(resolve_controller_model("pro-controller"), cache_size=2)
+    a = m.hold((Button.A,))
+    b = m.hold((Button.B,))
+    c = m.hold((Button.X,))
+    cached_a = m.to_input_state(a)
+    m.to_input_state(b)
+    m.to_input_state(a)
+    m.to_input_state(c)
+
+    assert m.to_input_state(a) is cached_a
+    assert m.to_input_state(b).buttons == frozenset({SwbtButton.B})
+
+
+def test_mapper_without_cache_builds_equal_input_states() -> None:
+    m = NyxSwbtInputMapper(resolve_controller_model("pro-controller"), cache_size=0)
+    state = m.hold((Button.A, Hat.DOWNLEFT))
+
+    first = m.to_input_state(state)
+
+    assert m.to_input_state(state) == first
+    assert m.to_input_state(state) is not first
+    assert first.buttons == frozenset({SwbtButton.A, SwbtButton.DPAD_DOWN, SwbtButton.DPAD_LEFT})
+
+
+def test_mapper_rejects_negative_cache_size() -> None:
+    with pytest.raises(ValueError, match="cache_size"):
+        NyxSwbtInputMapper(resolve_controller_model("pro-controller"), cache_size=-1)
@@ -14,6 +14,7 @@ from nyxpy.framework.core.hardware.swbt.session import (
     SwbtControllerSession,
     is_swbt_status_connected,
 )
+from nyxpy.framework.core.macro.exceptions import ConfigurationError, DeviceError
 
 
 def gamepad_status(connection_state: str) -> GamepadStatus:
@@ -498,6 +499,120 @@ def test_session_close_preserves_controller_and_loop_stop_errors(monkeypatch) ->
     assert fake.closed
 
 
+class BlockingApplyFakeSwbtController(AwaitableFakeSwbtController):
+    def __init__(self) -> None:
+        super().__init__()
+        self.first_apply_started = Event()
+        self.release_first_apply = asyncio.Event()
+
+    async def apply(self, state) -> None:
+        self.calls.append(("apply", state))
+        if not self.first_apply_started.is_set():
+            self.first_apply_started.set()
+            await self.release_first_apply.wait()
+
+
+class FailingApplyFakeSwbtController(FakeSwbtController):
+    def apply(self, state) -> None:
+        raise RuntimeError("report write failed")
+
+
+def async_session(fake: FakeSwbtController, **kwargs) -> SwbtControllerSession:
+    session = SwbtControllerSession(
+        replace(config(), async_apply=True, report_period_us=1000),
+        controller_factory=lambda _config, _writer: fake,
+        **kwargs,
+    )
+    session.pair(timeout_sec=1.0)
+    return session
+
+
+def test_async_apply_returns_without_status_round_trip_and_applies_on_loop() -> None:
+    fake = FakeSwbtController()
+    session = async_session(fake)
+    fake.calls.clear()
+
+    session.apply("state-1")
+    assert session._mailbox.wait_idle(timeout=1.0)
+    session.neutral()
+
+    assert fake.calls == [("apply", "state-1"), ("neutral", None)]
+    stats = session.apply_stats()
+    assert (stats.posted, stats.sent, stats.coalesced) == (2, 2, 0)
+    assert stats.latency_max_ms >= stats.latency_p95_ms >= stats.latency_p50_ms > 0
+    session.close()
+
+
+def test_async_apply_coalesces_states_posted_while_controller_is_busy() -> None:
+    fake = BlockingApplyFakeSwbtController()
+    session = async_session(fake)
+    fake.calls.clear()
+
+    session.apply("first")
+    assert fake.first_apply_started.wait(timeout=1.0)
+    for index in range(10):
+        session.apply(f"intermediate-{index}")
+    session.apply("latest")
+    loop = session._loop
+    assert loop is not None
+    loop.call_soon_threadsafe(fake.release_first_apply.set)
+    assert session._mailbox.wait_idle(timeout=1.0)
+
+    assert fake.calls == [("apply", "first"), ("apply", "latest")]
+    assert session.apply_stats().coalesced == 10
+    session.close()
+
+
+def test_async_apply_reports_controller_error_on_next_call() -> None:
+    fake = FailingApplyFakeSwbtController()
+    session = async_session(fake)
+
+    session.apply("state")
+    assert session._mailbox.wait_idle(timeout=1.0)
+
+    with pytest.raises(ConfigurationError) as exc_info:
+        session.apply("next")
+    assert exc_info.value.code == "NYX_SWBT_CONNECTION_FAILED"
+    session.apply("after-error")
+    session.close()
+
+
+def test_async_apply_requires_connection_and_close_stops_pump() -> None:
+    fake = AwaitableFakeSwbtController()
+    written: list[str] = []
+    session = SwbtControllerSession(
+        replace(config(), async_apply=True),
+        controller_factory=lambda _config, _writer: fake,
+        diagnostics_writer=WriterStub(written),
+    )
+
+    with pytest.raises(DeviceError, match="not connected"):
+        session.apply("state")
+
+    session.pair(timeout_sec=1.0)
+    session.apply("state")
+    session.close()
+    session.close()
+
+    assert session._pump_future is None
+    assert fake.calls[-1] == ("close", True)
+    assert len([line for line in written if "async apply" in line]) == 1
+    with pytest.raises(DeviceError, match="not connected"):
+        session.apply("after-close")
+
+
+class WriterStub:
+    def __init__(self, lines: list[str]) -> None:
+        self.lines = lines
+
+    def write(self, text: str) -> int:
+        self.lines.append(text)
+        return len(text)
+
+    def flush(self) -> None:
+        pass
+
+
 @pytest.mark.parametrize(
     ("connection_state", "expected"),
     [("connected", True), ("closed", False), ("reconnecting", False), ("failed", False)],
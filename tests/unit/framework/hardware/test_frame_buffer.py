@@ -0,0 +1,161 @@
+import threading
+
+import numpy as np
+import pytest
+
+from nyxpy.framework.core.hardware.frame_buffer import FrameRingBuffer, readonly_view
+
+
+def _frame(value: int) -> np.ndarray:
+    return np.full((2, 2, 3), value, dtype=np.uint8)
+
+
+def test_frame_ring_buffer_returns_none_before_first_write() -> None:
+    frames = FrameRingBuffer()
+
+    assert frames.latest() is None
+    assert frames.seq == 0
+
+
+def test_frame_ring_buffer_latest_is_readonly_view_of_slot() -> None:
+    frames = FrameRingBuffer()
+    source = _frame(3)
+
+    seq = frames.write(source)
+    latest = frames.latest()
+
+    assert seq == 1
+    assert latest is not None
+    assert latest.flags.writeable is False
+    assert not np.shares_memory(latest, source)
+    assert np.shares_memory(latest, frames.latest())
+    with pytest.raises(ValueError):
+        latest[0, 0, 0] = 0
+
+
+def test_frame_ring_buffer_reuses_unreferenced_slots() -> None:
+    frames = FrameRingBuffer(slots=2)
+    for value in range(2):
+        frames.write(_frame(value))
+    buffer_ids = [id(buffer) for buffer in frames._buffers]
+
+    for value in range(2, 6):
+        frames.write(_frame(value))
+
+    assert [id(buffer) for buffer in frames._buffers] == buffer_ids
+    assert frames.seq == 6
+
+
+def test_frame_ring_buffer_does_not_overwrite_slot_held_by_reader() -> None:
+    frames = FrameRingBuffer(slots=2)
+    frames.write(_frame(1))
+    held = frames.latest()
+    assert held is not None
+    cropped = held[:1]
+    del held
+
+    for value in range(2, 6):
+        frames.write(_frame(value))
+
+    assert cropped[0, 0, 0] == 1
+    latest = frames.latest()
+    assert latest is not None
+    assert latest[0, 0, 0] == 5
+
+
+def test_frame_ring_buffer_writable_buffer_skips_shared_slot() -> None:
+    frames = FrameRingBuffer(slots=2)
+    frames.write(_frame(1))
+    frames.write(_frame(2))
+    assert frames.writable_buffer() is not None
+
+    frames.write(_frame(3))
+    held = frames.latest()
+
+    frames.write(_frame(4))
+    assert frames.writable_buffer() is None
+    del held
+    assert frames.writable_buffer() is not None
+
+
+def test_frame_ring_buffer_write_without_copy_adopts_frame() -> None:
+    frames = FrameRingBuffer()
+    source = _frame(7)
+
+    frames.write(source, copy=False)
+
+    latest = frames.latest()
+    assert latest is not None
+    assert np.shares_memory(latest, source)
+
+
+def test_frame_ring_buffer_clear_withdraws_latest_frame() -> None:
+    frames = FrameRingBuffer()
+    frames.write(_frame(1))
+
+    frames.clear()
+
+    assert frames.latest() is None
+
+
+def test_frame_ring_buffer_rejects_single_slot() -> None:
+    with pytest.raises(ValueError):
+        FrameRingBuffer(slots=1)
+
+
+def test_readonly_view_does_not_copy() -> None:
+    source = _frame(1)
+
+    view = readonly_view(source)
+
+    assert np.shares_memory(view, source)
+    assert view.flags.writeable is False
+    assert source.flags.writeable is True
+    assert readonly_view(view) is view
+
+
+def test_frame_ring_buffer_latest_captured_reports_seq_and_timestamp() -> None:
+    frames = FrameRingBuffer()
+
+    frames.write(_frame(1), timestamp=10.0)
+    frames.write(_frame(2), timestamp=11.0)
+    captured = frames.latest_captured()
+
+    assert captured is not None
+    assert captured.seq == 2
+    assert captured.timestamp == 11.0
+    assert captured.image[0, 0, 0] == 2
+
+
+def test_frame_ring_buffer_wait_for_next_wakes_on_write() -> None:
+    frames = FrameRingBuffer()
+    frames.write(_frame(1))
+    writer = threading.Timer(0.02, lambda: frames.write(_frame(2)))
+
+    writer.start()
+    try:
+        captured = frames.wait_for_next(1, timeout=1.0)
+    finally:
+        writer.join()
+
+    assert captured is not None
+    assert captured.seq == 2
+    assert captured.image[0, 0, 0] == 2
+
+
+def test_frame_ring_buffer_wait_for_next_returns_latest_when_already_newer() -> None:
+    frames = FrameRingBuffer()
+    frames.write(_frame(1))
+    frames.write(_frame(2))
+
+    captured = frames.wait_for_next(0, timeout=0)
+
+    assert captured is not None
+    assert captured.seq == 2
+
+
+def test_frame_ring_buffer_wait_for_next_times_out() -> None:
+    frames = FrameRingBuffer()
+    frames.write(_frame(1))
+
+    assert frames.wait_for_next(1, timeout=0.01) is None
@@ -0,0 +1,71 @@
+import pytest
+
+from nyxpy.framework.core.constants import Button, Hat
+from nyxpy.framework.core.hardware.key_map import CompiledKeyMap, flag_ops
+
+
+class UnsupportedError(ValueError):
+    pass
+
+
+class CustomHat(int):
+    pass
+
+
+def _key_map() -> CompiledKeyMap:
+    return CompiledKeyMap(
+        bytes([0x00, 0x00, Hat.CENTER]),
+        {
+            Button: {key: flag_ops(key, 0) for key in (Button.A, Button.HOME)},
+            Hat: {key: ((2, 0xFF, key, Hat.CENTER),) for key in Hat},
+            int: lambda value: ((2, 0xFF, value, Hat.CENTER),),
+            str: None,
+        },
+        lambda key: UnsupportedError(repr(key)),
+    )
+
+
+def test_flag_ops_splits_mask_into_little_endian_bytes() -> None:
+    assert flag_ops(0x0104, 1) == ((1, 0x04, 0x04, 0x00), (2, 0x01, 0x01, 0x00))
+    assert flag_ops(0x0004, 1) == ((1, 0x04, 0x04, 0x00),)
+
+
+def test_press_and_release_update_frame_in_place() -> None:
+    key_map = _key_map()
+    frame = key_map.new_frame()
+
+    key_map.press(frame, (Button.A, Button.HOME, Hat.UP))
+    assert frame == bytearray([Button.A, Button.HOME >> 8, Hat.UP])
+
+    key_map.release(frame, (Button.A, Hat.UP))
+    assert frame == bytearray([0x00, Button.HOME >> 8, Hat.CENTER])
+
+    key_map.reset(frame)
+    assert bytes(frame) == key_map.initial_frame
+
+
+def test_keys_of_same_value_are_resolved_by_type() -> None:
+    # Button.Y と Hat.UPRIGHT は IntEnum として等しいが、別々の表から引く。
+    key_map = _key_map()
+
+    assert key_map.ops(Hat.UPRIGHT) == ((2, 0xFF, Hat.UPRIGHT, Hat.CENTER),)
+    with pytest.raises(UnsupportedError):
+        key_map.ops(Button.Y)
+
+
+def test_unsupported_type_raises_and_unknown_type_is_ignored() -> None:
+    key_map = _key_map()
+    frame = key_map.new_frame()
+
+    with pytest.raises(UnsupportedError):
+        key_map.press(frame, ("A",))
+    key_map.press(frame, (1.5,))
+
+    assert bytes(frame) == key_map.initial_frame
+
+
+def test_subclass_uses_registered_base_type_resolver() -> None:
+    key_map = _key_map()
+
+    assert key_map.ops(CustomHat(3)) == ((2, 0xFF, 3, Hat.CENTER),)
+    assert key_map.ops(CustomHat(4)) == ((2, 0xFF, 4, Hat.CENTER),)
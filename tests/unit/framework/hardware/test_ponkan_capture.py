@@ -73,9 +73,14 @@ def test_ponkan_capture_device_caches_bgr_frame_copy() -> None:
     device.initialize()
 
     def assert_frame_ready() -> None:
-        latest = device.get_frame()
-        latest[0, 0, 0] = 0
-        assert frame[0, 0, 0] == 1
+        try:
+            latest = device.get_frame()
+        except CaptureDeviceNotReady as exc:
+            raise AssertionError("frame is not ready") from exc
+        assert latest.flags.writeable is False
+        assert not np.shares_memory(latest, frame)
+        frame[0, 0, 0] = 0
+        assert latest[0, 0, 0] == 1
 
     _wait_until(assert_frame_ready)
     device.release()
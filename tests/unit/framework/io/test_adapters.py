@@ -1,10 +1,16 @@
 from __future__ import annotations
 
+import time
+
 import numpy as np
 import pytest
 
-from nyxpy.framework.core.constants import Button, KeyboardOp, KeyCode
-from nyxpy.framework.core.hardware.camera_capture import CaptureDeviceReadFailed
+from nyxpy.framework.core.constants import Button, KeyboardOp, KeyCode, LStick
+from nyxpy.framework.core.hardware.camera_capture import (
+    CaptureDeviceInterface,
+    CaptureDeviceReadFailed,
+)
+from nyxpy.framework.core.hardware.frame_buffer import FrameRingBuffer
 from nyxpy.framework.core.hardware.protocol import CH552SerialProtocol, ThreeDSSerialProtocol
 from nyxpy.framework.core.io.adapters import (
     CaptureFrameSourcePort,
@@ -12,6 +18,8 @@ from nyxpy.framework.core.io.adapters import (
     NoopNotificationAdapter,
     NotificationHandlerAdapter,
     SerialControllerOutputPort,
+    SerialFrameStats,
+    SerialStateFrameFilter,
 )
 from nyxpy.framework.core.io.ports import FrameNotReadyError, FrameReadError
 
@@ -24,6 +32,20 @@ class SerialDevice:
         self.sent.append(data)
 
 
+class StateSerialDevice(SerialDevice):
+    def __init__(self) -> None:
+        super().__init__()
+        self.states = []
+        self.flush_timeouts = []
+
+    def send_state(self, data) -> None:
+        self.states.append(data)
+
+    def flush(self, timeout=None) -> bool:
+        self.flush_timeouts.append(timeout)
+        return True
+
+
 class Protocol:
     def __init__(self, *, keyboard_supported: bool = True) -> None:
         self.keyboard_supported = keyboard_supported
@@ -59,6 +81,165 @@ class ThreeDSProtocol(Protocol):
         return ("disable_sleep", enabled)
 
 
+class FullStateProtocol(ThreeDSProtocol):
+    full_state_frames = True
+
+
+def test_serial_controller_sends_full_state_frames_as_state() -> None:
+    device = StateSerialDevice()
+    port = SerialControllerOutputPort(device, FullStateProtocol())
+
+    port.press((Button.A,))
+    port.release()
+    port.touch_down(10, 20)
+    port.keyboard("a")
+
+    assert device.states == [
+        ("press", (Button.A,)),
+        ("release", ()),
+        ("touch_down", 10, 20),
+    ]
+    assert device.sent[0] == ("keyboard", "a")
+
+
+def test_serial_controller_sends_partial_frames_without_coalescing() -> None:
+    device = StateSerialDevice()
+    port = SerialControllerOutputPort(device, Protocol())
+
+    port.press((Button.A,))
+
+    assert device.states == []
+    assert device.sent == [("press", (Button.A,))]
+
+
+def test_serial_controller_suppresses_repeated_state_frames() -> None:
+    device = StateSerialDevice()
+    frame_filter = SerialStateFrameFilter(device.send_state)
+    port = SerialControllerOutputPort(device, FullStateProtocol(), frame_filter=frame_filter)
+
+    port.release()
+    port.release()
+    port.hold((Button.A,))
+    port.hold((Button.A,))
+    port.release()
+
+    assert device.states == [
+        ("release", ()),
+        ("hold", (Button.A,)),
+        ("release", ()),
+    ]
+    assert port.frame_stats == SerialFrameStats(sent=3, suppressed=2)
+
+
+def test_serial_controller_resends_state_after_non_state_command() -> None:
+    device = StateSerialDevice()
+    port = SerialControllerOutputPort(
+        device, FullStateProtocol(), frame_filter=SerialStateFrameFilter(device.send_state)
+    )
+
+    port.release()
+    port.type_key(KeyCode("a"))
+    port.release()
+
+    assert device.states == [("release", ()), ("release", ())]
+
+
+def test_serial_controller_ignores_frame_filter_for_partial_frames() -> None:
+    device = SerialDevice()
+    port = SerialControllerOutputPort(
+        device, Protocol(), frame_filter=SerialStateFrameFilter(device.send)
+    )
+
+    port.release()
+    port.release()
+
+    assert port.frame_filter is None
+    assert port.frame_stats is None
+    assert device.sent == [("release", ()), ("release", ())]
+
+
+def test_serial_state_frame_filter_sends_keep_alive_when_idle() -> None:
+    sent = []
+    frame_filter = SerialStateFrameFilter(sent.append, keep_alive_sec=0.01)
+
+    frame_filter.send_state(b"state")
+    deadline = time.monotonic() + 1.0
+    while len(sent) < 3 and time.monotonic() < deadline:
+        time.sleep(0.005)
+    frame_filter.close()
+
+    assert sent[:3] == [b"state", b"state", b"state"]
+    stats = frame_filter.stats()
+    assert stats.keep_alive == stats.sent - 1 >= 2
+
+
+def test_serial_state_frame_filter_rejects_non_positive_keep_alive() -> None:
+    with pytest.raises(ValueError, match="keep_alive_sec"):
+        SerialStateFrameFilter(lambda frame: None, keep_alive_sec=0)
+
+
+def test_serial_controller_tap_builds_frames_once() -> None:
+    class CountingProtocol(FullStateProtocol):
+        builds = 0
+
+        def build_press_command(self, keys):
+            self.builds += 1
+            return super().build_press_command(keys)
+
+    device = StateSerialDevice()
+    protocol = CountingProtocol()
+    port = SerialControllerOutputPort(
+        device, protocol, frame_filter=SerialStateFrameFilter(device.send_state)
+    )
+
+    result = port.tap((Button.A,), 0, 0, repeat=4)
+
+    assert result.taps == 4
+    assert protocol.builds == 1
+    assert device.states == [("press", (Button.A,)), ("release", (Button.A,))] * 4
+
+
+def test_serial_controller_stick_path_sends_prebuilt_frames() -> None:
+    class CountingProtocol(FullStateProtocol):
+        builds = 0
+
+        def build_press_command(self, keys):
+            self.builds += 1
+            return super().build_press_command(keys)
+
+    device = StateSerialDevice()
+    protocol = CountingProtocol()
+    port = SerialControllerOutputPort(device, protocol)
+    positions = (LStick.UP, LStick.LEFT, LStick.DOWN)
+    original_send_state = port._send_state
+    builds_when_sent: list[int] = []
+
+    def send_state(frame):
+        builds_when_sent.append(protocol.builds)
+        original_send_state(frame)
+
+    port._send_state = send_state
+
+    result = port.stick_path(positions, 0.001)
+
+    assert result.frames == 3
+    assert builds_when_sent[:3] == [3, 3, 3]
+    assert device.states == [
+        ("press", (LStick.UP,)),
+        ("press", (LStick.LEFT,)),
+        ("press", (LStick.DOWN,)),
+        ("release", (LStick.DOWN,)),
+    ]
+
+
+def test_serial_controller_flush_delegates_to_device() -> None:
+    device = StateSerialDevice()
+
+    assert SerialControllerOutputPort(device, Protocol()).flush(0.5) is True
+    assert device.flush_timeouts == [0.5]
+    assert SerialControllerOutputPort(SerialDevice(), Protocol()).flush() is True
+
+
 def test_controller_output_port_serializes_send_operations() -> None:
     serial = SerialDevice()
     port = SerialControllerOutputPort(serial, Protocol())
@@ -160,13 +341,16 @@ def test_frame_source_await_ready_timeout() -> None:
     assert port.await_ready(0.01) is False
 
 
-def test_frame_source_latest_frame_returns_copy_and_reports_not_ready() -> None:
+def test_frame_source_latest_frame_returns_readonly_view_and_reports_not_ready() -> None:
     frame = np.ones((2, 2, 3), dtype=np.uint8)
     port = CaptureFrameSourcePort(CaptureDevice([frame]))
 
     latest = port.latest_frame()
-    latest[0, 0, 0] = 0
 
+    assert np.shares_memory(latest, frame)
+    assert latest.flags.writeable is False
+    with pytest.raises(ValueError):
+        latest[0, 0, 0] = 0
     assert frame[0, 0, 0] == 1
 
     with pytest.raises(FrameNotReadyError):
@@ -184,14 +368,16 @@ def test_frame_source_latest_frame_maps_capture_device_read_failed() -> None:
         port.latest_frame()
 
 
-def test_frame_source_try_latest_frame_returns_copy_and_skips_not_ready() -> None:
+def test_frame_source_try_latest_frame_returns_readonly_view_and_skips_not_ready() -> None:
     frame = np.ones((2, 2, 3), dtype=np.uint8)
     port = CaptureFrameSourcePort(CaptureDevice([frame, None]))
 
     latest = port.try_latest_frame()
 
     assert latest is not None
-    latest[0, 0, 0] = 0
+    assert np.shares_memory(latest, frame)
+    with pytest.raises(ValueError):
+        latest[0, 0, 0] = 0
     assert frame[0, 0, 0] == 1
     assert port.try_latest_frame() is None
 
@@ -206,6 +392,78 @@ def test_frame_source_try_latest_frame_is_nonblocking() -> None:
         port._frame_lock.release()
 
 
+class RingCaptureDevice(CaptureDeviceInterface):
+    def __init__(self) -> None:
+        self.frames = FrameRingBuffer()
+
+    def initialize(self) -> None:
+        pass
+
+    def get_frame(self):
+        return self.frames.latest()
+
+    def get_captured_frame(self):
+        return self.frames.latest_captured()
+
+    def wait_for_next_frame(self, after_seq, timeout):
+        return self.frames.wait_for_next(after_seq, timeout)
+
+    def release(self) -> None:
+        pass
+
+
+def test_frame_source_latest_captured_frame_reports_device_sequence() -> None:
+    device = RingCaptureDevice()
+    device.frames.write(np.ones((2, 2, 3), dtype=np.uint8))
+    device.frames.write(np.full((2, 2, 3), 2, dtype=np.uint8))
+    port = CaptureFrameSourcePort(device)
+
+    captured = port.latest_captured_frame()
+
+    assert captured.seq == 2
+    assert captured.image[0, 0, 0] == 2
+    assert captured.image.flags.writeable is False
+
+
+def test_frame_source_latest_captured_frame_without_sequence_uses_zero() -> None:
+    port = CaptureFrameSourcePort(CaptureDevice([np.ones((2, 2, 3), dtype=np.uint8)]))
+
+    assert port.latest_captured_frame().seq == 0
+
+
+def test_frame_source_wait_for_next_frame_returns_newer_frame_or_none() -> None:
+    device = RingCaptureDevice()
+    device.frames.write(np.ones((2, 2, 3), dtype=np.uint8))
+    port = CaptureFrameSourcePort(device)
+
+    assert port.wait_for_next_frame(1, 0.01) is None
+
+    device.frames.write(np.full((2, 2, 3), 2, dtype=np.uint8))
+    captured = port.wait_for_next_frame(1, 0.01)
+
+    assert captured is not None
+    assert captured.seq == 2
+
+
+def test_frame_source_wait_for_next_frame_requires_sequence_support() -> None:
+    port = CaptureFrameSourcePort(CaptureDevice([]))
+
+    with pytest.raises(NotImplementedError, match="frame sequence"):
+        port.wait_for_next_frame(0, 0.01)
+
+
+def test_dummy_frame_source_port_advances_sequence_on_wait() -> None:
+    port = DummyFrameSourcePort()
+    port.initialize()
+    first = port.latest_captured_frame()
+
+    captured = port.wait_for_next_frame(first.seq, 1.0)
+
+    assert captured is not None
+    assert captured.seq > first.seq
+    assert port.wait_for_next_frame(captured.seq, 0) is None
+
+
 def test_dummy_frame_source_port_is_ready_after_initialize() -> None:
     port = DummyFrameSourcePort()
 
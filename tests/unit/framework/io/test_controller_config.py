@@ -28,6 +28,41 @@ def test_serial_controller_config_from_controller_schema() -> None:
     )
 
     assert config == SerialControllerConfig(device="COM3", protocol="3DS", baudrate=115200)
+    assert config.writer_thread is False
+
+
+def test_serial_controller_config_reads_writer_thread() -> None:
+    config = controller_config_from_settings(
+        {"controller": {"backend": "serial", "serial": {"writer_thread": True}}}
+    )
+
+    assert config == SerialControllerConfig(device=None, writer_thread=True)
+
+
+def test_serial_controller_config_reads_frame_suppression_settings() -> None:
+    default = controller_config_from_settings({"controller": {"backend": "serial"}})
+    config = controller_config_from_settings(
+        {
+            "controller": {
+                "backend": "serial",
+                "serial": {"suppress_duplicate_frames": False, "keep_alive_sec": 0.5},
+            }
+        }
+    )
+
+    assert default.suppress_duplicate_frames is True
+    assert default.keep_alive_sec is None
+    assert config.suppress_duplicate_frames is False
+    assert config.keep_alive_sec == 0.5
+
+
+def test_serial_controller_config_rejects_non_positive_keep_alive() -> None:
+    with pytest.raises(ConfigurationError) as exc_info:
+        controller_config_from_settings(
+            {"controller": {"backend": "serial", "serial": {"keep_alive_sec": 0}}}
+        )
+
+    assert exc_info.value.code == "NYX_CONTROLLER_CONFIG_INVALID"
 
 
 def test_controller_config_rejects_legacy_serial_flat_keys() -> None:
@@ -65,6 +100,16 @@ def test_swbt_controller_config_resolves_model_and_default_profile(tmp_path: Pat
     assert config.profile_path == tmp_path / ".nyxpy" / "swbt" / "joy-con-l-profile.json"
     assert config.connect_timeout_sec == 12.0
     assert config.report_period_us is None
+    assert config.async_apply is False
+
+
+def test_swbt_controller_config_reads_async_apply() -> None:
+    config = controller_config_from_settings(
+        {"controller": {"backend": "swbt", "swbt": {"async_apply": True}}}
+    )
+
+    assert isinstance(config, SwbtControllerConfig)
+    assert config.async_apply is True
 
 
 def test_swbt_controller_config_does_not_keep_controller_type_string() -> None:
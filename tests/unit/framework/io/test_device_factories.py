@@ -10,6 +10,7 @@ from nyxpy.framework.core.hardware.device_discovery import (
     DeviceDiscoveryResult,
     DeviceInfo,
 )
+from nyxpy.framework.core.hardware.serial_comm import ThreadedSerialComm
 from nyxpy.framework.core.hardware.window_capture import WindowCaptureBackend, WindowCaptureSession
 from nyxpy.framework.core.io.device_factories import (
     FrameSourcePortFactory,
@@ -61,6 +62,13 @@ class Protocol:
         return b""
 
 
+class FullStateProtocol(Protocol):
+    full_state_frames = True
+
+    def build_press_command(self, keys):
+        return b"pressed"
+
+
 class CaptureDevice:
     instances = []
 
@@ -141,6 +149,72 @@ def test_controller_factory_reuses_named_device_and_closes_once() -> None:
     assert SerialDevice.instances[0].closed is True
 
 
+def test_controller_factory_wraps_device_with_writer_thread() -> None:
+    SerialDevice.instances.clear()
+    factory = SerialControllerOutputPortFactory(
+        discovery=Discovery(),
+        protocol=Protocol(),
+        serial_factory=SerialDevice,
+        writer_thread=True,
+    )
+
+    port = factory.create(name="COM1", baudrate=9600, allow_dummy=False, timeout_sec=0)
+    port.release()
+
+    assert isinstance(port.serial_device, ThreadedSerialComm)
+    assert port.serial_device.device is SerialDevice.instances[0]
+    assert port.flush(1.0)
+    assert port.serial_device.stats().written == 1
+
+    factory.close()
+
+    assert SerialDevice.instances[0].closed is True
+
+
+def test_controller_factory_shares_frame_filter_per_device() -> None:
+    SerialDevice.instances.clear()
+    factory = SerialControllerOutputPortFactory(
+        discovery=Discovery(),
+        protocol=FullStateProtocol(),
+        serial_factory=SerialDevice,
+    )
+
+    first = factory.create(name="COM1", baudrate=9600, allow_dummy=False, timeout_sec=0)
+    second = factory.create(name="COM1", baudrate=9600, allow_dummy=False, timeout_sec=0)
+    first.release()
+    second.release()
+    second.press(())
+
+    assert first.frame_filter is second.frame_filter
+    assert second.frame_stats.sent == 2
+    assert second.frame_stats.suppressed == 1
+    factory.close()
+
+
+def test_controller_factory_can_disable_frame_suppression() -> None:
+    SerialDevice.instances.clear()
+    full_state = SerialControllerOutputPortFactory(
+        discovery=Discovery(),
+        protocol=FullStateProtocol(),
+        serial_factory=SerialDevice,
+        suppress_duplicate_frames=False,
+    )
+    partial = SerialControllerOutputPortFactory(
+        discovery=Discovery(),
+        protocol=Protocol(),
+        serial_factory=SerialDevice,
+    )
+
+    assert (
+        full_state.create(name="COM1", baudrate=9600, allow_dummy=False, timeout_sec=0).frame_filter
+        is None
+    )
+    assert (
+        partial.create(name="COM1", baudrate=9600, allow_dummy=False, timeout_sec=0).frame_filter
+        is None
+    )
+
+
 def test_frame_source_factory_reuses_device_and_initializes_once() -> None:
     CaptureDevice.instances.clear()
     factory = FrameSourcePortFactory(
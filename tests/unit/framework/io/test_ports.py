@@ -2,13 +2,14 @@ from pathlib import Path
 
 import pytest
 
-from nyxpy.framework.core.constants import Button, IMUFrame, KeyCode
+from nyxpy.framework.core.constants import Button, IMUFrame, KeyCode, LStick
 from nyxpy.framework.core.io.ports import ControllerOutputPort
 from nyxpy.framework.core.io.resources import (
     DefaultResourcePathGuard,
     MacroResourceScope,
     ResourcePathError,
 )
+from nyxpy.framework.core.utils.cancellation import CancellationToken
 from tests.support.fakes import FakeControllerOutputPort, FakeFullCapabilityController
 
 
@@ -120,3 +121,70 @@ def test_macro_resource_scope_candidate_asset_paths_keep_lookup_order(tmp_path:
         standard_assets.resolve() / "template.png",
         package_assets.resolve() / "template.png",
     )
+
+
+def test_controller_output_port_tap_repeats_press_and_release() -> None:
+    controller = FakeControllerOutputPort()
+
+    result = controller.tap((Button.A,), 0.005, 0.005, repeat=3)
+
+    assert controller.events == [("press", (Button.A,)), ("release", (Button.A,))] * 3
+    assert result.taps == 3
+    assert result.cancelled is False
+    assert result.elapsed_sec >= 0.03
+    assert result.max_lateness_sec >= 0
+
+
+def test_controller_output_port_tap_releases_keys_when_cancelled() -> None:
+    controller = FakeControllerOutputPort()
+    token = CancellationToken()
+    original_press = controller.press
+
+    def press_then_cancel(keys):
+        original_press(keys)
+        token.request_stop()
+
+    controller.press = press_then_cancel
+
+    result = controller.tap((Button.A,), 1.0, 1.0, repeat=5, token=token)
+
+    assert controller.events == [("press", (Button.A,)), ("release", (Button.A,))]
+    assert result.taps == 1
+    assert result.cancelled is True
+
+
+def test_controller_output_port_tap_rejects_negative_arguments() -> None:
+    with pytest.raises(ValueError, match="tap"):
+        FakeControllerOutputPort().tap((Button.A,), -1, 0)
+
+
+def test_controller_output_port_stick_path_presses_each_position_then_releases() -> None:
+    controller = FakeControllerOutputPort()
+
+    result = controller.stick_path((LStick.UP, LStick.RIGHT), 0.005)
+
+    assert controller.events == [
+        ("press", (LStick.UP,)),
+        ("press", (LStick.RIGHT,)),
+        ("release", (LStick.RIGHT,)),
+    ]
+    assert result.frames == 2
+    assert result.cancelled is False
+    assert result.elapsed_sec >= 0.01
+
+
+def test_controller_output_port_stick_path_stops_when_cancelled() -> None:
+    controller = FakeControllerOutputPort()
+    token = CancellationToken()
+    token.request_stop()
+
+    result = controller.stick_path((LStick.UP,), 1.0, release=False, token=token)
+
+    assert controller.events == []
+    assert result.frames == 0
+    assert result.cancelled is True
+
+
+def test_controller_output_port_stick_path_rejects_non_positive_interval() -> None:
+    with pytest.raises(ValueError, match="interval"):
+        FakeControllerOutputPort().stick_path((LStick.UP,), 0)
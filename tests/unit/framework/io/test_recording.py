@@ -0,0 +1,230 @@
+from __future__ import annotations
+
+import time
+
+import pytest
+
+from nyxpy.framework.core.constants import (
+    Button,
+    Hat,
+    IMUFrame,
+    KeyCode,
+    LStick,
+    RStick,
+    SpecialKeyCode,
+    ThreeDSButton,
+    TouchState,
+)
+from nyxpy.framework.core.io.recording import (
+    InputTrace,
+    RecordingControllerOutputPort,
+    TraceOp,
+    replay_input_trace,
+)
+from nyxpy.framework.core.utils.cancellation import CancellationToken
+from tests.support.fakes import FakeFullCapabilityController
+
+
+class IMUController(FakeFullCapabilityController):
+    @property
+    def supports_imu(self) -> bool:
+        return True
+
+    def imu(self, *frames: IMUFrame) -> None:
+        self.events.append(("imu", frames))
+
+
+def _record_all(port: RecordingControllerOutputPort) -> None:
+    port.press((Button.A, Hat.UPRIGHT, LStick.LEFT))
+    port.hold((RStick(0.5, 0.5), ThreeDSButton.POWER, TouchState.down(10, 20)))
+    port.release((Button.Y,))
+    port.release()
+    port.keyboard("nyx かな")
+    port.type_key(KeyCode("a"))
+    port.type_key(SpecialKeyCode.ENTER)
+    port.touch_down(100, 200)
+    port.touch_up()
+    port.imu(IMUFrame.raw(accel=(1, -2, 3), gyro=(-4, 5, -6)), IMUFrame.neutral())
+    port.disable_sleep(False)
+
+
+def test_recording_port_forwards_calls_and_records_timestamps() -> None:
+    inner = IMUController()
+    port = RecordingControllerOutputPort(inner)
+
+    _record_all(port)
+
+    assert port.supports_touch is True
+    assert port.supports_imu is True
+    assert [name for name, _payload in inner.events] == [
+        "press",
+        "hold",
+        "release",
+        "release",
+        "keyboard",
+        "type_key",
+        "type_key",
+        "touch_down",
+        "touch_up",
+        "imu",
+        "disable_sleep",
+    ]
+    times = list(port.trace.times)
+    assert len(port.trace) == 11
+    assert times == sorted(times)
+    assert times[0] >= 0
+
+
+def test_input_trace_round_trips_through_bytes() -> None:
+    port = RecordingControllerOutputPort(IMUController())
+    _record_all(port)
+
+    restored = InputTrace.from_bytes(port.trace.to_bytes())
+    events = list(restored.events())
+
+    assert [event.op for event in events] == [
+        TraceOp.PRESS,
+        TraceOp.HOLD,
+        TraceOp.RELEASE,
+        TraceOp.RELEASE,
+        TraceOp.KEYBOARD,
+        TraceOp.TYPE_KEY,
+        TraceOp.TYPE_KEY,
+        TraceOp.TOUCH_DOWN,
+        TraceOp.TOUCH_UP,
+        TraceOp.IMU,
+        TraceOp.DISABLE_SLEEP,
+    ]
+    assert [event.at for event in events] == list(port.trace.times)
+    button, hat, stick = events[0].value
+    assert (button, hat) == (Button.A, Hat.UPRIGHT)
+    assert type(hat) is Hat
+    assert (type(stick), stick.x, stick.y) == (LStick, LStick.LEFT.x, LStick.LEFT.y)
+    rstick, threeds, touch = events[1].value
+    assert (type(rstick), rstick.x, rstick.y) == (RStick, RStick(0.5, 0.5).x, RStick(0.5, 0.5).y)
+    assert type(threeds) is ThreeDSButton
+    assert touch == TouchState.down(10, 20)
+    assert events[2].value == (Button.Y,)
+    assert type(events[2].value[0]) is Button
+    assert events[3].value == ()
+    assert events[4].value == "nyx かな"
+    assert str(events[5].value) == "a"
+    assert events[6].value is SpecialKeyCode.ENTER
+    assert events[7].value == (100, 200)
+    assert events[8].value is None
+    assert events[9].value == (
+        IMUFrame.raw(accel=(1, -2, 3), gyro=(-4, 5, -6)),
+        IMUFrame.neutral(),
+    )
+    assert events[10].value is False
+
+
+def test_input_trace_stores_columns_without_per_event_objects() -> None:
+    trace = InputTrace()
+    for index in range(100):
+        trace.append_keys(index * 0.01, TraceOp.PRESS, (Button.A,))
+
+    # header 22 byte + event ごとに時刻 8 + 操作 1 + 引数位置 4 + キー 12 byte
+    assert len(trace.to_bytes()) == 22 + 100 * (8 + 1 + 4 + 12)
+
+
+def test_input_trace_save_and_load(tmp_path) -> None:
+    trace = InputTrace()
+    trace.append_keys(0.5, TraceOp.HOLD, (Button.B,))
+
+    path = trace.save(tmp_path / "input.nyxtrace")
+    loaded = InputTrace.load(path)
+
+    assert list(loaded.events())[0].value == (Button.B,)
+    assert loaded.duration == 0.5
+
+
+@pytest.mark.parametrize(
+    ("data", "message"),
+    [
+        (b"NYX", "truncated"),
+        (b"NOTTRACE" + bytes(18), "not a NyX input trace"),
+    ],
+)
+def test_input_trace_rejects_invalid_bytes(data: bytes, message: str) -> None:
+    with pytest.raises(ValueError, match=message):
+        InputTrace.from_bytes(data)
+
+
+def test_input_trace_rejects_truncated_columns() -> None:
+    trace = InputTrace()
+    trace.append_keys(0.0, TraceOp.PRESS, (Button.A,))
+
+    with pytest.raises(ValueError, match="truncated"):
+        InputTrace.from_bytes(trace.to_bytes()[:-4])
+
+
+def test_recording_port_passes_trace_to_close_callback() -> None:
+    inner = IMUController()
+    closed: list[InputTrace] = []
+    port = RecordingControllerOutputPort(inner, on_close=closed.append)
+    port.press((Button.A,))
+
+    port.close()
+
+    assert inner.closed is True
+    assert closed == [port.trace]
+
+
+def test_recording_port_rejects_unknown_key_types() -> None:
+    port = RecordingControllerOutputPort(IMUController())
+
+    with pytest.raises(TypeError, match="unsupported key type"):
+        port.press(("A",))
+
+
+def test_replay_sends_events_with_original_timing() -> None:
+    trace = InputTrace()
+    trace.append_keys(0.0, TraceOp.PRESS, (Button.A,))
+    trace.append_keys(0.02, TraceOp.RELEASE, (Button.A,))
+    trace.append_text(0.04, "ok")
+    controller = IMUController()
+
+    started = time.perf_counter()
+    result = replay_input_trace(trace, controller)
+    elapsed = time.perf_counter() - started
+
+    assert controller.events == [
+        ("press", (Button.A,)),
+        ("release", (Button.A,)),
+        ("keyboard", "ok"),
+    ]
+    assert result.sent == 3
+    assert result.cancelled is False
+    assert elapsed >= 0.04
+    assert 0 <= result.mean_jitter_sec <= result.max_jitter_sec < 0.025
+
+
+def test_replay_speed_scales_intervals() -> None:
+    trace = InputTrace()
+    trace.append_keys(0.0, TraceOp.PRESS, (Button.A,))
+    trace.append_keys(0.2, TraceOp.RELEASE, ())
+
+    started = time.perf_counter()
+    replay_input_trace(trace, IMUController(), speed=10.0)
+
+    assert time.perf_counter() - started < 0.15
+
+
+def test_replay_stops_on_cancellation() -> None:
+    trace = InputTrace()
+    trace.append_keys(0.0, TraceOp.PRESS, (Button.A,))
+    trace.append_keys(5.0, TraceOp.RELEASE, ())
+    token = CancellationToken()
+    token.request_stop()
+    controller = IMUController()
+
+    result = replay_input_trace(trace, controller, token=token)
+
+    assert result.cancelled is True
+    assert controller.events == []
+
+
+def test_replay_rejects_non_positive_speed() -> None:
+    with pytest.raises(ValueError, match="speed"):
+        replay_input_trace(InputTrace(), IMUController(), speed=0)
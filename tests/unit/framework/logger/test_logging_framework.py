@@ -3,9 +3,14 @@ from __future__ import annotations
 import importlib
 import importlib.util
 import json
+import re
+import threading
+import time
 from datetime import datetime
 from pathlib import Path
 
+import pytest
+
 from nyxpy.framework.core.logger import (
     DefaultLogger,
     JsonlLogBackend,
@@ -13,6 +18,7 @@ from nyxpy.framework.core.logger import (
     LogLevel,
     LogSanitizer,
     LogSinkDispatcher,
+    NullLoggerPort,
     RunLogContext,
     TechnicalLog,
     TestLogSink,
@@ -21,7 +27,13 @@ from nyxpy.framework.core.logger import (
 )
 from nyxpy.framework.core.logger.backend import NullLogBackend
 from nyxpy.framework.core.logger.ports import LogSink
-from nyxpy.framework.core.logger.sinks import RunJsonlFileSink
+from nyxpy.framework.core.logger.rotation import RotationPolicy
+from nyxpy.framework.core.logger.sinks import (
+    JsonlFileSink,
+    RunJsonlFileSink,
+    TextFileLogSink,
+    _BufferedFileSink,
+)
 from nyxpy.framework.core.macro.exceptions import ConfigurationError
 
 
@@ -346,3 +358,345 @@ def test_log_serialization_falls_back_to_repr() -> None:
     )
 
     assert sink.technical_logs[0].event.extra["value"] == repr(value)
+
+
+class BlockingSink(TestLogSink):
+    def __init__(self) -> None:
+        super().__init__()
+        self.entered = threading.Event()
+        self.release = threading.Event()
+
+    def emit_technical(self, event):
+        self.entered.set()
+        self.release.wait(5)
+        super().emit_technical(event)
+
+
+def _technical(event: str, level: LogLevel = LogLevel.INFO) -> TechnicalLog:
+    return TechnicalLog(
+        LogEvent(
+            timestamp=datetime.now(),
+            level=level,
+            component="test",
+            event=event,
+            message=event,
+        )
+    )
+
+
+def test_async_dispatch_delivers_in_order_after_flush() -> None:
+    sink = TestLogSink()
+    dispatcher = LogSinkDispatcher(LogSanitizer(), async_dispatch=True)
+    dispatcher.add_sink(sink, level="DEBUG")
+
+    for index in range(50):
+        dispatcher.emit_technical(_technical(f"macro.step{index}"))
+    dispatcher.emit_user(UserEvent(datetime.now(), LogLevel.INFO, "test", "macro.done", "done"))
+
+    assert dispatcher.flush(timeout=5) is True
+    assert [log.event.event for log in sink.technical_logs] == [
+        f"macro.step{index}" for index in range(50)
+    ]
+    assert sink.user_events[0].event == "macro.done"
+    assert dispatcher.stats().delivered == 51
+    assert dispatcher.stats().queued == 0
+    dispatcher.close()
+
+
+def test_async_dispatch_does_not_wait_for_slow_sink() -> None:
+    sink = BlockingSink()
+    dispatcher = LogSinkDispatcher(LogSanitizer(), async_dispatch=True)
+    dispatcher.add_sink(sink, level="DEBUG")
+
+    dispatcher.emit_technical(_technical("macro.first"))
+    assert sink.entered.wait(5)
+    dispatcher.emit_technical(_technical("macro.second"))
+
+    assert sink.technical_logs == []
+    sink.release.set()
+    dispatcher.close()
+    assert [log.event.event for log in sink.technical_logs] == ["macro.first", "macro.second"]
+
+
+def test_async_dispatch_drops_on_overflow_and_reports_count() -> None:
+    sink = BlockingSink()
+    observer = TestLogSink()
+    dispatcher = LogSinkDispatcher(LogSanitizer(), async_dispatch=True, queue_size=2)
+    dispatcher.add_sink(sink, level="DEBUG")
+    dispatcher.add_sink(observer, level="WARNING")
+
+    dispatcher.emit_technical(_technical("macro.first"))
+    assert sink.entered.wait(5)
+    for index in range(5):
+        dispatcher.emit_technical(_technical(f"macro.step{index}"))
+
+    assert dispatcher.stats().dropped == 3
+    sink.release.set()
+    dispatcher.flush(timeout=5)
+
+    assert [log.event.event for log in sink.technical_logs] == [
+        "macro.first",
+        "macro.step0",
+        "macro.step1",
+        "logging.events_dropped",
+    ]
+    dropped = [
+        log for log in observer.technical_logs if log.event.event == "logging.events_dropped"
+    ]
+    assert dropped[0].event.extra == {"dropped": 3, "queue_size": 2}
+    dispatcher.close()
+
+
+def test_async_dispatch_block_policy_waits_for_space() -> None:
+    sink = BlockingSink()
+    dispatcher = LogSinkDispatcher(
+        LogSanitizer(),
+        async_dispatch=True,
+        queue_size=1,
+        overflow_policy="block",
+        block_timeout_sec=5.0,
+    )
+    dispatcher.add_sink(sink, level="DEBUG")
+    dispatcher.emit_technical(_technical("macro.first"))
+    assert sink.entered.wait(5)
+    dispatcher.emit_technical(_technical("macro.second"))
+    threading.Timer(0.05, sink.release.set).start()
+
+    dispatcher.emit_technical(_technical("macro.third"))
+    dispatcher.close()
+
+    assert dispatcher.stats().dropped == 0
+    assert [log.event.event for log in sink.technical_logs] == [
+        "macro.first",
+        "macro.second",
+        "macro.third",
+    ]
+
+
+def test_async_dispatch_rejects_invalid_options() -> None:
+    with pytest.raises(ValueError, match="queue_size"):
+        LogSinkDispatcher(LogSanitizer(), queue_size=0)
+    with pytest.raises(ValueError, match="overflow policy"):
+        LogSinkDispatcher(LogSanitizer(), overflow_policy="wait")  # type: ignore[arg-type]
+
+
+def test_dispatcher_snapshot_is_rebuilt_only_on_registration_change() -> None:
+    dispatcher = LogSinkDispatcher(LogSanitizer())
+    debug_sink = TestLogSink()
+    sink_id = dispatcher.add_sink(debug_sink, level="WARNING")
+    snapshot = dispatcher._snapshot(LogLevel.INFO)
+
+    dispatcher.emit_technical(_technical("macro.step"))
+
+    assert dispatcher._snapshot(LogLevel.INFO) is snapshot
+    assert snapshot == ()
+    dispatcher.set_level(sink_id, "DEBUG")
+    assert [registration.sink for registration in dispatcher._snapshot(LogLevel.INFO)] == [
+        debug_sink
+    ]
+
+
+def test_dispatcher_emits_synchronously_after_close() -> None:
+    sink = TestLogSink()
+    dispatcher = LogSinkDispatcher(LogSanitizer(), async_dispatch=True)
+    dispatcher.add_sink(sink, level="DEBUG")
+    dispatcher.close()
+
+    dispatcher.emit_technical(_technical("macro.late"))
+
+    assert sink.technical_logs[0].event.event == "macro.late"
+
+
+def _user_event(message: str, run_id: str | None = "run-1") -> UserEvent:
+    return UserEvent(
+        timestamp=datetime.now(),
+        level=LogLevel.INFO,
+        component="test",
+        event="macro.message",
+        message=message,
+        run_id=run_id,
+    )
+
+
+def test_text_file_sink_buffers_lines_until_flush(tmp_path: Path) -> None:
+    path = tmp_path / "nyxpy.log"
+    sink = TextFileLogSink(path, flush_interval_sec=60.0)
+
+    sink.emit_user(_user_event("first"))
+    sink.emit_user(_user_event("second"))
+
+    assert path.read_text(encoding="utf-8") == ""
+    sink.flush()
+    assert path.read_text(encoding="utf-8").count("\n") == 2
+    sink.close()
+
+
+def test_file_sink_flushes_after_interval(tmp_path: Path) -> None:
+    path = tmp_path / "events.jsonl"
+    sink = JsonlFileSink(path, flush_interval_sec=0.01)
+
+    sink.emit_user(_user_event("buffered"))
+
+    deadline = time.monotonic() + 5
+    while not path.read_text(encoding="utf-8") and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert json.loads(path.read_text(encoding="utf-8"))["message"] == "buffered"
+    sink.close()
+
+
+def test_file_sink_rotates_from_written_byte_count(tmp_path: Path) -> None:
+    path = tmp_path / "nyxpy.log"
+    sink = TextFileLogSink(path, max_bytes=64, backup_count=1, flush_interval_sec=60.0)
+
+    for index in range(4):
+        sink.emit_user(_user_event(f"message {index}"))
+    sink.close()
+
+    assert path.exists()
+    assert (tmp_path / "nyxpy.log.1").exists()
+    assert not (tmp_path / "nyxpy.log.2").exists()
+    assert "message 3" in path.read_text(encoding="utf-8")
+
+
+def test_file_sink_runs_retention_cleanup_on_interval(tmp_path: Path, monkeypatch) -> None:
+    calls: list[Path] = []
+    monkeypatch.setattr(
+        "nyxpy.framework.core.logger.sinks.cleanup_retention",
+        lambda path, policy: calls.append(path),
+    )
+    sink = TextFileLogSink(tmp_path / "nyxpy.log", cleanup_interval_sec=60.0)
+
+    for index in range(20):
+        sink.emit_user(_user_event(f"message {index}"))
+    assert calls == []
+
+    sink.cleanup_interval_sec = 0.0
+    sink._next_cleanup = 0.0
+    sink.emit_user(_user_event("cleanup"))
+    sink.close()
+
+    assert calls == [tmp_path / "nyxpy.log"]
+
+
+def test_run_jsonl_sink_limits_open_run_files(tmp_path: Path) -> None:
+    sink = RunJsonlFileSink(tmp_path, max_open_files=2, flush_interval_sec=60.0)
+
+    for run_id in ("run-1", "run-2", "run-3"):
+        sink.emit_user(_user_event("message", run_id=run_id))
+
+    # 最も古い run-1 の handle は閉じられ、buffer の内容はファイルへ書き出される。
+    assert next(tmp_path.glob("*/run-1.jsonl")).read_text(encoding="utf-8") != ""
+    assert next(tmp_path.glob("*/run-3.jsonl")).read_text(encoding="utf-8") == ""
+    sink.close()
+    assert next(tmp_path.glob("*/run-3.jsonl")).read_text(encoding="utf-8") != ""
+
+
+def test_dispatcher_tracks_minimum_enabled_level() -> None:
+    dispatcher = LogSinkDispatcher(LogSanitizer())
+    assert dispatcher.minimum_level is None
+    assert dispatcher.is_enabled(LogLevel.CRITICAL) is False
+
+    sink_id = dispatcher.add_sink(TestLogSink(), level="WARNING")
+    assert dispatcher.minimum_level is LogLevel.WARNING
+    assert dispatcher.is_enabled(LogLevel.INFO) is False
+    assert dispatcher.is_enabled(LogLevel.ERROR) is True
+
+    dispatcher.set_level(sink_id, "DEBUG")
+    assert dispatcher.minimum_level is LogLevel.DEBUG
+    dispatcher.remove_sink(sink_id)
+    assert dispatcher.minimum_level is None
+
+
+def test_default_logger_skips_disabled_levels_before_building_event() -> None:
+    class StrictSanitizer(LogSanitizer):
+        def mask_text(self, text: str) -> str:
+            raise AssertionError("disabled log must not be sanitized")
+
+    sanitizer = StrictSanitizer()
+    dispatcher = LogSinkDispatcher(sanitizer)
+    dispatcher.add_sink(TestLogSink(), level="WARNING")
+    logger = DefaultLogger(dispatcher, sanitizer)
+
+    logger.technical("DEBUG", "skipped", component="test", event="macro.debug", exc=ValueError())
+    logger.user("INFO", "skipped", component="test", event="macro.message")
+
+    assert logger.is_enabled("info") is False
+    assert logger.is_enabled("WARNING") is True
+
+
+def test_default_logger_keeps_technical_logs_enabled_by_backend(tmp_path: Path) -> None:
+    sanitizer = LogSanitizer()
+    dispatcher = LogSinkDispatcher(sanitizer)
+    backend = JsonlLogBackend(tmp_path / "framework.jsonl", level="DEBUG")
+    logger = DefaultLogger(dispatcher, sanitizer, backend)
+
+    logger.technical("DEBUG", "stored", component="test", event="macro.debug")
+
+    assert logger.is_enabled("DEBUG") is True
+    assert "macro.debug" in (tmp_path / "framework.jsonl").read_text(encoding="utf-8")
+    assert NullLoggerPort().is_enabled("CRITICAL") is False
+
+
+def _legacy_mask_text(sanitizer: LogSanitizer, text: str) -> str:
+    sanitized = text.replace("\r", "\\r").replace("\n", "\\n")
+    for fragment in sanitizer.secret_fragments:
+        sanitized = re.sub(
+            rf"({re.escape(fragment)}\s*[:=]\s*)[^\s,;]+",
+            r"\1***",
+            sanitized,
+            flags=re.IGNORECASE,
+        )
+    return sanitized
+
+
+def test_mask_text_matches_per_fragment_substitution() -> None:
+    sanitizer = LogSanitizer(["api.key", "Session"])
+    samples = [
+        "plain message",
+        "frame 12: matched",
+        "password=plain-secret",
+        "Authorization: Bearer abc",
+        "authorization=abc, auth=def; token : ghi",
+        "my_token=abc next=1",
+        "token=password=nested",
+        "API.KEY=value\nsession:xyz\rWEBHOOK = https://example.invalid/hook",
+        "passwd:=x secret==y",
+    ]
+
+    for text in samples:
+        assert sanitizer.mask_text(text) == _legacy_mask_text(sanitizer, text)
+
+
+def test_mask_text_skips_regex_without_fragments(monkeypatch) -> None:
+    sanitizer = LogSanitizer()
+
+    class FailingPattern:
+        def finditer(self, *args):
+            raise AssertionError("regex must be skipped")
+
+    monkeypatch.setattr(sanitizer, "_secret_pattern", FailingPattern())
+
+    assert sanitizer.mask_text("count=3 state: ok") == "count=3 state: ok"
+    assert sanitizer.mask_text("token mentioned without value") == ("token mentioned without value")
+
+
+def test_secret_key_classification_is_memoized() -> None:
+    sanitizer = LogSanitizer()
+    extra = {"profile": {"auth_token": "x", "name": "nyx"}, "attempt": 1}
+
+    first = sanitizer.sanitize_extra_for_technical(extra)
+    second = sanitizer.sanitize_extra_for_technical(extra)
+
+    assert first == second == {"profile": {"auth_token": "***", "name": "nyx"}, "attempt": 1}
+    info = sanitizer._is_secret_key.cache_info()
+    assert info.currsize == 4
+    assert info.hits >= 4
+
+
+def test_buffered_file_sink_requires_file_hooks() -> None:
+    class IncompleteSink(_BufferedFileSink):
+        def _open_files(self):
+            return ()
+
+    with pytest.raises(TypeError, match="_cleanup_retention"):
+        IncompleteSink(RotationPolicy(), flush_interval_sec=0, cleanup_interval_sec=60)
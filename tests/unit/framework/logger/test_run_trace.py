@@ -0,0 +1,286 @@
+from __future__ import annotations
+
+import io
+import json
+import os
+import subprocess
+import sys
+from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from nyxpy.framework.core.logger import (
+    LogEvent,
+    LogLevel,
+    RunTrace,
+    TechnicalLog,
+    UserEvent,
+    create_default_logging,
+)
+from nyxpy.framework.core.logger.run_trace import (
+    RECORD_DTYPE,
+    RunTraceWriter,
+    export_run_trace_jsonl,
+    run_trace_paths,
+)
+from nyxpy.framework.core.logger.sinks import RunJsonlFileSink, RunTraceFileSink
+
+STARTED = datetime(2026, 5, 26, 23, 52, 45, 123456)
+
+
+def _technical(index: int) -> TechnicalLog:
+    return TechnicalLog(
+        LogEvent(
+            timestamp=STARTED.replace(second=index % 60),
+            level=LogLevel.DEBUG,
+            component="Command",
+            event="command.press",
+            message=f"press {index}",
+            run_id="run-1",
+            macro_id="sample",
+            extra={"index": index, "keys": ["A"]},
+        )
+    )
+
+
+def _failure() -> TechnicalLog:
+    return TechnicalLog(
+        LogEvent(
+            timestamp=STARTED,
+            level=LogLevel.ERROR,
+            component="MacroRunner",
+            event="macro.failed",
+            message="失敗しました",
+            run_id="run-1",
+            macro_id="sample",
+            exception_type="RuntimeError",
+            traceback="Traceback ...\nRuntimeError: boom\n",
+        ),
+        include_traceback=True,
+    )
+
+
+def _user(message: str = "visible") -> UserEvent:
+    return UserEvent(
+        timestamp=STARTED,
+        level=LogLevel.INFO,
+        component="Sample",
+        event="command.log",
+        message=message,
+        run_id="run-1",
+        macro_id="sample",
+        code="NYX_SAMPLE",
+    )
+
+
+def test_run_trace_round_trips_events(tmp_path: Path) -> None:
+    path = tmp_path / "run-1.nyxlog"
+    writer = RunTraceWriter(path)
+    writer.write_technical(_technical(0))
+    writer.write_user(_user())
+    writer.write_technical(_failure())
+    writer.close()
+
+    events = list(RunTrace.load(path).events())
+
+    assert events == [_technical(0), _user(), _failure()]
+
+
+def test_run_trace_interns_names_and_exposes_columns(tmp_path: Path) -> None:
+    path = tmp_path / "run-1.nyxlog"
+    writer = RunTraceWriter(path)
+    for index in range(100):
+        writer.write_technical(_technical(index))
+    writer.close()
+
+    trace = RunTrace.load(path)
+
+    assert len(trace) == 100
+    assert trace.records.dtype == RECORD_DTYPE
+    assert path.stat().st_size == 12 + 100 * RECORD_DTYPE.itemsize
+    assert trace.names == ("Command", "command.press", "run-1", "sample")
+    assert set(trace.records["component"].tolist()) == {0}
+    assert trace.name(int(trace.records["event"][0])) == "command.press"
+    assert np.all(np.diff(trace.timestamps_ns[:60]) == 1_000_000_000)
+    assert trace.timestamps_ns[0] % 1_000_000_000 == 123_456_000
+
+
+def test_run_trace_appends_to_existing_trace(tmp_path: Path) -> None:
+    path = tmp_path / "run-1.nyxlog"
+    first = RunTraceWriter(path)
+    first.write_technical(_technical(0))
+    first.close()
+    second = RunTraceWriter(path)
+    second.write_user(_user("again"))
+    second.write_technical(_technical(1))
+    second.close()
+
+    trace = RunTrace.load(path)
+
+    assert [event.message for event in _messages(trace)] == ["press 0", "again", "press 1"]
+    assert trace.names.count("Command") == 1
+
+
+def test_run_trace_ignores_incomplete_trailing_record(tmp_path: Path) -> None:
+    path = tmp_path / "run-1.nyxlog"
+    writer = RunTraceWriter(path)
+    writer.write_technical(_technical(0))
+    writer.write_technical(_technical(1))
+    writer.close()
+    _records_path, _names_path, data_path = run_trace_paths(path)
+    data_path.write_bytes(data_path.read_bytes()[:-5])
+    with path.open("ab") as file:
+        file.write(b"\x00" * 7)
+
+    trace = RunTrace.load(path)
+
+    assert [event.message for event in _messages(trace)] == ["press 0"]
+
+
+_CRASHING_WRITER = """
+import os
+import sys
+from datetime import datetime
+from pathlib import Path
+
+from nyxpy.framework.core.logger import LogEvent, LogLevel, TechnicalLog
+from nyxpy.framework.core.logger.run_trace import RunTraceWriter
+
+
+def technical(index, event):
+    return TechnicalLog(
+        LogEvent(
+            timestamp=datetime(2026, 5, 26, 23, 52, index % 60),
+            level=LogLevel.DEBUG,
+            component="Command",
+            event=event,
+            message=f"press {index}",
+            run_id="run-1",
+            macro_id="sample",
+            # 本文を buffer より大きくし、record と本文だけがディスクへ届く状況を作る。
+            extra={"padding": "x" * 64},
+        )
+    )
+
+
+writer = RunTraceWriter(Path(sys.argv[1]))
+for index in range(300):
+    writer.write_technical(technical(index, "command.press"))
+writer.flush()
+writer.write_technical(technical(300, "command.hold"))
+for index in range(301, 600):
+    writer.write_technical(technical(index, "command.press"))
+os._exit(0)
+"""
+
+
+def test_run_trace_survives_crash_after_new_name(tmp_path: Path) -> None:
+    path = tmp_path / "run-1.nyxlog"
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)}
+    subprocess.run([sys.executable, "-c", _CRASHING_WRITER, str(path)], check=True, env=env)
+
+    trace = RunTrace.load(path)
+    events = _messages(trace)
+
+    assert len(events) >= 300
+    assert [event.message for event in events[:300]] == [f"press {i}" for i in range(300)]
+    assert all(
+        event.event == ("command.hold" if event.message == "press 300" else "command.press")
+        for event in events
+    )
+
+    writer = RunTraceWriter(path)
+    writer.write_technical(
+        TechnicalLog(
+            LogEvent(
+                timestamp=STARTED,
+                level=LogLevel.INFO,
+                component="Command",
+                event="command.release",
+                message="resumed",
+                run_id="run-1",
+            )
+        )
+    )
+    writer.close()
+
+    resumed = _messages(RunTrace.load(path))
+    assert [event.event for event in resumed[: len(events)]] == [event.event for event in events]
+    assert resumed[-1].event == "command.release"
+
+
+def test_run_trace_keeps_only_records_before_unknown_name(tmp_path: Path) -> None:
+    path = tmp_path / "run-1.nyxlog"
+    writer = RunTraceWriter(path)
+    for index in range(3):
+        writer.write_technical(_technical(index))
+    writer.close()
+    records_path, _names_path, _data_path = run_trace_paths(path)
+    records = np.fromfile(records_path, dtype=RECORD_DTYPE, offset=12)
+    records["event"][1] = 99
+    with records_path.open("r+b") as file:
+        file.seek(12)
+        file.write(records.tobytes())
+
+    trace = RunTrace.load(path)
+
+    assert [event.message for event in _messages(trace)] == ["press 0"]
+
+
+@pytest.mark.parametrize(
+    ("data", "message"),
+    [(b"NYX", "truncated"), (b"NOTTRACE" + bytes(4), "not a NyX run trace")],
+)
+def test_run_trace_rejects_invalid_files(tmp_path: Path, data: bytes, message: str) -> None:
+    path = tmp_path / "broken.nyxlog"
+    path.write_bytes(data)
+
+    with pytest.raises(ValueError, match=message):
+        RunTrace.load(path)
+
+
+def test_run_trace_export_matches_run_jsonl(tmp_path: Path) -> None:
+    jsonl_sink = RunJsonlFileSink(tmp_path / "jsonl")
+    trace_sink = RunTraceFileSink(tmp_path / "trace")
+    for sink in (jsonl_sink, trace_sink):
+        sink.emit_technical(_technical(0))
+        sink.emit_user(_user())
+        sink.emit_technical(_failure())
+        sink.close()
+    output = io.StringIO()
+
+    count = export_run_trace_jsonl(next((tmp_path / "trace").glob("*/run-1.nyxlog")), output)
+
+    expected = next((tmp_path / "jsonl").glob("*/run-1.jsonl")).read_text(encoding="utf-8")
+    assert count == 3
+    assert [json.loads(line) for line in output.getvalue().splitlines()] == [
+        json.loads(line) for line in expected.splitlines()
+    ]
+
+
+def test_run_trace_sink_skips_events_without_run_id(tmp_path: Path) -> None:
+    sink = RunTraceFileSink(tmp_path)
+    sink.emit_user(
+        UserEvent(STARTED, LogLevel.INFO, "Sample", "command.log", "no run", run_id=None)
+    )
+    sink.close()
+
+    assert list(tmp_path.rglob("*.nyxlog")) == []
+
+
+def test_default_logging_adds_run_trace_sink_when_enabled(tmp_path: Path) -> None:
+    logging = create_default_logging(
+        base_dir=tmp_path, console_enabled=False, run_trace_enabled=True
+    )
+    logging.dispatcher.emit_user(_user())
+    logging.close()
+
+    assert "run_trace" in logging.sink_ids
+    trace = RunTrace.load(next((tmp_path / "runs").glob("*/run-1.nyxlog")))
+    assert [event.message for event in _messages(trace)] == ["visible"]
+
+
+def _messages(trace: RunTrace) -> list[LogEvent | UserEvent]:
+    return [event.event if isinstance(event, TechnicalLog) else event for event in trace.events()]
@@ -70,6 +70,9 @@ def test_command_public_method_names_are_stable() -> None:
         "touch_down",
         "touch_up",
         "disable_sleep",
+        "schedule",
+        "tap",
+        "stick_path",
     }
 
     missing = {name for name in expected_methods if not hasattr(Command, name)}
@@ -93,9 +96,11 @@ def test_command_core_signatures_are_stable() -> None:
     assert log.parameters["level"].default == "DEBUG"
 
     capture = inspect.signature(Command.capture)
-    assert _parameter_names(Command.capture) == ["self", "crop_region", "grayscale"]
+    assert _parameter_names(Command.capture) == ["self", "crop_region", "grayscale", "fresh"]
     assert capture.parameters["crop_region"].default is None
     assert capture.parameters["grayscale"].default is False
+    assert capture.parameters["fresh"].kind is inspect.Parameter.KEYWORD_ONLY
+    assert capture.parameters["fresh"].default is False
 
     load_img = inspect.signature(Command.load_img)
     assert _parameter_names(Command.load_img) == ["self", "filename", "grayscale"]
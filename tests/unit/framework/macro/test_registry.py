@@ -136,6 +136,7 @@ def test_registry_loads_convention_package_macro(tmp_path: Path) -> None:
     assert definition.display_name == "ConventionPackageMacro"
     assert definition.description == "class description"
     assert definition.tags == ("class-tag",)
+    assert definition.ocr_languages == ()
     assert definition.settings_path is None
     assert definition.entrypoint_kind == "convention"
 
@@ -177,6 +178,36 @@ def test_registry_uses_class_metadata_when_manifest_absent(tmp_path: Path) -> No
     assert definition.settings_path == "settings.toml"
 
 
+def test_registry_reads_ocr_languages_from_class_and_manifest(tmp_path: Path) -> None:
+    macros_dir = _prepare_project(tmp_path)
+    _write_macro_file(
+        macros_dir / "ocr_class.py",
+        "OcrClassMacro",
+        body='ocr_languages = ["en"]',
+    )
+    package_dir = _write_package(
+        macros_dir, "ocr_manifest", "OcrManifestMacro", body='ocr_languages = ["en"]'
+    )
+    (package_dir / "macro.toml").write_text(
+        textwrap.dedent(
+            """
+            [macro]
+            id = "ocr_manifest"
+            entrypoint = "macros.ocr_manifest.macro:OcrManifestMacro"
+            ocr_languages = ["ja", "en"]
+            """
+        ),
+        encoding="utf-8",
+    )
+
+    registry = MacroRegistry(project_root=tmp_path)
+    registry.reload()
+
+    assert registry.resolve("ocr_class").ocr_languages == ("en",)
+    assert registry.resolve("ocr_manifest").ocr_languages == ("ja", "en")
+    assert registry.diagnostics == ()
+
+
 def test_registry_requires_manifest_when_convention_is_ambiguous(tmp_path: Path) -> None:
     macros_dir = _prepare_project(tmp_path)
     (macros_dir / "ambiguous.py").write_text(
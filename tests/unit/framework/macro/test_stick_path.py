@@ -0,0 +1,156 @@
+from __future__ import annotations
+
+import math
+import time
+
+import numpy as np
+import pytest
+
+from nyxpy.framework.core.constants import Button, LStick, RStick
+from nyxpy.framework.core.macro.command import DefaultCommand
+from nyxpy.framework.core.macro.exceptions import ConfigurationError, MacroCancelled
+from nyxpy.framework.core.macro.stick_path import StickPath, StickPathPlayback
+from nyxpy.framework.core.macro.timeline import InputTimeline
+from nyxpy.framework.core.utils.cancellation import CancellationToken
+from tests.support.fake_execution_context import make_fake_execution_context
+from tests.support.fakes import FakeControllerOutputPort
+
+
+def _axes(positions) -> list[tuple[int, int]]:
+    return [(position.x, position.y) for position in positions]
+
+
+def test_stick_path_from_polar_accepts_numpy_arrays() -> None:
+    path = StickPath.from_polar(
+        np.array([0.0, math.pi / 2, math.pi]), np.array([1.0, 1.0, 0.5]), interval=0.01
+    )
+
+    assert _axes(path.positions) == _axes(
+        [LStick(0.0, 1.0), LStick(math.pi / 2, 1.0), LStick(math.pi, 0.5)]
+    )
+    assert len(path) == 3
+    assert path.duration == pytest.approx(0.03)
+
+
+def test_stick_path_from_polar_uses_degrees_and_right_stick() -> None:
+    path = StickPath.from_polar([90, 180], interval=0.01, stick=RStick, degrees=True)
+
+    assert all(type(position) is RStick for position in path.positions)
+    assert _axes(path.positions) == _axes([RStick.UP, RStick.LEFT])
+
+
+def test_stick_path_from_function_samples_each_interval() -> None:
+    times: list[float] = []
+
+    def spiral(t: float) -> tuple[float, float]:
+        times.append(t)
+        return (t, t)
+
+    path = StickPath.from_function(spiral, 0.04, interval=0.01)
+
+    assert times == pytest.approx([0.0, 0.01, 0.02, 0.03])
+    assert len(path) == 4
+
+
+def test_stick_path_circle_does_not_repeat_start_position() -> None:
+    path = StickPath.circle(1.0, interval=0.25, clockwise=True)
+
+    assert _axes(path.positions) == _axes([LStick.RIGHT, LStick.DOWN, LStick.LEFT, LStick.UP])
+
+
+@pytest.mark.parametrize(
+    "build",
+    [
+        lambda: StickPath([LStick.UP], 0),
+        lambda: StickPath([Button.A], 0.01),
+        lambda: StickPath.from_polar([[0.0]], interval=0.01),
+        lambda: StickPath.from_polar([0.0, 1.0], [1.0, 1.0, 1.0], interval=0.01),
+        lambda: StickPath.from_polar([math.nan], interval=0.01),
+        lambda: StickPath.circle(-1.0, interval=0.01),
+    ],
+)
+def test_stick_path_rejects_invalid_input(build) -> None:
+    with pytest.raises(ConfigurationError) as exc_info:
+        build()
+
+    assert exc_info.value.code == "NYX_INVALID_STICK_PATH"
+
+
+def test_playback_streams_positions_from_thread_and_releases() -> None:
+    controller = FakeControllerOutputPort()
+    path = StickPath([LStick.UP, LStick.LEFT, RStick.DOWN], 0.01)
+    playback = StickPathPlayback(path, controller, CancellationToken())
+
+    started = time.perf_counter()
+    playback.start()
+    result = playback.result(timeout=1.0)
+
+    assert time.perf_counter() - started >= 0.03
+    assert controller.events == [
+        ("press", (LStick.UP,)),
+        ("press", (LStick.LEFT,)),
+        ("press", (RStick.DOWN,)),
+        ("release", (LStick.LEFT, RStick.DOWN)),
+    ]
+    assert result.frames == 3
+    assert result.cancelled is False
+
+
+def test_playback_reraises_controller_error() -> None:
+    controller = FakeControllerOutputPort()
+
+    def fail(keys) -> None:
+        raise RuntimeError("send failed")
+
+    controller.press = fail
+    playback = StickPathPlayback(StickPath([LStick.UP], 0.01), controller, CancellationToken())
+    playback.start()
+
+    with pytest.raises(RuntimeError, match="send failed"):
+        playback.result(timeout=1.0)
+
+
+def test_command_stick_path_waits_and_logs_summary(tmp_path) -> None:
+    controller = FakeControllerOutputPort()
+    context = make_fake_execution_context(tmp_path, controller=controller)
+    cmd = DefaultCommand(context=context)
+
+    playback = cmd.stick_path(StickPath.circle(0.04, interval=0.01), release=False)
+
+    assert playback.done()
+    assert [name for name, _keys in controller.events] == ["press"] * 4
+    logs = [log for log in context.logger.technical_logs if log.event.event == "command.stick_path"]
+    assert len(logs) == 1
+    assert logs[0].event.extra["sent"] == 4
+    assert logs[0].event.extra["cancelled"] is False
+
+
+def test_command_stick_path_raises_after_cancel(tmp_path) -> None:
+    controller = FakeControllerOutputPort()
+    context = make_fake_execution_context(tmp_path, controller=controller)
+    cmd = DefaultCommand(context=context)
+    original_press = controller.press
+
+    def press_then_cancel(keys) -> None:
+        original_press(keys)
+        context.cancellation_token.request_cancel(reason="test", source="test")
+
+    controller.press = press_then_cancel
+
+    with pytest.raises(MacroCancelled):
+        cmd.stick_path(StickPath([LStick.UP, LStick.DOWN], 1.0))
+
+    # 最後に送る予定だった位置の型で stick を中央へ戻す。
+    assert controller.events == [("press", (LStick.UP,)), ("release", (LStick.DOWN,))]
+
+
+def test_command_stick_path_rejects_overlapping_playback(tmp_path) -> None:
+    cmd = DefaultCommand(context=make_fake_execution_context(tmp_path))
+    playback = cmd.stick_path(StickPath([LStick.UP], 0.2), wait=False)
+
+    with pytest.raises(ConfigurationError) as exc_info:
+        cmd.schedule(InputTimeline().hold(0.0, Button.A))
+
+    assert exc_info.value.code == "NYX_TIMELINE_ALREADY_RUNNING"
+    assert exc_info.value.message == "another stick path is still playing"
+    playback.result(timeout=1.0)
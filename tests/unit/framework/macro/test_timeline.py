@@ -0,0 +1,191 @@
+from __future__ import annotations
+
+import threading
+import time
+
+import pytest
+
+from nyxpy.framework.core.constants import Button, Hat
+from nyxpy.framework.core.macro.command import DefaultCommand
+from nyxpy.framework.core.macro.exceptions import ConfigurationError, MacroCancelled
+from nyxpy.framework.core.macro.timeline import (
+    InputTimeline,
+    TimelineEvent,
+    TimelinePlayback,
+)
+from nyxpy.framework.core.runtime.context import RuntimeOptions
+from nyxpy.framework.core.utils.cancellation import CancellationToken, wait_until
+from tests.support.fake_execution_context import make_fake_execution_context
+from tests.support.fakes import FakeControllerOutputPort
+
+
+class TimedController(FakeControllerOutputPort):
+    def __init__(self) -> None:
+        super().__init__()
+        self.times: list[float] = []
+
+    def press(self, keys) -> None:
+        self.times.append(time.perf_counter())
+        super().press(keys)
+
+    def hold(self, keys) -> None:
+        self.times.append(time.perf_counter())
+        super().hold(keys)
+
+    def release(self, keys=()) -> None:
+        self.times.append(time.perf_counter())
+        super().release(keys)
+
+
+def test_timeline_orders_events_by_offset() -> None:
+    timeline = (
+        InputTimeline().press(0.02, Button.A, dur=0.01).hold(0.0, Button.B, Hat.UP).release(0.05)
+    )
+
+    assert timeline.events == (
+        TimelineEvent(0.0, "hold", (Button.B, Hat.UP)),
+        TimelineEvent(0.02, "press", (Button.A,)),
+        TimelineEvent(0.03, "release", (Button.A,)),
+        TimelineEvent(0.05, "release", ()),
+    )
+    assert timeline.duration == 0.05
+    assert len(timeline) == 4
+
+
+def test_timeline_from_states_holds_each_state() -> None:
+    timeline = InputTimeline.from_states([(0.0, (Button.A,)), (0.1, ())])
+
+    assert timeline.events == (
+        TimelineEvent(0.0, "hold", (Button.A,)),
+        TimelineEvent(0.1, "release", ()),
+    )
+
+
+@pytest.mark.parametrize("build", [lambda t: t.hold(-0.1), lambda t: t.press(0.0, dur=-1)])
+def test_timeline_rejects_negative_offsets(build) -> None:
+    with pytest.raises(ConfigurationError) as exc_info:
+        build(InputTimeline())
+
+    assert exc_info.value.code == "NYX_INVALID_TIMELINE_OFFSET"
+
+
+def test_playback_sends_events_at_scheduled_offsets() -> None:
+    controller = TimedController()
+    timeline = InputTimeline().press(0.01, Button.A, dur=0.02).hold(0.05, Button.B)
+    start_at = time.perf_counter()
+    playback = TimelinePlayback(timeline, controller, CancellationToken(), start_at=start_at)
+
+    playback.start()
+    result = playback.result(1.0)
+
+    assert controller.events == [
+        ("press", (Button.A,)),
+        ("release", (Button.A,)),
+        ("hold", (Button.B,)),
+    ]
+    assert [item.scheduled_at for item in result.events] == [0.01, 0.03, 0.05]
+    for item, sent in zip(result.events, controller.times, strict=True):
+        assert item.jitter_sec >= 0
+        assert sent - start_at >= item.scheduled_at
+    assert result.max_jitter_sec >= result.mean_jitter_sec >= 0
+    assert result.cancelled is False
+
+
+def test_playback_stops_on_cancellation() -> None:
+    controller = FakeControllerOutputPort()
+    token = CancellationToken()
+    timeline = InputTimeline().hold(0.0, Button.A).release(10.0)
+    playback = TimelinePlayback(timeline, controller, token, start_at=time.perf_counter())
+
+    playback.start()
+    time.sleep(0.02)
+    token.request_cancel(reason="test")
+    result = playback.result(1.0)
+
+    assert result.cancelled is True
+    assert controller.events == [("hold", (Button.A,))]
+
+
+def test_playback_reraises_controller_error() -> None:
+    class FailingController(FakeControllerOutputPort):
+        def hold(self, keys) -> None:
+            raise RuntimeError("disconnected")
+
+    playback = TimelinePlayback(
+        InputTimeline().hold(0.0, Button.A),
+        FailingController(),
+        CancellationToken(),
+        start_at=time.perf_counter(),
+    )
+    playback.start()
+
+    with pytest.raises(RuntimeError, match="disconnected"):
+        playback.result(1.0)
+
+
+def test_wait_until_returns_false_when_cancelled() -> None:
+    token = CancellationToken()
+    threading.Timer(0.01, token.request_cancel).start()
+
+    assert wait_until(time.perf_counter() + 5.0, token) is False
+
+
+def test_wait_until_does_not_return_before_deadline() -> None:
+    deadline = time.perf_counter() + 0.01
+
+    assert wait_until(deadline, CancellationToken()) is True
+    assert time.perf_counter() >= deadline
+
+
+def test_command_schedule_waits_and_logs_jitter(tmp_path) -> None:
+    controller = FakeControllerOutputPort()
+    context = make_fake_execution_context(tmp_path, controller=controller)
+    cmd = DefaultCommand(context=context)
+
+    playback = cmd.schedule([(0.0, (Button.A,)), (0.01, ())])
+
+    assert playback.done()
+    assert controller.events == [("hold", (Button.A,)), ("release", ())]
+    log = next(
+        log.event
+        for log in context.logger.technical_logs
+        if log.event.event == "command.timeline_finished"
+    )
+    assert log.extra["sent"] == 2
+    assert log.extra["max_jitter_ms"] >= 0
+
+
+@pytest.mark.parametrize(
+    ("precise_wait", "precise", "expected"),
+    [(True, None, 0.004), (False, None, 0.0), (False, True, 0.004), (True, False, 0.0)],
+)
+def test_command_schedule_follows_precise_wait_settings(
+    tmp_path, precise_wait, precise, expected
+) -> None:
+    options = RuntimeOptions(precise_wait=precise_wait, precise_wait_margin_sec=0.004)
+    cmd = DefaultCommand(context=make_fake_execution_context(tmp_path, options=options))
+
+    playback = cmd.schedule([(0.0, (Button.A,)), (0.001, ())], precise=precise)
+
+    assert playback._spin_margin == expected
+
+
+def test_command_schedule_rejects_overlapping_playback(tmp_path) -> None:
+    cmd = DefaultCommand(context=make_fake_execution_context(tmp_path))
+    playback = cmd.schedule(InputTimeline().hold(0.0, Button.A).release(0.2), wait=False)
+
+    with pytest.raises(ConfigurationError) as exc_info:
+        cmd.schedule(InputTimeline().hold(0.0, Button.B))
+
+    assert exc_info.value.code == "NYX_TIMELINE_ALREADY_RUNNING"
+    assert exc_info.value.message == "another input timeline is still playing"
+    playback.result(1.0)
+
+
+def test_command_schedule_raises_when_cancelled(tmp_path) -> None:
+    token = CancellationToken()
+    cmd = DefaultCommand(context=make_fake_execution_context(tmp_path, cancellation_token=token))
+    threading.Timer(0.02, token.request_cancel).start()
+
+    with pytest.raises(MacroCancelled):
+        cmd.schedule(InputTimeline().hold(0.0, Button.A).release(5.0))
@@ -1,9 +1,11 @@
 from pathlib import Path
 
+import cv2
 import numpy as np
 import pytest
 
 from nyxpy.framework.core.constants import Button, IMUFrame, KeyCode
+from nyxpy.framework.core.io.adapters import DummyFrameSourcePort
 from nyxpy.framework.core.io.ports import FrameNotReadyError
 from nyxpy.framework.core.io.resources import (
     ArtifactScope,
@@ -11,12 +13,13 @@ from nyxpy.framework.core.io.resources import (
     ResourceWriteError,
 )
 from nyxpy.framework.core.macro.command import DefaultCommand
-from nyxpy.framework.core.macro.exceptions import MacroCancelled
+from nyxpy.framework.core.macro.exceptions import ConfigurationError, MacroCancelled
 from nyxpy.framework.core.runtime.context import RuntimeOptions
 from tests.support.fake_execution_context import make_fake_execution_context
 from tests.support.fakes import (
     FakeControllerOutputPort,
     FakeFullCapabilityController,
+    FakeLoggerPort,
     FakeNotificationPort,
     FakeResourceStore,
     FakeRunArtifactStore,
@@ -44,6 +47,62 @@ def test_default_command_press_delegates_to_controller_port(tmp_path) -> None:
     assert controller.events == [("press", (Button.A,)), ("release", (Button.A,))]
 
 
+def test_default_command_tap_logs_single_summary(tmp_path) -> None:
+    controller = FakeControllerOutputPort()
+    context = make_fake_execution_context(tmp_path, controller=controller)
+    cmd = DefaultCommand(context=context)
+
+    result = cmd.tap(Button.A, dur=0, wait=0, repeat=5)
+
+    assert result.taps == 5
+    assert controller.events == [("press", (Button.A,)), ("release", (Button.A,))] * 5
+    logs = [log for log in context.logger.technical_logs if log.event.event == "command.tap"]
+    assert len(logs) == 1
+    assert logs[0].event.extra["taps"] == 5
+    assert logs[0].event.extra["cancelled"] is False
+
+
+def test_default_command_tap_rejects_negative_repeat(tmp_path) -> None:
+    cmd = DefaultCommand(context=make_fake_execution_context(tmp_path))
+
+    with pytest.raises(ConfigurationError) as exc_info:
+        cmd.tap(Button.A, repeat=-1)
+
+    assert exc_info.value.code == "NYX_INVALID_TAP"
+
+
+def test_default_command_tap_raises_after_cancel(tmp_path) -> None:
+    controller = FakeControllerOutputPort()
+    context = make_fake_execution_context(tmp_path, controller=controller)
+    cmd = DefaultCommand(context=context)
+    original_release = controller.release
+
+    def release_then_cancel(keys=()):
+        original_release(keys)
+        context.cancellation_token.request_cancel(reason="test", source="test")
+
+    controller.release = release_then_cancel
+
+    with pytest.raises(MacroCancelled):
+        cmd.tap(Button.A, dur=0, wait=1.0, repeat=3)
+
+    assert controller.events == [("press", (Button.A,)), ("release", (Button.A,))]
+
+
+def test_default_command_wait_records_error_by_mode(tmp_path) -> None:
+    cmd = DefaultCommand(
+        context=make_fake_execution_context(tmp_path, options=RuntimeOptions(precise_wait=True))
+    )
+
+    cmd.wait(0.005)
+    cmd.wait(0.005, precise=False)
+
+    summary = cmd.wait_stats.summary()
+    assert summary["precise"]["count"] == 1
+    assert summary["coarse"]["count"] == 1
+    assert summary["precise"]["max_ms"] >= 0
+
+
 def test_default_command_imu_delegates_to_controller(tmp_path) -> None:
     class ImuController(FakeControllerOutputPort):
         def imu(self, *frames: IMUFrame) -> None:
@@ -99,6 +158,109 @@ def test_default_command_capture_resizes_crops_and_grayscales(tmp_path) -> None:
     assert result.dtype == frame.dtype
 
 
+def _gradient_frame(width: int, height: int) -> np.ndarray:
+    xs = np.linspace(0, 255, width, dtype=np.float32)
+    ys = np.linspace(0, 255, height, dtype=np.float32)
+    frame = np.empty((height, width, 3), dtype=np.uint8)
+    frame[..., 0] = xs[np.newaxis, :]
+    frame[..., 1] = ys[:, np.newaxis]
+    frame[..., 2] = 128
+    return frame
+
+
+@pytest.mark.parametrize("size", [(1280, 720), (2560, 1440)])
+def test_default_command_capture_crop_matches_full_frame_resize(tmp_path, size) -> None:
+    frame = _gradient_frame(*size)
+    context = make_fake_execution_context(tmp_path)
+    context.frame_source.frame = frame
+    context.frame_source.initialize()
+    cmd = DefaultCommand(context=context)
+
+    result = cmd.capture(crop_region=(400, 360, 480, 360))
+
+    expected = cv2.resize(frame, (1280, 720), interpolation=cv2.INTER_AREA)[360:720, 400:880]
+    np.testing.assert_array_equal(result, expected)
+
+
+def test_default_command_capture_crop_resizes_only_mapped_region(tmp_path) -> None:
+    frame = _gradient_frame(1920, 1080)
+    context = make_fake_execution_context(tmp_path)
+    context.frame_source.frame = frame
+    context.frame_source.initialize()
+    cmd = DefaultCommand(context=context)
+
+    result = cmd.capture(crop_region=(340, 0, 600, 720), grayscale=True)
+
+    full = cv2.resize(frame, (1280, 720), interpolation=cv2.INTER_AREA)
+    expected = cv2.cvtColor(full[0:720, 340:940], cv2.COLOR_BGR2GRAY)
+    np.testing.assert_array_equal(result, expected)
+
+
+@pytest.mark.parametrize("size", [(1920, 1080), (1366, 768), (640, 360)])
+def test_default_command_capture_crop_matches_full_frame_resize_for_any_roi(tmp_path, size) -> None:
+    rng = np.random.default_rng(3)
+    frame = rng.integers(0, 256, (size[1], size[0], 3), dtype=np.uint8)
+    frame_source = DummyFrameSourcePort(frame)
+    frame_source.initialize()
+    full = cv2.resize(frame, (1280, 720), interpolation=cv2.INTER_AREA)
+    regions = [(333, 211, 89, 223), (400, 360, 480, 360), (1, 1, 1, 1), (0, 0, 1280, 720)]
+    for _ in range(30):
+        x, y = int(rng.integers(0, 1279)), int(rng.integers(0, 719))
+        regions.append((x, y, int(rng.integers(1, 1281 - x)), int(rng.integers(1, 721 - y))))
+
+    for region in regions:
+        # 毎回新しい command で、全体 resize の再利用に頼らない経路を確かめる。
+        cmd = DefaultCommand(
+            context=make_fake_execution_context(tmp_path, frame_source=frame_source)
+        )
+        x, y, w, h = region
+        np.testing.assert_array_equal(
+            cmd.capture(crop_region=region), full[y : y + h, x : x + w], err_msg=str(region)
+        )
+
+
+@pytest.mark.parametrize("region", [(1280, 0, 0, 10), (10, 20, 0, 0), (100, 100, 0, 50)])
+def test_default_command_capture_returns_empty_array_for_zero_size_roi(tmp_path, region) -> None:
+    frame_source = DummyFrameSourcePort(_gradient_frame(1920, 1080))
+    frame_source.initialize()
+    cmd = DefaultCommand(context=make_fake_execution_context(tmp_path, frame_source=frame_source))
+
+    result = cmd.capture(crop_region=region)
+
+    assert result.size == 0
+
+
+def test_default_command_capture_reuses_derived_images_for_same_frame(
+    tmp_path, monkeypatch
+) -> None:
+    frame_source = DummyFrameSourcePort(_gradient_frame(1920, 1080))
+    frame_source.initialize()
+    cmd = DefaultCommand(context=make_fake_execution_context(tmp_path, frame_source=frame_source))
+    resize_calls = []
+    resize = cv2.resize
+
+    def counting_resize(*args, **kwargs):
+        resize_calls.append(args[1])
+        return resize(*args, **kwargs)
+
+    monkeypatch.setattr(cv2, "resize", counting_resize)
+
+    first = cmd.capture(crop_region=(400, 360, 480, 360))
+    first[:] = 0
+    second = cmd.capture(crop_region=(400, 360, 480, 360))
+    gray = cmd.capture(crop_region=(400, 360, 480, 360), grayscale=True)
+    cmd.capture()
+    cmd.capture(crop_region=(0, 0, 89, 223))
+
+    assert resize_calls == [(480, 360), (1280, 720)]
+    assert second.any()
+    assert gray.shape == (360, 480)
+
+    cmd.capture(crop_region=(400, 360, 480, 360), fresh=True)
+
+    assert resize_calls == [(480, 360), (1280, 720), (480, 360)]
+
+
 def test_default_command_capture_raises_when_frame_is_not_ready(tmp_path) -> None:
     cmd = DefaultCommand(context=make_fake_execution_context(tmp_path))
 
@@ -106,6 +268,44 @@ def test_default_command_capture_raises_when_frame_is_not_ready(tmp_path) -> Non
         cmd.capture()
 
 
+def test_default_command_fresh_capture_waits_for_newer_frame(tmp_path) -> None:
+    frame_source = DummyFrameSourcePort(np.zeros((720, 1280, 3), dtype=np.uint8))
+    frame_source.initialize()
+    context = make_fake_execution_context(tmp_path, frame_source=frame_source)
+    cmd = DefaultCommand(context=context)
+    seen: list[int] = []
+    wait_for_next_frame = frame_source.wait_for_next_frame
+
+    def recording_wait(after_seq: int, timeout: float):
+        seen.append(after_seq)
+        return wait_for_next_frame(after_seq, timeout)
+
+    frame_source.wait_for_next_frame = recording_wait
+
+    cmd.capture()
+    cmd.capture(fresh=True)
+    cmd.capture(fresh=True)
+
+    assert seen == [1, 2]
+
+
+def test_default_command_fresh_capture_times_out_without_new_frame(tmp_path) -> None:
+    class StalledFrameSource(DummyFrameSourcePort):
+        def wait_for_next_frame(self, after_seq: int, timeout: float):
+            return None
+
+    frame_source = StalledFrameSource()
+    frame_source.initialize()
+    context = make_fake_execution_context(
+        tmp_path,
+        frame_source=frame_source,
+        options=RuntimeOptions(frame_ready_timeout_sec=0.01),
+    )
+
+    with pytest.raises(FrameNotReadyError):
+        DefaultCommand(context=context).capture(fresh=True)
+
+
 def test_default_command_resources_and_artifacts_delegate_to_ports(tmp_path) -> None:
     context = make_fake_execution_context(tmp_path)
     image = np.ones((1, 1, 3), dtype=np.uint8)
@@ -242,3 +442,29 @@ def test_default_command_wait_raises_after_cancel(tmp_path) -> None:
 
     with pytest.raises(MacroCancelled):
         cmd.wait(1.0)
+
+
+def test_default_command_log_skips_formatting_for_disabled_level(tmp_path, monkeypatch) -> None:
+    class InfoLogger(FakeLoggerPort):
+        def is_enabled(self, level: str) -> bool:
+            return level != "DEBUG"
+
+        def bind_context(self, context) -> FakeLoggerPort:
+            return self
+
+    def fail_caller_lookup() -> str:
+        raise AssertionError("caller lookup must be skipped")
+
+    class Unprintable:
+        def __str__(self) -> str:
+            raise AssertionError("values must not be formatted")
+
+    context = make_fake_execution_context(tmp_path, logger=InfoLogger())
+    cmd = DefaultCommand(context=context)
+    monkeypatch.setattr(
+        "nyxpy.framework.core.macro.command._get_caller_class_name", fail_caller_lookup
+    )
+
+    cmd.log(Unprintable(), level="DEBUG")
+
+    assert context.logger.user_events == []
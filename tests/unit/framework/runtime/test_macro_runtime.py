@@ -7,6 +7,7 @@ from nyxpy.framework.core.macro.base import MacroBase
 from nyxpy.framework.core.macro.command import Command
 from nyxpy.framework.core.macro.exceptions import MacroStopException
 from nyxpy.framework.core.macro.registry import MacroDefinition
+from nyxpy.framework.core.runtime import runtime as runtime_module
 from nyxpy.framework.core.runtime.result import RunStatus
 from nyxpy.framework.core.runtime.runtime import MacroRuntime
 from tests.support.fake_execution_context import make_fake_execution_context
@@ -73,7 +74,7 @@ class FailingCloseFrameSource(FakeFrameSourcePort):
         raise RuntimeError("close failed")
 
 
-def definition_for(macro: MacroBase) -> MacroDefinition:
+def definition_for(macro: MacroBase, *, ocr_languages: tuple[str, ...] = ()) -> MacroDefinition:
     return MacroDefinition(
         id="sample",
         aliases=("sample", "RecordingMacro"),
@@ -86,6 +87,7 @@ def definition_for(macro: MacroBase) -> MacroDefinition:
         description="",
         tags=(),
         factory=Factory(macro),
+        ocr_languages=ocr_languages,
     )
 
 
@@ -103,6 +105,26 @@ def test_macro_runtime_run_delegates_to_runner_and_closes_ports(tmp_path) -> Non
     assert context.frame_source.closed is True
 
 
+def test_macro_runtime_logs_wait_accuracy(tmp_path) -> None:
+    class WaitingMacro(RecordingMacro):
+        def run(self, cmd: Command) -> None:
+            cmd.wait(0.002, precise=True)
+
+    context = make_fake_execution_context(tmp_path)
+    runtime = MacroRuntime(Registry(definition_for(WaitingMacro())))
+
+    runtime.run(context)
+
+    log = next(
+        log.event
+        for log in context.logger.technical_logs
+        if log.event.event == "command.wait_stats"
+    )
+    assert log.level == "INFO"
+    assert log.extra["precise"]["count"] == 1
+    assert log.extra["spin_margin_ms"] == 2.0
+
+
 def test_macro_runtime_pre_run_frame_not_ready_returns_failed_result(tmp_path) -> None:
     macro = RecordingMacro()
     context = make_fake_execution_context(tmp_path, frame_source=NotReadyFrameSource())
@@ -183,3 +205,28 @@ def test_run_handle_cancel_requests_token(tmp_path) -> None:
     assert context.cancellation_token.stop_requested()
     assert context.cancellation_token.reason() == "user cancelled"
     assert context.cancellation_token.source() == "gui_or_cli"
+
+
+def test_macro_runtime_starts_ocr_warmup_before_frame_source(tmp_path, monkeypatch) -> None:
+    order: list[str] = []
+
+    class OrderedFrameSource(FakeFrameSourcePort):
+        def initialize(self) -> None:
+            order.append("frame_source")
+            super().initialize()
+
+    monkeypatch.setattr(
+        runtime_module,
+        "start_macro_warmup",
+        lambda definition, logger, *, worker_process: order.extend(
+            [*definition.ocr_languages, worker_process]
+        ),
+    )
+    macro = RecordingMacro()
+    context = make_fake_execution_context(tmp_path, frame_source=OrderedFrameSource())
+    runtime = MacroRuntime(Registry(definition_for(macro, ocr_languages=("en",))))
+
+    result = runtime.run(context)
+
+    assert result.status is RunStatus.SUCCESS
+    assert order == ["en", False, "frame_source"]
@@ -3,6 +3,7 @@ from pathlib import Path
 import numpy as np
 import pytest
 
+from nyxpy.framework.core.constants import Button
 from nyxpy.framework.core.hardware.capture_source import WindowCaptureSourceConfig
 from nyxpy.framework.core.hardware.device_discovery import DeviceDiscoveryResult, DeviceInfo
 from nyxpy.framework.core.hardware.swbt.config import SwbtControllerConfig, resolve_controller_model
@@ -12,6 +13,11 @@ from nyxpy.framework.core.io.device_factories import (
     FrameSourcePortFactory,
     SerialControllerOutputPortFactory,
 )
+from nyxpy.framework.core.io.recording import (
+    InputTrace,
+    RecordingControllerOutputPort,
+    TraceOp,
+)
 from nyxpy.framework.core.io.resources import MacroResourceScope
 from nyxpy.framework.core.macro.exceptions import ConfigurationError
 from nyxpy.framework.core.macro.registry import MacroDefinition
@@ -205,6 +211,32 @@ def test_runtime_builder_uses_global_command_debug_setting(tmp_path: Path) -> No
     assert context.options.command_debug_enabled is True
 
 
+def test_runtime_builder_uses_ocr_worker_process_setting(tmp_path: Path) -> None:
+    default_builder = make_builder(tmp_path, Discovery())
+    worker_builder = make_builder(
+        tmp_path,
+        Discovery(),
+        settings={"runtime": {"ocr_worker_process": True}},
+    )
+    request = RuntimeBuildRequest(macro_id="sample", allow_dummy=True)
+
+    assert default_builder.build(request).options.ocr_worker_process is False
+    assert worker_builder.build(request).options.ocr_worker_process is True
+
+
+def test_runtime_builder_uses_precise_wait_settings(tmp_path: Path) -> None:
+    builder = make_builder(
+        tmp_path,
+        Discovery(),
+        settings={"runtime": {"precise_wait": True, "precise_wait_margin_sec": 0.004}},
+    )
+
+    options = builder.build(RuntimeBuildRequest(macro_id="sample", allow_dummy=True)).options
+
+    assert options.precise_wait is True
+    assert options.precise_wait_margin_sec == 0.004
+
+
 def test_runtime_builder_allows_macro_command_debug_override(tmp_path: Path) -> None:
     builder = make_builder(
         tmp_path,
@@ -834,3 +866,29 @@ def _start_cleanup_builder(
         notification_factory=lambda _request, _definition: notifications,
         logger_factory=lambda _request, _definition: logger,
     )
+
+
+def test_runtime_builder_records_input_trace_to_artifacts(tmp_path: Path) -> None:
+    builder = make_builder(
+        tmp_path,
+        Discovery(),
+        settings={"runtime": {"record_input_trace": True}},
+    )
+    context = builder.build(RuntimeBuildRequest(macro_id="sample", allow_dummy=True))
+
+    assert isinstance(context.controller, RecordingControllerOutputPort)
+    context.controller.trace.append_keys(0.0, TraceOp.PRESS, (Button.A,))
+    context.controller.trace.append_keys(0.1, TraceOp.RELEASE, ())
+    context.controller.close()
+
+    (trace_path,) = tmp_path.rglob("input_trace.nyxtrace")
+    trace = InputTrace.load(trace_path)
+    assert [event.op for event in trace.events()] == [TraceOp.PRESS, TraceOp.RELEASE]
+
+
+def test_runtime_builder_does_not_record_input_trace_by_default(tmp_path: Path) -> None:
+    builder = make_builder(tmp_path, Discovery())
+
+    context = builder.build(RuntimeBuildRequest(macro_id="sample", allow_dummy=True))
+
+    assert not isinstance(context.controller, RecordingControllerOutputPort)
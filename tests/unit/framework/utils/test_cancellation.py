@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+import threading
+import time
+
+import pytest
+
+from nyxpy.framework.core.macro.exceptions import MacroCancelled
+from nyxpy.framework.core.utils.cancellation import (
+    CancellationToken,
+    WaitErrorStats,
+    cancellation_aware_wait,
+)
+
+
+def test_precise_wait_does_not_return_before_deadline() -> None:
+    token = CancellationToken()
+    started = time.perf_counter()
+
+    assert cancellation_aware_wait(0.02, token, precise=True) is True
+
+    elapsed = time.perf_counter() - started
+    assert 0.02 <= elapsed < 0.025
+
+
+def test_precise_wait_stops_on_cancellation() -> None:
+    token = CancellationToken()
+    threading.Timer(0.01, token.request_cancel).start()
+    started = time.perf_counter()
+
+    assert cancellation_aware_wait(5.0, token, precise=True, spin_margin=0.5) is False
+    assert time.perf_counter() - started < 1.0
+
+
+def test_precise_wait_raises_when_already_cancelled() -> None:
+    token = CancellationToken()
+    token.request_cancel(reason="stop")
+
+    with pytest.raises(MacroCancelled):
+        cancellation_aware_wait(0.01, token, precise=True)
+
+
+def test_wait_error_stats_summarizes_each_mode() -> None:
+    stats = WaitErrorStats()
+    for error in (0.001, 0.002, 0.003):
+        stats.record("coarse", error)
+    stats.record("precise", 0.00001)
+
+    summary = stats.summary()
+
+    assert summary["coarse"] == {
+        "count": 3,
+        "mean_ms": 2.0,
+        "p50_ms": 2.0,
+        "p95_ms": 2.0,
+        "max_ms": 3.0,
+    }
+    assert summary["precise"]["count"] == 1
+    assert summary["precise"]["max_ms"] == 0.01
+    assert WaitErrorStats().summary() == {}
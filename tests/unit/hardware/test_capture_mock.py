@@ -21,7 +21,7 @@ class DummyVideoCapture:
     def isOpened(self):
         return self._is_opened
 
-    def read(self) -> tuple[bool, cv2.typing.MatLike]:
+    def read(self, image=None) -> tuple[bool, cv2.typing.MatLike]:
         # 最初の1回目のみ有効なフレームを返す(黒画面)
         self.read_count += 1
         if self.read_count == 1:
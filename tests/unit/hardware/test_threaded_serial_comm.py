@@ -0,0 +1,209 @@
+from __future__ import annotations
+
+import threading
+
+import pytest
+
+from nyxpy.framework.core.hardware.serial_comm import (
+    WRITE_LATENCY_BUCKETS_MS,
+    SerialWriterStats,
+    ThreadedSerialComm,
+)
+
+
+class LoggerSpy:
+    def __init__(self) -> None:
+        self.technical_logs: list[dict] = []
+
+    def technical(self, level, message, *, component, event="log.message", extra=None, exc=None):
+        self.technical_logs.append({"level": level, "event": event, "extra": extra, "exc": exc})
+
+
+class BlockingSerialDevice:
+    """`release` が set されるまで書き込みを止める serial device。"""
+
+    def __init__(self) -> None:
+        self.port = "COM1"
+        self.sent: list[bytes] = []
+        self.opened: list[int] = []
+        self.closed = False
+        self.release = threading.Event()
+        self.release.set()
+        self.writing = threading.Event()
+        self.error: Exception | None = None
+
+    def open(self, baudrate: int) -> None:
+        self.opened.append(baudrate)
+
+    def send(self, data: bytes) -> None:
+        self.writing.set()
+        self.release.wait(1.0)
+        if self.error is not None:
+            raise self.error
+        self.sent.append(data)
+
+    def close(self) -> None:
+        self.closed = True
+
+
+@pytest.fixture
+def device() -> BlockingSerialDevice:
+    return BlockingSerialDevice()
+
+
+def _stall(device: BlockingSerialDevice, writer: ThreadedSerialComm) -> None:
+    """書き込み中の frame を 1 件作り、writer thread を止めておく。"""
+    device.release.clear()
+    writer.send(b"stalled")
+    assert device.writing.wait(1.0)
+
+
+def test_send_writes_frames_in_order_on_writer_thread(device) -> None:
+    writer = ThreadedSerialComm(device)
+    writer.open(115200)
+
+    writer.send(b"a")
+    writer.send_state(b"b")
+    writer.send(b"c")
+
+    assert writer.flush(1.0)
+    assert device.opened == [115200]
+    assert device.sent == [b"a", b"b", b"c"]
+    writer.close()
+    assert device.closed
+
+
+def test_send_state_replaces_unsent_state_frame(device) -> None:
+    writer = ThreadedSerialComm(device)
+    writer.start()
+    _stall(device, writer)
+
+    writer.send_state(b"press")
+    writer.send_state(b"hold")
+    writer.send(b"keyboard")
+    writer.send_state(b"release")
+    device.release.set()
+
+    assert writer.flush(1.0)
+    assert device.sent == [b"stalled", b"hold", b"keyboard", b"release"]
+    stats = writer.stats()
+    assert stats.coalesced == 1
+    assert stats.written == 4
+    writer.close()
+
+
+def test_send_state_keeps_every_frame_without_coalescing(device) -> None:
+    writer = ThreadedSerialComm(device, coalesce=False)
+    writer.start()
+    _stall(device, writer)
+
+    writer.send_state(b"press")
+    writer.send_state(b"release")
+    device.release.set()
+
+    assert writer.flush(1.0)
+    assert device.sent == [b"stalled", b"press", b"release"]
+    writer.close()
+
+
+def test_flush_times_out_while_writer_is_stalled(device) -> None:
+    writer = ThreadedSerialComm(device)
+    writer.start()
+    _stall(device, writer)
+
+    assert writer.flush(0.01) is False
+
+    device.release.set()
+    assert writer.flush(1.0) is True
+    writer.close()
+
+
+def test_full_queue_blocks_sender_and_logs_backpressure(device) -> None:
+    logger = LoggerSpy()
+    writer = ThreadedSerialComm(device, queue_size=1, logger=logger)
+    writer.start()
+    _stall(device, writer)
+    writer.send(b"queued")
+
+    sender = threading.Thread(target=writer.send, args=(b"blocked",))
+    sender.start()
+    sender.join(0.05)
+    assert sender.is_alive()
+
+    device.release.set()
+    sender.join(1.0)
+    assert writer.flush(1.0)
+    assert device.sent == [b"stalled", b"queued", b"blocked"]
+    assert writer.stats().backpressure_waits == 1
+    log = logger.technical_logs[0]
+    assert log["level"] == "WARNING"
+    assert log["event"] == "serial.backpressure"
+    assert log["extra"]["queue_size"] == 1
+    assert log["extra"]["waited_ms"] > 0
+    writer.close()
+
+
+def test_write_failure_is_raised_on_next_send(device) -> None:
+    logger = LoggerSpy()
+    device.error = OSError("unplugged")
+    writer = ThreadedSerialComm(device, logger=logger)
+    writer.start()
+
+    writer.send(b"a")
+    with pytest.raises(RuntimeError, match="serial write failed") as exc_info:
+        writer.flush(1.0)
+
+    assert isinstance(exc_info.value.__cause__, OSError)
+    with pytest.raises(RuntimeError):
+        writer.send(b"b")
+    assert logger.technical_logs[0]["event"] == "serial.writer_failed"
+    writer.close()
+    assert device.closed
+
+
+def test_send_before_start_raises(device) -> None:
+    writer = ThreadedSerialComm(device)
+
+    with pytest.raises(RuntimeError, match="not running"):
+        writer.send(b"a")
+
+
+def test_close_logs_latency_histogram(device) -> None:
+    logger = LoggerSpy()
+    writer = ThreadedSerialComm(device, logger=logger)
+    writer.start()
+    for index in range(10):
+        writer.send(bytes([index]))
+
+    writer.close()
+
+    log = logger.technical_logs[-1]
+    assert log["event"] == "serial.writer_stats"
+    assert log["extra"]["written"] == 10
+    assert sum(log["extra"]["latency_histogram"]) == 10
+    assert log["extra"]["latency_p95_ms"] is not None
+
+
+def test_stats_latency_percentile_uses_bucket_upper_bound() -> None:
+    histogram = [0] * (len(WRITE_LATENCY_BUCKETS_MS) + 1)
+    histogram[0] = 90
+    histogram[3] = 9
+    histogram[-1] = 1
+    stats = SerialWriterStats(
+        enqueued=100,
+        written=100,
+        coalesced=0,
+        backpressure_waits=0,
+        max_queue_depth=1,
+        latency_histogram=tuple(histogram),
+    )
+
+    assert stats.latency_percentile_ms(50) == WRITE_LATENCY_BUCKETS_MS[0]
+    assert stats.latency_percentile_ms(95) == WRITE_LATENCY_BUCKETS_MS[3]
+    assert stats.latency_percentile_ms(100) == float("inf")
+    assert SerialWriterStats(0, 0, 0, 0, 0, (0,) * len(histogram)).latency_percentile_ms(50) is None
+
+
+def test_queue_size_must_be_positive(device) -> None:
+    with pytest.raises(ValueError):
+        ThreadedSerialComm(device, queue_size=0)
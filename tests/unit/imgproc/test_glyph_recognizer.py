@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+import cv2
+import numpy as np
+import pytest
+
+from nyxpy.framework.core.imgproc import (
+    FallbackOCRBackend,
+    GlyphDigitRecognizer,
+    ImageProcessor,
+    InvalidImageError,
+    OCRBackend,
+    OCRProcessingError,
+    OCRResult,
+)
+
+
+def _render(text: str, *, inverse: bool = False) -> np.ndarray:
+    background, foreground = (0, 255) if inverse else (255, 0)
+    image = np.full((40, 24 * len(text) + 16, 3), background, dtype=np.uint8)
+    cv2.putText(
+        image,
+        text,
+        (8, 30),
+        cv2.FONT_HERSHEY_SIMPLEX,
+        1.0,
+        (foreground, foreground, foreground),
+        2,
+        cv2.LINE_8,
+    )
+    return image
+
+
+@pytest.fixture
+def recognizer() -> GlyphDigitRecognizer:
+    recognizer = GlyphDigitRecognizer()
+    for digit in "0123456789":
+        recognizer.add_glyph(digit, _render(digit))
+    return recognizer
+
+
+@pytest.mark.parametrize("text", ["0", "123", "4567", "98760", "31"])
+def test_glyph_recognizer_reads_rendered_digits(recognizer, text) -> None:
+    results = recognizer.recognize_text(_render(text))
+
+    assert [result.text for result in results] == [text]
+    assert results[0].confidence > 0.9
+    assert recognizer.extract_digits(_render(text)) == text
+
+
+def test_glyph_recognizer_handles_inverted_polarity(recognizer) -> None:
+    assert recognizer.get_best_text(_render("2048", inverse=True)) == "2048"
+
+
+def test_glyph_recognizer_reports_low_confidence_for_unknown_glyph(recognizer) -> None:
+    results = recognizer.recognize_text(_render("12X"))
+
+    assert results[0].confidence < 0.8
+
+
+def test_glyph_recognizer_returns_empty_for_blank_image(recognizer) -> None:
+    assert recognizer.recognize_text(np.full((20, 40), 255, dtype=np.uint8)) == []
+
+
+def test_glyph_recognizer_requires_glyphs() -> None:
+    with pytest.raises(OCRProcessingError):
+        GlyphDigitRecognizer().recognize_text(_render("1"))
+
+
+def test_glyph_recognizer_trains_from_directory(tmp_path) -> None:
+    for digit in "0123456789":
+        cv2.imwrite(str(tmp_path / f"{digit}.png"), _render(digit))
+    cv2.imwrite(str(tmp_path / "1_alt.png"), _render("1", inverse=True))
+    (tmp_path / "README.txt").write_text("ignored", encoding="utf-8")
+
+    recognizer = GlyphDigitRecognizer.from_directory(tmp_path)
+
+    assert recognizer.characters == "0123456789"
+    assert recognizer.get_best_text(_render("305")) == "305"
+
+
+def test_glyph_recognizer_from_directory_requires_images(tmp_path) -> None:
+    with pytest.raises(InvalidImageError):
+        GlyphDigitRecognizer.from_directory(tmp_path)
+
+
+def test_glyph_recognizer_rejects_multi_character_label() -> None:
+    with pytest.raises(ValueError):
+        GlyphDigitRecognizer().add_glyph("12", _render("12"))
+
+
+class StaticBackend(OCRBackend):
+    def __init__(self, results: list[OCRResult]) -> None:
+        self.results = results
+        self.calls = 0
+
+    def recognize_text(self, image):
+        self.calls += 1
+        return self.results
+
+
+def test_fallback_backend_uses_primary_when_confident() -> None:
+    fallback = StaticBackend([OCRResult("999", 0.99)])
+    backend = FallbackOCRBackend(StaticBackend([OCRResult("123", 0.95)]), fallback)
+
+    assert backend.extract_digits(_render("123")) == "123"
+    assert fallback.calls == 0
+    assert backend.fallback_count == 0
+
+
+@pytest.mark.parametrize("primary_results", [[OCRResult("12?", 0.4)], []])
+def test_fallback_backend_switches_on_low_confidence(primary_results) -> None:
+    fallback = StaticBackend([OCRResult("123", 0.99)])
+    backend = FallbackOCRBackend(StaticBackend(primary_results), fallback, min_confidence=0.8)
+
+    assert backend.get_best_text(_render("123")) == "123"
+    assert fallback.calls == 1
+    assert backend.fallback_count == 1
+
+
+def test_image_processor_get_digits_uses_backend(recognizer) -> None:
+    frame = np.full((100, 200, 3), 255, dtype=np.uint8)
+    frame[30:70, 20:108] = _render("256")
+
+    assert ImageProcessor(frame).get_digits(region=(20, 30, 88, 40), backend=recognizer) == "256"
@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from nyxpy.framework.core.imgproc import OCRCacheStats, OCRResult, OCRResultCache
+from tests.support.fakes import FakeOCRProcessor
+
+
+def _image(value: int) -> np.ndarray:
+    return np.full((8, 8, 3), value, dtype=np.uint8)
+
+
+def test_ocr_processor_reuses_results_for_identical_images() -> None:
+    processor = FakeOCRProcessor("en")
+
+    first = processor.recognize_text(_image(1))
+    second = processor.recognize_text(_image(1).copy())
+    digits = processor.extract_digits(_image(1))
+
+    assert first == second == [OCRResult(text="1", confidence=0.9)]
+    assert digits == "1"
+    assert processor._ocr_engine.calls == [1]
+    assert processor.cache.stats() == OCRCacheStats(hits=2, misses=1, size=1, max_entries=256)
+
+
+def test_ocr_processor_batch_predicts_only_cache_misses() -> None:
+    processor = FakeOCRProcessor("en")
+    processor.recognize_text(_image(2))
+
+    results = processor.recognize_batch([_image(1), _image(2), _image(3)])
+
+    assert [result[0].text for result in results] == ["1", "2", "3"]
+    assert processor._ocr_engine.calls == [1, 2]
+
+
+def test_ocr_processor_cache_distinguishes_shape_and_content() -> None:
+    processor = FakeOCRProcessor("en")
+    image = _image(1)
+    changed = image.copy()
+    changed[7, 7, 2] = 2
+
+    processor.recognize_text(image)
+    processor.recognize_text(changed)
+    processor.recognize_text(np.full((8, 4, 3), 1, dtype=np.uint8))
+    processor.recognize_text(np.full((8, 8), 1, dtype=np.uint8)[..., np.newaxis])
+
+    assert processor._ocr_engine.calls == [1, 1, 1, 1]
+
+
+def test_ocr_processor_cache_can_be_bypassed_or_disabled() -> None:
+    processor = FakeOCRProcessor("en")
+    processor.recognize_text(_image(1))
+    processor.recognize_text(_image(1), use_cache=False)
+    disabled = FakeOCRProcessor("en", cache_size=0)
+    disabled.recognize_text(_image(1))
+    disabled.recognize_text(_image(1))
+
+    assert processor._ocr_engine.calls == [1, 1]
+    assert disabled.cache is None
+    assert disabled._ocr_engine.calls == [1, 1]
+
+
+def test_ocr_processor_cache_returns_independent_lists() -> None:
+    processor = FakeOCRProcessor("en")
+    processor.recognize_text(_image(1)).clear()
+
+    assert processor.recognize_text(_image(1)) == [OCRResult(text="1", confidence=0.9)]
+
+
+def test_ocr_result_cache_evicts_least_recently_used() -> None:
+    cache = OCRResultCache(max_entries=2)
+    keys = [OCRResultCache.key_for(_image(value)) for value in range(3)]
+    cache.put(keys[0], [OCRResult("0", 1.0)])
+    cache.put(keys[1], [OCRResult("1", 1.0)])
+    cache.get(keys[0])
+
+    cache.put(keys[2], [OCRResult("2", 1.0)])
+
+    assert cache.get(keys[1]) is None
+    assert cache.get(keys[0]) == [OCRResult("0", 1.0)]
+    assert cache.stats() == OCRCacheStats(hits=2, misses=1, size=2, max_entries=2)
+
+    cache.clear()
+
+    assert cache.stats() == OCRCacheStats(hits=0, misses=0, size=0, max_entries=2)
+
+
+def test_ocr_result_cache_rejects_non_positive_size() -> None:
+    with pytest.raises(ValueError):
+        OCRResultCache(max_entries=0)
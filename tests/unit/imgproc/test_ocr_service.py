@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from nyxpy.framework.core.imgproc import (
+    InvalidImageError,
+    OCRProcessingError,
+    OCRResult,
+    OCRService,
+)
+from tests.support.fakes import FakeOCRProcessor
+
+
+def _image(value: int) -> np.ndarray:
+    return np.full((8, 8, 3), value, dtype=np.uint8)
+
+
+def test_ocr_processor_recognize_batch_uses_single_predict_call() -> None:
+    processor = FakeOCRProcessor("en")
+
+    results = processor.recognize_batch([_image(1), _image(2), _image(3)])
+
+    assert results == [
+        [OCRResult(text="1", confidence=0.9)],
+        [OCRResult(text="2", confidence=0.9)],
+        [OCRResult(text="3", confidence=0.9)],
+    ]
+    assert processor._ocr_engine.calls == [3]
+
+
+def test_ocr_processor_recognize_regions_crops_each_roi() -> None:
+    processor = FakeOCRProcessor("en")
+    frame = np.zeros((20, 40, 3), dtype=np.uint8)
+    frame[0:10, 0:10] = 5
+    frame[10:20, 20:40] = 7
+
+    results = processor.recognize_regions(frame, [(0, 0, 10, 10), (20, 10, 20, 10)])
+
+    assert [result[0].text for result in results] == ["5", "7"]
+
+
+def test_ocr_processor_recognize_batch_rejects_empty_image() -> None:
+    processor = FakeOCRProcessor("en")
+
+    with pytest.raises(InvalidImageError):
+        processor.recognize_batch([_image(1), np.zeros((0, 0, 3), dtype=np.uint8)])
+
+
+def test_ocr_processor_recognize_batch_rejects_mismatched_results() -> None:
+    processor = FakeOCRProcessor("en")
+    processor._ocr_engine.predict = lambda images, **kwargs: [{"rec_texts": [], "rec_scores": []}]
+
+    with pytest.raises(OCRProcessingError):
+        processor.recognize_batch([_image(1), _image(2)])
+
+
+def test_ocr_service_submit_returns_future_without_blocking_caller() -> None:
+    processor = FakeOCRProcessor("en")
+    processor._ocr_engine.release.clear()
+
+    with OCRService(processor) as service:
+        future = service.submit(_image(4))
+        assert not future.done()
+        processor._ocr_engine.release.set()
+
+        assert future.result(timeout=1.0) == [OCRResult(text="4", confidence=0.9)]
+
+
+def test_ocr_service_batches_regions_and_serializes_engine_access() -> None:
+    processor = FakeOCRProcessor("en", cache_size=0)
+    frame = np.zeros((10, 40, 3), dtype=np.uint8)
+    for index in range(4):
+        frame[:, index * 10 : (index + 1) * 10] = index + 1
+    regions = [(index * 10, 0, 10, 10) for index in range(4)]
+
+    with OCRService(processor) as service:
+        futures = [service.submit_regions(frame, regions) for _ in range(5)]
+        results = [future.result(timeout=1.0) for future in futures]
+
+    assert all([r[0].text for r in result] == ["1", "2", "3", "4"] for result in results)
+    assert processor._ocr_engine.calls == [4] * 5
+    assert processor._ocr_engine.max_active == 1
+
+
+def test_ocr_service_copies_inputs_at_submit() -> None:
+    processor = FakeOCRProcessor("en")
+    processor._ocr_engine.release.clear()
+    image = _image(1)
+
+    with OCRService(processor) as service:
+        future = service.submit_batch([image])
+        image[:] = 9
+        processor._ocr_engine.release.set()
+
+        assert future.result(timeout=1.0)[0][0].text == "1"
+
+
+def test_ocr_service_rejects_submit_after_close() -> None:
+    service = OCRService(FakeOCRProcessor("en"))
+    service.close()
+
+    with pytest.raises(RuntimeError, match="closed"):
+        service.submit(_image(1))
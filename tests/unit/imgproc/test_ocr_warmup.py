@@ -0,0 +1,188 @@
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from nyxpy.framework.core.imgproc import OCRProcessor, OCRWarmupReport
+from nyxpy.framework.core.imgproc.exceptions import OCREngineNotFoundError
+from nyxpy.framework.core.macro.registry import MacroDefinition
+from nyxpy.framework.core.runtime.warmup import start_macro_warmup
+from tests.support.fakes import FakeOCRProcessor, FakePaddleEngine
+
+
+class LoggerSpy:
+    def __init__(self) -> None:
+        self.technical_logs: list[dict] = []
+
+    def technical(self, level, message, *, component, event="log.message", extra=None, exc=None):
+        self.technical_logs.append({"level": level, "event": event, "extra": extra, "exc": exc})
+
+
+@pytest.fixture(autouse=True)
+def clear_ocr_instances():
+    OCRProcessor.clear_cache()
+    yield
+    OCRProcessor.clear_cache()
+
+
+def _definition(*languages: str) -> MacroDefinition:
+    return MacroDefinition(
+        id="ocr-macro",
+        aliases=(),
+        display_name="OCR Macro",
+        class_name="OcrMacro",
+        module_name="macros.ocr",
+        macro_root=Path("."),
+        source_path=Path("macro.py"),
+        settings_path=None,
+        description="",
+        tags=(),
+        factory=None,
+        ocr_languages=languages,
+    )
+
+
+def test_importing_imgproc_does_not_import_paddleocr() -> None:
+    code = (
+        "import sys\n"
+        "import nyxpy.framework.core.imgproc\n"
+        "import nyxpy.framework.core.runtime\n"
+        "print('paddleocr' in sys.modules, 'paddle' in sys.modules)\n"
+    )
+
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)}
+
+    output = subprocess.run(
+        [sys.executable, "-c", code], check=True, capture_output=True, text=True, env=env
+    ).stdout
+
+    assert output.split() == ["False", "False"]
+
+
+def test_warm_up_loads_shared_instance_on_background_thread() -> None:
+    warmup = FakeOCRProcessor.warm_up("en")
+
+    report = warmup.wait(1.0)
+
+    assert report is not None
+    assert report.succeeded
+    assert report.language == "en"
+    assert report.elapsed_sec >= 0
+    processor = OCRProcessor.get_instance("en")
+    assert isinstance(processor, FakeOCRProcessor)
+    # 試行推論は cache を通さず、認識結果を汚さない。
+    assert processor._ocr_engine.calls == [1]
+    assert processor.cache.stats().size == 0
+
+
+def test_warm_up_is_idempotent_per_language() -> None:
+    first = FakeOCRProcessor.warm_up("en")
+    first.wait(1.0)
+
+    assert FakeOCRProcessor.warm_up("en") is first
+    assert FakeOCRProcessor.warm_up("ja") is not first
+
+
+def test_get_instance_waits_for_running_warmup(monkeypatch) -> None:
+    engine = FakePaddleEngine()
+    engine.release.clear()
+    monkeypatch.setattr(
+        FakeOCRProcessor, "_init_engine", lambda self: setattr(self, "_ocr_engine", engine)
+    )
+    warmup = FakeOCRProcessor.warm_up("en")
+    engine.release.set()
+
+    processor = FakeOCRProcessor.get_instance("en")
+
+    assert warmup.wait(1.0).succeeded
+    assert processor is OCRProcessor.get_instance("en")
+    assert engine.calls == [1]
+
+
+def test_warm_up_does_not_wait_for_model_load_in_progress(monkeypatch) -> None:
+    loading = threading.Event()
+    release = threading.Event()
+
+    def slow_init(self) -> None:
+        loading.set()
+        assert release.wait(5.0)
+        self._ocr_engine = FakePaddleEngine()
+
+    monkeypatch.setattr(FakeOCRProcessor, "_init_engine", slow_init)
+    first = FakeOCRProcessor.warm_up("en")
+    assert loading.wait(1.0)
+
+    started = time.perf_counter()
+    try:
+        again = FakeOCRProcessor.warm_up("en")
+        other = FakeOCRProcessor.warm_up("ja")
+        elapsed = time.perf_counter() - started
+    finally:
+        release.set()
+
+    assert elapsed < 0.5
+    assert again is first
+    assert first.wait(1.0).succeeded
+    assert other.wait(1.0).succeeded
+
+
+def test_warm_up_reports_failure_and_retries(monkeypatch) -> None:
+    def fail(self) -> None:
+        raise OCREngineNotFoundError("missing")
+
+    monkeypatch.setattr(FakeOCRProcessor, "_init_engine", fail)
+    failed = FakeOCRProcessor.warm_up("en")
+    report = failed.wait(1.0)
+
+    assert report is not None
+    assert not report.succeeded
+    assert isinstance(report.error, OCREngineNotFoundError)
+
+    monkeypatch.undo()
+    retried = FakeOCRProcessor.warm_up("en")
+
+    assert retried is not failed
+    assert retried.wait(1.0).succeeded
+
+
+def test_add_done_callback_runs_immediately_after_completion() -> None:
+    warmup = FakeOCRProcessor.warm_up("en")
+    warmup.wait(1.0)
+    reports: list[OCRWarmupReport] = []
+
+    warmup.add_done_callback(reports.append)
+
+    assert reports == [warmup.report]
+
+
+def test_start_macro_warmup_logs_timing_for_declared_languages(monkeypatch) -> None:
+    engine = FakePaddleEngine()
+    engine.release.clear()
+    monkeypatch.setattr(
+        OCRProcessor, "_init_engine", lambda self: setattr(self, "_ocr_engine", engine)
+    )
+    logger = LoggerSpy()
+
+    warmups = start_macro_warmup(_definition("en"), logger)
+    engine.release.set()
+    warmups[0].wait(1.0)
+
+    assert [warmup.language for warmup in warmups] == ["en"]
+    log = logger.technical_logs[0]
+    assert log["event"] == "ocr.warmup_finished"
+    assert log["extra"]["macro_id"] == "ocr-macro"
+    assert log["extra"]["language"] == "en"
+    assert log["extra"]["elapsed_ms"] >= 0
+
+
+def test_start_macro_warmup_ignores_macros_without_ocr() -> None:
+    logger = LoggerSpy()
+
+    assert start_macro_warmup(_definition(), logger) == ()
+    assert logger.technical_logs == []
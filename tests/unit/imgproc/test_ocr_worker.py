@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+import os
+
+import numpy as np
+import pytest
+
+from nyxpy.framework.core.imgproc import (
+    OCREngineNotFoundError,
+    OCRProcessor,
+    OCRResult,
+    OCRWorkerProcess,
+    OCRWorkerProcessor,
+    ocr_worker,
+)
+from tests.support.fakes import create_failing_ocr_engine, create_fake_ocr_engine
+
+
+@pytest.fixture(scope="module")
+def worker():
+    worker = OCRWorkerProcess("en", engine_factory=create_fake_ocr_engine, start_timeout_sec=30.0)
+    yield worker
+    worker.close()
+
+
+def _image(value: int) -> np.ndarray:
+    return np.full((8, 8, 3), value, dtype=np.uint8)
+
+
+def test_worker_process_recognizes_images_out_of_process(worker) -> None:
+    frame = np.zeros((40, 40, 3), dtype=np.uint8)
+    frame[10:20, 10:20] = 7
+
+    results = worker.predict([_image(3), frame[10:20, 10:20]])
+
+    assert worker.pid is not None
+    assert worker.pid != os.getpid()
+    assert results == [
+        [OCRResult(text="3", confidence=0.9)],
+        [OCRResult(text="7", confidence=0.9)],
+    ]
+
+
+def test_worker_process_grows_shared_memory_for_large_batches(worker, monkeypatch) -> None:
+    monkeypatch.setattr(ocr_worker, "_INITIAL_SHARED_MEMORY_SIZE", 64)
+    worker.close()
+
+    results = worker.predict([_image(value) for value in (1, 2, 3)])
+
+    assert [result[0].text for result in results] == ["1", "2", "3"]
+    assert worker._shared_memory.size >= 3 * 256
+
+
+def test_worker_process_restart_replaces_process(worker) -> None:
+    worker.start()
+    previous = worker.pid
+
+    worker.restart()
+
+    assert worker.pid not in (None, previous)
+    assert worker.predict([_image(5)])[0][0].text == "5"
+
+
+def test_worker_process_restarts_after_unexpected_exit(worker) -> None:
+    worker.start()
+    worker._process.kill()
+    worker._process.join(5.0)
+
+    assert worker.predict([_image(6)])[0][0].text == "6"
+
+
+def test_worker_process_reports_engine_initialization_failure() -> None:
+    worker = OCRWorkerProcess("en", engine_factory=create_failing_ocr_engine)
+
+    with pytest.raises(OCREngineNotFoundError, match="engine unavailable"):
+        worker.start()
+
+    assert worker.pid is None
+
+
+def test_worker_processor_keeps_cache_in_caller_process(worker) -> None:
+    processor = OCRWorkerProcessor("en", worker=worker)
+
+    first = processor.recognize_text(_image(4))
+    second = processor.recognize_text(_image(4))
+
+    assert first == second == [OCRResult(text="4", confidence=0.9)]
+    assert processor.cache.stats().hits == 1
+
+
+def test_use_worker_process_switches_shared_instances(monkeypatch) -> None:
+    created = []
+
+    class RecordingWorkerProcessor(OCRWorkerProcessor):
+        def __init__(self, language: str) -> None:
+            created.append(language)
+            super().__init__(
+                language,
+                worker=OCRWorkerProcess(language, engine_factory=create_fake_ocr_engine),
+            )
+
+    monkeypatch.setattr(ocr_worker, "OCRWorkerProcessor", RecordingWorkerProcessor)
+    OCRProcessor.clear_cache()
+    try:
+        OCRProcessor.use_worker_process(True)
+        processor = OCRProcessor.get_instance("en")
+
+        assert isinstance(processor, RecordingWorkerProcessor)
+        assert OCRProcessor.get_instance("en") is processor
+        OCRProcessor.use_worker_process(True)
+        assert OCRProcessor.get_instance("en") is processor
+        assert created == ["en"]
+
+        OCRProcessor.use_worker_process(False)
+
+        assert not processor.worker.is_alive()
+    finally:
+        OCRProcessor.use_worker_process(False)
+        OCRProcessor.clear_cache()
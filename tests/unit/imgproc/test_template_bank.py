@@ -0,0 +1,174 @@
+from __future__ import annotations
+
+import cv2
+import numpy as np
+import pytest
+
+from nyxpy.framework.core.imgproc import (
+    ImageProcessor,
+    InvalidImageError,
+    TemplateBank,
+    find_template,
+)
+from nyxpy.framework.core.imgproc.utils import ImagePreprocessor
+
+
+def _make_frame() -> np.ndarray:
+    rng = np.random.default_rng(1234)
+    noise = rng.integers(0, 256, size=(180, 320, 3), dtype=np.uint8)
+    # 縮小しても特徴が残るよう、低周波成分にしてから原寸へ戻す。
+    return cv2.resize(noise, (1280, 720), interpolation=cv2.INTER_CUBIC)
+
+
+@pytest.fixture
+def frame() -> np.ndarray:
+    return _make_frame()
+
+
+def test_template_bank_matches_all_registered_templates(frame) -> None:
+    bank = TemplateBank()
+    bank.register("title", frame[100:164, 200:296])
+    bank.register("menu", frame[500:540, 900:1020])
+
+    results = bank.match_all(frame)
+
+    assert set(results) == {"title", "menu"}
+    assert results["title"].position == (200, 100)
+    assert results["title"].bounding_box == (200, 100, 96, 64)
+    assert results["menu"].position == (900, 500)
+    assert results["menu"].confidence > 0.99
+
+
+def test_template_bank_omits_templates_below_threshold(frame) -> None:
+    bank = TemplateBank()
+    bank.register("present", frame[100:164, 200:296])
+    absent = np.random.default_rng(99).integers(0, 256, size=(64, 96, 3), dtype=np.uint8)
+    bank.register("absent", absent, threshold=0.9)
+
+    results = bank.match_all(frame)
+
+    assert list(results) == ["present"]
+
+
+def test_template_bank_roi_limits_search_and_reports_source_coordinates(frame) -> None:
+    bank = TemplateBank()
+    template = frame[300:340, 600:680]
+    bank.register("inside", template, roi=(560, 280, 200, 120))
+    bank.register("outside", template, roi=(0, 0, 200, 120), threshold=0.99)
+
+    results = bank.match_all(frame)
+
+    assert results["inside"].position == (600, 300)
+    assert "outside" not in results
+
+
+def test_template_bank_rejects_roi_outside_source(frame) -> None:
+    bank = TemplateBank()
+    bank.register("edge", frame[0:20, 0:20], roi=(1200, 700, 100, 40))
+
+    with pytest.raises(InvalidImageError):
+        bank.match_all(frame)
+
+
+def test_template_bank_rejects_template_larger_than_roi(frame) -> None:
+    with pytest.raises(InvalidImageError):
+        TemplateBank().register("large", frame[0:64, 0:64], roi=(0, 0, 32, 32))
+
+
+def test_template_bank_matches_selected_names(frame) -> None:
+    bank = TemplateBank()
+    bank.register("a", frame[100:164, 200:296])
+    bank.register("b", frame[500:540, 900:1020])
+
+    assert set(bank.match_all(frame, names=["b"])) == {"b"}
+    with pytest.raises(KeyError):
+        bank.match_all(frame, names=["missing"])
+
+
+def test_template_bank_pyramid_search_matches_full_resolution(frame) -> None:
+    bank = TemplateBank(pyramid_levels=2)
+    template = frame[410:474, 731:827]
+    bank.register("target", template)
+
+    result = bank.match_all(frame)["target"]
+    expected = find_template(
+        cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY),
+        cv2.cvtColor(template, cv2.COLOR_BGR2GRAY),
+    )
+
+    assert result.position == expected.position == (731, 410)
+    assert result.confidence == pytest.approx(expected.confidence)
+
+
+def test_template_bank_parallel_matches_sequential(frame) -> None:
+    regions = [(x, y) for x in range(0, 1200, 150) for y in (50, 400)]
+    sequential = TemplateBank()
+    with TemplateBank(max_workers=4) as parallel:
+        for index, (x, y) in enumerate(regions):
+            template = frame[y : y + 48, x : x + 64]
+            sequential.register(f"t{index}", template)
+            parallel.register(f"t{index}", template)
+
+        parallel_results = parallel.match_all(frame)
+
+    assert parallel_results == sequential.match_all(frame)
+    assert len(parallel_results) == len(regions)
+
+
+def test_template_bank_preprocesses_source_once_per_call(frame, monkeypatch) -> None:
+    bank = TemplateBank(preprocess=True)
+    bank.register("a", frame[100:164, 200:296])
+    bank.register("b", frame[500:540, 900:1020])
+    calls = []
+    enhance = ImagePreprocessor.enhance_for_template_matching
+
+    def counting_enhance(image):
+        calls.append(image.shape)
+        return enhance(image)
+
+    monkeypatch.setattr(
+        ImagePreprocessor, "enhance_for_template_matching", staticmethod(counting_enhance)
+    )
+
+    bank.match_all(frame)
+
+    assert calls == [frame.shape]
+
+
+def test_template_bank_register_replaces_and_unregister_removes(frame) -> None:
+    bank = TemplateBank()
+    bank.register("a", frame[100:164, 200:296])
+    bank.register("a", frame[500:540, 900:1020])
+    bank.register("b", frame[0:32, 0:32])
+
+    bank.unregister("b")
+
+    assert bank.names == ("a",)
+    assert bank.match_all(frame)["a"].position == (900, 500)
+
+
+def test_image_processor_match_templates_delegates_to_bank(frame) -> None:
+    bank = TemplateBank()
+    bank.register("title", frame[100:164, 200:296])
+
+    results = ImageProcessor(frame).match_templates(bank)
+
+    assert results["title"].position == (200, 100)
+
+
+def test_image_processor_reuses_preprocessed_source(frame, monkeypatch) -> None:
+    processor = ImageProcessor(frame)
+    calls = []
+    enhance = processor.preprocessor.enhance_for_template_matching
+
+    def counting_enhance(image):
+        calls.append(image.shape)
+        return enhance(image)
+
+    monkeypatch.setattr(processor.preprocessor, "enhance_for_template_matching", counting_enhance)
+    template = frame[100:164, 200:296]
+
+    processor.contains_template(template, preprocess=True)
+    processor.find_template(template, preprocess=True)
+
+    assert calls == [frame.shape, template.shape, template.shape]
@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+import cv2
+import numpy as np
+import pytest
+
+from nyxpy.framework.core.imgproc import ThresholdNotMetError, contains_template, find_template
+from nyxpy.framework.core.imgproc.template_matcher import _top_locations
+
+
+@pytest.fixture
+def frame() -> np.ndarray:
+    rng = np.random.default_rng(42)
+    noise = rng.integers(0, 256, size=(180, 320), dtype=np.uint8)
+    return cv2.resize(noise, (1280, 720), interpolation=cv2.INTER_CUBIC)
+
+
+@pytest.mark.parametrize("pyramid_levels", [1, 2])
+@pytest.mark.parametrize("origin", [(0, 0), (731, 410), (1184, 656)])
+def test_find_template_pyramid_matches_full_resolution(frame, pyramid_levels, origin) -> None:
+    x, y = origin
+    template = frame[y : y + 64, x : x + 96]
+
+    expected = find_template(frame, template)
+    result = find_template(frame, template, pyramid_levels=pyramid_levels)
+
+    assert result.position == expected.position == origin
+    assert result.bounding_box == expected.bounding_box
+    assert result.confidence == pytest.approx(expected.confidence)
+
+
+def test_find_template_pyramid_supports_sqdiff(frame) -> None:
+    template = frame[200:248, 300:380]
+
+    result = find_template(frame, template, method=cv2.TM_SQDIFF_NORMED, pyramid_levels=2)
+
+    assert result.position == (300, 200)
+    assert result.confidence == pytest.approx(1.0)
+
+
+def test_find_template_pyramid_ignores_similar_decoy_with_multiple_candidates(frame) -> None:
+    template = frame[500:548, 100:180].copy()
+    source = frame.copy()
+    # 縮小画像では見分けにくいよう、高周波ノイズだけを加えた類似領域を置く。
+    rng = np.random.default_rng(7)
+    decoy = template.astype(np.int16) + rng.integers(-40, 41, size=template.shape)
+    source[100:148, 900:980] = np.clip(decoy, 0, 255).astype(np.uint8)
+
+    result = find_template(source, template, pyramid_levels=2, candidates=3)
+
+    assert result.position == (100, 500)
+
+
+@pytest.mark.parametrize(
+    ("method", "sign"), [(cv2.TM_CCOEFF_NORMED, 1.0), (cv2.TM_SQDIFF_NORMED, -1.0)]
+)
+def test_top_locations_returns_separated_peaks_in_score_order(method, sign) -> None:
+    scores = np.zeros((40, 40), dtype=np.float32)
+    scores[10, 10] = 0.9
+    scores[11, 11] = 0.85
+    scores[30, 25] = 0.8
+    scores[5, 35] = 0.7
+    template = np.zeros((6, 6), dtype=np.uint8)
+
+    locations = _top_locations(sign * scores, method, 3, template)
+
+    assert locations == [(10, 10), (25, 30), (35, 5)]
+
+
+def test_find_template_pyramid_falls_back_for_small_template(frame) -> None:
+    template = frame[10:22, 20:32]
+
+    result = find_template(frame, template, pyramid_levels=2)
+
+    assert result.position == find_template(frame, template).position
+
+
+def test_find_template_pyramid_raises_below_threshold(frame) -> None:
+    template = np.random.default_rng(3).integers(0, 256, size=(64, 96), dtype=np.uint8)
+
+    with pytest.raises(ThresholdNotMetError):
+        find_template(frame, template, threshold=0.9, pyramid_levels=1)
+    assert not contains_template(frame, template, threshold=0.9, pyramid_levels=1)
+
+
+@pytest.mark.parametrize(
+    ("kwargs", "message"),
+    [({"pyramid_levels": -1}, "pyramid_levels"), ({"candidates": 0}, "candidates")],
+)
+def test_find_template_rejects_invalid_pyramid_options(frame, kwargs, message) -> None:
+    with pytest.raises(ValueError, match=message):
+        find_template(frame, frame[0:32, 0:32], **kwargs)
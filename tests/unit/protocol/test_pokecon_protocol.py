@@ -0,0 +1,44 @@
+import pytest
+
+from nyxpy.framework.core.constants import Button, Hat, LStick, RStick, ThreeDSButton
+from nyxpy.framework.core.hardware.protocol import PokeConSerialProtocol, UnsupportedKeyError
+
+
+@pytest.fixture
+def protocol():
+    return PokeConSerialProtocol()
+
+
+def test_press_button_shifts_mask_by_two_bits(protocol):
+    assert protocol.build_press_command((Button.A,)) == (
+        f"{0x0003 | (Button.A << 2):#X} 8 80 80 80 80\r\n".encode()
+    )
+
+
+def test_press_accumulates_and_release_clears_only_given_keys(protocol):
+    protocol.build_press_command((Button.B,))
+    protocol.build_press_command((Hat.UP, LStick.RIGHT))
+
+    assert protocol.build_release_command((Button.B,)) == b"0X3 0 FF 80 80 80\r\n"
+    assert protocol.build_release_command((Hat.UP, LStick.RIGHT)) == b"0X3 8 80 80 80 80\r\n"
+
+
+def test_hold_replaces_previous_state(protocol):
+    protocol.build_press_command((Button.A, Hat.LEFT))
+
+    assert protocol.build_hold_command((RStick.UP,)) == b"0X3 8 80 80 80 0\r\n"
+
+
+def test_release_without_keys_resets_state(protocol):
+    protocol.build_press_command((Button.ZR, Hat.DOWN, LStick.LEFT))
+
+    assert protocol.build_release_command(()) == b"0X3 8 80 80 80 80\r\n"
+
+
+def test_highest_button_uses_top_bit_of_sixteen_bits(protocol):
+    assert protocol.build_press_command((Button.CAP,)) == b"0X8003 8 80 80 80 80\r\n"
+
+
+def test_unsupported_key_raises(protocol):
+    with pytest.raises(UnsupportedKeyError):
+        protocol.build_press_command((ThreeDSButton.POWER,))